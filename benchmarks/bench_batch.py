@@ -0,0 +1,60 @@
+"""Small writes with one commit per statement against batched commits.
+
+Inserts single rows into a database file, once in autocommit mode (every
+statement is its own transaction) and once through Executor.batch(), which
+commits every DEFAULT_BATCH_ROWS rows or DEFAULT_BATCH_MS milliseconds.
+
+Run with: python benchmarks/bench_batch.py
+"""
+
+import sqlite3
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from sqlinpython import Insert, literal
+from sqlinpython.base import CompleteSqlQuery
+from sqlinpython.execution import Executor
+
+ROWS = 2_000
+
+
+def open_db(path: Path) -> Executor:
+    connection = sqlite3.connect(path, isolation_level=None)
+    connection.execute("CREATE TABLE t (a INTEGER PRIMARY KEY, b TEXT)")
+    return Executor(connection)
+
+
+def insert(i: int) -> CompleteSqlQuery:
+    return Insert.Into("t")("a", "b").Values((literal(i), literal(f"row {i}")))
+
+
+def autocommit(db: Executor) -> None:
+    for i in range(ROWS):
+        db.execute(insert(i))
+
+
+def batched(db: Executor) -> None:
+    with db.batch() as batch:
+        for i in range(ROWS):
+            batch.execute(insert(i))
+
+
+def main() -> None:
+    cases: tuple[tuple[str, Callable[[Executor], None]], ...] = (
+        ("autocommit", autocommit),
+        ("batched", batched),
+    )
+    for name, func in cases:
+        with tempfile.TemporaryDirectory() as directory:
+            db = open_db(Path(directory) / "db.sqlite")
+            start = time.perf_counter()
+            func(db)
+            elapsed = time.perf_counter() - start
+            db.close()
+        print(f"{name:>12}: {ROWS / elapsed:10.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Bulk load benchmark: executemany template against literal VALUES chunks.
+
+Loads the same rows into an in-memory SQLite table twice: once through
+``ValuesChunked`` with every cell built as a literal node and sent with
+get_query_and_params(), and once through a ``ValuesTemplate`` statement
+whose rows go straight to ``sqlite3.Connection.executemany``.
+
+Run with: python benchmarks/bench_executemany.py
+"""
+
+import sqlite3
+import time
+from collections.abc import Iterator
+
+from sqlinpython import Insert, literal
+
+ROWS = 200_000
+
+
+def rows() -> Iterator[tuple[int, str, float]]:
+    for i in range(ROWS):
+        yield (i, f"name {i}", i * 0.5)
+
+
+def connect() -> sqlite3.Connection:
+    db = sqlite3.connect(":memory:")
+    db.execute("CREATE TABLE t (a INTEGER PRIMARY KEY, b TEXT, c REAL)")
+    return db
+
+
+def literal_chunks() -> None:
+    db = connect()
+    insert = Insert.Into("t")("a", "b", "c")
+    literal_rows = (tuple(literal(value) for value in row) for row in rows())
+    with db:
+        for query in insert.ValuesChunked(literal_rows, max_bytes=None):
+            db.execute(*query.get_query_and_params())
+
+
+def template() -> None:
+    db = connect()
+    with db:
+        Insert.Into("t")("a", "b", "c").ValuesTemplate.executemany(db, rows())
+
+
+def main() -> None:
+    for name, func in (("literal chunks", literal_chunks), ("template", template)):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        print(f"{name:>16}: {elapsed:6.2f} s, {ROWS / elapsed:10.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""IN conditions over lists of ids: inline values, json_each and a temp table.
+
+Counts the rows of a 200k row table in a database file whose ids are in a
+list, for lists of increasing length. Every repetition looks up a new list of
+a slightly different length, as an application would:
+
+- inline: ``id IN (?, ?, ...)``, one parameter per value, prepared again for
+  every length; fails past SQLite's limit on the number of parameters;
+- json: ``id IN (SELECT value FROM json_each(?))``, one statement for all;
+- temp table: the list loaded into a temporary table for the lookup.
+
+Run with: python benchmarks/bench_in_list.py
+"""
+
+import random
+import sqlite3
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from sqlinpython import FunctionName, Select, TableRef, col
+from sqlinpython.execution import Executor
+from sqlinpython.expression import Expression
+from sqlinpython.in_list import TempValues, in_json
+
+ROWS = 200_000
+SIZES = (10, 100, 1_000, 10_000, 50_000)
+REPEAT = 10
+
+
+def open_db(path: Path) -> Executor:
+    connection = sqlite3.connect(path, isolation_level=None)
+    connection.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT)")
+    with connection:
+        connection.executemany(
+            "INSERT INTO t VALUES (?, ?)", ((i, f"row {i}") for i in range(ROWS))
+        )
+    return Executor(connection)
+
+
+def count(db: Executor, condition: Expression) -> int:
+    query = Select(FunctionName("count")("*")).From(TableRef("t")).Where(condition)
+    result: int = db.fetchone(query)[0]
+    return result
+
+
+def inline(db: Executor, ids: list[int]) -> int:
+    return count(db, col("id").In(*ids))
+
+
+def json(db: Executor, ids: list[int]) -> int:
+    return count(db, in_json(col("id"), ids))
+
+
+def temp_table(db: Executor, ids: list[int]) -> int:
+    with TempValues(db, ids) as values:
+        return count(db, values.contains(col("id")))
+
+
+def main() -> None:
+    cases: tuple[tuple[str, Callable[[Executor, list[int]], int]], ...] = (
+        ("inline", inline),
+        ("json", json),
+        ("temp table", temp_table),
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        db = open_db(Path(directory) / "db.sqlite")
+        print(f"{'values':>8}" + "".join(f"{name:>14}" for name, _ in cases))
+        for size in SIZES:
+            lists = [random.sample(range(2 * ROWS), size + i) for i in range(REPEAT)]
+            line = f"{size:>8}"
+            for _, func in cases:
+                start = time.perf_counter()
+                try:
+                    for ids in lists:
+                        func(db, ids)
+                except sqlite3.OperationalError:
+                    line += f"{'too many vars':>14}"
+                    continue
+                elapsed = (time.perf_counter() - start) / REPEAT
+                line += f"{elapsed * 1e3:>11.2f} ms"
+            print(line)
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
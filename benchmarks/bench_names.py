@@ -0,0 +1,79 @@
+"""Benchmark of identifier-heavy query construction.
+
+Builds SELECT statements that reference the same handful of columns and
+tables over and over, the way application code typically does, and reports
+the time and memory spent per statement. The "uncached" case turns off Name
+interning and the quote_if_necessary cache, so every identifier is matched,
+quoted and allocated again; the speedup is relative to it.
+
+Run with: python benchmarks/bench_names.py
+"""
+
+import timeit
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import sqlinpython.name as name_module
+from sqlinpython import Select, TableRef, col, literal
+from sqlinpython.base import CompleteSqlQuery
+
+COLUMNS = [f"column_{i}" for i in range(20)] + ["user id", "select", "order"]
+STATEMENTS = 1_000
+REPEAT = 5
+NUMBER = 3
+
+
+def build_statement(i: int) -> CompleteSqlQuery:
+    return (
+        Select(*(col(name) for name in COLUMNS))
+        .From(TableRef("accounts"))
+        .Where(col("tenant", "column_1").eq(literal(i)).And(col("user id") > 10))
+        .OrderBy(col("column_0").Asc, col("order").Desc)
+    )
+
+
+def build_statements() -> list[CompleteSqlQuery]:
+    return [build_statement(i) for i in range(STATEMENTS)]
+
+
+class _NoInterning(dict[Any, Any]):
+    def __setitem__(self, key: Any, value: Any) -> None:
+        pass
+
+
+@contextmanager
+def uncached() -> Iterator[None]:
+    interned, quote = name_module._interned, name_module.quote_if_necessary
+    name_module._interned = _NoInterning()
+    name_module.quote_if_necessary = quote.__wrapped__  # type: ignore[assignment]
+    try:
+        yield
+    finally:
+        name_module._interned, name_module.quote_if_necessary = interned, quote
+
+
+def measure(label: str) -> float:
+    best = min(timeit.repeat(build_statements, repeat=REPEAT, number=NUMBER)) / NUMBER
+    print(f"{label:>16}: {best / STATEMENTS * 1e6:8.2f} us per statement")
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    statements = build_statements()
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    memory = allocated / len(statements)
+    print(f"{'':>16}  {memory:8.0f} bytes per statement")
+    return best
+
+
+def main() -> None:
+    with uncached():
+        baseline = measure("uncached")
+    best = measure("cached")
+    print(f"{'speedup':>16}: {baseline / best:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Benchmark of tokenizing and parsing a large SQL script.
+
+Generates a script of a few megabytes mixing DDL, inserts and queries, then
+reports the tokenizer throughput and the time spent per parsed statement.
+
+Run with: python benchmarks/bench_parser.py
+"""
+
+import timeit
+
+from sqlinpython.parser import parse_script, tokenize
+
+STATEMENTS = [
+    "CREATE TABLE IF NOT EXISTS t{i} (id INTEGER PRIMARY KEY, name TEXT NOT NULL)",
+    "INSERT INTO t{i} (id, name) VALUES ({i}, 'name {i}'), ({i} + 1, 'it''s')",
+    "SELECT t.id, count(*) AS n FROM t{i} AS t LEFT JOIN u ON u.id = t.id "
+    "WHERE t.name LIKE 'a%' AND t.id IN (1, 2, 3) GROUP BY t.id ORDER BY n DESC",
+    "UPDATE t{i} SET name = upper(name) WHERE id BETWEEN {i} AND {i} * 2",
+    "DELETE FROM t{i} WHERE name IS NULL /* cleanup */",
+]
+COPIES = 8_000
+REPEAT = 3
+
+
+def make_script() -> str:
+    return "".join(
+        statement.format(i=i) + ";\n" for i in range(COPIES) for statement in STATEMENTS
+    )
+
+
+def main() -> None:
+    script = make_script()
+    statements = len(STATEMENTS) * COPIES
+    megabytes = len(script) / 1e6
+
+    tokens = sum(1 for _ in tokenize(script))
+    best = min(
+        timeit.repeat(lambda: sum(1 for _ in tokenize(script)), number=1, repeat=REPEAT)
+    )
+    print(
+        f"{'tokenize':>12}: {megabytes / best:8.2f} MB/s, {tokens / best / 1e6:.2f} M tokens/s"
+    )
+
+    best = min(
+        timeit.repeat(
+            lambda: sum(1 for _ in parse_script(script)), number=1, repeat=REPEAT
+        )
+    )
+    print(
+        f"{'parse':>12}: {best / statements * 1e6:8.2f} us per statement ({megabytes:.1f} MB)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Per-request connection setup against a pooled connection.
+
+Runs the same point query per simulated request, once opening a new
+connection and applying the PRAGMA profile every time, and once checking a
+reader out of a ConnectionPool.
+
+Run with: python benchmarks/bench_pool.py
+"""
+
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from sqlinpython import Select, TableRef, col, literal
+from sqlinpython.execution import Executor
+from sqlinpython.pool import DEFAULT_PROFILE, READER_PROFILE, ConnectionPool
+
+REQUESTS = 5_000
+QUERY = Select(col("b")).From(TableRef("t")).Where(col("a").eq(literal(42)))
+
+
+def setup(path: Path) -> None:
+    db = sqlite3.connect(path)
+    db.execute("CREATE TABLE t (a INTEGER PRIMARY KEY, b TEXT)")
+    db.executemany("INSERT INTO t VALUES (?, ?)", ((i, str(i)) for i in range(1000)))
+    db.commit()
+    db.close()
+
+
+def connect_per_request(path: Path) -> None:
+    for _ in range(REQUESTS):
+        db = Executor(sqlite3.connect(path))
+        for pragma in (*DEFAULT_PROFILE, *READER_PROFILE):
+            db.connection.execute(pragma.get_query()).fetchall()
+        db.fetchone(QUERY)
+        db.close()
+
+
+def pooled(path: Path) -> None:
+    with ConnectionPool(str(path)) as pool:
+        for _ in range(REQUESTS):
+            with pool.reader() as db:
+                db.fetchone(QUERY)
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "db.sqlite"
+        setup(path)
+        for name, func in (("per request", connect_per_request), ("pooled", pooled)):
+            start = time.perf_counter()
+            func(path)
+            elapsed = time.perf_counter() - start
+            print(f"{name:>12}: {elapsed / REQUESTS * 1e6:8.1f} us/request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Fan-out benchmark for the prefix render cache.
+
+One base ``Select(...).From(...)`` is branched into 100 variants, each with its
+own WHERE / ORDER BY / LIMIT tail. With a shared base only the first variant
+renders the prefix; the others reuse its cached text. The "unshared" case
+rebuilds the base for every variant, which is what every variant used to cost.
+
+Run with: python benchmarks/bench_prefix_cache.py
+"""
+
+import timeit
+
+from sqlinpython import Select, TableRef, col, literal
+from sqlinpython.select import SelectFromClause
+from sqlinpython.select_base import Core
+
+FAN_OUT = 100
+REPEAT = 5
+NUMBER = 20
+
+
+def build_base() -> SelectFromClause[Core]:
+    users = TableRef("users").As("u")
+    orders = TableRef("orders").As("o")
+    items = TableRef("items").As("i")
+    columns = [users[f"c{i}"] for i in range(20)] + [orders["total"], items["sku"]]
+    return Select(*columns).From(
+        users.Join(orders)
+        .On(users["id"].eq(orders["user_id"]))
+        .LeftJoin(items)
+        .On(orders["id"].eq(items["order_id"]))
+    )
+
+
+def render_variants(base: SelectFromClause[Core]) -> None:
+    for i in range(FAN_OUT):
+        (
+            base.Where(col("status").eq(literal(i)))
+            .OrderBy(col("created_at").Desc)
+            .Limit(literal(i + 10))
+            .get_query()
+        )
+
+
+def shared() -> None:
+    render_variants(build_base())
+
+
+def unshared() -> None:
+    for i in range(FAN_OUT):
+        (
+            build_base()
+            .Where(col("status").eq(literal(i)))
+            .OrderBy(col("created_at").Desc)
+            .Limit(literal(i + 10))
+            .get_query()
+        )
+
+
+def main() -> None:
+    results = {}
+    for name, func in (("unshared prefix", unshared), ("shared prefix", shared)):
+        best = min(timeit.repeat(func, repeat=REPEAT, number=NUMBER)) / NUMBER
+        results[name] = best
+        print(f"{name:>16}: {best * 1e3:8.3f} ms per {FAN_OUT} variants")
+    speedup = results["unshared prefix"] / results["shared prefix"]
+    print(f"{'speedup':>16}: {speedup:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
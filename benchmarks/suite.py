@@ -0,0 +1,268 @@
+"""Construction and rendering benchmarks for every statement family.
+
+Each case builds one representative statement. For every case the suite
+reports how many statements per second can be built, how many freshly built
+statements per second can be rendered with get_query(), and the peak traced
+memory of building and rendering one statement.
+
+Results can be stored as a baseline and later compared against it; the
+comparison fails when any case is slower, or allocates more, than the
+baseline by more than the threshold. Baselines are machine specific, record
+them on the machine that runs the check.
+
+Run with:
+    python benchmarks/suite.py                # report only
+    python benchmarks/suite.py --save         # write benchmarks/baseline.json
+    python benchmarks/suite.py --check        # compare against the baseline
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import TypedDict
+
+from sqlinpython import (
+    ColumnDef,
+    Create,
+    Delete,
+    ForeignKey,
+    FunctionName,
+    Insert,
+    PartitionBy,
+    Select,
+    TableName,
+    TableRef,
+    TypeName,
+    Unique,
+    Update,
+    With,
+    col,
+    literal,
+)
+from sqlinpython.base import CompleteSqlQuery
+from sqlinpython.functions import RowNumber, Sum
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+DEFAULT_THRESHOLD = 0.3
+REPEAT = 5
+
+
+class CaseResult(TypedDict):
+    build_ops: float
+    render_ops: float
+    peak_bytes: int
+
+
+def select_join_cte() -> CompleteSqlQuery:
+    users = TableRef("users").As("u")
+    orders = TableRef("orders").As("o")
+    recent = TableName("recent")("user_id", "total").As(
+        Select(col("user_id"), FunctionName("SUM")(col("total")))
+        .From(TableRef("orders"))
+        .Where(col("created_at") > literal("2024-01-01"))
+        .GroupBy(col("user_id"))
+    )
+    return (
+        With(recent)
+        .Select(users["name"], col("recent", "total"))
+        .From(
+            users.Join(TableRef("recent"))
+            .On(users["id"].eq(col("recent", "user_id")))
+            .LeftJoin(orders)
+            .On(orders["user_id"].eq(users["id"]))
+        )
+        .Where(col("recent", "total") > literal(100))
+        .OrderBy(col("recent", "total").Desc)
+        .Limit(50)
+    )
+
+
+def select_window() -> CompleteSqlQuery:
+    return Select(
+        col("user_id"),
+        RowNumber().Over(PartitionBy(col("user_id")).OrderBy(col("created_at").Desc)),
+        Sum(col("total")).Over(
+            PartitionBy(col("user_id"))
+            .OrderBy(col("created_at"))
+            .Rows.Between.UnboundedPreceding.And.CurrentRow
+        ),
+    ).From(TableRef("orders"))
+
+
+def insert_values() -> CompleteSqlQuery:
+    return Insert.Into("events")("id", "kind", "payload", "score", "raw").Values(
+        *(
+            (
+                literal(i),
+                literal("click"),
+                literal(f"payload {i}"),
+                literal(i * 0.25),
+                literal(b"\x00\x01"),
+            )
+            for i in range(1_000)
+        )
+    )
+
+
+def update() -> CompleteSqlQuery:
+    return (
+        Update("orders")
+        .Set(status=literal("shipped"), shipped_at=literal("2024-06-01"))
+        .Where(col("status").eq(literal("paid")).And(col("total") > literal(10)))
+    )
+
+
+def delete() -> CompleteSqlQuery:
+    return (
+        Delete.From("orders")
+        .Where(
+            col("status")
+            .eq(literal("cancelled"))
+            .And(col("created_at") < literal("2020-01-01"))
+        )
+        .Returning("*")
+    )
+
+
+def create_table() -> CompleteSqlQuery:
+    return Create.Table.IfNotExists("orders")(
+        ColumnDef("id")(TypeName("INTEGER")).PrimaryKey.AutoIncrement,
+        ColumnDef("user_id")(TypeName("INTEGER")).NotNull,
+        ColumnDef("total")(TypeName("REAL")).NotNull.Default(0),
+        ColumnDef("status")(TypeName("TEXT")).Check(
+            col("status").In(literal("new"), literal("paid"))
+        ),
+        Unique(col("user_id"), col("id")),
+        ForeignKey("user_id").References("users"),
+    ).Strict
+
+
+def create_trigger() -> CompleteSqlQuery:
+    return (
+        Create.Trigger.IfNotExists("audit")
+        .After.Update.Of("total")
+        .On("orders")
+        .ForEachRow.When(col("NEW", "total") > col("OLD", "total"))
+        .Begin(
+            Insert.Into("audit")("order_id", "delta").Values(
+                (col("NEW", "id"), col("NEW", "total") - col("OLD", "total"))
+            ),
+            Update("users")
+            .Set(spent=col("spent") + col("NEW", "total"))
+            .Where(col("id").eq(col("NEW", "user_id"))),
+        )
+        .End
+    )
+
+
+CASES: dict[str, Callable[[], CompleteSqlQuery]] = {
+    "select_join_cte": select_join_cte,
+    "select_window": select_window,
+    "insert_values_1000": insert_values,
+    "update": update,
+    "delete": delete,
+    "create_table": create_table,
+    "create_trigger": create_trigger,
+}
+
+
+def _best_ops(run: Callable[[int], float], number: int) -> float:
+    return number / min(run(number) for _ in range(REPEAT))
+
+
+def measure(build: Callable[[], CompleteSqlQuery]) -> CaseResult:
+    timer = timeit.Timer(build)
+    # Enough iterations for each timing run to take at least 0.2 seconds.
+    number, _ = timer.autorange()
+    build_ops = _best_ops(timer.timeit, number)
+
+    def render(n: int) -> float:
+        # get_query() caches its result, so every run renders fresh trees.
+        queries = [build() for _ in range(n)]
+        start = time.perf_counter()
+        for query in queries:
+            query.get_query()
+        return time.perf_counter() - start
+
+    render_ops = _best_ops(render, number)
+
+    tracemalloc.start()
+    build().get_query()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"build_ops": build_ops, "render_ops": render_ops, "peak_bytes": peak}
+
+
+def run_suite() -> dict[str, CaseResult]:
+    results = {}
+    for name, build in CASES.items():
+        result = measure(build)
+        results[name] = result
+        print(
+            f"{name:>20}: {result['build_ops']:10.0f} builds/s"
+            f" {result['render_ops']:10.0f} renders/s"
+            f" {result['peak_bytes']:10d} peak bytes"
+        )
+    return results
+
+
+def compare(
+    results: dict[str, CaseResult], baseline: dict[str, CaseResult], threshold: float
+) -> list[str]:
+    """Return a description of every regression beyond threshold."""
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            print(f"{name}: no baseline")
+            continue
+        base = baseline[name]
+        for key in ("build_ops", "render_ops"):
+            if result[key] < base[key] * (1 - threshold):
+                regressions.append(
+                    f"{name}: {key} {result[key]:.0f} < baseline {base[key]:.0f}"
+                )
+        if result["peak_bytes"] > base["peak_bytes"] * (1 + threshold):
+            regressions.append(
+                f"{name}: peak_bytes {result['peak_bytes']}"
+                f" > baseline {base['peak_bytes']}"
+            )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--save", action="store_true", help="write the baseline")
+    parser.add_argument(
+        "--check", action="store_true", help="fail on regressions against baseline"
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    results = run_suite()
+    environment = f"{platform.python_implementation()} {platform.python_version()}"
+    if args.save:
+        data = {"environment": environment, "cases": results}
+        args.baseline.write_text(json.dumps(data, indent=2) + "\n")
+        print(f"baseline written to {args.baseline}")
+    if args.check:
+        data = json.loads(args.baseline.read_text())
+        if data["environment"] != environment:
+            print(f"warning: baseline was recorded on {data['environment']}")
+        regressions = compare(results, data["cases"], args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+        print(f"no regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
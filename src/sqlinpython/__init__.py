@@ -1,5 +1,126 @@
+"""Fluent builder for SQLite statements.
+
+The public names are loaded lazily (PEP 562): ``from sqlinpython import
+Select`` only imports the modules needed to build SELECT statements instead
+of every statement module.
+"""
+
+from typing import TYPE_CHECKING
+
 __version__ = "0.1.0"
 
-from sqlinpython.builders import *
-from sqlinpython.keywords import *
-from sqlinpython.types import *
+if TYPE_CHECKING:
+    from sqlinpython.builders import *
+    from sqlinpython.keywords import *
+    from sqlinpython.types import *
+
+# Public name -> module it is imported from. Must list exactly the names
+# re-exported by the builders, keywords and types modules.
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    # sqlinpython.builders
+    "ColumnDef": "sqlinpython.column_definition",
+    "TableName": "sqlinpython.common_table_expression",
+    "ColumnName": "sqlinpython.expression",
+    "FunctionName": "sqlinpython.expression",
+    "Star": "sqlinpython.expression",
+    "WindowName": "sqlinpython.expression",
+    "and_all": "sqlinpython.expression",
+    "col": "sqlinpython.expression",
+    "literal": "sqlinpython.expression",
+    "or_all": "sqlinpython.expression",
+    "IndexedColumn": "sqlinpython.indexed_column",
+    "Name": "sqlinpython.name",
+    "OrderingTerm": "sqlinpython.ordering_term",
+    "NestedFromClause": "sqlinpython.table_or_subquery",
+    "Subquery": "sqlinpython.table_or_subquery",
+    "TableFunctionRef": "sqlinpython.table_or_subquery",
+    "TableRef": "sqlinpython.table_or_subquery",
+    "TypeName": "sqlinpython.type_name",
+    # sqlinpython.keywords
+    "AlterTable": "sqlinpython.alter_table",
+    "Analyze": "sqlinpython.analyze",
+    "Attach": "sqlinpython.attach",
+    "With": "sqlinpython.common_table_expression",
+    "Create": "sqlinpython.create",
+    "Delete": "sqlinpython.delete",
+    "Detach": "sqlinpython.detach",
+    "Drop": "sqlinpython.drop",
+    "Case": "sqlinpython.expression",
+    "CurrentDate": "sqlinpython.expression",
+    "CurrentTime": "sqlinpython.expression",
+    "CurrentTimestamp": "sqlinpython.expression",
+    "Groups": "sqlinpython.expression",
+    "OrderBy": "sqlinpython.expression",
+    "PartitionBy": "sqlinpython.expression",
+    "Range": "sqlinpython.expression",
+    "Rows": "sqlinpython.expression",
+    "Insert": "sqlinpython.insert",
+    "Replace": "sqlinpython.insert",
+    "Pragma": "sqlinpython.pragma",
+    "Reindex": "sqlinpython.reindex",
+    "Release": "sqlinpython.savepoint",
+    "Rollback": "sqlinpython.savepoint",
+    "Savepoint": "sqlinpython.savepoint",
+    "Select": "sqlinpython.select",
+    "Values": "sqlinpython.select",
+    "Check": "sqlinpython.table_constraint",
+    "Constraint": "sqlinpython.table_constraint",
+    "ForeignKey": "sqlinpython.table_constraint",
+    "PrimaryKey": "sqlinpython.table_constraint",
+    "Unique": "sqlinpython.table_constraint",
+    "Begin": "sqlinpython.transaction",
+    "Commit": "sqlinpython.transaction",
+    "End": "sqlinpython.transaction",
+    "Update": "sqlinpython.update",
+    "Vacuum": "sqlinpython.vacuum",
+    # sqlinpython.types
+    "AlterTableStatement": "sqlinpython.alter_table",
+    "AnalyzeStatement": "sqlinpython.analyze",
+    "AttachStatement": "sqlinpython.attach",
+    "CreateIndexStatement": "sqlinpython.create_index",
+    "CreateTableStatement": "sqlinpython.create_table",
+    "CreateTriggerStatement": "sqlinpython.create_trigger",
+    "CreateViewStatement": "sqlinpython.create_view",
+    "CreateVirtualTableStatement": "sqlinpython.create_vtable",
+    "DeleteStatement": "sqlinpython.delete",
+    "DeleteStatementLimited": "sqlinpython.delete",
+    "DetachStatement": "sqlinpython.detach",
+    "DropIndexStatement": "sqlinpython.drop",
+    "DropStatement": "sqlinpython.drop",
+    "DropTableStatement": "sqlinpython.drop",
+    "DropTriggerStatement": "sqlinpython.drop",
+    "DropViewStatement": "sqlinpython.drop",
+    "InsertStatement": "sqlinpython.insert",
+    "PragmaStatement": "sqlinpython.pragma",
+    "ReindexStatement": "sqlinpython.reindex",
+    "ReleaseStatement": "sqlinpython.savepoint",
+    "RollbackStatement": "sqlinpython.savepoint",
+    "SavepointStatement": "sqlinpython.savepoint",
+    "SelectStatement": "sqlinpython.select_base",
+    "BeginStatement": "sqlinpython.transaction",
+    "CommitStatement": "sqlinpython.transaction",
+    "UpdateStatement": "sqlinpython.update",
+    "UpdateStatementLimited": "sqlinpython.update",
+    "VacuumStatement": "sqlinpython.vacuum",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+if not TYPE_CHECKING:
+
+    def __getattr__(name: str) -> object:
+        try:
+            module_name = _LAZY_ATTRIBUTES[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+        # Equivalent to `from module_name import name`; unlike
+        # importlib.import_module this shows up in `python -X importtime`.
+        value = getattr(__import__(module_name, fromlist=[name]), name)
+        globals()[name] = value
+        return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
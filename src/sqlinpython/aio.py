@@ -0,0 +1,342 @@
+"""asyncio access to stdlib sqlite3 connections.
+
+sqlite3 calls block, so an ``AsyncConnection`` owns one worker thread that
+opens the connection and runs every call on it, in submission order. The
+event loop only waits on futures:
+
+    db = await aio.connect("app.db")
+    await stmt.execute(db)
+    async for row in select.stream(db):
+        ...
+
+At most ``max_pending`` calls are queued or running per connection; further
+callers wait for a free place, so a burst of requests cannot grow the queue
+without bound. Streaming reads fetch one batch ahead of the consumer and no
+further. Cancelling a call that is still queued drops it, cancelling a call
+that is running interrupts the statement with ``Connection.interrupt()``.
+
+``transaction()`` and ``batch()`` are the async forms of the Executor ones.
+Other tasks using the same connection meanwhile run inside the transaction.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import enum
+import queue
+import sqlite3
+import threading
+from collections.abc import AsyncGenerator, Callable, Iterable, Iterator
+from typing import Any, Self
+
+from sqlinpython.base import CompleteSqlQuery
+from sqlinpython.execution import (
+    DEFAULT_BATCH_MS,
+    DEFAULT_BATCH_ROWS,
+    DEFAULT_BATCH_SIZE,
+    Executor,
+    Parameters,
+    TransactionMode,
+    WriteBatch,
+)
+from sqlinpython.execution import connect as _connect
+
+# Calls that may be queued or running on one connection at a time.
+DEFAULT_MAX_PENDING = 64
+
+
+class _State(enum.Enum):
+    QUEUED = enum.auto()
+    RUNNING = enum.auto()
+    DONE = enum.auto()
+
+
+def _set_result(future: asyncio.Future[Any], result: Any) -> None:
+    if not future.done():
+        future.set_result(result)
+
+
+def _set_exception(future: asyncio.Future[Any], exc: BaseException) -> None:
+    if not future.done():
+        future.set_exception(exc)
+
+
+class _Job:
+    __slots__ = ("func", "future", "state", "lock")
+
+    def __init__(self, func: Callable[[], Any], future: asyncio.Future[Any]) -> None:
+        self.func = func
+        self.future = future
+        self.state = _State.QUEUED
+        # Guards state, so that a running call is interrupted only while it
+        # is still running and never the call after it.
+        self.lock = threading.Lock()
+
+    def run(self) -> None:
+        with self.lock:
+            if self.future.cancelled():
+                self.state = _State.DONE
+                return
+            self.state = _State.RUNNING
+        loop = self.future.get_loop()
+        try:
+            result = self.func()
+        except BaseException as exc:
+            callback, value = _set_exception, exc
+        else:
+            callback, value = _set_result, result
+        with self.lock:
+            self.state = _State.DONE
+        try:
+            loop.call_soon_threadsafe(callback, self.future, value)
+        except RuntimeError:
+            # The event loop was closed while the call ran.
+            pass
+
+
+class Result:
+    """Rows and counters of an executed statement."""
+
+    __slots__ = ("rows", "rowcount", "lastrowid")
+
+    def __init__(self, rows: list[Any], rowcount: int, lastrowid: int | None) -> None:
+        self.rows = rows
+        self.rowcount = rowcount
+        self.lastrowid = lastrowid
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.rows)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+
+def _result(cursor: sqlite3.Cursor) -> Result:
+    try:
+        rows = cursor.fetchall()
+        return Result(rows, cursor.rowcount, cursor.lastrowid)
+    finally:
+        cursor.close()
+
+
+def _rowcount(cursor: sqlite3.Cursor) -> int:
+    rowcount = cursor.rowcount
+    cursor.close()
+    return rowcount
+
+
+class AsyncConnection:
+    """A sqlite3 connection used from asyncio through a worker thread.
+
+    Create it with ``await connect(...)``.
+    """
+
+    __slots__ = ("_jobs", "_pending", "_thread", "_executor", "_closed")
+
+    _executor: Executor
+
+    def __init__(self, max_pending: int = DEFAULT_MAX_PENDING) -> None:
+        self._jobs: queue.SimpleQueue[Callable[[], None] | None] = queue.SimpleQueue()
+        self._pending = asyncio.Semaphore(max_pending)
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._work, name="sqlinpython-aio", daemon=True
+        )
+        self._thread.start()
+
+    def _work(self) -> None:
+        while (job := self._jobs.get()) is not None:
+            job()
+
+    async def _call[T](self, func: Callable[[], T]) -> T:
+        async with self._pending:
+            job = _Job(func, asyncio.get_running_loop().create_future())
+            self._jobs.put(job.run)
+            try:
+                result: T = await job.future
+            except asyncio.CancelledError:
+                with job.lock:
+                    if job.state is _State.RUNNING:
+                        self._executor.connection.interrupt()
+                raise
+            return result
+
+    async def _submit[T](self, func: Callable[[], T]) -> T:
+        if self._closed:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+        return await self._call(func)
+
+    async def _open(self, database: str, connect_kwargs: dict[str, Any]) -> None:
+        def open_connection() -> None:
+            self._executor = _connect(database, **connect_kwargs)
+
+        try:
+            await self._call(open_connection)
+        except BaseException:
+            self._closed = True
+            self._jobs.put(None)
+            raise
+
+    async def execute(
+        self, statement: CompleteSqlQuery, parameters: Parameters | None = None
+    ) -> Result:
+        """Execute statement and fetch all of its rows."""
+
+        return await self._submit(
+            lambda: _result(self._executor.execute(statement, parameters))
+        )
+
+    async def executemany(
+        self, statement: CompleteSqlQuery, rows: Iterable[Parameters]
+    ) -> int:
+        """Execute statement once per row of parameters; return the rowcount."""
+
+        return await self._submit(
+            lambda: _rowcount(self._executor.executemany(statement, rows))
+        )
+
+    async def fetchone(
+        self, statement: CompleteSqlQuery, parameters: Parameters | None = None
+    ) -> Any:
+        result = await self.execute(statement, parameters)
+        return result.rows[0] if result.rows else None
+
+    async def fetchall(
+        self, statement: CompleteSqlQuery, parameters: Parameters | None = None
+    ) -> list[Any]:
+        return (await self.execute(statement, parameters)).rows
+
+    async def stream(
+        self,
+        statement: CompleteSqlQuery,
+        parameters: Parameters | None = None,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> AsyncGenerator[Any, None]:
+        """Yield the rows of statement, fetching batch_size rows at a time.
+
+        The next batch is fetched while the current one is consumed; nothing
+        beyond that is read until the consumer catches up.
+        """
+        cursor = await self._submit(
+            lambda: self._executor.execute(statement, parameters)
+        )
+
+        def fetch() -> list[Any]:
+            return cursor.fetchmany(batch_size)
+
+        def close_cursor() -> None:
+            with contextlib.suppress(sqlite3.Error):
+                cursor.close()
+
+        batch = asyncio.ensure_future(self._submit(fetch))
+        try:
+            while rows := await batch:
+                batch = asyncio.ensure_future(self._submit(fetch))
+                for row in rows:
+                    yield row
+        finally:
+            batch.cancel()
+            # Runs after the cancelled fetch, without waiting for it.
+            self._jobs.put(close_cursor)
+
+    @contextlib.asynccontextmanager
+    async def transaction(
+        self, mode: TransactionMode = "IMMEDIATE"
+    ) -> AsyncGenerator[Self, None]:
+        """Run the block in a transaction, see Executor.transaction."""
+        depth = await self._submit(lambda: self._executor._begin(mode))
+        try:
+            yield self
+        except BaseException:
+            await self._call(lambda: self._executor._end(depth, commit=False))
+            raise
+        await self._submit(lambda: self._executor._end(depth, commit=True))
+
+    def batch(
+        self,
+        *,
+        max_rows: int = DEFAULT_BATCH_ROWS,
+        max_ms: float = DEFAULT_BATCH_MS,
+        mode: TransactionMode = "IMMEDIATE",
+    ) -> AsyncWriteBatch:
+        """Group the writes made through the returned batch into transactions."""
+        return AsyncWriteBatch(self, max_rows=max_rows, max_ms=max_ms, mode=mode)
+
+    async def close(self) -> None:
+        """Close the connection once the calls submitted so far have run."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            await self._call(self._executor.close)
+        finally:
+            self._jobs.put(None)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+
+class AsyncWriteBatch:
+    """Async form of execution.WriteBatch."""
+
+    __slots__ = ("_db", "_batch")
+
+    def __init__(
+        self,
+        db: AsyncConnection,
+        *,
+        max_rows: int = DEFAULT_BATCH_ROWS,
+        max_ms: float = DEFAULT_BATCH_MS,
+        mode: TransactionMode = "IMMEDIATE",
+    ) -> None:
+        self._db = db
+        # Only used on the worker thread.
+        self._batch = WriteBatch(
+            db._executor, max_rows=max_rows, max_ms=max_ms, mode=mode
+        )
+
+    async def execute(
+        self, statement: CompleteSqlQuery, parameters: Parameters | None = None
+    ) -> Result:
+        return await self._db._submit(
+            lambda: _result(self._batch.execute(statement, parameters))
+        )
+
+    async def executemany(
+        self, statement: CompleteSqlQuery, rows: Iterable[Parameters]
+    ) -> int:
+        return await self._db._submit(
+            lambda: _rowcount(self._batch.executemany(statement, rows))
+        )
+
+    async def flush(self) -> None:
+        await self._db._submit(self._batch.flush)
+
+    async def rollback(self) -> None:
+        await self._db._call(self._batch.rollback)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type: object, *exc_info: object) -> None:
+        if exc_type is None:
+            await self.flush()
+        else:
+            await self.rollback()
+
+
+async def connect(
+    database: str, *, max_pending: int = DEFAULT_MAX_PENDING, **kwargs: Any
+) -> AsyncConnection:
+    """Open a sqlite3 connection on a new worker thread.
+
+    Keyword arguments are passed to sqlinpython.execution.connect.
+    """
+    db = AsyncConnection(max_pending)
+    await db._open(database, kwargs)
+    return db
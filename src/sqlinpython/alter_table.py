@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from abc import ABC
+from collections.abc import Sequence
 from typing import override
 
-from sqlinpython.base import CompleteSqlQuery, SqlElement
+from sqlinpython.base import CompleteSqlQuery, QueryPart, SqlElement
 from sqlinpython.column_definition import ColumnDefinition
 from sqlinpython.conflict_clause import OnConflict_, OnConflictAction
 from sqlinpython.expression import Expression, ExpressionOrLiteral, to_expr
@@ -13,13 +14,17 @@ from sqlinpython.name import Name
 
 
 class AlterTableStatement(CompleteSqlQuery, ABC):
-    pass
+    __slots__ = ()
+
+    _inline_literals = True
 
 
 # ----- RENAME -----
 
 
 class AlterTableRenameTo(AlterTableStatement):
+    __slots__ = ("_prev", "_new_name")
+
     def __init__(self, prev: SqlElement, new_name: Name) -> None:
         self._prev = prev
         self._new_name = new_name
@@ -30,8 +35,14 @@ class AlterTableRenameTo(AlterTableStatement):
         buffer.append(" TO ")
         self._new_name._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " TO ", self._new_name)
+
 
 class IAlterTableRenameColumnTo(SqlElement, ABC):
+    __slots__ = ()
+
     def To(self, new_name: Name | str) -> AlterTableRenameTo:
         if isinstance(new_name, str):
             new_name = Name(new_name)
@@ -41,6 +52,8 @@ class IAlterTableRenameColumnTo(SqlElement, ABC):
 class AlterTableRenameColumn(IAlterTableRenameColumnTo):
     """RENAME COLUMN col — explicit COLUMN keyword"""
 
+    __slots__ = ("_prev", "_column_name")
+
     def __init__(self, prev: SqlElement, column_name: Name) -> None:
         self._prev = prev
         self._column_name = column_name
@@ -51,10 +64,16 @@ class AlterTableRenameColumn(IAlterTableRenameColumnTo):
         buffer.append(" COLUMN ")
         self._column_name._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " COLUMN ", self._column_name)
+
 
 class AlterTableRenameColumnName(IAlterTableRenameColumnTo):
     """RENAME col — shorthand without COLUMN keyword"""
 
+    __slots__ = ("_prev", "_column_name")
+
     def __init__(self, prev: SqlElement, column_name: Name) -> None:
         self._prev = prev
         self._column_name = column_name
@@ -65,8 +84,14 @@ class AlterTableRenameColumnName(IAlterTableRenameColumnTo):
         buffer.append(" ")
         self._column_name._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ", self._column_name)
+
 
 class AlterTableRename(SqlElement):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement) -> None:
         self._prev = prev
 
@@ -90,6 +115,10 @@ class AlterTableRename(SqlElement):
         self._prev._create_query(buffer)
         buffer.append(" RENAME")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " RENAME")
+
 
 # ----- ADD -----
 
@@ -97,6 +126,8 @@ class AlterTableRename(SqlElement):
 class AlterTableAddColumn(AlterTableStatement):
     """ADD COLUMN col_def — explicit COLUMN keyword"""
 
+    __slots__ = ("_prev", "_column_def")
+
     def __init__(self, prev: SqlElement, column_def: ColumnDefinition) -> None:
         self._prev = prev
         self._column_def = column_def
@@ -107,10 +138,16 @@ class AlterTableAddColumn(AlterTableStatement):
         buffer.append(" COLUMN ")
         self._column_def._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " COLUMN ", self._column_def)
+
 
 class AlterTableAddColumnDef(AlterTableStatement):
     """ADD col_def — shorthand without COLUMN keyword"""
 
+    __slots__ = ("_prev", "_column_def")
+
     def __init__(self, prev: SqlElement, column_def: ColumnDefinition) -> None:
         self._prev = prev
         self._column_def = column_def
@@ -121,18 +158,26 @@ class AlterTableAddColumnDef(AlterTableStatement):
         buffer.append(" ")
         self._column_def._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ", self._column_def)
+
 
 class AlterTableWithConflict(OnConflictAction, AlterTableStatement):
-    pass
+    __slots__ = ()
 
 
 class IAlterTableOnConflict(AlterTableStatement, ABC):
+    __slots__ = ()
+
     @property
     def OnConflict(self) -> OnConflict_[AlterTableWithConflict]:
         return OnConflict_(AlterTableWithConflict, self)
 
 
 class AlterTableAddCheck(IAlterTableOnConflict):
+    __slots__ = ("_prev", "_expr")
+
     def __init__(self, prev: SqlElement, expr: Expression) -> None:
         self._prev = prev
         self._expr = expr
@@ -144,8 +189,14 @@ class AlterTableAddCheck(IAlterTableOnConflict):
         self._expr._create_query(buffer)
         buffer.append(")")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " CHECK (", self._expr, ")")
+
 
 class AlterTableAddConstraintCheck(AlterTableStatement):
+    __slots__ = ("_prev", "_expr")
+
     def __init__(self, prev: AlterTableAddConstraintWithName, expr: Expression) -> None:
         self._prev = prev
         self._expr = expr
@@ -157,8 +208,14 @@ class AlterTableAddConstraintCheck(AlterTableStatement):
         self._expr._create_query(buffer)
         buffer.append(")")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " CHECK (", self._expr, ")")
+
 
 class AlterTableAddConstraintWithName(SqlElement):
+    __slots__ = ("_prev", "_name")
+
     def __init__(self, prev: SqlElement, name: Name) -> None:
         self._prev = prev
         self._name = name
@@ -172,8 +229,14 @@ class AlterTableAddConstraintWithName(SqlElement):
         buffer.append(" CONSTRAINT ")
         self._name._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " CONSTRAINT ", self._name)
+
 
 class AlterTableAdd(SqlElement):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement) -> None:
         self._prev = prev
 
@@ -196,6 +259,10 @@ class AlterTableAdd(SqlElement):
         self._prev._create_query(buffer)
         buffer.append(" ADD")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ADD")
+
 
 # ----- DROP -----
 
@@ -203,6 +270,8 @@ class AlterTableAdd(SqlElement):
 class AlterTableDropName(AlterTableStatement):
     """DROP col — shorthand without COLUMN keyword"""
 
+    __slots__ = ("_prev", "_name")
+
     def __init__(self, prev: SqlElement, name: Name) -> None:
         self._prev = prev
         self._name = name
@@ -213,8 +282,14 @@ class AlterTableDropName(AlterTableStatement):
         buffer.append(" ")
         self._name._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ", self._name)
+
 
 class AlterTableDropColumn(AlterTableStatement):
+    __slots__ = ("_prev", "_name")
+
     def __init__(self, prev: SqlElement, name: Name) -> None:
         self._prev = prev
         self._name = name
@@ -225,8 +300,14 @@ class AlterTableDropColumn(AlterTableStatement):
         buffer.append(" COLUMN ")
         self._name._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " COLUMN ", self._name)
+
 
 class AlterTableDropConstraint(AlterTableStatement):
+    __slots__ = ("_prev", "_name")
+
     def __init__(self, prev: SqlElement, name: Name) -> None:
         self._prev = prev
         self._name = name
@@ -237,8 +318,14 @@ class AlterTableDropConstraint(AlterTableStatement):
         buffer.append(" CONSTRAINT ")
         self._name._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " CONSTRAINT ", self._name)
+
 
 class AlterTableDrop(SqlElement):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement) -> None:
         self._prev = prev
 
@@ -262,11 +349,17 @@ class AlterTableDrop(SqlElement):
         self._prev._create_query(buffer)
         buffer.append(" DROP")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " DROP")
+
 
 # ----- ALTER COLUMN -----
 
 
 class AlterTableAlterColumnDropNotNull(AlterTableStatement):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement) -> None:
         self._prev = prev
 
@@ -275,8 +368,14 @@ class AlterTableAlterColumnDropNotNull(AlterTableStatement):
         self._prev._create_query(buffer)
         buffer.append(" DROP NOT NULL")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " DROP NOT NULL")
+
 
 class AlterTableAlterColumnSetNotNull(IAlterTableOnConflict):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement) -> None:
         self._prev = prev
 
@@ -285,8 +384,14 @@ class AlterTableAlterColumnSetNotNull(IAlterTableOnConflict):
         self._prev._create_query(buffer)
         buffer.append(" SET NOT NULL")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " SET NOT NULL")
+
 
 class IAlterTableAlterColumn(SqlElement, ABC):
+    __slots__ = ()
+
     @property
     def SetNotNull(self) -> AlterTableAlterColumnSetNotNull:
         return AlterTableAlterColumnSetNotNull(self)
@@ -299,6 +404,8 @@ class IAlterTableAlterColumn(SqlElement, ABC):
 class AlterTableAlterColumn(IAlterTableAlterColumn):
     """ALTER col — shorthand without COLUMN keyword"""
 
+    __slots__ = ("_prev", "_column_name")
+
     def __init__(self, prev: SqlElement, column_name: Name) -> None:
         self._prev = prev
         self._column_name = column_name
@@ -309,10 +416,16 @@ class AlterTableAlterColumn(IAlterTableAlterColumn):
         buffer.append(" ")
         self._column_name._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ", self._column_name)
+
 
 class AlterTableAlterColumnExplicit(IAlterTableAlterColumn):
     """ALTER COLUMN col — explicit COLUMN keyword"""
 
+    __slots__ = ("_prev", "_column_name")
+
     def __init__(self, prev: SqlElement, column_name: Name) -> None:
         self._prev = prev
         self._column_name = column_name
@@ -323,8 +436,14 @@ class AlterTableAlterColumnExplicit(IAlterTableAlterColumn):
         buffer.append(" COLUMN ")
         self._column_name._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " COLUMN ", self._column_name)
+
 
 class AlterTableAlter(SqlElement):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement) -> None:
         self._prev = prev
 
@@ -343,11 +462,17 @@ class AlterTableAlter(SqlElement):
         self._prev._create_query(buffer)
         buffer.append(" ALTER")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ALTER")
+
 
 # ----- ENTRY POINT -----
 
 
 class AlterTable(SqlElement):
+    __slots__ = ("_schema", "_table")
+
     def __init__(self, schema: Name | str, table: Name | str | None = None, /) -> None:
         if isinstance(schema, str):
             schema = Name(schema)
@@ -379,3 +504,10 @@ class AlterTable(SqlElement):
         if self._table is not None:
             buffer.append(".")
             self._table._create_query(buffer)
+
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        parts: list[QueryPart] = ["ALTER TABLE ", self._schema]
+        if self._table is not None:
+            parts.extend((".", self._table))
+        return parts
@@ -1,18 +1,21 @@
 from __future__ import annotations
 
 from abc import ABC
+from collections.abc import Sequence
 from typing import override
 
-from sqlinpython.base import CompleteSqlQuery, SqlElement
+from sqlinpython.base import CompleteSqlQuery, QueryPart, SqlElement
 from sqlinpython.name import Name
 
 
 # SPEC: https://sqlite.org/lang_analyze.html
 class AnalyzeStatement(CompleteSqlQuery, ABC):
-    pass
+    __slots__ = ()
 
 
 class AnalyzeComplete(AnalyzeStatement):
+    __slots__ = ("_prev", "_schema", "_table")
+
     def __init__(self, prev: SqlElement, schema: Name, table: Name | None) -> None:
         self._prev = prev
         self._schema = schema
@@ -27,8 +30,17 @@ class AnalyzeComplete(AnalyzeStatement):
             buffer.append(".")
             self._table._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        parts: list[QueryPart] = [self._prev, " ", self._schema]
+        if self._table is not None:
+            parts.extend((".", self._table))
+        return parts
+
 
 class AnalyzeKeyword(AnalyzeStatement):
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
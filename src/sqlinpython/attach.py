@@ -1,19 +1,22 @@
 from __future__ import annotations
 
 from abc import ABC
+from collections.abc import Sequence
 from typing import override
 
-from sqlinpython.base import CompleteSqlQuery, SqlElement
+from sqlinpython.base import CompleteSqlQuery, QueryPart, SqlElement
 from sqlinpython.expression import Expression, ExpressionOrLiteral, to_expr
 from sqlinpython.name import Name
 
 
 # SPEC: https://sqlite.org/lang_attach.html
 class AttachStatement(CompleteSqlQuery, ABC):
-    pass
+    __slots__ = ()
 
 
 class AttachComplete(AttachStatement):
+    __slots__ = ("_prev", "_schema")
+
     def __init__(self, prev: SqlElement, schema: Name) -> None:
         self._prev = prev
         self._schema = schema
@@ -24,8 +27,14 @@ class AttachComplete(AttachStatement):
         buffer.append(" AS ")
         self._schema._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " AS ", self._schema)
+
 
 class AttachWithExpr(SqlElement):
+    __slots__ = ("_prev", "_file_expr")
+
     def __init__(self, prev: SqlElement, file_expr: Expression) -> None:
         self._prev = prev
         self._file_expr = file_expr
@@ -41,13 +50,21 @@ class AttachWithExpr(SqlElement):
         buffer.append(" ")
         self._file_expr._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ", self._file_expr)
+
 
 class IAttachCall(SqlElement, ABC):
+    __slots__ = ()
+
     def __call__(self, file_expr: ExpressionOrLiteral) -> AttachWithExpr:
         return AttachWithExpr(self, to_expr(file_expr))
 
 
 class AttachDatabaseKeyword(IAttachCall):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: AttachKeyword) -> None:
         self._prev = prev
 
@@ -56,8 +73,14 @@ class AttachDatabaseKeyword(IAttachCall):
         self._prev._create_query(buffer)
         buffer.append(" DATABASE")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " DATABASE")
+
 
 class AttachKeyword(IAttachCall):
+    __slots__ = ()
+
     @property
     def Database(self) -> AttachDatabaseKeyword:
         return AttachDatabaseKeyword(self)
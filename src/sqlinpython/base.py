@@ -1,7 +1,14 @@
+from __future__ import annotations
+
 import enum
+import functools
+import math
+import time
 from abc import ABCMeta, abstractmethod
-from collections.abc import Iterable
-from typing import Protocol
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, Protocol, overload, override
+
+from sqlinpython import hooks
 
 
 class NoArg(enum.Enum):
@@ -12,6 +19,22 @@ class ISqlElement(Protocol):
     def _create_query(self, buffer: list[str]) -> None: ...
 
 
+class TextSink(Protocol):
+    def write(self, s: str, /) -> object: ...
+
+
+class SupportsExecute[R](Protocol):
+    def execute(self, statement: CompleteSqlQuery, /) -> R: ...
+
+
+class SupportsStream[R](Protocol):
+    def stream(self, statement: CompleteSqlQuery, /) -> R: ...
+
+
+# Chunk size, in characters, of streamed query text.
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
 def comma_separated(buffer: list[str], elements: Iterable[ISqlElement]) -> None:
     for i, element in enumerate(elements):
         if i > 0:
@@ -19,14 +42,319 @@ def comma_separated(buffer: list[str], elements: Iterable[ISqlElement]) -> None:
         element._create_query(buffer)
 
 
-class SqlElement(metaclass=ABCMeta):
+type QueryPart = str | SqlElement
+type ParameterValue = int | float | str | bytes
+type ParamStyle = Literal["qmark", "named"]
+
+
+class ParameterBuffer(list[str]):
+    """Buffer that collects literal values as bind parameters.
+
+    Literals rendered into this buffer append a placeholder instead of their
+    value, so queries that only differ in values render to the same SQL.
+    """
+
+    __slots__ = ("paramstyle", "params", "explicit_parameters")
+
+    def __init__(self, paramstyle: ParamStyle) -> None:
+        super().__init__()
+        self.paramstyle = paramstyle
+        self.params: list[ParameterValue] = []
+        self.explicit_parameters: list[str] = []
+
+    def add_parameter(self, value: ParameterValue) -> None:
+        self.params.append(value)
+        if self.paramstyle == "named":
+            self.append(f":p{len(self.params)}")
+        else:
+            self.append("?")
+
+    def add_explicit_parameter(self, text: str) -> None:
+        self.explicit_parameters.append(text)
+        self.append(text)
+
+    def check_explicit_parameters(self) -> None:
+        if not self.explicit_parameters:
+            return
+        if self.paramstyle == "qmark":
+            raise ValueError(
+                "Cannot mix literal parameters with explicit bind parameters "
+                f"{self.explicit_parameters} in qmark style, use paramstyle='named'"
+            )
+        generated = {f":p{i}" for i in range(1, len(self.params) + 1)}
+        for text in self.explicit_parameters:
+            if text[0] == "?" or text in generated:
+                raise ValueError(
+                    f"Explicit bind parameter {text!r} conflicts with the "
+                    "generated named parameters"
+                )
+
+
+class SqlElementMeta(ABCMeta):
+    """Metaclass of SqlElement.
+
+    Has no behaviour of its own; sqlinpython.interning installs a __call__
+    on it while interning is active or construction listeners are registered.
+    """
+
+
+# Slots that cache derived data or hold weak references rather than describe
+# the node.
+_CACHE_SLOTS = frozenset({"_query", "_hash", "__weakref__"})
+
+
+class SqlElement(metaclass=SqlElementMeta):
+    """Base class of every node in the query tree.
+
+    Nodes are immutable: each attribute may be assigned once, during
+    construction. This is what allows rendered queries to be cached on the node.
+    Every subclass declares ``__slots__`` so that nodes carry no ``__dict__``.
+
+    Equality and hashing are structural: two nodes are equal when they have
+    the same type and equal fields, so separately built trees for the same
+    query compare equal and can be used as dict keys.
+    """
+
+    # _query is only used by CompleteSqlQuery, but declaring it here keeps
+    # statement mixins from conflicting in their slot layouts.
+    __slots__ = ("_query", "_hash")
+
+    _hash: int
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if hasattr(self, name):
+            raise AttributeError(
+                f"{type(self).__name__} is immutable, cannot reassign {name!r}"
+            )
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(
+            f"{type(self).__name__} is immutable, cannot delete {name!r}"
+        )
+
+    def _fields(self) -> tuple[object, ...]:
+        # Some optional fields are only assigned when used.
+        return tuple(
+            [getattr(self, name, NoArg.NO_ARG) for name in _field_names(type(self))]
+        )
+
+    def _children(self) -> Iterator[SqlElement]:
+        pending: list[object] = list(self._fields())
+        while pending:
+            value = pending.pop()
+            if isinstance(value, SqlElement):
+                yield value
+            elif isinstance(value, tuple):
+                pending.extend(value)
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            pass
+        # Hash the children before their parents, without recursion, so that
+        # deep trees do not exhaust the stack. Each hash is cached on its node.
+        stack: list[SqlElement] = [self]
+        while stack:
+            node = stack[-1]
+            pending = [c for c in node._children() if not hasattr(c, "_hash")]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            if not hasattr(node, "_hash"):
+                value = hash((type(node), node._fields()))
+                object.__setattr__(node, "_hash", value)
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, SqlElement):
+            return NotImplemented
+        stack: list[tuple[object, object]] = [(self, other)]
+        while stack:
+            left, right = stack.pop()
+            if left is right:
+                continue
+            if isinstance(left, SqlElement):
+                if type(left) is not type(right) or hash(left) != hash(right):
+                    return False
+                assert isinstance(right, SqlElement)
+                stack.extend(zip(left._fields(), right._fields()))
+            elif isinstance(left, tuple):
+                if not isinstance(right, tuple) or len(left) != len(right):
+                    return False
+                stack.extend(zip(left, right))
+            elif type(left) is not type(right) or left != right:
+                return False
+            elif type(left) is float:
+                assert isinstance(right, float)
+                # 0.0 == -0.0, but they render differently.
+                if math.copysign(1.0, left) != math.copysign(1.0, right):
+                    return False
+        return True
+
     @abstractmethod
     def _create_query(self, buffer: list[str]) -> None:
         pass
 
+    def _create_query_cached(self, buffer: list[str]) -> None:
+        """Like _create_query, but reuses text cached on the node if there is any."""
+        self._create_query(buffer)
+
+    def _parts(self) -> Iterable[QueryPart] | None:
+        """Shallow form of _create_query used by the iterative renderer.
+
+        Returns the strings and child nodes this node renders to, in order,
+        without rendering the children. Nodes that return None are rendered
+        with _create_query instead. Nodes with many children (VALUES rows)
+        may return an iterator, so that streaming renders stay bounded.
+        """
+        return None
+
+
+@functools.cache
+def _field_names(cls: type[SqlElement]) -> tuple[str, ...]:
+    return tuple(
+        name
+        for klass in reversed(cls.__mro__)
+        for name in vars(klass).get("__slots__", ())
+        if name not in _CACHE_SLOTS
+    )
+
+
+def _replaced[T: SqlElement](node: T, **fields: object) -> T:
+    """A copy of node with some of its fields replaced."""
+    copy = object.__new__(type(node))
+    for name in _field_names(type(node)):
+        if name in fields:
+            setattr(copy, name, fields[name])
+        elif hasattr(node, name):
+            setattr(copy, name, getattr(node, name))
+    return copy
+
+
+def comma_separated_parts(elements: Iterable[SqlElement]) -> list[QueryPart]:
+    parts: list[QueryPart] = []
+    for i, element in enumerate(elements):
+        if i > 0:
+            parts.append(", ")
+        parts.append(element)
+    return parts
+
+
+class CompleteSqlQuery(SqlElement, metaclass=SqlElementMeta):
+    # Statements can be weakly referenced, so that data derived from them
+    # (fingerprints) is kept beside the tree instead of in a slot on every
+    # node. __weakref__ does not take part in the instance layout, so
+    # statement mixins still combine, but mypy treats it as any other slot.
+    if TYPE_CHECKING:
+        __slots__ = ()
+    else:
+        __slots__ = ("__weakref__",)
+
+    _query: str
+    # Schema statements keep their literals inline: SQLite does not accept
+    # bind parameters in DDL (e.g. column DEFAULT values).
+    _inline_literals: ClassVar[bool] = False
 
-class CompleteSqlQuery(SqlElement, metaclass=ABCMeta):
     def get_query(self) -> str:
+        try:
+            return self._query
+        except AttributeError:
+            pass
+        observed = hooks.observing_renders
+        start = time.perf_counter() if observed else 0.0
         buffer: list[str] = []
         self._create_query(buffer)
-        return "".join(buffer)
+        query = "".join(buffer)
+        # Bypass the write-once check: concurrent renders store the same string.
+        object.__setattr__(self, "_query", query)
+        if observed:
+            hooks.emit_query_rendered(self, time.perf_counter() - start)
+        return query
+
+    def iter_query(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+        """Yield the query text in chunks of at most chunk_size characters.
+
+        Unlike get_query, the full text is never held in memory at once.
+        """
+        from sqlinpython.render import iter_query
+
+        return iter_query(self, chunk_size)
+
+    def write_query(self, sink: TextSink, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """Stream the query text to sink (e.g. a text file); return its length."""
+        from sqlinpython.render import write_query
+
+        return write_query(self, sink, chunk_size)
+
+    def execute[R](self, db: SupportsExecute[R]) -> R:
+        """Execute the statement on db.
+
+        db is e.g. a sqlinpython.execution.Executor, which returns a cursor,
+        or a sqlinpython.aio.AsyncConnection, which returns an awaitable.
+        """
+        return db.execute(self)
+
+    def stream[R](self, db: SupportsStream[R]) -> R:
+        """Iterate over the rows of the statement on db, fetching in batches.
+
+        Synchronous executors return an iterator, asynchronous connections an
+        async iterator.
+        """
+        return db.stream(self)
+
+    @overload
+    def get_query_and_params(
+        self, paramstyle: Literal["qmark"] = "qmark"
+    ) -> tuple[str, tuple[ParameterValue, ...]]: ...
+    @overload
+    def get_query_and_params(
+        self, paramstyle: Literal["named"]
+    ) -> tuple[str, dict[str, ParameterValue]]: ...
+    def get_query_and_params(
+        self, paramstyle: ParamStyle = "qmark"
+    ) -> tuple[str, tuple[ParameterValue, ...]] | tuple[str, dict[str, ParameterValue]]:
+        """Render the query with its literals replaced by bind parameters.
+
+        Returns the SQL text and the parameters to execute it with: a tuple
+        for ``paramstyle="qmark"`` (``?`` placeholders) or a dict for
+        ``paramstyle="named"`` (``:p1``, ``:p2``, ... placeholders).
+        NULL, TRUE/FALSE and raw NumericLiteral values are kept inline.
+        """
+        if self._inline_literals:
+            query = self.get_query()
+            if paramstyle == "named":
+                return query, {}
+            return query, ()
+        observed = hooks.observing_renders
+        start = time.perf_counter() if observed else 0.0
+        buffer = ParameterBuffer(paramstyle)
+        self._create_query(buffer)
+        buffer.check_explicit_parameters()
+        query = "".join(buffer)
+        if observed:
+            hooks.emit_query_rendered(self, time.perf_counter() - start)
+        if paramstyle == "named":
+            return query, {f"p{i}": v for i, v in enumerate(buffer.params, 1)}
+        return query, tuple(buffer.params)
+
+    @override
+    def _create_query_cached(self, buffer: list[str]) -> None:
+        # Used by clauses to render their prefix, so that statements branched
+        # from a common prefix only render the shared part once.
+        if isinstance(buffer, ParameterBuffer):
+            # The cached text has the literals inline.
+            self._create_query(buffer)
+            return
+        try:
+            buffer.append(self._query)
+            return
+        except AttributeError:
+            pass
+        start = len(buffer)
+        self._create_query(buffer)
+        object.__setattr__(self, "_query", "".join(buffer[start:]))
@@ -4,8 +4,10 @@ from sqlinpython.expression import ColumnName as ColumnName
 from sqlinpython.expression import FunctionName as FunctionName
 from sqlinpython.expression import Star as Star
 from sqlinpython.expression import WindowName as WindowName
+from sqlinpython.expression import and_all as and_all
 from sqlinpython.expression import col as col
 from sqlinpython.expression import literal as literal
+from sqlinpython.expression import or_all as or_all
 from sqlinpython.indexed_column import IndexedColumn as IndexedColumn
 from sqlinpython.name import Name as Name
 from sqlinpython.ordering_term import OrderingTerm as OrderingTerm
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from abc import ABC
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, overload, override
 
-from sqlinpython.base import SqlElement
+from sqlinpython.base import QueryPart, SqlElement
 from sqlinpython.conflict_clause import OnConflict_, OnConflictAction
 from sqlinpython.expression import Expression, ExpressionOrLiteral, Literal, to_expr
 from sqlinpython.name import Name
@@ -17,10 +18,14 @@ if TYPE_CHECKING:
 class ColumnDefinition(SqlElement, ABC):
     """To construct a ColumnDefinition, start from a ColumnDef"""
 
+    __slots__ = ()
+
     pass
 
 
 class IColumnConstraintWithName(SqlElement, ABC):
+    __slots__ = ()
+
     @property
     def PrimaryKey(self) -> ColumnConstraintPrimaryKey:
         return ColumnConstraintPrimaryKey(self)
@@ -87,6 +92,8 @@ class IColumnConstraintWithName(SqlElement, ABC):
 
 
 class IColumnConstraint(ColumnDefinition, IColumnConstraintWithName, ABC):
+    __slots__ = ()
+
     def Constraint(self, name: Name | str) -> ColumnConstraintWithName:
         if isinstance(name, str):
             name = Name(name)
@@ -94,6 +101,8 @@ class IColumnConstraint(ColumnDefinition, IColumnConstraintWithName, ABC):
 
 
 class ConflictClauseAutoIncrement(IColumnConstraint):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement):
         self._prev = prev
 
@@ -102,20 +111,30 @@ class ConflictClauseAutoIncrement(IColumnConstraint):
         self._prev._create_query(buffer)
         buffer.append(" AUTOINCREMENT")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " AUTOINCREMENT")
+
 
 class ConflictClauseMaybeAutoIncrement(OnConflictAction, IColumnConstraint):
+    __slots__ = ()
+
     @property
     def AutoIncrement(self) -> ConflictClauseAutoIncrement:
         return ConflictClauseAutoIncrement(self)
 
 
 class IPrimaryKeyConflict(ConflictClauseMaybeAutoIncrement, ABC):
+    __slots__ = ()
+
     @property
     def OnConflict(self) -> OnConflict_[ConflictClauseMaybeAutoIncrement]:
         return OnConflict_(ConflictClauseMaybeAutoIncrement, self)
 
 
 class ColumnConstraintPrimaryKeyOrdered(IPrimaryKeyConflict):
+    __slots__ = ("_ascending",)
+
     def __init__(self, prev: SqlElement, ascending: bool):
         self._prev = prev
         self._ascending = ascending
@@ -128,8 +147,14 @@ class ColumnConstraintPrimaryKeyOrdered(IPrimaryKeyConflict):
         else:
             buffer.append(" DESC")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ASC" if self._ascending else " DESC")
+
 
 class ColumnConstraintPrimaryKey(IPrimaryKeyConflict):
+    __slots__ = ()
+
     def __init__(self, prev: SqlElement):
         self._prev = prev
 
@@ -146,18 +171,26 @@ class ColumnConstraintPrimaryKey(IPrimaryKeyConflict):
         self._prev._create_query(buffer)
         buffer.append(" PRIMARY KEY")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " PRIMARY KEY")
+
 
 class ConstraintWithClause(OnConflictAction, IColumnConstraint, ABC):
-    pass
+    __slots__ = ()
 
 
 class IConflictClause(ConstraintWithClause, ABC):
+    __slots__ = ()
+
     @property
     def OnConflict(self) -> OnConflict_[ConstraintWithClause]:
         return OnConflict_(ConstraintWithClause, self)
 
 
 class WithNotNull(IConflictClause):
+    __slots__ = ()
+
     def __init__(self, prev: SqlElement):
         self._prev = prev
 
@@ -166,8 +199,14 @@ class WithNotNull(IConflictClause):
         self._prev._create_query(buffer)
         buffer.append(" NOT NULL")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " NOT NULL")
+
 
 class WithUnique(IConflictClause):
+    __slots__ = ()
+
     def __init__(self, prev: SqlElement):
         self._prev = prev
 
@@ -176,8 +215,14 @@ class WithUnique(IConflictClause):
         self._prev._create_query(buffer)
         buffer.append(" UNIQUE")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " UNIQUE")
+
 
 class WithCheck(IColumnConstraint):
+    __slots__ = ("_prev", "_check_expression")
+
     def __init__(self, prev: SqlElement, check_expression: Expression):
         self._prev = prev
         self._check_expression = check_expression
@@ -189,8 +234,14 @@ class WithCheck(IColumnConstraint):
         self._check_expression._create_query(buffer)
         buffer.append(")")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " CHECK (", self._check_expression, ")")
+
 
 class WithDefault(IColumnConstraint):
+    __slots__ = ("_prev", "_default_value", "_explicit_sign", "_force_parenthesis")
+
     def __init__(
         self,
         prev: SqlElement,
@@ -222,8 +273,27 @@ class WithDefault(IColumnConstraint):
         else:
             self._default_value._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        if isinstance(self._default_value, int):
+            val = (
+                f"{self._default_value:+}"
+                if self._explicit_sign
+                else str(self._default_value)
+            )
+            return (
+                self._prev,
+                " DEFAULT ",
+                f"({val})" if self._force_parenthesis else val,
+            )
+        if self._force_parenthesis or not isinstance(self._default_value, Literal):
+            return (self._prev, " DEFAULT (", self._default_value, ")")
+        return (self._prev, " DEFAULT ", self._default_value)
+
 
 class WithCollate(IColumnConstraint):
+    __slots__ = ("_prev", "_collation_name")
+
     def __init__(self, prev: SqlElement, collation_name: Name):
         self._prev = prev
         self._collation_name = collation_name
@@ -234,8 +304,14 @@ class WithCollate(IColumnConstraint):
         buffer.append(" COLLATE ")
         self._collation_name._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " COLLATE ", self._collation_name)
+
 
 class GeneratedAlwaysAsHow(IColumnConstraint):
+    __slots__ = ("_prev", "_how")
+
     def __init__(self, prev: SqlElement, how: str):
         self._prev = prev
         self._how = how
@@ -245,8 +321,14 @@ class GeneratedAlwaysAsHow(IColumnConstraint):
         self._prev._create_query(buffer)
         buffer.append(f" {self._how}")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, f" {self._how}")
+
 
 class GeneratedAlwaysAs(IColumnConstraint):
+    __slots__ = ("_prev", "_expression")
+
     def __init__(self, prev: SqlElement, expression: Expression):
         self._prev = prev
         self._expression = expression
@@ -266,8 +348,14 @@ class GeneratedAlwaysAs(IColumnConstraint):
         self._expression._create_query(buffer)
         buffer.append(")")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " AS (", self._expression, ")")
+
 
 class WithGeneratedAlways(SqlElement):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement):
         self._prev = prev
 
@@ -279,8 +367,14 @@ class WithGeneratedAlways(SqlElement):
         self._prev._create_query(buffer)
         buffer.append(" GENERATED ALWAYS")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " GENERATED ALWAYS")
+
 
 class ColumnConstraintWithName(IColumnConstraintWithName):
+    __slots__ = ("_prev", "_name")
+
     def __init__(self, prev: SqlElement, name: Name):
         self._prev = prev
         self._name = name
@@ -291,8 +385,14 @@ class ColumnConstraintWithName(IColumnConstraintWithName):
         buffer.append(" CONSTRAINT ")
         self._name._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " CONSTRAINT ", self._name)
+
 
 class ColumnNameWithType(IColumnConstraint):
+    __slots__ = ("_prev", "_type_name")
+
     def __init__(self, prev: SqlElement, type_name: CompleteTypeName):
         self._prev = prev
         self._type_name = type_name
@@ -303,10 +403,16 @@ class ColumnNameWithType(IColumnConstraint):
         buffer.append(" ")
         self._type_name._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ", self._type_name)
+
 
 class ColumnDef(IColumnConstraint):
     """DDL entry point for a column definition: ColumnDef('a')(TypeName('INT'))."""
 
+    __slots__ = ("_name",)
+
     def __init__(self, name: Name | str, /) -> None:
         if isinstance(name, str):
             name = Name(name)
@@ -318,3 +424,7 @@ class ColumnDef(IColumnConstraint):
     @override
     def _create_query(self, buffer: list[str]) -> None:
         self._name._create_query(buffer)
+
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._name,)
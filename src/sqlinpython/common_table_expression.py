@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 from abc import ABC
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, override
 
-from sqlinpython.base import SqlElement, comma_separated
+from sqlinpython.base import (
+    QueryPart,
+    SqlElement,
+    comma_separated,
+    comma_separated_parts,
+)
 from sqlinpython.insert import InsertKeyword, ReplaceKeyword
 from sqlinpython.name import Name
 from sqlinpython.select_base import Complete, SelectStatement
@@ -16,10 +22,12 @@ if TYPE_CHECKING:
 
 # SPEC: https://sqlite.org/syntax/common-table-expression.html
 class CommonTableExpression(SqlElement, ABC):
-    pass
+    __slots__ = ()
 
 
 class CteWithSelectStmt(CommonTableExpression):
+    __slots__ = ("_prev", "_select_stmt")
+
     def __init__(self, prev: SqlElement, select_stmt: SelectStatement) -> None:
         self._prev = prev
         self._select_stmt = select_stmt
@@ -31,8 +39,14 @@ class CteWithSelectStmt(CommonTableExpression):
         self._select_stmt._create_query(buffer)
         buffer.append(")")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " (", self._select_stmt, ")")
+
 
 class Materialized_(SqlElement):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement) -> None:
         self._prev = prev
 
@@ -44,8 +58,14 @@ class Materialized_(SqlElement):
         self._prev._create_query(buffer)
         buffer.append(" MATERIALIZED")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " MATERIALIZED")
+
 
 class CteNot_(SqlElement):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement) -> None:
         self._prev = prev
 
@@ -58,8 +78,14 @@ class CteNot_(SqlElement):
         self._prev._create_query(buffer)
         buffer.append(" NOT")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " NOT")
+
 
 class As_(Materialized_):
+    __slots__ = ()
+
     def __init__(self, prev: SqlElement) -> None:
         self._prev = prev
 
@@ -76,16 +102,26 @@ class As_(Materialized_):
         self._prev._create_query(buffer)
         buffer.append(" AS")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " AS")
 
-class CteTableNameWithColumns(SqlElement):
-    def __init__(self, prev: SqlElement, column_names: tuple[Name, ...]) -> None:
-        self._prev = prev
-        self._column_names = column_names
+
+class ICteTableName(SqlElement, ABC):
+    __slots__ = ()
 
     @property
     def As(self) -> As_:
         return As_(self)
 
+
+class CteTableNameWithColumns(ICteTableName):
+    __slots__ = ("_prev", "_column_names")
+
+    def __init__(self, prev: SqlElement, column_names: tuple[Name, ...]) -> None:
+        self._prev = prev
+        self._column_names = column_names
+
     @override
     def _create_query(self, buffer: list[str]) -> None:
         self._prev._create_query(buffer)
@@ -93,8 +129,14 @@ class CteTableNameWithColumns(SqlElement):
         comma_separated(buffer, self._column_names)
         buffer.append(")")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, "(", *comma_separated_parts(self._column_names), ")")
+
+
+class TableName(Name, ICteTableName):
+    __slots__ = ()
 
-class TableName(Name, CteTableNameWithColumns):
     def __call__(
         self, column_name: Name | str, *more_column_names: Name | str
     ) -> CteTableNameWithColumns:
@@ -103,8 +145,15 @@ class TableName(Name, CteTableNameWithColumns):
         return CteTableNameWithColumns(self, names)
 
 
+# TableName cannot inherit CteTableNameWithColumns, whose slots would
+# conflict with Name's, but isinstance checks against it keep working.
+CteTableNameWithColumns.register(TableName)
+
+
 # SPEC: https://sqlite.org/lang_insert.html (WITH clause portion)
 class WithClause(SqlElement):
+    __slots__ = ("_prev", "_ctes")
+
     def __init__(
         self, prev: SqlElement, ctes: tuple[CommonTableExpression, ...]
     ) -> None:
@@ -149,8 +198,14 @@ class WithClause(SqlElement):
         buffer.append(" ")
         comma_separated(buffer, self._ctes)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ", *comma_separated_parts(self._ctes))
+
 
 class IWithCall(SqlElement, ABC):
+    __slots__ = ()
+
     def __call__(
         self, *ctes: *tuple[CommonTableExpression, *tuple[CommonTableExpression, ...]]
     ) -> WithClause:
@@ -158,6 +213,8 @@ class IWithCall(SqlElement, ABC):
 
 
 class WithRecursive(IWithCall):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement) -> None:
         self._prev = prev
 
@@ -166,8 +223,14 @@ class WithRecursive(IWithCall):
         self._prev._create_query(buffer)
         buffer.append(" RECURSIVE")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " RECURSIVE")
+
 
 class WithKeyword(IWithCall):
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
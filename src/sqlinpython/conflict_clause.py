@@ -1,9 +1,12 @@
+from collections.abc import Sequence
 from typing import override
 
-from sqlinpython.base import SqlElement
+from sqlinpython.base import QueryPart, SqlElement
 
 
 class OnConflict_[T: OnConflictAction](SqlElement):
+    __slots__ = ("_t", "_prev")
+
     def __init__(self, t: type[T], prev: SqlElement):
         self._t = t
         self._prev = prev
@@ -13,6 +16,10 @@ class OnConflict_[T: OnConflictAction](SqlElement):
         self._prev._create_query(buffer)
         buffer.append(" ON CONFLICT")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ON CONFLICT")
+
     @property
     def Rollback(self) -> T:
         return self._t(self, "ROLLBACK")
@@ -35,6 +42,8 @@ class OnConflict_[T: OnConflictAction](SqlElement):
 
 
 class OnConflictAction(SqlElement):
+    __slots__ = ("_prev", "_action")
+
     def __init__(self, prev: SqlElement, action: str):
         self._prev = prev
         self._action = action
@@ -43,3 +52,7 @@ class OnConflictAction(SqlElement):
     def _create_query(self, buffer: list[str]) -> None:
         self._prev._create_query(buffer)
         buffer.append(f" {self._action}")
+
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, f" {self._action}")
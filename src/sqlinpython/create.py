@@ -1,8 +1,9 @@
 import typing
 from abc import ABC
+from collections.abc import Sequence
 from typing import override
 
-from sqlinpython.base import SqlElement
+from sqlinpython.base import QueryPart, SqlElement
 from sqlinpython.create_index import CreateIndex
 from sqlinpython.create_table import CreateTable
 from sqlinpython.create_trigger import CreateTrigger
@@ -16,12 +17,16 @@ from sqlinpython.create_vtable import CreateVirtualTable
 
 
 class ICreateUnique(SqlElement, ABC):
+    __slots__ = ()
+
     @property
     def Index(self) -> CreateIndex:
         return CreateIndex(self)
 
 
 class CreateUnique(ICreateUnique):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement):
         self._prev = prev
 
@@ -30,8 +35,14 @@ class CreateUnique(ICreateUnique):
         self._prev._create_query(buffer)
         buffer.append(" UNIQUE")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " UNIQUE")
+
 
 class ICreateTemp(SqlElement, ABC):
+    __slots__ = ()
+
     @property
     def Table(self) -> CreateTable:
         return CreateTable(self)
@@ -46,6 +57,8 @@ class ICreateTemp(SqlElement, ABC):
 
 
 class CreateTempTable(ICreateTemp):
+    __slots__ = ("_prev", "_how")
+
     def __init__(self, prev: SqlElement, how: typing.Literal["TEMPORARY", "TEMP"]):
         self._prev = prev
         self._how = how
@@ -55,8 +68,14 @@ class CreateTempTable(ICreateTemp):
         self._prev._create_query(buffer)
         buffer.append(f" {self._how}")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, f" {self._how}")
+
 
 class CreateKeyword(ICreateTemp, ICreateUnique):
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
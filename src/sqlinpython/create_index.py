@@ -1,9 +1,16 @@
 from __future__ import annotations
 
 from abc import ABC
+from collections.abc import Sequence
 from typing import override
 
-from sqlinpython.base import CompleteSqlQuery, SqlElement, comma_separated
+from sqlinpython.base import (
+    CompleteSqlQuery,
+    QueryPart,
+    SqlElement,
+    comma_separated,
+    comma_separated_parts,
+)
 from sqlinpython.expression import Expression, ExpressionOrLiteral, to_expr
 from sqlinpython.indexed_column import IndexedColumn
 from sqlinpython.name import Name
@@ -12,10 +19,14 @@ from sqlinpython.name import Name
 
 
 class CreateIndexStatement(CompleteSqlQuery, ABC):
-    pass
+    __slots__ = ()
+
+    _inline_literals = True
 
 
 class CreateIndexWithWhere(CreateIndexStatement):
+    __slots__ = ("_prev", "_expr")
+
     def __init__(self, prev: SqlElement, expr: Expression):
         self._prev = prev
         self._expr = expr
@@ -26,8 +37,14 @@ class CreateIndexWithWhere(CreateIndexStatement):
         buffer.append(" WHERE ")
         self._expr._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " WHERE ", self._expr)
+
 
 class CreateIndexOnTable(CreateIndexStatement):
+    __slots__ = ("_prev", "_table", "_columns")
+
     def __init__(
         self,
         prev: SqlElement,
@@ -50,8 +67,21 @@ class CreateIndexOnTable(CreateIndexStatement):
         comma_separated(buffer, self._columns)
         buffer.append(")")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (
+            self._prev,
+            " ON ",
+            self._table,
+            " (",
+            *comma_separated_parts(self._columns),
+            ")",
+        )
+
 
 class CreateIndexWithName(SqlElement):
+    __slots__ = ("_prev", "_schema", "_index")
+
     def __init__(self, prev: SqlElement, schema: Name, index: Name | None):
         self._prev = prev
         self._schema = schema
@@ -75,8 +105,17 @@ class CreateIndexWithName(SqlElement):
             buffer.append(".")
             self._index._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        parts: list[QueryPart] = [self._prev, " ", self._schema]
+        if self._index is not None:
+            parts.extend((".", self._index))
+        return parts
+
 
 class ICallableCreateIndex(SqlElement, ABC):
+    __slots__ = ()
+
     def __call__(
         self, schema: str | Name, index: str | Name | None = None, /
     ) -> CreateIndexWithName:
@@ -88,6 +127,8 @@ class ICallableCreateIndex(SqlElement, ABC):
 
 
 class CreateIndexIfNotExists(ICallableCreateIndex):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement):
         self._prev = prev
 
@@ -96,8 +137,14 @@ class CreateIndexIfNotExists(ICallableCreateIndex):
         self._prev._create_query(buffer)
         buffer.append(" IF NOT EXISTS")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " IF NOT EXISTS")
+
 
 class CreateIndex(ICallableCreateIndex):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement):
         self._prev = prev
 
@@ -109,3 +156,7 @@ class CreateIndex(ICallableCreateIndex):
     def _create_query(self, buffer: list[str]) -> None:
         self._prev._create_query(buffer)
         buffer.append(" INDEX")
+
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " INDEX")
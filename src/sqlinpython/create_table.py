@@ -2,9 +2,16 @@ from __future__ import annotations
 
 import typing
 from abc import ABC
+from collections.abc import Sequence
 from typing import override
 
-from sqlinpython.base import CompleteSqlQuery, SqlElement, comma_separated
+from sqlinpython.base import (
+    CompleteSqlQuery,
+    QueryPart,
+    SqlElement,
+    comma_separated,
+    comma_separated_parts,
+)
 from sqlinpython.column_definition import ColumnDefinition
 from sqlinpython.name import Name
 from sqlinpython.select_base import SelectStatement
@@ -13,10 +20,14 @@ from sqlinpython.table_constraint import TableConstraint
 
 # SPEC: https://sqlite.org/syntax/create-table-stmt.html
 class CreateTableStatement(CompleteSqlQuery, ABC):
-    pass
+    __slots__ = ()
+
+    _inline_literals = True
 
 
 class CreateTableAs(CreateTableStatement):
+    __slots__ = ("_prev", "_select_stmt")
+
     def __init__(self, prev: SqlElement, select_stmt: SelectStatement):
         self._prev = prev
         self._select_stmt = select_stmt
@@ -27,8 +38,14 @@ class CreateTableAs(CreateTableStatement):
         buffer.append(" AS ")
         self._select_stmt._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " AS ", self._select_stmt)
+
 
 class ITableOptions(CreateTableStatement, ABC):
+    __slots__ = ()
+
     @property
     def WithoutRowId(self) -> CreateTableWithOptions:
         return CreateTableWithOptions(self, "WITHOUT ROWID")
@@ -39,6 +56,8 @@ class ITableOptions(CreateTableStatement, ABC):
 
 
 class CreateTableWithOptions(ITableOptions):
+    __slots__ = ("_prev", "_option")
+
     def __init__(
         self, prev: SqlElement, option: typing.Literal["WITHOUT ROWID", "STRICT"]
     ):
@@ -52,8 +71,18 @@ class CreateTableWithOptions(ITableOptions):
             buffer.append(",")
         buffer.append(f" {self._option}")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        parts: list[QueryPart] = [self._prev]
+        if isinstance(self._prev, CreateTableWithOptions):
+            parts.append(",")
+        parts.append(f" {self._option}")
+        return parts
+
 
 class CreateTableWithDefinitions(ITableOptions):
+    __slots__ = ("_prev", "_args")
+
     def __init__(
         self, prev: SqlElement, args: tuple[ColumnDefinition | TableConstraint, ...]
     ):
@@ -67,8 +96,14 @@ class CreateTableWithDefinitions(ITableOptions):
         comma_separated(buffer, self._args)
         buffer.append(")")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " (", *comma_separated_parts(self._args), ")")
+
 
 class CreateTableWithName(SqlElement):
+    __slots__ = ("_prev", "_schema", "_table")
+
     def __init__(self, prev: SqlElement, schema: Name, table: Name | None):
         self._prev = prev
         self._schema = schema
@@ -102,8 +137,17 @@ class CreateTableWithName(SqlElement):
             buffer.append(".")
             self._table._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        parts: list[QueryPart] = [self._prev, " ", self._schema]
+        if self._table is not None:
+            parts.extend((".", self._table))
+        return parts
+
 
 class CreateTableIfNotExists(SqlElement):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement):
         self._prev = prev
 
@@ -121,8 +165,14 @@ class CreateTableIfNotExists(SqlElement):
         self._prev._create_query(buffer)
         buffer.append(" IF NOT EXISTS")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " IF NOT EXISTS")
+
 
 class CreateTable(CreateTableIfNotExists):
+    __slots__ = ()
+
     def __init__(self, prev: SqlElement):
         self._prev = prev
 
@@ -134,3 +184,7 @@ class CreateTable(CreateTableIfNotExists):
     def _create_query(self, buffer: list[str]) -> None:
         self._prev._create_query(buffer)
         buffer.append(" TABLE")
+
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " TABLE")
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
 from abc import ABC
+from collections.abc import Sequence
 from typing import Literal, override
 
-from sqlinpython.base import CompleteSqlQuery, SqlElement, comma_separated
+from sqlinpython.base import (
+    CompleteSqlQuery,
+    QueryPart,
+    SqlElement,
+    comma_separated,
+    comma_separated_parts,
+)
 from sqlinpython.delete import DeleteStatement
 from sqlinpython.expression import Expression, ExpressionOrLiteral, to_expr
 from sqlinpython.insert import InsertStatement
@@ -17,10 +24,14 @@ TriggerBodyStmt = UpdateStatement | InsertStatement | DeleteStatement | SelectSt
 
 
 class CreateTriggerStatement(CompleteSqlQuery, ABC):
-    pass
+    __slots__ = ()
+
+    _inline_literals = True
 
 
 class CreateTriggerEnd(CreateTriggerStatement):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement) -> None:
         self._prev = prev
 
@@ -29,8 +40,14 @@ class CreateTriggerEnd(CreateTriggerStatement):
         self._prev._create_query(buffer)
         buffer.append("END")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, "END")
+
 
 class IBeforeBegin(SqlElement, ABC):
+    __slots__ = ()
+
     def Begin(
         self, *stmts: *tuple[TriggerBodyStmt, *tuple[TriggerBodyStmt, ...]]
     ) -> CreateTriggerBegin:
@@ -38,6 +55,8 @@ class IBeforeBegin(SqlElement, ABC):
 
 
 class CreateTriggerBegin(SqlElement):
+    __slots__ = ("_prev", "_stmts")
+
     def __init__(self, prev: SqlElement, stmts: tuple[TriggerBodyStmt, ...]) -> None:
         self._prev = prev
         self._stmts = stmts
@@ -54,8 +73,17 @@ class CreateTriggerBegin(SqlElement):
             stmt._create_query(buffer)
             buffer.append("; ")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        parts: list[QueryPart] = [self._prev, " BEGIN "]
+        for stmt in self._stmts:
+            parts.extend((stmt, "; "))
+        return parts
+
 
 class CreateTriggerWhen(IBeforeBegin):
+    __slots__ = ("_prev", "_expr")
+
     def __init__(self, prev: SqlElement, expr: Expression) -> None:
         self._prev = prev
         self._expr = expr
@@ -66,13 +94,21 @@ class CreateTriggerWhen(IBeforeBegin):
         buffer.append(" WHEN ")
         self._expr._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " WHEN ", self._expr)
+
 
 class IWithWhen(IBeforeBegin, ABC):
+    __slots__ = ()
+
     def When(self, expr: ExpressionOrLiteral) -> CreateTriggerWhen:
         return CreateTriggerWhen(self, to_expr(expr))
 
 
 class CreateTriggerForEachRow(IWithWhen):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement) -> None:
         self._prev = prev
 
@@ -81,8 +117,14 @@ class CreateTriggerForEachRow(IWithWhen):
         self._prev._create_query(buffer)
         buffer.append(" FOR EACH ROW")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " FOR EACH ROW")
+
 
 class CreateTriggerOnTable(IWithWhen):
+    __slots__ = ("_prev", "_table")
+
     def __init__(self, prev: SqlElement, table: Name) -> None:
         self._prev = prev
         self._table = table
@@ -97,8 +139,14 @@ class CreateTriggerOnTable(IWithWhen):
         buffer.append(" ON ")
         self._table._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ON ", self._table)
+
 
 class IBeforeOnTable(SqlElement, ABC):
+    __slots__ = ()
+
     def On(self, table: Name | str, /) -> CreateTriggerOnTable:
         if isinstance(table, str):
             table = Name(table)
@@ -106,6 +154,8 @@ class IBeforeOnTable(SqlElement, ABC):
 
 
 class CreateTriggerUpdateOf(IBeforeOnTable):
+    __slots__ = ("_prev", "_columns")
+
     def __init__(self, prev: SqlElement, columns: tuple[Name, ...]) -> None:
         self._prev = prev
         self._columns = columns
@@ -116,8 +166,14 @@ class CreateTriggerUpdateOf(IBeforeOnTable):
         buffer.append(" OF ")
         comma_separated(buffer, self._columns)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " OF ", *comma_separated_parts(self._columns))
+
 
 class CreateTriggerUpdate(IBeforeOnTable):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement) -> None:
         self._prev = prev
 
@@ -132,8 +188,14 @@ class CreateTriggerUpdate(IBeforeOnTable):
         self._prev._create_query(buffer)
         buffer.append(" UPDATE")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " UPDATE")
+
 
 class CreateTriggerEvent(IBeforeOnTable):
+    __slots__ = ("_prev", "_event")
+
     def __init__(self, prev: SqlElement, event: Literal["DELETE", "INSERT"]) -> None:
         self._prev = prev
         self._event = event
@@ -143,8 +205,14 @@ class CreateTriggerEvent(IBeforeOnTable):
         self._prev._create_query(buffer)
         buffer.append(f" {self._event}")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, f" {self._event}")
+
 
 class IEventClause(SqlElement, ABC):
+    __slots__ = ()
+
     @property
     def Delete(self) -> CreateTriggerEvent:
         return CreateTriggerEvent(self, "DELETE")
@@ -159,6 +227,8 @@ class IEventClause(SqlElement, ABC):
 
 
 class CreateTriggerTiming(IEventClause):
+    __slots__ = ("_prev", "_timing")
+
     def __init__(
         self, prev: SqlElement, timing: Literal["BEFORE", "AFTER", "INSTEAD OF"]
     ) -> None:
@@ -170,8 +240,14 @@ class CreateTriggerTiming(IEventClause):
         self._prev._create_query(buffer)
         buffer.append(f" {self._timing}")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, f" {self._timing}")
+
 
 class CreateTriggerWithName(IEventClause):
+    __slots__ = ("_prev", "_schema", "_name")
+
     def __init__(self, prev: SqlElement, schema: Name, name: Name | None) -> None:
         self._prev = prev
         self._schema = schema
@@ -198,8 +274,17 @@ class CreateTriggerWithName(IEventClause):
             buffer.append(".")
             self._name._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        parts: list[QueryPart] = [self._prev, " ", self._schema]
+        if self._name is not None:
+            parts.extend((".", self._name))
+        return parts
+
 
 class CreateTriggerIfNotExists(SqlElement):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement) -> None:
         self._prev = prev
 
@@ -217,8 +302,14 @@ class CreateTriggerIfNotExists(SqlElement):
         self._prev._create_query(buffer)
         buffer.append(" IF NOT EXISTS")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " IF NOT EXISTS")
+
 
 class CreateTrigger(CreateTriggerIfNotExists):
+    __slots__ = ()
+
     def __init__(self, prev: SqlElement) -> None:
         self._prev = prev
 
@@ -230,3 +321,7 @@ class CreateTrigger(CreateTriggerIfNotExists):
     def _create_query(self, buffer: list[str]) -> None:
         self._prev._create_query(buffer)
         buffer.append(" TRIGGER")
+
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " TRIGGER")
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
 from abc import ABC
+from collections.abc import Sequence
 from typing import override
 
-from sqlinpython.base import CompleteSqlQuery, SqlElement, comma_separated
+from sqlinpython.base import (
+    CompleteSqlQuery,
+    QueryPart,
+    SqlElement,
+    comma_separated,
+    comma_separated_parts,
+)
 from sqlinpython.name import Name
 from sqlinpython.select_base import SelectStatement
 
@@ -11,10 +18,14 @@ from sqlinpython.select_base import SelectStatement
 
 
 class CreateViewStatement(CompleteSqlQuery, ABC):
-    pass
+    __slots__ = ()
+
+    _inline_literals = True
 
 
 class CreateViewAs(CreateViewStatement):
+    __slots__ = ("_prev", "_select_stmt")
+
     def __init__(self, prev: SqlElement, select_stmt: SelectStatement):
         self._prev = prev
         self._select_stmt = select_stmt
@@ -25,13 +36,21 @@ class CreateViewAs(CreateViewStatement):
         buffer.append(" AS ")
         self._select_stmt._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " AS ", self._select_stmt)
+
 
 class IHasAs(SqlElement, ABC):
+    __slots__ = ()
+
     def As(self, select_stmt: SelectStatement) -> CreateViewAs:
         return CreateViewAs(self, select_stmt)
 
 
 class CreateViewWithColumns(IHasAs):
+    __slots__ = ("_prev", "_columns")
+
     def __init__(self, prev: SqlElement, columns: tuple[Name, ...]):
         self._prev = prev
         self._columns = columns
@@ -43,8 +62,14 @@ class CreateViewWithColumns(IHasAs):
         comma_separated(buffer, self._columns)
         buffer.append(")")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " (", *comma_separated_parts(self._columns), ")")
+
 
 class CreateViewWithName(IHasAs):
+    __slots__ = ("_prev", "_schema", "_view")
+
     def __init__(self, prev: SqlElement, schema: Name, view: Name | None):
         self._prev = prev
         self._schema = schema
@@ -66,8 +91,17 @@ class CreateViewWithName(IHasAs):
             buffer.append(".")
             self._view._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        parts: list[QueryPart] = [self._prev, " ", self._schema]
+        if self._view is not None:
+            parts.extend((".", self._view))
+        return parts
+
 
 class ICallableCreateView(SqlElement, ABC):
+    __slots__ = ()
+
     def __call__(
         self, schema: str | Name, view: str | Name | None = None, /
     ) -> CreateViewWithName:
@@ -79,6 +113,8 @@ class ICallableCreateView(SqlElement, ABC):
 
 
 class CreateViewIfNotExists(ICallableCreateView):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement):
         self._prev = prev
 
@@ -87,8 +123,14 @@ class CreateViewIfNotExists(ICallableCreateView):
         self._prev._create_query(buffer)
         buffer.append(" IF NOT EXISTS")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " IF NOT EXISTS")
+
 
 class CreateView(ICallableCreateView):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement):
         self._prev = prev
 
@@ -100,3 +142,7 @@ class CreateView(ICallableCreateView):
     def _create_query(self, buffer: list[str]) -> None:
         self._prev._create_query(buffer)
         buffer.append(" VIEW")
+
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " VIEW")
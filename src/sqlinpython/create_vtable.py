@@ -1,19 +1,24 @@
 from __future__ import annotations
 
 from abc import ABC
+from collections.abc import Sequence
 from typing import override
 
-from sqlinpython.base import CompleteSqlQuery, SqlElement
+from sqlinpython.base import CompleteSqlQuery, QueryPart, SqlElement
 from sqlinpython.name import Name
 
 # SPEC: https://sqlite.org/lang_createvtab.html
 
 
 class CreateVirtualTableStatement(CompleteSqlQuery, ABC):
-    pass
+    __slots__ = ()
+
+    _inline_literals = True
 
 
 class CreateVirtualTableWithArgs(CreateVirtualTableStatement):
+    __slots__ = ("_prev", "_args")
+
     def __init__(self, prev: SqlElement, args: tuple[str, ...]):
         self._prev = prev
         self._args = args
@@ -28,8 +33,14 @@ class CreateVirtualTableWithArgs(CreateVirtualTableStatement):
             buffer.append(arg)
         buffer.append(")")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, "(", ", ".join(self._args), ")")
+
 
 class CreateVirtualTableUsing(CreateVirtualTableStatement):
+    __slots__ = ("_prev", "_module")
+
     def __init__(self, prev: SqlElement, module: Name):
         self._prev = prev
         self._module = module
@@ -43,8 +54,14 @@ class CreateVirtualTableUsing(CreateVirtualTableStatement):
         buffer.append(" USING ")
         self._module._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " USING ", self._module)
+
 
 class CreateVirtualTableWithName(SqlElement):
+    __slots__ = ("_prev", "_schema", "_table")
+
     def __init__(self, prev: SqlElement, schema: Name, table: Name | None):
         self._prev = prev
         self._schema = schema
@@ -64,8 +81,17 @@ class CreateVirtualTableWithName(SqlElement):
             buffer.append(".")
             self._table._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        parts: list[QueryPart] = [self._prev, " ", self._schema]
+        if self._table is not None:
+            parts.extend((".", self._table))
+        return parts
+
 
 class CreateVirtualTableIfNotExists(SqlElement):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement):
         self._prev = prev
 
@@ -83,8 +109,14 @@ class CreateVirtualTableIfNotExists(SqlElement):
         self._prev._create_query(buffer)
         buffer.append(" IF NOT EXISTS")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " IF NOT EXISTS")
+
 
 class CreateVirtualTable(CreateVirtualTableIfNotExists):
+    __slots__ = ()
+
     def __init__(self, prev: SqlElement):
         self._prev = prev
 
@@ -96,3 +128,7 @@ class CreateVirtualTable(CreateVirtualTableIfNotExists):
     def _create_query(self, buffer: list[str]) -> None:
         self._prev._create_query(buffer)
         buffer.append(" VIRTUAL TABLE")
+
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " VIRTUAL TABLE")
@@ -2,9 +2,17 @@ from __future__ import annotations
 
 import typing
 from abc import ABC
+from collections.abc import Sequence
 from typing import override
 
-from sqlinpython.base import CompleteSqlQuery, NoArg, SqlElement, comma_separated
+from sqlinpython.base import (
+    CompleteSqlQuery,
+    NoArg,
+    QueryPart,
+    SqlElement,
+    comma_separated,
+    comma_separated_parts,
+)
 from sqlinpython.expression import (
     AliasedExpression,
     Expression,
@@ -31,12 +39,16 @@ from sqlinpython.returning import ReturningBase
 class DeleteStatementLimited(CompleteSqlQuery, ABC):
     """Base for delete-stmt-limited (ORDER BY / LIMIT requires SQLITE_ENABLE_UPDATE_DELETE_LIMIT)."""
 
+    __slots__ = ()
+
     pass
 
 
 class DeleteStatement(DeleteStatementLimited, ABC):
     """Base for delete-stmt (no ORDER BY / LIMIT; no compile-time flag needed)."""
 
+    __slots__ = ()
+
     pass
 
 
@@ -46,6 +58,8 @@ class DeleteStatement(DeleteStatementLimited, ABC):
 
 
 class DeleteLimitOffset(DeleteStatementLimited):
+    __slots__ = ("_prev", "_offset")
+
     def __init__(self, prev: SqlElement, offset: Expression) -> None:
         self._prev = prev
         self._offset = offset
@@ -56,8 +70,14 @@ class DeleteLimitOffset(DeleteStatementLimited):
         buffer.append(" OFFSET ")
         self._offset._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " OFFSET ", self._offset)
+
 
 class DeleteLimitComma(DeleteStatementLimited):
+    __slots__ = ("_prev", "_limit", "_offset")
+
     def __init__(self, prev: SqlElement, limit: Expression, offset: Expression) -> None:
         self._prev = prev
         self._limit = limit
@@ -71,8 +91,14 @@ class DeleteLimitComma(DeleteStatementLimited):
         buffer.append(", ")
         self._offset._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " LIMIT ", self._limit, ", ", self._offset)
+
 
 class DeleteLimit(DeleteStatementLimited):
+    __slots__ = ("_prev", "_limit")
+
     def __init__(self, prev: SqlElement, limit: Expression) -> None:
         self._prev = prev
         self._limit = limit
@@ -86,8 +112,14 @@ class DeleteLimit(DeleteStatementLimited):
         buffer.append(" LIMIT ")
         self._limit._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " LIMIT ", self._limit)
+
 
 class IDeleteLimit(SqlElement, ABC):
+    __slots__ = ()
+
     @typing.overload
     def Limit(self, expr: ExpressionOrLiteral) -> DeleteLimit: ...
     @typing.overload
@@ -105,6 +137,8 @@ class IDeleteLimit(SqlElement, ABC):
 
 
 class DeleteOrderBy(DeleteStatementLimited, IDeleteLimit):
+    __slots__ = ("_prev", "_terms")
+
     def __init__(self, prev: SqlElement, terms: tuple[OrderingTerm, ...]) -> None:
         self._prev = prev
         self._terms = terms
@@ -115,8 +149,14 @@ class DeleteOrderBy(DeleteStatementLimited, IDeleteLimit):
         buffer.append(" ORDER BY ")
         comma_separated(buffer, self._terms)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ORDER BY ", *comma_separated_parts(self._terms))
+
 
 class IDeleteOrderBy(IDeleteLimit, ABC):
+    __slots__ = ()
+
     def OrderBy(
         self, *terms: *tuple[OrderingTerm, *tuple[OrderingTerm, ...]]
     ) -> DeleteOrderBy:
@@ -129,10 +169,12 @@ class IDeleteOrderBy(IDeleteLimit, ABC):
 
 
 class DeleteReturning(DeleteStatement, IDeleteOrderBy, ReturningBase):
-    pass
+    __slots__ = ()
 
 
 class IBeforeReturningClause(DeleteStatement, IDeleteOrderBy, ABC):
+    __slots__ = ()
+
     def Returning(
         self,
         *args: typing.Literal["*"] | Expression | AliasedExpression | Star_,
@@ -142,6 +184,8 @@ class IBeforeReturningClause(DeleteStatement, IDeleteOrderBy, ABC):
 
 
 class DeleteWhere(IBeforeReturningClause):
+    __slots__ = ("_prev", "_condition")
+
     def __init__(self, prev: SqlElement, condition: Expression) -> None:
         self._prev = prev
         self._condition = condition
@@ -152,13 +196,21 @@ class DeleteWhere(IBeforeReturningClause):
         buffer.append(" WHERE ")
         self._condition._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " WHERE ", self._condition)
+
 
 class IBeforeWhereClause(IBeforeReturningClause, ABC):
+    __slots__ = ()
+
     def Where(self, condition: ExpressionOrLiteral) -> DeleteWhere:
         return DeleteWhere(self, to_expr(condition))
 
 
 class DeleteFromNotIndexed(IBeforeWhereClause):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement) -> None:
         self._prev = prev
 
@@ -167,8 +219,14 @@ class DeleteFromNotIndexed(IBeforeWhereClause):
         self._prev._create_query(buffer)
         buffer.append(" NOT INDEXED")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " NOT INDEXED")
+
 
 class DeleteFromIndexedBy(IBeforeWhereClause):
+    __slots__ = ("_prev", "_index_name")
+
     def __init__(self, prev: SqlElement, index_name: Name) -> None:
         self._prev = prev
         self._index_name = index_name
@@ -179,8 +237,14 @@ class DeleteFromIndexedBy(IBeforeWhereClause):
         buffer.append(" INDEXED BY ")
         self._index_name._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " INDEXED BY ", self._index_name)
+
 
 class IIndexHints(IBeforeWhereClause, ABC):
+    __slots__ = ()
+
     def IndexedBy(self, index_name: Name | str) -> DeleteFromIndexedBy:
         if isinstance(index_name, str):
             index_name = Name(index_name)
@@ -192,6 +256,8 @@ class IIndexHints(IBeforeWhereClause, ABC):
 
 
 class DeleteFromAliased(IIndexHints):
+    __slots__ = ("_prev", "_alias")
+
     def __init__(self, prev: SqlElement, alias: Name) -> None:
         self._prev = prev
         self._alias = alias
@@ -202,8 +268,14 @@ class DeleteFromAliased(IIndexHints):
         buffer.append(" AS ")
         self._alias._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " AS ", self._alias)
+
 
 class DeleteFrom(IIndexHints):
+    __slots__ = ("_prev", "_schema", "_table")
+
     def __init__(self, prev: SqlElement, schema: Name, table: Name | None) -> None:
         self._prev = prev
         self._schema = schema
@@ -223,8 +295,17 @@ class DeleteFrom(IIndexHints):
             buffer.append(".")
             self._table._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        parts: list[QueryPart] = [self._prev, " ", self._schema]
+        if self._table is not None:
+            parts.extend((".", self._table))
+        return parts
+
 
 class DeleteKeyword(SqlElement):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement | None = None) -> None:
         self._prev = prev
 
@@ -243,5 +324,11 @@ class DeleteKeyword(SqlElement):
             self._prev._create_query(buffer)
             buffer.append(" DELETE FROM")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        if self._prev is None:
+            return ("DELETE FROM",)
+        return (self._prev, " DELETE FROM")
+
 
 Delete = DeleteKeyword()
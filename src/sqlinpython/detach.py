@@ -1,18 +1,21 @@
 from __future__ import annotations
 
 from abc import ABC
+from collections.abc import Sequence
 from typing import override
 
-from sqlinpython.base import CompleteSqlQuery, SqlElement
+from sqlinpython.base import CompleteSqlQuery, QueryPart, SqlElement
 from sqlinpython.name import Name
 
 
 # SPEC: https://sqlite.org/lang_detach.html
 class DetachStatement(CompleteSqlQuery, ABC):
-    pass
+    __slots__ = ()
 
 
 class DetachComplete(DetachStatement):
+    __slots__ = ("_prev", "_schema")
+
     def __init__(self, prev: SqlElement, schema: Name) -> None:
         self._prev = prev
         self._schema = schema
@@ -23,8 +26,14 @@ class DetachComplete(DetachStatement):
         buffer.append(" ")
         self._schema._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ", self._schema)
+
 
 class IDetachCall(SqlElement, ABC):
+    __slots__ = ()
+
     def __call__(self, schema: Name | str) -> DetachComplete:
         if isinstance(schema, str):
             schema = Name(schema)
@@ -32,6 +41,8 @@ class IDetachCall(SqlElement, ABC):
 
 
 class DetachDatabaseKeyword(IDetachCall):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: DetachKeyword) -> None:
         self._prev = prev
 
@@ -40,8 +51,14 @@ class DetachDatabaseKeyword(IDetachCall):
         self._prev._create_query(buffer)
         buffer.append(" DATABASE")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " DATABASE")
+
 
 class DetachKeyword(IDetachCall):
+    __slots__ = ()
+
     @property
     def Database(self) -> DetachDatabaseKeyword:
         return DetachDatabaseKeyword(self)
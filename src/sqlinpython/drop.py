@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from abc import ABC
+from collections.abc import Sequence
 from typing import Literal, override
 
-from sqlinpython.base import CompleteSqlQuery, SqlElement
+from sqlinpython.base import CompleteSqlQuery, QueryPart, SqlElement
 from sqlinpython.name import Name
 
 # SPEC DROP TABLE: https://sqlite.org/lang_droptable.html
@@ -25,6 +26,8 @@ class _Index: ...
 
 
 class DropStatement[T: (_Table, _View, _Trigger, _Index)](CompleteSqlQuery):
+    __slots__ = ("_prev", "_schema", "_name")
+
     def __init__(self, prev: SqlElement, schema: Name, name: Name | None) -> None:
         self._prev = prev
         self._schema = schema
@@ -39,6 +42,13 @@ class DropStatement[T: (_Table, _View, _Trigger, _Index)](CompleteSqlQuery):
             buffer.append(".")
             self._name._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        parts: list[QueryPart] = [self._prev, " ", self._schema]
+        if self._name is not None:
+            parts.extend((".", self._name))
+        return parts
+
 
 DropTableStatement = DropStatement[_Table]
 DropViewStatement = DropStatement[_View]
@@ -47,6 +57,8 @@ DropIndexStatement = DropStatement[_Index]
 
 
 class IDropCallable[T: (_Table, _View, _Trigger, _Index)](SqlElement, ABC):
+    __slots__ = ()
+
     def __call__(
         self,
         schema: Name | str,
@@ -61,6 +73,8 @@ class IDropCallable[T: (_Table, _View, _Trigger, _Index)](SqlElement, ABC):
 
 
 class DropIfExists[T: (_Table, _View, _Trigger, _Index)](IDropCallable[T]):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: DropTypeKeyword[T]) -> None:
         self._prev: DropTypeKeyword[T] = prev
 
@@ -69,8 +83,14 @@ class DropIfExists[T: (_Table, _View, _Trigger, _Index)](IDropCallable[T]):
         self._prev._create_query(buffer)
         buffer.append(" IF EXISTS")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " IF EXISTS")
+
 
 class DropTypeKeyword[T: (_Table, _View, _Trigger, _Index)](IDropCallable[T]):
+    __slots__ = ("_keyword",)
+
     def __init__(self, keyword: Literal["TABLE", "VIEW", "TRIGGER", "INDEX"]) -> None:
         self._keyword = keyword
 
@@ -84,6 +104,8 @@ class DropTypeKeyword[T: (_Table, _View, _Trigger, _Index)](IDropCallable[T]):
 
 
 class DropKeyword:
+    __slots__ = ()
+
     @property
     def Table(self) -> DropTypeKeyword[_Table]:
         return DropTypeKeyword("TABLE")
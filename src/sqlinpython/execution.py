@@ -0,0 +1,447 @@
+"""Running statements on stdlib sqlite3 connections.
+
+``Executor`` wraps a ``sqlite3.Connection`` and runs any CompleteSqlQuery on
+it. Literals are sent as bind parameters (see get_query_and_params), so
+statements that only differ in values share one prepared statement in the
+connection's statement cache. The SQL and parameters are cached by the SQL
+text of the statement with its literals inline, which get_query() caches on
+the statement: executing the same statement again skips rendering as well,
+and the cache holds strings rather than whole statement trees.
+
+sqlite3 can only size its statement cache when a connection is opened.
+``connect`` picks ``cached_statements`` from the number of distinct SQL texts
+executed so far in the process, so short-lived connections opened by a
+long-running worker are sized for the statements it actually runs.
+
+``Executor.transaction()`` runs a block in a transaction, nested blocks in
+savepoints. ``Executor.batch()`` groups many small writes into transactions
+that are committed every ``max_rows`` rows or ``max_ms`` milliseconds,
+instead of one commit per statement.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import sqlite3
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import Any, Literal, Self
+
+from sqlinpython import hooks
+from sqlinpython.base import CompleteSqlQuery
+from sqlinpython.savepoint import Release, Rollback, Savepoint
+from sqlinpython.transaction import Begin, Commit
+
+type Parameters = Sequence[Any] | Mapping[str, Any]
+type TransactionMode = Literal["DEFERRED", "IMMEDIATE", "EXCLUSIVE"]
+
+DEFAULT_CACHE_SIZE = 256
+# Rows fetched at a time by stream().
+DEFAULT_BATCH_SIZE = 256
+# Commit interval of batch().
+DEFAULT_BATCH_ROWS = 1000
+DEFAULT_BATCH_MS = 100.0
+# Bounds of the cached_statements picked by connect(); sqlite3's default is 128.
+MIN_CACHED_STATEMENTS = 128
+MAX_CACHED_STATEMENTS = 4096
+
+# Distinct SQL texts executed by any Executor, up to MAX_CACHED_STATEMENTS.
+_observed_sql: set[str] = set()
+
+
+_BEGIN: dict[TransactionMode, CompleteSqlQuery] = {
+    "DEFERRED": Begin.Deferred,
+    "IMMEDIATE": Begin.Immediate,
+    "EXCLUSIVE": Begin.Exclusive,
+}
+
+
+@functools.cache
+def _savepoint(
+    depth: int,
+) -> tuple[CompleteSqlQuery, CompleteSqlQuery, CompleteSqlQuery]:
+    """SAVEPOINT, RELEASE and ROLLBACK TO of a block nested depth levels deep."""
+    name = f"sqlinpython_{depth}"
+    return Savepoint(name), Release(name), Rollback.To(name)
+
+
+def recommended_cached_statements() -> int:
+    """cached_statements for a new connection, with 25% headroom."""
+    wanted = len(_observed_sql) + len(_observed_sql) // 4
+    return max(MIN_CACHED_STATEMENTS, min(MAX_CACHED_STATEMENTS, wanted))
+
+
+def _executed(
+    statement: CompleteSqlQuery, sql: str, start: float, prepared: float
+) -> None:
+    step = time.perf_counter() - prepared
+    hooks.emit_statement_executed(statement, sql, prepared - start, step)
+
+
+def _fetched(statement: CompleteSqlQuery, rows: int, start: float) -> None:
+    hooks.emit_rows_fetched(statement, rows, time.perf_counter() - start)
+
+
+class Executor:
+    """Runs statements on a sqlite3 connection.
+
+    With parameterize=False statements are sent with get_query() and their
+    literals inline.
+    """
+
+    __slots__ = (
+        "connection",
+        "_cache_size",
+        "_parameterize",
+        "_compiled",
+        "_distinct_sql",
+        "_transactions",
+    )
+
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        *,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        parameterize: bool = True,
+    ) -> None:
+        self.connection = connection
+        self._cache_size = cache_size
+        self._parameterize = parameterize
+        self._compiled: OrderedDict[tuple[str, bool], tuple[str, Parameters]] = (
+            OrderedDict()
+        )
+        self._distinct_sql: set[str] = set()
+        # Statements that end each open transaction block: (commit, rollback).
+        self._transactions: list[
+            tuple[CompleteSqlQuery, tuple[CompleteSqlQuery, ...]]
+        ] = []
+
+    @property
+    def distinct_statements(self) -> int:
+        """Number of distinct SQL texts executed (up to MAX_CACHED_STATEMENTS)."""
+        return len(self._distinct_sql)
+
+    def compile(
+        self, statement: CompleteSqlQuery, *, named: bool = False
+    ) -> tuple[str, Parameters]:
+        """The SQL text and parameters statement is executed with.
+
+        named selects :p1, :p2, ... placeholders and a dict of parameters
+        instead of ? placeholders and a tuple.
+        """
+        key = (statement.get_query(), named)
+        try:
+            self._compiled.move_to_end(key)
+            return self._compiled[key]
+        except KeyError:
+            pass
+        compiled: tuple[str, Parameters]
+        if not self._parameterize:
+            compiled = (key[0], {} if named else ())
+        elif named:
+            compiled = statement.get_query_and_params("named")
+        else:
+            compiled = statement.get_query_and_params()
+        self._compiled[key] = compiled
+        if len(self._compiled) > self._cache_size:
+            self._compiled.popitem(last=False)
+        self._observe(compiled[0])
+        return compiled
+
+    def _observe(self, sql: str) -> None:
+        if len(self._distinct_sql) < MAX_CACHED_STATEMENTS:
+            self._distinct_sql.add(sql)
+        if len(_observed_sql) < MAX_CACHED_STATEMENTS:
+            _observed_sql.add(sql)
+
+    def _prepare(
+        self, statement: CompleteSqlQuery, parameters: Parameters | None
+    ) -> tuple[str, Parameters]:
+        if parameters is None:
+            return self.compile(statement)
+        if isinstance(parameters, Mapping):
+            # Named parameters of the statement are merged with the literals.
+            sql, params = self.compile(statement, named=True)
+            assert isinstance(params, Mapping)
+            return sql, {**params, **parameters}
+        # Positional parameters are only possible with the literals inline.
+        sql = statement.get_query()
+        self._observe(sql)
+        return sql, parameters
+
+    def execute(
+        self, statement: CompleteSqlQuery, parameters: Parameters | None = None
+    ) -> sqlite3.Cursor:
+        """Execute statement and return the cursor, ready for fetching.
+
+        parameters are values for the BindParameters of the statement: a
+        mapping for named ones, or a sequence for positional ones.
+        """
+        if not hooks.observing_execution:
+            return self.connection.execute(*self._prepare(statement, parameters))
+        start = time.perf_counter()
+        sql, params = self._prepare(statement, parameters)
+        prepared = time.perf_counter()
+        cursor = self.connection.execute(sql, params)
+        _executed(statement, sql, start, prepared)
+        return cursor
+
+    def executemany(
+        self, statement: CompleteSqlQuery, rows: Iterable[Parameters]
+    ) -> sqlite3.Cursor:
+        """Execute statement once per row of parameters (see ValuesTemplate)."""
+        if not hooks.observing_execution:
+            sql = statement.get_query()
+            self._observe(sql)
+            return self.connection.executemany(sql, rows)
+        start = time.perf_counter()
+        sql = statement.get_query()
+        self._observe(sql)
+        prepared = time.perf_counter()
+        cursor = self.connection.executemany(sql, rows)
+        _executed(statement, sql, start, prepared)
+        return cursor
+
+    def fetchone(
+        self, statement: CompleteSqlQuery, parameters: Parameters | None = None
+    ) -> Any:
+        cursor = self.execute(statement, parameters)
+        if not hooks.observing_execution:
+            return cursor.fetchone()
+        start = time.perf_counter()
+        row = cursor.fetchone()
+        _fetched(statement, int(row is not None), start)
+        return row
+
+    def fetchmany(
+        self,
+        statement: CompleteSqlQuery,
+        size: int,
+        parameters: Parameters | None = None,
+    ) -> list[Any]:
+        cursor = self.execute(statement, parameters)
+        if not hooks.observing_execution:
+            return cursor.fetchmany(size)
+        start = time.perf_counter()
+        rows = cursor.fetchmany(size)
+        _fetched(statement, len(rows), start)
+        return rows
+
+    def fetchall(
+        self, statement: CompleteSqlQuery, parameters: Parameters | None = None
+    ) -> list[Any]:
+        cursor = self.execute(statement, parameters)
+        if not hooks.observing_execution:
+            return cursor.fetchall()
+        start = time.perf_counter()
+        rows = cursor.fetchall()
+        _fetched(statement, len(rows), start)
+        return rows
+
+    def stream(
+        self,
+        statement: CompleteSqlQuery,
+        parameters: Parameters | None = None,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[Any]:
+        """Yield the rows of statement, fetching batch_size rows at a time."""
+        cursor = self.execute(statement, parameters)
+        if not hooks.observing_execution:
+            try:
+                while rows := cursor.fetchmany(batch_size):
+                    yield from rows
+            finally:
+                cursor.close()
+            return
+        # Only the time spent fetching counts, not the time the consumer takes.
+        fetching = 0.0
+        count = 0
+        try:
+            while True:
+                start = time.perf_counter()
+                rows = cursor.fetchmany(batch_size)
+                fetching += time.perf_counter() - start
+                if not rows:
+                    break
+                count += len(rows)
+                yield from rows
+        finally:
+            cursor.close()
+            hooks.emit_rows_fetched(statement, count, fetching)
+
+    def _begin(self, mode: TransactionMode) -> int:
+        """Open a transaction or savepoint; return its depth for _end."""
+        depth = len(self._transactions)
+        if not self._transactions and not self.connection.in_transaction:
+            self.execute(_BEGIN[mode])
+            self._transactions.append((Commit, (Rollback,)))
+        else:
+            # Inside a transaction, also one opened implicitly by sqlite3.
+            savepoint, release, rollback = _savepoint(depth)
+            self.execute(savepoint)
+            self._transactions.append((release, (rollback, release)))
+        return depth
+
+    def _end(self, depth: int, commit: bool) -> None:
+        if len(self._transactions) != depth + 1:
+            raise sqlite3.ProgrammingError(
+                "transaction blocks and write batches must end in the reverse"
+                " order they began"
+            )
+        done, undo = self._transactions.pop()
+        if commit:
+            self.execute(done)
+        elif self.connection.in_transaction:
+            # SQLite may already have rolled back, e.g. after SQLITE_FULL.
+            for statement in undo:
+                self.execute(statement)
+
+    @contextlib.contextmanager
+    def transaction(self, mode: TransactionMode = "IMMEDIATE") -> Iterator[Self]:
+        """Run the block in a transaction, committed unless the block raises.
+
+        The outermost block issues BEGIN <mode> and COMMIT or ROLLBACK,
+        nested blocks SAVEPOINT and RELEASE or ROLLBACK TO.
+        """
+        depth = self._begin(mode)
+        try:
+            yield self
+        except BaseException:
+            self._end(depth, commit=False)
+            raise
+        self._end(depth, commit=True)
+
+    def batch(
+        self,
+        *,
+        max_rows: int = DEFAULT_BATCH_ROWS,
+        max_ms: float = DEFAULT_BATCH_MS,
+        mode: TransactionMode = "IMMEDIATE",
+    ) -> WriteBatch:
+        """Group the writes made through the returned batch into transactions."""
+        return WriteBatch(self, max_rows=max_rows, max_ms=max_ms, mode=mode)
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+class WriteBatch:
+    """Writes committed in transactions of up to max_rows rows or max_ms ms.
+
+    A transaction is opened by the first write and committed by the write
+    that reaches either limit, or when the batch is flushed or its block
+    ends. Limits are checked on each write, so a transaction stays open
+    while no writes arrive. If the block raises, only the writes since the
+    last commit are rolled back.
+
+    Executor.transaction blocks may be opened inside the batch's transaction:
+    the limits are not checked until they end, and flush() or rollback()
+    while one is open raises sqlite3.ProgrammingError. A transaction opened
+    by the batch inside such a block must be flushed before the block ends.
+    """
+
+    __slots__ = (
+        "_executor",
+        "_mode",
+        "max_rows",
+        "max_ms",
+        "_rows",
+        "_started",
+        "_depth",
+    )
+
+    def __init__(
+        self,
+        executor: Executor,
+        *,
+        max_rows: int = DEFAULT_BATCH_ROWS,
+        max_ms: float = DEFAULT_BATCH_MS,
+        mode: TransactionMode = "IMMEDIATE",
+    ) -> None:
+        self._executor = executor
+        self._mode = mode
+        self.max_rows = max_rows
+        self.max_ms = max_ms
+        self._rows = 0
+        self._started: float | None = None
+        self._depth = 0
+
+    def _write(self, rowcount: int) -> None:
+        # Statements that do not report a row count count as one row.
+        self._rows += max(rowcount, 1)
+        assert self._started is not None
+        if len(self._executor._transactions) > self._depth + 1:
+            # A transaction block opened inside the batch is still open.
+            return
+        elapsed_ms = (time.monotonic() - self._started) * 1000
+        if self._rows >= self.max_rows or elapsed_ms >= self.max_ms:
+            self.flush()
+
+    def _open(self) -> None:
+        if self._started is None:
+            self._depth = self._executor._begin(self._mode)
+            self._started = time.monotonic()
+            self._rows = 0
+
+    def execute(
+        self, statement: CompleteSqlQuery, parameters: Parameters | None = None
+    ) -> sqlite3.Cursor:
+        self._open()
+        cursor = self._executor.execute(statement, parameters)
+        self._write(cursor.rowcount)
+        return cursor
+
+    def executemany(
+        self, statement: CompleteSqlQuery, rows: Iterable[Parameters]
+    ) -> sqlite3.Cursor:
+        self._open()
+        cursor = self._executor.executemany(statement, rows)
+        self._write(cursor.rowcount)
+        return cursor
+
+    def flush(self) -> None:
+        """Commit the open transaction, if any."""
+        self._end(commit=True)
+
+    def rollback(self) -> None:
+        """Roll back the writes since the last commit."""
+        self._end(commit=False)
+
+    def _end(self, commit: bool) -> None:
+        if self._started is None:
+            return
+        if len(self._executor._transactions) != self._depth + 1:
+            raise sqlite3.ProgrammingError(
+                "Cannot end a write batch inside a transaction block opened after it."
+            )
+        self._started = None
+        self._executor._end(self._depth, commit)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type: object, *exc_info: object) -> None:
+        if exc_type is None:
+            self.flush()
+        else:
+            self.rollback()
+
+
+def connect(
+    database: str, *, cached_statements: int | None = None, **kwargs: Any
+) -> Executor:
+    """Open a sqlite3 connection wrapped in an Executor.
+
+    Keyword arguments are passed to sqlite3.connect. cached_statements
+    defaults to recommended_cached_statements().
+    """
+    if cached_statements is None:
+        cached_statements = recommended_cached_statements()
+    connection = sqlite3.connect(
+        database, cached_statements=cached_statements, **kwargs
+    )
+    return Executor(connection)
@@ -37,3 +37,5 @@ from .literal import Literal as Literal
 from .literal import NumericLiteral as NumericLiteral
 from .literal import literal as literal
 from .literal import to_expr as to_expr
+from .logical import and_all as and_all
+from .logical import or_all as or_all
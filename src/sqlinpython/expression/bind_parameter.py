@@ -1,6 +1,7 @@
 import re
 from typing import Literal, overload, override
 
+from sqlinpython.base import ParameterBuffer
 from sqlinpython.expression.core import Expression12
 
 _NAME_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
@@ -10,6 +11,8 @@ _TCL_NAME_PATTERN = re.compile(
 
 
 class BindParameter(Expression12):
+    __slots__ = ("_value", "_bind_symbol")
+
     @overload
     def __init__(self) -> None: ...
     @overload
@@ -38,6 +41,10 @@ class BindParameter(Expression12):
 
     @override
     def _create_query(self, buffer: list[str]) -> None:
-        buffer.append(self._bind_symbol)
+        text = self._bind_symbol
         if self._value is not None:
-            buffer.append(str(self._value))
+            text += str(self._value)
+        if isinstance(buffer, ParameterBuffer):
+            buffer.add_explicit_parameter(text)
+        else:
+            buffer.append(text)
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 from abc import ABC
+from collections.abc import Sequence
 from typing import override
 
-from sqlinpython.base import SqlElement
+from sqlinpython.base import QueryPart, SqlElement
 from sqlinpython.expression.core import Expression, Expression13
 from sqlinpython.expression.literal import ExpressionOrLiteral, to_expr
 
 
 class CaseExpression(Expression13):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: ElseClause | ThenClause):
         self._prev = prev
 
@@ -17,8 +20,14 @@ class CaseExpression(Expression13):
         self._prev._create_query(buffer)
         buffer.append(" END")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " END")
+
 
 class ElseClause(SqlElement):
+    __slots__ = ("_prev", "_else")
+
     def __init__(self, prev: ThenClause, else_: Expression):
         self._prev = prev
         self._else = else_
@@ -33,13 +42,21 @@ class ElseClause(SqlElement):
         buffer.append(" ELSE ")
         self._else._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ELSE ", self._else)
+
 
 class IWhenCallable(SqlElement, ABC):
+    __slots__ = ()
+
     def When(self, when: ExpressionOrLiteral) -> WhenClause:
         return WhenClause(self, to_expr(when))
 
 
 class ThenClause(IWhenCallable):
+    __slots__ = ("_prev", "_then")
+
     def __init__(self, prev: WhenClause, then: Expression):
         self._prev = prev
         self._then = then
@@ -57,8 +74,14 @@ class ThenClause(IWhenCallable):
         buffer.append(" THEN ")
         self._then._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " THEN ", self._then)
+
 
 class WhenClause(SqlElement):
+    __slots__ = ("_prev", "_when")
+
     def __init__(self, prev: SqlElement, when: Expression):
         self._prev = prev
         self._when = when
@@ -72,8 +95,14 @@ class WhenClause(SqlElement):
         buffer.append(" WHEN ")
         self._when._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " WHEN ", self._when)
+
 
 class CaseWithBaseExpr(IWhenCallable):
+    __slots__ = ("_prev", "_base")
+
     def __init__(self, prev: CaseKeyword, base: Expression):
         self._prev = prev
         self._base = base
@@ -84,8 +113,14 @@ class CaseWithBaseExpr(IWhenCallable):
         buffer.append(" ")
         self._base._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ", self._base)
+
 
 class CaseKeyword(IWhenCallable):
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
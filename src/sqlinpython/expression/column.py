@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import overload, override
 
+from sqlinpython.base import QueryPart
 from sqlinpython.name import Name
 
 from .core import Expression12
@@ -10,8 +12,12 @@ from .core import Expression12
 class ColumnName(Name, Expression12):
     """Expression atom referring to a column. Use ColumnDef for column definitions."""
 
+    __slots__ = ()
+
 
 class TableColumnName(Expression12):
+    __slots__ = ("_table", "_column")
+
     def __init__(self, table: Name | str, column: Name | str) -> None:
         if isinstance(table, str):
             table = Name(table)
@@ -26,8 +32,14 @@ class TableColumnName(Expression12):
         buffer.append(".")
         self._column._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._table, ".", self._column)
+
 
 class SchemaTableColumnName(Expression12):
+    __slots__ = ("_schema", "_table", "_column")
+
     def __init__(
         self, schema: Name | str, table: Name | str, column: Name | str
     ) -> None:
@@ -49,6 +61,10 @@ class SchemaTableColumnName(Expression12):
         buffer.append(".")
         self._column._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._schema, ".", self._table, ".", self._column)
+
 
 @overload
 def col(__schema: str, __table: str, __column: str) -> SchemaTableColumnName: ...
@@ -2,9 +2,16 @@ from __future__ import annotations
 
 import typing
 from abc import ABC
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, overload, override
 
-from sqlinpython.base import NoArg, SqlElement, comma_separated
+from sqlinpython.base import (
+    NoArg,
+    QueryPart,
+    SqlElement,
+    comma_separated,
+    comma_separated_parts,
+)
 from sqlinpython.expression.frame_bound import IHasFrameBounds
 from sqlinpython.indexed_column import IHasAscDesc
 from sqlinpython.name import Name
@@ -28,6 +35,8 @@ def _to_expr(value: ExpressionOrLiteral) -> Expression:
 
 # SPEC: https://sqlite.org/lang_expr.html
 class INegatedOperations(SqlElement, ABC):
+    __slots__ = ()
+
     def Between(
         self, lower: ExpressionOrLiteral, upper: ExpressionOrLiteral
     ) -> BetweenExpression:
@@ -132,6 +141,8 @@ class INegatedOperations(SqlElement, ABC):
 
 
 class Expression(IHasAscDesc, INegatedOperations, IHasFrameBounds, ABC):
+    __slots__ = ()
+
     def As(self, alias: str | Name, /) -> AliasedExpression:
         if isinstance(alias, str):
             alias = Name(alias)
@@ -327,6 +338,8 @@ class Expression(IHasAscDesc, INegatedOperations, IHasFrameBounds, ABC):
 
 
 class AliasedExpression(SqlElement):
+    __slots__ = ("_expression", "_alias", "_explicit_as")
+
     def __init__(
         self, expression: Expression, alias: Name, *, explicit_as: bool = True
     ) -> None:
@@ -343,12 +356,18 @@ class AliasedExpression(SqlElement):
             buffer.append(" ")
         self._alias._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._expression, " AS " if self._explicit_as else " ", self._alias)
+
 
 class Expression1(Expression, ABC):
-    pass
+    __slots__ = ()
 
 
 class OrCondition(Expression1):
+    __slots__ = ("_left", "_right")
+
     def __init__(self, left: Expression1, right: Expression2) -> None:
         self._left = left
         self._right = right
@@ -359,12 +378,18 @@ class OrCondition(Expression1):
         buffer.append(" OR ")
         self._right._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._left, " OR ", self._right)
+
 
 class Expression2(Expression1, ABC):
-    pass
+    __slots__ = ()
 
 
 class AndCondition(Expression2):
+    __slots__ = ("_left", "_right")
+
     def __init__(self, left: Expression2, right: Expression3) -> None:
         self._left = left
         self._right = right
@@ -375,12 +400,18 @@ class AndCondition(Expression2):
         buffer.append(" AND ")
         self._right._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._left, " AND ", self._right)
+
 
 class Expression3(Expression2, ABC):
-    pass
+    __slots__ = ()
 
 
 class NotKeyword:
+    __slots__ = ()
+
     def __call__(self, after: ExpressionOrLiteral) -> NotExpression:
         return NotExpression(_to_expr(after)._wrap_parenthesis_if_not(Expression3))
 
@@ -392,6 +423,8 @@ Not = NotKeyword()
 
 
 class NotExpression(Expression3):
+    __slots__ = ("_after",)
+
     def __init__(self, after: Expression3) -> None:
         self._after = after
 
@@ -400,12 +433,18 @@ class NotExpression(Expression3):
         buffer.append("NOT ")
         self._after._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return ("NOT ", self._after)
+
 
 class Expression4(Expression3, ABC):
-    pass
+    __slots__ = ()
 
 
 class EqExpression(Expression4):
+    __slots__ = ("_left", "_right", "_double_eq")
+
     def __init__(self, left: Expression4, right: Expression5, double_eq: bool) -> None:
         self._left = left
         self._right = right
@@ -421,8 +460,14 @@ class EqExpression(Expression4):
         buffer.append(op)
         self._right._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._left, " == " if self._double_eq else " = ", self._right)
+
 
 class NeExpression(Expression4):
+    __slots__ = ("_left", "_right", "_arrows")
+
     def __init__(self, left: Expression4, right: Expression5, arrows: bool) -> None:
         self._left = left
         self._right = right
@@ -438,8 +483,14 @@ class NeExpression(Expression4):
         buffer.append(op)
         self._right._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._left, " <> " if self._arrows else " != ", self._right)
+
 
 class IsExpressionComplete(Expression4):
+    __slots__ = ("_prev", "_other")
+
     def __init__(self, prev: IIsCallable, other: Expression4) -> None:
         self._prev = prev
         self._other = other
@@ -450,14 +501,22 @@ class IsExpressionComplete(Expression4):
         buffer.append(" ")
         self._other._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ", self._other)
+
 
 class IIsCallable(SqlElement, ABC):
+    __slots__ = ()
+
     def __call__(self, other: ExpressionOrLiteral) -> IsExpressionComplete:
         _other = _to_expr(other)._wrap_parenthesis_if_not(Expression4)
         return IsExpressionComplete(self, _other)
 
 
 class IsDistinctFromExpression(IIsCallable):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: IIsCallable) -> None:
         self._prev = prev
 
@@ -466,8 +525,14 @@ class IsDistinctFromExpression(IIsCallable):
         self._prev._create_query(buffer)
         buffer.append(" DISTINCT FROM")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " DISTINCT FROM")
+
 
 class IsNotExpression(IIsCallable):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: IsExpression) -> None:
         self._prev = prev
 
@@ -480,8 +545,14 @@ class IsNotExpression(IIsCallable):
         self._prev._create_query(buffer)
         buffer.append(" NOT")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " NOT")
+
 
 class IsExpression(IIsCallable):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: Expression4) -> None:
         self._prev = prev
 
@@ -498,8 +569,14 @@ class IsExpression(IIsCallable):
         self._prev._create_query(buffer)
         buffer.append(" IS")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " IS")
+
 
 class BetweenExpression(Expression4):
+    __slots__ = ("_prev", "_lower", "_upper")
+
     def __init__(
         self, prev: SqlElement, lower: Expression5, upper: Expression5
     ) -> None:
@@ -515,8 +592,14 @@ class BetweenExpression(Expression4):
         buffer.append(" AND ")
         self._upper._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " BETWEEN ", self._lower, " AND ", self._upper)
+
 
 class EmptyInExpression(Expression4):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement) -> None:
         self._prev = prev
 
@@ -525,8 +608,14 @@ class EmptyInExpression(Expression4):
         self._prev._create_query(buffer)
         buffer.append(" IN ()")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " IN ()")
+
 
 class InExpressionWithSelect(Expression4):
+    __slots__ = ("_prev", "_select_stmt")
+
     def __init__(self, prev: SqlElement, select_stmt: SelectStatement) -> None:
         self._prev = prev
         self._select_stmt = select_stmt
@@ -538,8 +627,14 @@ class InExpressionWithSelect(Expression4):
         self._select_stmt._create_query(buffer)
         buffer.append(")")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " IN (", self._select_stmt, ")")
+
 
 class InExpressionWithExpressions(Expression4):
+    __slots__ = ("_prev", "_exprs")
+
     def __init__(self, prev: SqlElement, exprs: tuple[Expression, ...]) -> None:
         self._prev = prev
         self._exprs = exprs
@@ -551,8 +646,14 @@ class InExpressionWithExpressions(Expression4):
         comma_separated(buffer, self._exprs)
         buffer.append(")")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " IN (", *comma_separated_parts(self._exprs), ")")
+
 
 class InExpressionWithTableName(Expression4):
+    __slots__ = ("_prev", "_schema", "_name")
+
     def __init__(
         self, prev: SqlElement, schema: Name, name: Name | None = None
     ) -> None:
@@ -569,8 +670,16 @@ class InExpressionWithTableName(Expression4):
             buffer.append(".")
             self._name._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        if self._name is None:
+            return (self._prev, " IN ", self._schema)
+        return (self._prev, " IN ", self._schema, ".", self._name)
+
 
 class InExpressionWithTableFunction(Expression4):
+    __slots__ = ("_prev", "_table_function")
+
     def __init__(self, prev: SqlElement, table_function: TableFunctionRefCall) -> None:
         self._prev = prev
         self._table_function = table_function
@@ -581,8 +690,14 @@ class InExpressionWithTableFunction(Expression4):
         buffer.append(" IN ")
         self._table_function._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " IN ", self._table_function)
+
 
 class MatchLikeExpression(Expression4):
+    __slots__ = ("_prev", "_pattern", "_op")
+
     def __init__(
         self,
         prev: SqlElement,
@@ -599,8 +714,14 @@ class MatchLikeExpression(Expression4):
         buffer.append(f" {self._op} ")
         self._pattern._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, f" {self._op} ", self._pattern)
+
 
 class LikeExpressionWithEscape(Expression4):
+    __slots__ = ("_prev", "_escape")
+
     def __init__(self, prev: LikeExpression, escape: Expression5) -> None:
         self._prev = prev
         self._escape = escape
@@ -611,8 +732,14 @@ class LikeExpressionWithEscape(Expression4):
         buffer.append(" ESCAPE ")
         self._escape._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ESCAPE ", self._escape)
+
 
 class LikeExpression(Expression4):
+    __slots__ = ("_prev", "_pattern")
+
     def __init__(self, prev: SqlElement, pattern: Expression5) -> None:
         self._prev = prev
         self._pattern = pattern
@@ -627,8 +754,14 @@ class LikeExpression(Expression4):
         buffer.append(" LIKE ")
         self._pattern._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " LIKE ", self._pattern)
+
 
 class NullCompareExpression(Expression4):
+    __slots__ = ("_prev", "_op")
+
     def __init__(
         self, prev: SqlElement, op: typing.Literal["ISNULL", "NOTNULL", "NULL"]
     ) -> None:
@@ -640,8 +773,14 @@ class NullCompareExpression(Expression4):
         self._prev._create_query(buffer)
         buffer.append(f" {self._op}")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, f" {self._op}")
+
 
 class NegatedOperator(INegatedOperations):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: Expression4) -> None:
         self._prev = prev
 
@@ -654,12 +793,18 @@ class NegatedOperator(INegatedOperations):
         self._prev._create_query(buffer)
         buffer.append(" NOT")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " NOT")
+
 
 class Expression5(Expression4, ABC):
-    pass
+    __slots__ = ()
 
 
 class Comparison(Expression5):
+    __slots__ = ("_left", "_right", "_operator")
+
     def __init__(
         self,
         left: Expression5,
@@ -676,16 +821,22 @@ class Comparison(Expression5):
         buffer.append(f" {self._operator} ")
         self._right._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._left, f" {self._operator} ", self._right)
+
 
 class Expression6(Expression5, ABC):
-    pass
+    __slots__ = ()
 
 
 class Expression7(Expression6, ABC):
-    pass
+    __slots__ = ()
 
 
 class BitOperation(Expression7):
+    __slots__ = ("_left", "_right", "_operator")
+
     def __init__(
         self,
         left: Expression7,
@@ -702,12 +853,18 @@ class BitOperation(Expression7):
         buffer.append(f" {self._operator} ")
         self._right._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._left, f" {self._operator} ", self._right)
+
 
 class Expression8(Expression7, ABC):
-    pass
+    __slots__ = ()
 
 
 class Summand(Expression8):
+    __slots__ = ("_left", "_right", "_operator")
+
     def __init__(
         self, left: Expression8, right: Expression9, operator: typing.Literal["+", "-"]
     ):
@@ -721,12 +878,18 @@ class Summand(Expression8):
         buffer.append(f" {self._operator} ")
         self._right._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._left, f" {self._operator} ", self._right)
+
 
 class Expression9(Expression8, ABC):
-    pass
+    __slots__ = ()
 
 
 class Factor(Expression9):
+    __slots__ = ("_left", "_right", "_operator")
+
     def __init__(
         self,
         left: Expression9,
@@ -743,12 +906,18 @@ class Factor(Expression9):
         buffer.append(f" {self._operator} ")
         self._right._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._left, f" {self._operator} ", self._right)
+
 
 class Expression10(Expression9, ABC):
-    pass
+    __slots__ = ()
 
 
 class ConcatLikeOperator(Expression10):
+    __slots__ = ("_left", "_right", "_operator")
+
     def __init__(
         self,
         left: Expression10,
@@ -765,12 +934,18 @@ class ConcatLikeOperator(Expression10):
         buffer.append(f" {self._operator} ")
         self._right._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._left, f" {self._operator} ", self._right)
+
 
 class Expression11(Expression10, ABC):
-    pass
+    __slots__ = ()
 
 
 class CollateOperator(Expression11):
+    __slots__ = ("_left", "_right")
+
     def __init__(
         self,
         left: Expression11,
@@ -785,27 +960,63 @@ class CollateOperator(Expression11):
         buffer.append(" COLLATE ")
         self._right._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._left, " COLLATE ", self._right)
+
 
 class Expression12(Expression11, ABC):
-    pass
+    __slots__ = ()
+
+
+def _starts_with_minus(element: SqlElement) -> bool:
+    node = element
+    while True:
+        parts = node._parts()
+        if parts is None:
+            text: list[str] = []
+            node._create_query(text)
+            return "".join(text).startswith("-")
+        for part in parts:
+            if isinstance(part, SqlElement):
+                node = part
+                break
+            if part:
+                return part.startswith("-")
+        else:
+            return False
 
 
 class UnaryOperator(Expression12):
+    __slots__ = ("_left", "_op")
+
     def __init__(self, left: Expression, op: typing.Literal["+", "-", "~"]):
         self._left = left
         self._op = op
 
+    def _operator(self) -> str:
+        # "- -3" must not render as "--3", which starts a comment.
+        if self._op == "-" and _starts_with_minus(self._left):
+            return "- "
+        return self._op
+
     @override
     def _create_query(self, buffer: list[str]) -> None:
-        buffer.append(self._op)
+        buffer.append(self._operator())
         self._left._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._operator(), self._left)
+
 
 class Expression13(Expression12, ABC):
-    pass
+    __slots__ = ()
 
 
 class ParenthesizedExpression(Expression13):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: Expression) -> None:
         self._prev = prev
 
@@ -815,8 +1026,14 @@ class ParenthesizedExpression(Expression13):
         self._prev._create_query(buffer)
         buffer.append(")")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return ("(", self._prev, ")")
+
 
 class Row(Expression13):
+    __slots__ = ("_exprs",)
+
     def __init__(
         self,
         *exprs: *tuple[
@@ -833,8 +1050,14 @@ class Row(Expression13):
         comma_separated(buffer, self._exprs)
         buffer.append(")")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return ("(", *comma_separated_parts(self._exprs), ")")
+
 
 class Cast(Expression13):
+    __slots__ = ("_expr", "_type_name")
+
     def __init__(self, expr: Expression, type_name: CompleteTypeName) -> None:
         self._expr = expr
         self._type_name = type_name
@@ -847,8 +1070,14 @@ class Cast(Expression13):
         self._type_name._create_query(buffer)
         buffer.append(")")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return ("CAST(", self._expr, " AS ", self._type_name, ")")
+
 
 class Subquery(Expression13):
+    __slots__ = ("_select_stmt",)
+
     def __init__(self, select_stmt: SelectStatement) -> None:
         self._select_stmt = select_stmt
 
@@ -858,8 +1087,14 @@ class Subquery(Expression13):
         self._select_stmt._create_query(buffer)
         buffer.append(")")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return ("(", self._select_stmt, ")")
+
 
 class Exists(Expression13):
+    __slots__ = ("_select_stmt",)
+
     def __init__(self, select_stmt: SelectStatement) -> None:
         self._select_stmt = select_stmt
 
@@ -869,29 +1104,35 @@ class Exists(Expression13):
         self._select_stmt._create_query(buffer)
         buffer.append(")")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return ("EXISTS (", self._select_stmt, ")")
+
 
 class IgnoreKeyword:
-    pass
+    __slots__ = ()
 
 
 Ignore = IgnoreKeyword()
 
 
 class AbortKeyword:
-    pass
+    __slots__ = ()
 
 
 Abort = AbortKeyword()
 
 
 class FailKeyword:
-    pass
+    __slots__ = ()
 
 
 Fail = FailKeyword()
 
 
 class RaiseExpression(Expression13):
+    __slots__ = ("_mode", "_message")
+
     def __init__(
         self,
         mode: typing.Literal["IGNORE", "ROLLBACK", "ABORT", "FAIL"],
@@ -908,8 +1149,16 @@ class RaiseExpression(Expression13):
             self._message._create_query(buffer)
         buffer.append(")")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        if self._message is None:
+            return (f"RAISE({self._mode}", ")")
+        return (f"RAISE({self._mode}", ", ", self._message, ")")
+
 
 class RaiseKeyword:
+    __slots__ = ()
+
     @property
     def Ignore(self) -> RaiseExpression:
         return RaiseExpression("IGNORE", None)
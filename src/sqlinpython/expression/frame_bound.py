@@ -1,16 +1,19 @@
 from __future__ import annotations
 
 from abc import ABC
+from collections.abc import Sequence
 from typing import override
 
-from sqlinpython.base import SqlElement
+from sqlinpython.base import QueryPart, SqlElement
 
 
 class FrameBound(SqlElement, ABC):
-    pass
+    __slots__ = ()
 
 
 class PrecedingFrameBound(FrameBound):
+    __slots__ = ("_expr",)
+
     def __init__(self, expr: SqlElement) -> None:
         self._expr = expr
 
@@ -19,8 +22,14 @@ class PrecedingFrameBound(FrameBound):
         self._expr._create_query(buffer)
         buffer.append(" PRECEDING")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._expr, " PRECEDING")
+
 
 class FollowingFrameBound(FrameBound):
+    __slots__ = ("_expr",)
+
     def __init__(self, expr: SqlElement) -> None:
         self._expr = expr
 
@@ -29,8 +38,14 @@ class FollowingFrameBound(FrameBound):
         self._expr._create_query(buffer)
         buffer.append(" FOLLOWING")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._expr, " FOLLOWING")
+
 
 class IHasFrameBounds(SqlElement, ABC):
+    __slots__ = ()
+
     @property
     def Preceding(self) -> PrecedingFrameBound:
         return PrecedingFrameBound(self)
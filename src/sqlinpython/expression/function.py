@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 from abc import ABC
+from collections.abc import Sequence
 from typing import Literal, cast, overload, override
 
-from sqlinpython.base import SqlElement, comma_separated
+from sqlinpython.base import (
+    QueryPart,
+    SqlElement,
+    comma_separated,
+    comma_separated_parts,
+)
 from sqlinpython.name import Name
 from sqlinpython.ordering_term import OrderingTerm
 
@@ -15,6 +21,8 @@ from .literal import ExpressionOrLiteral, to_expr
 class Star_(SqlElement):
     """Represents * in function arguments like COUNT(*)."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
@@ -28,10 +36,12 @@ Star = Star_()
 
 # SPEC: https://sqlite.org/syntax/window-defn.html
 class WindowDefn(SqlElement, ABC):
-    pass
+    __slots__ = ()
 
 
 class OrderByKeyword:
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement | None):
         self._prev = prev
 
@@ -45,6 +55,8 @@ OrderBy = OrderByKeyword(None)
 
 
 class IHasFrameSpec(WindowDefn, ABC):
+    __slots__ = ()
+
     @property
     def Range(self) -> FrameSpecClause:
         return FrameSpecClause(self, "RANGE")
@@ -59,6 +71,8 @@ class IHasFrameSpec(WindowDefn, ABC):
 
 
 class OrderByClause(IHasFrameSpec):
+    __slots__ = ("_prev", "_terms")
+
     def __init__(self, prev: SqlElement | None, terms: tuple[OrderingTerm, ...]):
         self._prev = prev
         self._terms = terms
@@ -71,9 +85,19 @@ class OrderByClause(IHasFrameSpec):
         buffer.append("ORDER BY ")
         comma_separated(buffer, self._terms)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        parts: list[QueryPart] = []
+        if self._prev is not None:
+            parts.extend((self._prev, " "))
+        parts.extend(("ORDER BY ", *comma_separated_parts(self._terms)))
+        return parts
+
 
 # SPEC: https://sqlite.org/syntax/frame-spec.html
 class FrameSpecClause(SqlElement):
+    __slots__ = ("_prev", "_kind")
+
     def __init__(
         self, prev: SqlElement | None, kind: Literal["RANGE", "ROWS", "GROUPS"]
     ):
@@ -102,8 +126,18 @@ class FrameSpecClause(SqlElement):
             buffer.append(" ")
         buffer.append(self._kind)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        parts: list[QueryPart] = []
+        if self._prev is not None:
+            parts.extend((self._prev, " "))
+        parts.append(self._kind)
+        return parts
+
 
 class FrameSpecBetween(SqlElement):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: FrameSpecClause) -> None:
         self._prev = prev
 
@@ -125,8 +159,14 @@ class FrameSpecBetween(SqlElement):
         self._prev._create_query(buffer)
         buffer.append(" BETWEEN")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " BETWEEN")
+
 
 class FrameSpecBetweenExprStart(SqlElement):
+    __slots__ = ("_prev", "_bound")
+
     def __init__(
         self, prev: FrameSpecBetween, bound: PrecedingFrameBound | FollowingFrameBound
     ) -> None:
@@ -143,8 +183,14 @@ class FrameSpecBetweenExprStart(SqlElement):
         buffer.append(" ")
         self._bound._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ", self._bound)
+
 
 class FrameSpecBetweenStart(SqlElement):
+    __slots__ = ("_prev", "_kind")
+
     def __init__(
         self,
         prev: FrameSpecBetween,
@@ -163,8 +209,14 @@ class FrameSpecBetweenStart(SqlElement):
         buffer.append(" ")
         buffer.append(self._kind)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ", self._kind)
+
 
 class FrameSpecBetweenAnd(SqlElement):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: FrameSpecBetweenStart | FrameSpecBetweenExprStart) -> None:
         self._prev = prev
 
@@ -186,8 +238,14 @@ class FrameSpecBetweenAnd(SqlElement):
         self._prev._create_query(buffer)
         buffer.append(" AND")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " AND")
+
 
 class FrameSpecWithExclude(WindowDefn):
+    __slots__ = ("_prev", "_kind")
+
     def __init__(
         self,
         prev: SqlElement,
@@ -202,8 +260,14 @@ class FrameSpecWithExclude(WindowDefn):
         buffer.append(" EXCLUDE ")
         buffer.append(self._kind)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " EXCLUDE ", self._kind)
+
 
 class IFrameSpecBound(WindowDefn, ABC):
+    __slots__ = ()
+
     @property
     def ExcludeNoOthers(self) -> FrameSpecWithExclude:
         return FrameSpecWithExclude(self, "NO OTHERS")
@@ -222,6 +286,8 @@ class IFrameSpecBound(WindowDefn, ABC):
 
 
 class FrameSpecBetweenEnd(IFrameSpecBound):
+    __slots__ = ("_prev", "_kind")
+
     def __init__(
         self,
         prev: FrameSpecBetweenAnd,
@@ -236,8 +302,14 @@ class FrameSpecBetweenEnd(IFrameSpecBound):
         buffer.append(" ")
         buffer.append(self._kind)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ", self._kind)
+
 
 class FrameSpecBetweenExprEnd(IFrameSpecBound):
+    __slots__ = ("_prev", "_bound")
+
     def __init__(
         self,
         prev: FrameSpecBetweenAnd,
@@ -252,10 +324,16 @@ class FrameSpecBetweenExprEnd(IFrameSpecBound):
         buffer.append(" ")
         self._bound._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ", self._bound)
+
 
 class FrameSpecExprBound(IFrameSpecBound):
     # Only PrecedingFrameBound is valid for single frame spec (not BETWEEN).
     # Per SQLite syntax, frame-single only allows: UNBOUNDED PRECEDING | expr PRECEDING | CURRENT ROW
+    __slots__ = ("_prev", "_bound")
+
     def __init__(self, prev: FrameSpecClause, bound: PrecedingFrameBound) -> None:
         self._prev = prev
         self._bound = bound
@@ -266,8 +344,14 @@ class FrameSpecExprBound(IFrameSpecBound):
         buffer.append(" ")
         self._bound._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ", self._bound)
+
 
 class FrameSpecSingleBound(IFrameSpecBound):
+    __slots__ = ("_prev", "_kind")
+
     def __init__(
         self,
         prev: FrameSpecClause,
@@ -282,6 +366,10 @@ class FrameSpecSingleBound(IFrameSpecBound):
         buffer.append(" ")
         buffer.append(self._kind)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ", self._kind)
+
 
 Range = FrameSpecClause(None, "RANGE")
 Rows = FrameSpecClause(None, "ROWS")
@@ -289,6 +377,8 @@ Groups = FrameSpecClause(None, "GROUPS")
 
 
 class PartitionByKeyword:
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement | None):
         self._prev = prev
 
@@ -303,12 +393,16 @@ PartitionBy = PartitionByKeyword(None)
 
 
 class IHasOrderBy(IHasFrameSpec, ABC):
+    __slots__ = ()
+
     @property
     def OrderBy(self) -> OrderByKeyword:
         return OrderByKeyword(self)
 
 
 class PartitionByClause(IHasOrderBy):
+    __slots__ = ("_prev", "_exprs")
+
     def __init__(self, prev: SqlElement | None, exprs: tuple[Expression, ...]):
         self._prev = prev
         self._exprs = exprs
@@ -321,8 +415,18 @@ class PartitionByClause(IHasOrderBy):
         buffer.append("PARTITION BY ")
         comma_separated(buffer, self._exprs)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        parts: list[QueryPart] = []
+        if self._prev is not None:
+            parts.extend((self._prev, " "))
+        parts.extend(("PARTITION BY ", *comma_separated_parts(self._exprs)))
+        return parts
+
 
 class WindowName(Name, IHasOrderBy):
+    __slots__ = ()
+
     @property
     def PartitionBy(self) -> PartitionByKeyword:
         return PartitionByKeyword(self)
@@ -330,6 +434,8 @@ class WindowName(Name, IHasOrderBy):
 
 # SPEC: https://sqlite.org/syntax/over-clause.html
 class FunctionCallWithOver(Expression13):
+    __slots__ = ("_prev", "_arg")
+
     def __init__(
         self, prev: SqlElement, arg: WindowName | WindowDefn | None = None, /
     ) -> None:
@@ -349,8 +455,18 @@ class FunctionCallWithOver(Expression13):
             self._arg._create_query(buffer)
             buffer.append(")")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        if self._arg is None:
+            return (self._prev, " OVER ()")
+        if type(self._arg) is WindowName:
+            return (self._prev, " OVER ", self._arg)
+        return (self._prev, " OVER (", self._arg, ")")
+
 
 class IFunctionCallOver(Expression13, ABC):
+    __slots__ = ()
+
     def Over(self, arg: WindowName | WindowDefn | None = None) -> FunctionCallWithOver:
         return FunctionCallWithOver(self, arg)
 
@@ -358,6 +474,8 @@ class IFunctionCallOver(Expression13, ABC):
 class FunctionCallWithFilter(IFunctionCallOver):
     """A function call with a FILTER clause."""
 
+    __slots__ = ("_prev", "_filter_expr")
+
     def __init__(self, prev: FunctionCall, filter_expr: Expression) -> None:
         self._prev = prev
         self._filter_expr = filter_expr
@@ -369,10 +487,16 @@ class FunctionCallWithFilter(IFunctionCallOver):
         self._filter_expr._create_query(buffer)
         buffer.append(")")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " FILTER (WHERE ", self._filter_expr, ")")
+
 
 class FunctionCall(IFunctionCallOver):
     """A complete function call with arguments."""
 
+    __slots__ = ("_func", "_args", "_star", "_distinct", "_order_by")
+
     def __init__(
         self,
         func: FunctionName,
@@ -405,10 +529,26 @@ class FunctionCall(IFunctionCallOver):
                 comma_separated(buffer, self._order_by)
         buffer.append(")")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        if self._star:
+            return (self._func, "(*)")
+        parts: list[QueryPart] = [self._func, "("]
+        if self._distinct:
+            parts.append("DISTINCT ")
+        parts.extend(comma_separated_parts(self._args))
+        if self._order_by:
+            parts.append(" ORDER BY ")
+            parts.extend(comma_separated_parts(self._order_by))
+        parts.append(")")
+        return parts
+
 
 class FunctionName(SqlElement):
     """A SQL function name that can be called with arguments."""
 
+    __slots__ = ("_name",)
+
     def __init__(self, name: str) -> None:
         self._name = Name(name)
 
@@ -456,3 +596,7 @@ class FunctionName(SqlElement):
     @override
     def _create_query(self, buffer: list[str]) -> None:
         self._name._create_query(buffer)
+
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._name,)
@@ -3,14 +3,18 @@ import math
 from abc import ABC
 from typing import NoReturn, override
 
+from sqlinpython.base import ParameterBuffer
+
 from .core import Expression, Expression13
 
 
 class Literal(Expression13, ABC):
-    pass
+    __slots__ = ()
 
 
 class CurrentTimeKeyword(Literal):
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
@@ -23,6 +27,8 @@ CurrentTime = CurrentTimeKeyword()
 
 
 class CurrentDateKeyword(Literal):
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
@@ -35,6 +41,8 @@ CurrentDate = CurrentDateKeyword()
 
 
 class CurrentTimestampKeyword(Literal):
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
@@ -72,6 +80,8 @@ def _is_hexdigit(c: str) -> bool:
 class NumericLiteral(Literal):
     """Raw SQLite numeric literal. Underscore separators require SQLite >= 3.46.0."""
 
+    __slots__ = ("_s",)
+
     def __init__(self, s: str) -> None:
         state = _State.Start
 
@@ -194,6 +204,8 @@ class NumericLiteral(Literal):
 
 
 class FloatLiteral(Literal):
+    __slots__ = ("_value",)
+
     def __init__(self, value: float) -> None:
         if not math.isfinite(value):
             raise ValueError(
@@ -203,19 +215,37 @@ class FloatLiteral(Literal):
 
     @override
     def _create_query(self, buffer: list[str]) -> None:
+        if isinstance(buffer, ParameterBuffer):
+            buffer.add_parameter(self._value)
+            return
         buffer.append(str(self._value))
 
 
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+
 class IntLiteral(Literal):
+    __slots__ = ("_value",)
+
     def __init__(self, value: int) -> None:
         self._value = value
 
     @override
     def _create_query(self, buffer: list[str]) -> None:
+        # sqlite3 cannot bind integers beyond 64 bits, SQLite reads them as REAL.
+        if (
+            isinstance(buffer, ParameterBuffer)
+            and _INT64_MIN <= self._value <= _INT64_MAX
+        ):
+            buffer.add_parameter(self._value)
+            return
         buffer.append(str(self._value))
 
 
 class HexLiteral(Literal):
+    __slots__ = ("_value",)
+
     def __init__(self, value: int) -> None:
         if value < 0:
             raise ValueError(f"HexLiteral does not accept negative values, got {value}")
@@ -223,29 +253,47 @@ class HexLiteral(Literal):
 
     @override
     def _create_query(self, buffer: list[str]) -> None:
+        # SQLite reads up to 16 hex digits as a two's-complement 64-bit integer
+        # and rejects longer ones.
+        if isinstance(buffer, ParameterBuffer) and self._value < 2**64:
+            value = self._value
+            buffer.add_parameter(value - 2**64 if value > _INT64_MAX else value)
+            return
         buffer.append(f"0x{self._value:X}")
 
 
 class BlobLiteral(Literal):
+    __slots__ = ("_value",)
+
     def __init__(self, value: bytes) -> None:
         self._value = value
 
     @override
     def _create_query(self, buffer: list[str]) -> None:
+        if isinstance(buffer, ParameterBuffer):
+            buffer.add_parameter(self._value)
+            return
         buffer.append(f"X'{self._value.hex().upper()}'")
 
 
 class StringLiteral(Literal):
+    __slots__ = ("_value",)
+
     def __init__(self, value: str) -> None:
         self._value = value
 
     @override
     def _create_query(self, buffer: list[str]) -> None:
+        if isinstance(buffer, ParameterBuffer):
+            buffer.add_parameter(self._value)
+            return
         escaped = self._value.replace("'", "''")
         buffer.append(f"'{escaped}'")
 
 
 class BooleanLiteral(Literal):
+    __slots__ = ("_value",)
+
     def __init__(self, value: bool) -> None:
         self._value = value
 
@@ -255,6 +303,8 @@ class BooleanLiteral(Literal):
 
 
 class NullLiteral(Literal):
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
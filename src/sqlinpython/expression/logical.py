@@ -0,0 +1,212 @@
+"""AND/OR over many conditions, and expression depth checks.
+
+``a.And(b).And(c)`` builds a chain one level deeper per condition, and SQLite
+parses ``a AND b AND c`` the same way: statements with filters of 1000 or
+more conditions fail with "Expression tree is too large". ``and_all`` and
+``or_all`` build a single node holding all the conditions instead:
+
+    query = Select(col("id")).From(TableRef("t")).Where(
+        and_all(*(rule.condition() for rule in rules))
+    )
+
+Up to MAX_FLAT_TERMS conditions render as a plain chain, the same text as
+``.And()``. Longer lists are split into parenthesized groups of at most
+MAX_FLAT_TERMS conditions, so the expression SQLite builds grows with the
+logarithm of the number of conditions instead.
+
+``measure`` reports the depth and node count of an expression, and
+``check_depth`` raises before a too deep statement gets to SQLite.
+"""
+
+from __future__ import annotations
+
+from abc import ABC
+from collections.abc import Sequence
+from typing import NamedTuple, override
+
+from sqlinpython.base import QueryPart, SqlElement
+
+from .core import (
+    AndCondition,
+    Expression,
+    Expression1,
+    Expression2,
+    Expression3,
+    OrCondition,
+    ParenthesizedExpression,
+    _to_expr,
+)
+from .literal import ExpressionOrLiteral, literal
+
+# SQLITE_MAX_EXPR_DEPTH, the default limit of SQLite.
+MAX_EXPR_DEPTH = 1000
+# Conditions rendered in one chain before grouping them.
+MAX_FLAT_TERMS = 64
+
+
+def _joined(terms: Sequence[Expression], separator: str) -> list[QueryPart]:
+    if len(terms) <= MAX_FLAT_TERMS:
+        flat: list[QueryPart] = [terms[0]]
+        for term in terms[1:]:
+            flat.append(separator)
+            flat.append(term)
+        return flat
+    # At most MAX_FLAT_TERMS groups of at least two terms each.
+    size = -(-len(terms) // MAX_FLAT_TERMS)
+    parts: list[QueryPart] = []
+    for start in range(0, len(terms), size):
+        if start:
+            parts.append(separator)
+        group = terms[start : start + size]
+        if len(group) == 1:
+            parts.append(group[0])
+        else:
+            parts.append("(")
+            parts.extend(_joined(group, separator))
+            parts.append(")")
+    return parts
+
+
+def _chain_height(count: int) -> int:
+    """Levels of operators SQLite builds for the rendered chain of count terms."""
+    if count <= MAX_FLAT_TERMS:
+        return count - 1
+    size = -(-count // MAX_FLAT_TERMS)
+    return -(-count // size) - 1 + _chain_height(size)
+
+
+class _Conditions(Expression, ABC):
+    __slots__ = ("_terms",)
+
+    _separator: str
+
+    def __init__(self, terms: tuple[Expression, ...]) -> None:
+        self._terms = terms
+
+    @override
+    def _create_query(self, buffer: list[str]) -> None:
+        for part in _joined(self._terms, self._separator):
+            if isinstance(part, str):
+                buffer.append(part)
+            else:
+                part._create_query(buffer)
+
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return _joined(self._terms, self._separator)
+
+
+class OrConditions(_Conditions, Expression1):
+    """``a OR b OR ...`` over any number of conditions; see or_all."""
+
+    __slots__ = ()
+
+    _separator = " OR "
+
+
+class AndConditions(_Conditions, Expression2):
+    """``a AND b AND ...`` over any number of conditions; see and_all."""
+
+    __slots__ = ()
+
+    _separator = " AND "
+
+
+def _flatten(
+    conditions: Sequence[ExpressionOrLiteral],
+    binary: type[AndCondition | OrCondition],
+    nary: type[_Conditions],
+    operand: type[Expression],
+) -> tuple[Expression, ...]:
+    terms: list[Expression] = []
+    # Nested conditions of the same operator are inlined, without recursion
+    # so that long .And()/.Or() chains can be passed in.
+    stack = [_to_expr(c) for c in reversed(conditions)]
+    while stack:
+        term = stack.pop()
+        if isinstance(term, binary):
+            stack.append(term._right)
+            stack.append(term._left)
+        elif isinstance(term, nary):
+            stack.extend(reversed(term._terms))
+        else:
+            terms.append(term._wrap_parenthesis_if_not(operand))
+    return tuple(terms)
+
+
+def and_all(*conditions: ExpressionOrLiteral) -> Expression:
+    """The conjunction of conditions; TRUE if there are none."""
+    terms = _flatten(conditions, AndCondition, AndConditions, Expression3)
+    if not terms:
+        return literal(True)
+    if len(terms) == 1:
+        return terms[0]
+    return AndConditions(terms)
+
+
+def or_all(*conditions: ExpressionOrLiteral) -> Expression:
+    """The disjunction of conditions; FALSE if there are none."""
+    terms = _flatten(conditions, OrCondition, OrConditions, Expression2)
+    if not terms:
+        return literal(False)
+    if len(terms) == 1:
+        return terms[0]
+    return OrConditions(terms)
+
+
+class ExpressionSize(NamedTuple):
+    # Levels of nested operators, as SQLite counts them against its limit.
+    depth: int
+    # Nodes of the query tree.
+    nodes: int
+
+
+def _height(node: SqlElement) -> int:
+    if isinstance(node, _Conditions):
+        return _chain_height(len(node._terms))
+    if isinstance(node, Expression) and not isinstance(node, ParenthesizedExpression):
+        return 1
+    return 0
+
+
+def measure(element: SqlElement) -> ExpressionSize:
+    """Return the expression depth and node count of element.
+
+    The depth is an upper bound of the depth SQLite computes for the
+    rendered statement: nested subqueries add up, parentheses do not count.
+    """
+    nodes = 0
+    # Heights of the subtrees below the nodes being visited.
+    heights: list[int] = []
+    # A node and -1 before its children are visited, its child count after.
+    stack: list[tuple[SqlElement, int]] = [(element, -1)]
+    while stack:
+        node, children = stack.pop()
+        if children < 0:
+            nodes += 1
+            parts = node._parts()
+            if parts is None:
+                # Nodes rendered by _create_query still have children to count.
+                below = list(node._children())
+            else:
+                below = [p for p in parts if not isinstance(p, str)]
+            stack.append((node, len(below)))
+            stack.extend((child, -1) for child in below)
+            continue
+        tallest = 0
+        if children:
+            tallest = max(heights[-children:])
+            del heights[-children:]
+        heights.append(tallest + _height(node))
+    return ExpressionSize(heights[0], nodes)
+
+
+def check_depth(element: SqlElement, max_depth: int = MAX_EXPR_DEPTH) -> ExpressionSize:
+    """Return measure(element); raise ValueError if it is deeper than max_depth."""
+    size = measure(element)
+    if size.depth > max_depth:
+        raise ValueError(
+            f"expression depth {size.depth} ({size.nodes} nodes) exceeds"
+            f" {max_depth}; combine long condition lists with and_all()/or_all()"
+        )
+    return size
@@ -0,0 +1,559 @@
+"""Constant folding and boolean simplification of expressions.
+
+Generated conditions often carry ``TRUE AND x``, ``x OR FALSE``, ``NOT NOT x``
+or ``1 = 1``, and parentheses that were needed around a subexpression before
+it was simplified. SQLite evaluates them for every row. ``simplify`` returns
+an equivalent expression without them:
+
+    query = Select(col("id")).From(TableRef("t")).Where(
+        simplify(condition, predicate=True)
+    )
+
+- AND and OR with constant operands: ``FALSE AND x`` is FALSE, ``TRUE AND x``
+  is x and ``x OR TRUE`` is TRUE. NULL operands are kept, as ``NULL AND x``
+  is FALSE or NULL depending on x;
+- ``NOT`` of a constant, and ``NOT NOT x``;
+- comparisons, arithmetic, bitwise operators and ``||`` between literals,
+  computed as SQLite does. Results Python cannot reproduce, such as integer
+  overflows that SQLite turns into floats, are left to SQLite;
+- parentheses that the precedence of the operators does not need.
+
+AND, OR and NOT only look at whether their operands are true, false or NULL,
+but ``5 AND TRUE`` is 1, not 5. x replaces ``x AND TRUE`` or ``NOT NOT x``
+only where its truth value is all that matters: in operands of AND, OR and
+NOT, and in the whole expression with ``predicate=True`` (for WHERE, HAVING
+and ON conditions), or when x itself only returns 0, 1 or NULL.
+
+Subqueries are left as they are.
+"""
+
+from __future__ import annotations
+
+import math
+import operator
+from collections.abc import Callable
+from typing import Any
+
+from sqlinpython.base import SqlElement, _field_names, _replaced
+from sqlinpython.select_base import SelectStatement_
+
+from .core import (
+    AndCondition,
+    BetweenExpression,
+    BitOperation,
+    Cast,
+    CollateOperator,
+    Comparison,
+    ConcatLikeOperator,
+    EmptyInExpression,
+    EqExpression,
+    Exists,
+    Expression,
+    Expression1,
+    Expression2,
+    Expression3,
+    Expression4,
+    Expression5,
+    Expression6,
+    Expression7,
+    Expression8,
+    Expression9,
+    Expression10,
+    Expression11,
+    Expression12,
+    Expression13,
+    Factor,
+    InExpressionWithExpressions,
+    InExpressionWithSelect,
+    InExpressionWithTableFunction,
+    InExpressionWithTableName,
+    IsDistinctFromExpression,
+    IsExpression,
+    IsExpressionComplete,
+    IsNotExpression,
+    LikeExpression,
+    LikeExpressionWithEscape,
+    MatchLikeExpression,
+    NeExpression,
+    NegatedOperator,
+    NotExpression,
+    NullCompareExpression,
+    OrCondition,
+    ParenthesizedExpression,
+    Row,
+    Summand,
+    UnaryOperator,
+)
+from .function import FunctionCall
+from .literal import (
+    BlobLiteral,
+    BooleanLiteral,
+    FloatLiteral,
+    IntLiteral,
+    NullLiteral,
+    StringLiteral,
+    literal,
+)
+from .logical import AndConditions, OrConditions, and_all, or_all
+
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+# The precedence class of the operands in each field, as the builders wrap
+# them; see Expression._wrap_parenthesis_if_not.
+_OPERANDS: dict[type[SqlElement], dict[str, type[Expression]]] = {
+    OrCondition: {"_left": Expression1, "_right": Expression2},
+    OrConditions: {"_terms": Expression2},
+    AndCondition: {"_left": Expression2, "_right": Expression3},
+    AndConditions: {"_terms": Expression3},
+    NotExpression: {"_after": Expression3},
+    EqExpression: {"_left": Expression4, "_right": Expression5},
+    NeExpression: {"_left": Expression4, "_right": Expression5},
+    IsExpression: {"_prev": Expression4},
+    # The builders allow Expression4 operands where SQLite, reading from the
+    # left, needs Expression5 or tighter ones.
+    IsExpressionComplete: {"_other": Expression5},
+    BetweenExpression: {
+        "_prev": Expression4,
+        "_lower": Expression5,
+        "_upper": Expression5,
+    },
+    EmptyInExpression: {"_prev": Expression4},
+    InExpressionWithExpressions: {"_prev": Expression4, "_exprs": Expression},
+    InExpressionWithSelect: {"_prev": Expression4},
+    InExpressionWithTableName: {"_prev": Expression4},
+    InExpressionWithTableFunction: {"_prev": Expression4},
+    LikeExpression: {"_prev": Expression4, "_pattern": Expression5},
+    LikeExpressionWithEscape: {"_escape": Expression5},
+    MatchLikeExpression: {"_prev": Expression4, "_pattern": Expression5},
+    NullCompareExpression: {"_prev": Expression4},
+    NegatedOperator: {"_prev": Expression4},
+    Comparison: {"_left": Expression5, "_right": Expression6},
+    BitOperation: {"_left": Expression7, "_right": Expression8},
+    Summand: {"_left": Expression8, "_right": Expression9},
+    Factor: {"_left": Expression9, "_right": Expression10},
+    ConcatLikeOperator: {"_left": Expression10, "_right": Expression11},
+    CollateOperator: {"_left": Expression11},
+    UnaryOperator: {"_left": Expression13},
+    ParenthesizedExpression: {"_prev": Expression},
+    FunctionCall: {"_args": Expression},
+    Cast: {"_expr": Expression},
+    Row: {"_exprs": Expression},
+}
+# Precedence classes, from the one binding tightest.
+_LEVELS = (
+    Expression13,
+    Expression12,
+    Expression11,
+    Expression10,
+    Expression9,
+    Expression8,
+    Expression7,
+    Expression6,
+    Expression5,
+    Expression4,
+    Expression3,
+    Expression2,
+    Expression1,
+)
+_AND_OR = (AndCondition, AndConditions, OrCondition, OrConditions)
+# Expressions that return 0, 1 or NULL.
+_BOOLEAN = (
+    *_AND_OR,
+    NotExpression,
+    EqExpression,
+    NeExpression,
+    Comparison,
+    IsExpressionComplete,
+    BetweenExpression,
+    EmptyInExpression,
+    InExpressionWithExpressions,
+    InExpressionWithSelect,
+    InExpressionWithTableName,
+    InExpressionWithTableFunction,
+    LikeExpression,
+    LikeExpressionWithEscape,
+    NullCompareExpression,
+    Exists,
+    BooleanLiteral,
+    NullLiteral,
+)
+_COMPARISONS: dict[str, Callable[[Any, Any], bool]] = {
+    "=": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+_FLOAT_OPERATORS: dict[str, Callable[[float, float], float]] = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+}
+
+type _Value = int | float | str | bytes | None
+
+
+class _Unknown:
+    """The value of an expression that is not a literal."""
+
+    __slots__ = ()
+
+
+_UNKNOWN = _Unknown()
+
+
+def _strip(expr: Expression) -> Expression:
+    while isinstance(expr, ParenthesizedExpression):
+        expr = expr._prev
+    return expr
+
+
+def _value(expr: Expression) -> _Value | _Unknown:
+    """The value of a literal, booleans as integers and NULL as None."""
+    expr = _strip(expr)
+    if isinstance(expr, BooleanLiteral):
+        return int(expr._value)
+    if isinstance(expr, IntLiteral | FloatLiteral | StringLiteral | BlobLiteral):
+        value: _Value = expr._value
+        return value
+    if isinstance(expr, NullLiteral):
+        return None
+    return _UNKNOWN
+
+
+def _truth(expr: Expression) -> bool | None | _Unknown:
+    """Whether a numeric literal is true, None for NULL."""
+    value = _value(expr)
+    if isinstance(value, int | float):
+        return value != 0
+    if value is None:
+        return None
+    # Text and blobs are true depending on their numeric prefix.
+    return _UNKNOWN
+
+
+def _is_boolean(expr: Expression) -> bool:
+    expr = _strip(expr)
+    if isinstance(expr, IntLiteral):
+        return expr._value in (0, 1)
+    if isinstance(expr, MatchLikeExpression):
+        return expr._op == "GLOB"
+    return isinstance(expr, _BOOLEAN)
+
+
+def _level(expr: Expression) -> type[Expression]:
+    for level in _LEVELS:
+        if isinstance(expr, level):
+            return level
+    return Expression
+
+
+def _fit(
+    parent: type[SqlElement], field: str, old: Expression, new: Expression
+) -> Expression:
+    """new, parenthesized if needed, to replace old in a field of parent."""
+    required = _OPERANDS.get(parent, {}).get(field)
+    if required is None:
+        # Elsewhere new has to bind as tightly as what it replaces.
+        if isinstance(old, ParenthesizedExpression):
+            required = Expression13
+        else:
+            required = _level(old)
+    new = _strip(new)
+    if (
+        parent is UnaryOperator
+        and isinstance(new, IntLiteral | FloatLiteral)
+        and math.copysign(1, new._value) < 0
+    ):
+        # Without parentheses "--1" starts a comment.
+        return ParenthesizedExpression(new)
+    if (
+        parent is IsExpressionComplete
+        and isinstance(new, BooleanLiteral)
+        and not isinstance(_strip(old), BooleanLiteral)
+    ):
+        # "x IS TRUE" tests whether x is true, "x IS (1 = 1)" whether x is 1.
+        return literal(int(new._value))
+    return new._wrap_parenthesis_if_not(required)
+
+
+def _rebuild(
+    node: SqlElement, simplified: Callable[[SqlElement], SqlElement]
+) -> SqlElement:
+    """node with its children replaced by their simplified form."""
+    cls = type(node)
+
+    def replace(field: str, value: object) -> object:
+        if isinstance(value, tuple):
+            items = tuple(replace(field, item) for item in value)
+            same = all(new is old for new, old in zip(items, value, strict=True))
+            return value if same else items
+        if not isinstance(value, SqlElement) or isinstance(value, SelectStatement_):
+            return value
+        new = simplified(value)
+        if new is value:
+            return value
+        if isinstance(value, Expression) and isinstance(new, Expression):
+            return _fit(cls, field, value, new)
+        return new
+
+    changed: dict[str, object] = {}
+    for name in _field_names(cls):
+        if hasattr(node, name):
+            value = getattr(node, name)
+            new = replace(name, value)
+            if new is not value:
+                changed[name] = new
+    return _replaced(node, **changed) if changed else node
+
+
+def _logical(node: Expression, truth_only: bool) -> Expression:
+    """AND or OR without the operands that do not change its result."""
+    binary: type[AndCondition | OrCondition] = AndCondition
+    nary: type[AndConditions | OrConditions] = AndConditions
+    combine = and_all
+    # The value of an operand that decides the result, FALSE for AND.
+    absorbing = False
+    if isinstance(node, OrCondition | OrConditions):
+        binary, nary, combine, absorbing = OrCondition, OrConditions, or_all, True
+    terms: list[Expression] = []
+    stack = [node]
+    while stack:
+        term = _strip(stack.pop())
+        if isinstance(term, binary):
+            stack.append(term._right)
+            stack.append(term._left)
+        elif isinstance(term, nary):
+            stack.extend(reversed(term._terms))
+        else:
+            terms.append(term)
+    kept: list[Expression] = []
+    for term in terms:
+        truth = _truth(term)
+        if truth is absorbing:
+            return BooleanLiteral(absorbing)
+        if truth is not (not absorbing):
+            kept.append(term)
+    if not kept:
+        return BooleanLiteral(not absorbing)
+    if len(kept) == 1 and not truth_only and not _is_boolean(kept[0]):
+        # 5 AND TRUE is 1: keep one of the constants.
+        kept.append(BooleanLiteral(not absorbing))
+    if len(kept) == len(terms):
+        return node
+    return combine(*kept)
+
+
+def _storage_class(value: int | float | str | bytes) -> int:
+    if isinstance(value, int | float):
+        return 0
+    return 1 if isinstance(value, str) else 2
+
+
+def _compare(op: str, left: _Value, right: _Value) -> bool | None:
+    """The result of comparing two values as SQLite does."""
+    if op in ("IS", "IS NOT"):
+        if left is None or right is None:
+            equal = left is None and right is None
+        else:
+            equal = bool(_compare("=", left, right))
+        return equal if op == "IS" else not equal
+    if left is None or right is None:
+        return None
+    left_class, right_class = _storage_class(left), _storage_class(right)
+    if left_class != right_class:
+        # Numbers sort before text, and text before blobs.
+        return _COMPARISONS[op](left_class, right_class)
+    return _COMPARISONS[op](left, right)
+
+
+def _fold_comparison(
+    node: Expression, op: str, left: Expression, right: Expression
+) -> Expression:
+    if op in ("IS", "IS NOT") and isinstance(_strip(right), BooleanLiteral):
+        # "x IS TRUE" tests whether x is true, not whether x = 1.
+        truth = _truth(left)
+        if isinstance(truth, _Unknown):
+            return node
+        matches = truth is not None and truth == (_value(right) == 1)
+        return BooleanLiteral(matches if op == "IS" else not matches)
+    lhs, rhs = _value(left), _value(right)
+    if isinstance(lhs, _Unknown) or isinstance(rhs, _Unknown):
+        return node
+    result = _compare(op, lhs, rhs)
+    return NullLiteral() if result is None else BooleanLiteral(result)
+
+
+def _fold_is(node: IsExpressionComplete) -> Expression:
+    # IS DISTINCT FROM is IS NOT, and IS NOT DISTINCT FROM is IS.
+    is_: SqlElement = node._prev
+    negated = False
+    if isinstance(is_, IsDistinctFromExpression):
+        is_, negated = is_._prev, True
+    if isinstance(is_, IsNotExpression):
+        is_, negated = is_._prev, not negated
+    if not isinstance(is_, IsExpression):
+        return node
+    op = "IS NOT" if negated else "IS"
+    return _fold_comparison(node, op, is_._prev, node._other)
+
+
+def _int64(value: int) -> int | None:
+    return value if _INT64_MIN <= value <= _INT64_MAX else None
+
+
+def _shift(value: int, count: int) -> int:
+    """value << count on 64 bit integers; negative counts shift right."""
+    if count >= 64:
+        return 0
+    if count >= 0:
+        shifted = (value << count) & (2**64 - 1)
+        return shifted - 2**64 if shifted > _INT64_MAX else shifted
+    if count <= -64:
+        return -1 if value < 0 else 0
+    return value >> -count
+
+
+def _int_arithmetic(op: str, left: int, right: int) -> _Value | _Unknown:
+    if op in ("/", "%") and right == 0:
+        return None
+    result: int | None
+    if op == "+":
+        result = _int64(left + right)
+    elif op == "-":
+        result = _int64(left - right)
+    elif op == "*":
+        result = _int64(left * right)
+    elif op == "/":
+        # Rounded towards zero.
+        quotient = abs(left) // abs(right)
+        result = _int64(quotient if (left < 0) == (right < 0) else -quotient)
+    elif op == "%":
+        # With the sign of the dividend.
+        remainder = abs(left) % abs(right)
+        result = -remainder if left < 0 else remainder
+    elif op == "&":
+        result = left & right
+    elif op == "|":
+        result = left | right
+    else:
+        result = _shift(left, right if op == "<<" else -right)
+    # Out of range results are floats in SQLite.
+    return _UNKNOWN if result is None else result
+
+
+def _arithmetic(op: str, left: _Value, right: _Value) -> _Value | _Unknown:
+    """SQLite's result of a binary operator on two literals."""
+    if left is None or right is None:
+        return None
+    if op == "||":
+        # SQLite does not format floats as Python does.
+        if isinstance(left, str | int) and isinstance(right, str | int):
+            return f"{left}{right}"
+        return _UNKNOWN
+    if not isinstance(left, int | float) or not isinstance(right, int | float):
+        # Text converts to numbers by its numeric prefix.
+        return _UNKNOWN
+    if isinstance(left, int) and isinstance(right, int):
+        return _int_arithmetic(op, left, right)
+    if op not in _FLOAT_OPERATORS:
+        # Operators that convert floats to integers.
+        return _UNKNOWN
+    if op == "/" and right == 0:
+        return None
+    value = _FLOAT_OPERATORS[op](left, right)
+    return value if math.isfinite(value) else _UNKNOWN
+
+
+def _fold_unary(node: UnaryOperator) -> Expression:
+    operand = _value(node._left)
+    if operand is None:
+        return literal(None)
+    if node._op == "~":
+        return literal(~operand) if isinstance(operand, int) else node
+    if not isinstance(operand, int | float):
+        return node
+    if node._op == "+":
+        return literal(operand)
+    if isinstance(operand, int):
+        negated = _int64(-operand)
+        return node if negated is None else literal(negated)
+    return literal(-operand)
+
+
+def _fold(node: Expression, truth_only: bool) -> Expression:
+    """node with its own operator simplified; its operands already are."""
+    if isinstance(node, ParenthesizedExpression):
+        return node._prev
+    if isinstance(node, _AND_OR):
+        return _logical(node, truth_only)
+    if isinstance(node, NotExpression):
+        truth = _truth(node._after)
+        if truth is None:
+            return literal(None)
+        if isinstance(truth, bool):
+            return literal(not truth)
+        inner = _strip(node._after)
+        if isinstance(inner, NotExpression) and (
+            truth_only or _is_boolean(inner._after)
+        ):
+            return inner._after
+        return node
+    if isinstance(node, EqExpression):
+        return _fold_comparison(node, "=", node._left, node._right)
+    if isinstance(node, NeExpression):
+        return _fold_comparison(node, "!=", node._left, node._right)
+    if isinstance(node, Comparison):
+        return _fold_comparison(node, node._operator, node._left, node._right)
+    if isinstance(node, IsExpressionComplete):
+        return _fold_is(node)
+    if isinstance(node, Summand | Factor | BitOperation | ConcatLikeOperator):
+        left, right = _value(node._left), _value(node._right)
+        if isinstance(left, _Unknown) or isinstance(right, _Unknown):
+            return node
+        value = _arithmetic(node._operator, left, right)
+        return node if isinstance(value, _Unknown) else literal(value)
+    if isinstance(node, UnaryOperator):
+        return _fold_unary(node)
+    return node
+
+
+def simplify(expr: Expression, *, predicate: bool = False) -> Expression:
+    """An expression equivalent to expr, with its constant parts folded.
+
+    With predicate, the result only has the same truth value as expr, as
+    needed for a WHERE clause: ``x AND TRUE`` becomes x whatever x returns.
+    """
+    # Simplified nodes by id and by whether only their truth value matters.
+    done: dict[tuple[int, bool], SqlElement] = {}
+    stack: list[tuple[SqlElement, bool, bool]] = [(expr, predicate, False)]
+    while stack:
+        node, truth_only, expanded = stack.pop()
+        if (id(node), truth_only) in done:
+            continue
+        # Operands of AND, OR and NOT only count for their truth value.
+        inner = isinstance(node, (*_AND_OR, NotExpression)) or (
+            truth_only and isinstance(node, ParenthesizedExpression)
+        )
+        if not expanded:
+            stack.append((node, truth_only, True))
+            stack.extend(
+                (child, inner, False)
+                for child in node._children()
+                if not isinstance(child, SelectStatement_)
+            )
+            continue
+
+        def simplified(child: SqlElement, inner: bool = inner) -> SqlElement:
+            return done[(id(child), inner)]
+
+        rebuilt = _rebuild(node, simplified)
+        if isinstance(rebuilt, Expression):
+            rebuilt = _fold(rebuilt, truth_only)
+        done[(id(node), truth_only)] = rebuilt
+    result = done[(id(expr), predicate)]
+    assert isinstance(result, Expression)
+    return _strip(result)
@@ -0,0 +1,118 @@
+"""Statement fingerprints, for grouping executions by statement shape.
+
+``fingerprint`` renders a statement with every literal and bind parameter
+replaced by ``?`` and every ``IN (...)`` list of expressions collapsed to a
+single form, so executions that only differ in their values, or in the
+number of values they look up, share a fingerprint:
+
+    fp = fingerprint(query)
+    latency[fp.digest].append(elapsed)
+
+The digest is a short BLAKE2b hash of the normalized text, so it is stable
+across processes and can be stored. Fingerprints of statements are kept in a
+weak table beside the tree, so executing the same statement object again, or
+an interned one, does not normalize it again. Other elements are normalized
+on every call.
+
+Integers that are whole ORDER BY or GROUP BY terms number result columns,
+which changes the shape of the statement: they are kept.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import weakref
+from typing import NamedTuple, override
+
+from sqlinpython.base import (
+    CompleteSqlQuery,
+    ParameterBuffer,
+    ParameterValue,
+    QueryPart,
+    SqlElement,
+)
+from sqlinpython.expression import BindParameter, Literal
+from sqlinpython.expression.core import InExpressionWithExpressions
+from sqlinpython.select import SelectGroupByClause, SelectOrderBy, _is_column_number
+
+PLACEHOLDER = "?"
+IN_LIST = " IN (...)"
+# In bytes; 16 hexadecimal digits.
+DIGEST_SIZE = 8
+
+
+class Fingerprint(NamedTuple):
+    digest: str
+    text: str
+
+
+_fingerprints: weakref.WeakKeyDictionary[CompleteSqlQuery, Fingerprint] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class _PlaceholderBuffer(ParameterBuffer):
+    """Renders the literals of nodes without _parts as placeholders."""
+
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        super().__init__("qmark")
+
+    @override
+    def add_parameter(self, value: ParameterValue) -> None:
+        self.append(PLACEHOLDER)
+
+    @override
+    def add_explicit_parameter(self, text: str) -> None:
+        self.append(PLACEHOLDER)
+
+
+def normalize(element: SqlElement) -> str:
+    """Return the query text of element with its values replaced."""
+    buffer = _PlaceholderBuffer()
+    stack: list[QueryPart] = [element]
+    pop = stack.pop
+    push = stack.extend
+    append = buffer.append
+    while stack:
+        part = pop()
+        if isinstance(part, str):
+            append(part)
+        elif isinstance(part, Literal | BindParameter):
+            append(PLACEHOLDER)
+        elif isinstance(part, InExpressionWithExpressions):
+            push((IN_LIST, part._prev))
+        else:
+            parts = part._parts()
+            if parts is None:
+                part._create_query(buffer)
+            elif isinstance(part, SelectOrderBy | SelectGroupByClause):
+                push(reversed([_column_number(p) for p in parts]))
+            else:
+                push(reversed(tuple(parts)))
+    return "".join(buffer)
+
+
+def _column_number(part: QueryPart) -> QueryPart:
+    if isinstance(part, SqlElement) and _is_column_number(part):
+        text: list[str] = []
+        part._create_query(text)
+        return "".join(text)
+    return part
+
+
+def fingerprint(element: SqlElement) -> Fingerprint:
+    """Return the digest and normalized text of element's statement shape."""
+    if not isinstance(element, CompleteSqlQuery):
+        return _fingerprint(element)
+    result = _fingerprints.get(element)
+    if result is None:
+        result = _fingerprints[element] = _fingerprint(element)
+    return result
+
+
+def _fingerprint(element: SqlElement) -> Fingerprint:
+    text = normalize(element)
+    digest = hashlib.blake2b(text.encode(), digest_size=DIGEST_SIZE).hexdigest()
+    return Fingerprint(digest, text)
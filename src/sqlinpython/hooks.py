@@ -0,0 +1,289 @@
+"""Instrumentation of query construction, rendering and execution.
+
+A ``Hook`` subclass overrides the events it wants to observe:
+
+- ``node_created(cls)``: a query tree node of class cls was constructed;
+- ``query_rendered(statement, seconds)``: ``get_query()`` or
+  ``get_query_and_params()`` rendered statement in seconds;
+- ``statement_executed(statement, sql, prepare_seconds, step_seconds)``: an
+  ``Executor`` ran statement. prepare is the time spent rendering it (or
+  finding it in the compile cache), step the time spent in sqlite3, which
+  compiles the SQL and runs it to its first row;
+- ``rows_fetched(statement, rows, seconds)``: the ``fetchone``, ``fetchmany``,
+  ``fetchall`` or ``stream`` methods of an ``Executor`` read rows of
+  statement, after seconds.
+
+Nothing is timed while no hook observes an event: rendering and execution
+only check a flag, and node construction is only observed through a
+construction listener of sqlinpython.interning while a hook wants it. Only
+actual renders are reported: ``get_query()`` returning the text cached on
+the statement takes no time. ``MetricsRecorder`` is a hook that keeps
+counters and latency histograms in process and exports them as text:
+
+    recorder = MetricsRecorder()
+    with hooked(recorder):
+        serve()
+    print(recorder.export_text())
+"""
+
+from __future__ import annotations
+
+import bisect
+import contextlib
+import math
+import threading
+from collections import Counter
+from collections.abc import Callable, Iterator, Sequence
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from sqlinpython.base import CompleteSqlQuery, SqlElement, TextSink
+
+# Upper bounds of the default latency buckets: 1 us doubling up to ~67 s.
+LATENCY_BUCKETS: tuple[float, ...] = tuple(1e-6 * 2**i for i in range(27))
+# Upper bounds of the default row count buckets: 1 doubling up to ~1 M.
+ROW_BUCKETS: tuple[float, ...] = tuple(float(2**i) for i in range(21))
+
+
+class Hook:
+    """Base class of instrumentation hooks. Every event is a no-op."""
+
+    __slots__ = ()
+
+    def node_created(self, cls: type[SqlElement]) -> None:
+        pass
+
+    def query_rendered(self, statement: CompleteSqlQuery, seconds: float) -> None:
+        pass
+
+    def statement_executed(
+        self,
+        statement: CompleteSqlQuery,
+        sql: str,
+        prepare_seconds: float,
+        step_seconds: float,
+    ) -> None:
+        pass
+
+    def rows_fetched(
+        self, statement: CompleteSqlQuery, rows: int, seconds: float
+    ) -> None:
+        pass
+
+
+_lock = threading.Lock()
+_registered: list[Hook] = []
+# Bound methods of the registered hooks that override each event. Replaced,
+# never mutated, so that emitting needs no lock.
+_query_rendered: tuple[Callable[[CompleteSqlQuery, float], None], ...] = ()
+_statement_executed: tuple[
+    Callable[[CompleteSqlQuery, str, float, float], None], ...
+] = ()
+_rows_fetched: tuple[Callable[[CompleteSqlQuery, int, float], None], ...] = ()
+
+# Whether a registered hook observes rendering, or execution through an
+# Executor. Checked by the code emitting the events before taking any time.
+observing_renders = False
+observing_execution = False
+
+
+def _overrides(hook: Hook, event: str) -> bool:
+    return getattr(type(hook), event) is not getattr(Hook, event)
+
+
+def _listeners(event: str) -> tuple[Any, ...]:
+    return tuple(getattr(h, event) for h in _registered if _overrides(h, event))
+
+
+def register(hook: Hook) -> None:
+    """Start calling hook on the events it overrides."""
+    # Imported here: sqlinpython.base, which interning needs, imports hooks.
+    from sqlinpython import interning
+
+    with _lock:
+        _registered.append(hook)
+        _update()
+        if _overrides(hook, "node_created"):
+            interning.add_construction_listener(hook.node_created)
+
+
+def unregister(hook: Hook) -> None:
+    """Stop calling hook; raises ValueError if it is not registered."""
+    from sqlinpython import interning
+
+    with _lock:
+        _registered.remove(hook)
+        _update()
+        if _overrides(hook, "node_created"):
+            interning.remove_construction_listener(hook.node_created)
+
+
+@contextlib.contextmanager
+def hooked[H: Hook](hook: H) -> Iterator[H]:
+    """Register hook for the duration of the block."""
+    register(hook)
+    try:
+        yield hook
+    finally:
+        unregister(hook)
+
+
+def _update() -> None:
+    global _query_rendered, _statement_executed, _rows_fetched
+    global observing_renders, observing_execution
+    _query_rendered = _listeners("query_rendered")
+    _statement_executed = _listeners("statement_executed")
+    _rows_fetched = _listeners("rows_fetched")
+    observing_renders = bool(_query_rendered)
+    observing_execution = bool(_statement_executed or _rows_fetched)
+
+
+# Emitted by CompleteSqlQuery and Executor while the events are observed.
+
+
+def emit_query_rendered(statement: CompleteSqlQuery, seconds: float) -> None:
+    for listener in _query_rendered:
+        listener(statement, seconds)
+
+
+def emit_statement_executed(
+    statement: CompleteSqlQuery, sql: str, prepare_seconds: float, step_seconds: float
+) -> None:
+    for listener in _statement_executed:
+        listener(statement, sql, prepare_seconds, step_seconds)
+
+
+def emit_rows_fetched(statement: CompleteSqlQuery, rows: int, seconds: float) -> None:
+    for listener in _rows_fetched:
+        listener(statement, rows, seconds)
+
+
+# Built-in recorder
+
+
+class Histogram:
+    """Counts of observed values in buckets with the given upper bounds.
+
+    Values above the last bound are counted in an overflow bucket.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "total", "max")
+
+    def __init__(self, bounds: Sequence[float] = LATENCY_BUCKETS) -> None:
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile (0 <= q <= 1).
+
+        The largest value observed for the overflow bucket, 0.0 if empty.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError(f"q must be between 0 and 1, got {q}")
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+
+class MetricsRecorder(Hook):
+    """Hook keeping counters and histograms of all events in process."""
+
+    __slots__ = (
+        "_lock",
+        "nodes_created",
+        "render_seconds",
+        "prepare_seconds",
+        "step_seconds",
+        "fetch_seconds",
+        "rows",
+    )
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # Constructed nodes by class name.
+        self.nodes_created: Counter[str] = Counter()
+        self.render_seconds = Histogram()
+        self.prepare_seconds = Histogram()
+        self.step_seconds = Histogram()
+        self.fetch_seconds = Histogram()
+        self.rows = Histogram(ROW_BUCKETS)
+
+    def node_created(self, cls: type[SqlElement]) -> None:
+        with self._lock:
+            self.nodes_created[cls.__name__] += 1
+
+    def query_rendered(self, statement: CompleteSqlQuery, seconds: float) -> None:
+        with self._lock:
+            self.render_seconds.observe(seconds)
+
+    def statement_executed(
+        self,
+        statement: CompleteSqlQuery,
+        sql: str,
+        prepare_seconds: float,
+        step_seconds: float,
+    ) -> None:
+        with self._lock:
+            self.prepare_seconds.observe(prepare_seconds)
+            self.step_seconds.observe(step_seconds)
+
+    def rows_fetched(
+        self, statement: CompleteSqlQuery, rows: int, seconds: float
+    ) -> None:
+        with self._lock:
+            self.fetch_seconds.observe(seconds)
+            self.rows.observe(rows)
+
+    def export_text(self) -> str:
+        """The metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+        with self._lock:
+            lines.append("# TYPE sqlinpython_nodes_created_total counter")
+            for name, count in sorted(self.nodes_created.items()):
+                lines.append(
+                    f'sqlinpython_nodes_created_total{{class="{name}"}} {count}'
+                )
+            for metric, histogram in (
+                ("sqlinpython_render_seconds", self.render_seconds),
+                ("sqlinpython_prepare_seconds", self.prepare_seconds),
+                ("sqlinpython_step_seconds", self.step_seconds),
+                ("sqlinpython_fetch_seconds", self.fetch_seconds),
+                ("sqlinpython_fetched_rows", self.rows),
+            ):
+                lines.extend(_histogram_lines(metric, histogram))
+        return "\n".join(lines) + "\n"
+
+    def write_text(self, sink: TextSink) -> None:
+        """Write export_text() to sink, e.g. a text file."""
+        sink.write(self.export_text())
+
+
+def _histogram_lines(metric: str, histogram: Histogram) -> Iterator[str]:
+    yield f"# TYPE {metric} histogram"
+    cumulative = 0
+    for bound, count in zip(histogram.bounds, histogram.counts):
+        cumulative += count
+        yield f'{metric}_bucket{{le="{bound:g}"}} {cumulative}'
+    yield f'{metric}_bucket{{le="+Inf"}} {histogram.count}'
+    yield f"{metric}_sum {histogram.total:g}"
+    yield f"{metric}_count {histogram.count}"
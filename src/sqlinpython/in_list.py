@@ -0,0 +1,162 @@
+"""IN conditions over long lists of values.
+
+``expr.In(*values)`` renders every value inline: with thousands of values the
+statement text is huge, has to be prepared again for every list length, and
+runs into SQLite's limit on the number of bound parameters once the executor
+turns the values into parameters. ``in_list`` picks a form by the length of
+the list instead:
+
+- up to MAX_INLINE_VALUES values, ``expr IN (v1, v2, ...)``;
+- above, ``expr IN (SELECT value FROM json_each(?))``, with the values passed
+  as a single JSON array parameter, so the statement is the same for every
+  list (see ``in_json``).
+
+JSON has no blobs: lists with bytes values stay inline in ``in_list``.
+``in_values`` loads them, as well as lists of more than MAX_JSON_VALUES
+values, into a temporary table, which is emptied when the block ends;
+``TempValues`` does so for any list, to look the same values up from several
+statements:
+
+    with in_values(db, col("id"), ids) as condition:
+        rows = db.fetchall(Select(col("name")).From(TableRef("users")).Where(condition))
+
+benchmarks/bench_in_list.py compares the three forms.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from typing import Self, cast
+
+from sqlinpython.base import ParameterValue
+from sqlinpython.column_definition import ColumnDef
+from sqlinpython.create import Create
+from sqlinpython.delete import Delete
+from sqlinpython.execution import Executor
+from sqlinpython.expression import Expression, col, literal
+from sqlinpython.insert import Insert
+from sqlinpython.name import Name
+from sqlinpython.select import Select
+from sqlinpython.table_or_subquery import TableFunctionRef
+
+# Longest list rendered inline by in_list.
+MAX_INLINE_VALUES = 16
+# Longest list passed as JSON by in_values; longer ones use a temporary table.
+MAX_JSON_VALUES = 1_000_000
+TEMP_SCHEMA = "temp"
+
+type JsonValue = int | float | str
+
+# Levels of the TempValues blocks open on each connection, by id(connection).
+# Tables are named after their level, so every use of a level runs the same
+# statements and the executor prepares them once.
+_open_levels: dict[int, set[int]] = {}
+
+
+def _has_bytes(values: Iterable[ParameterValue]) -> bool:
+    return any(isinstance(value, bytes) for value in values)
+
+
+def in_json(expr: Expression, values: Iterable[JsonValue]) -> Expression:
+    """``expr IN (SELECT value FROM json_each(<values as JSON>))``."""
+    array = json.dumps(list(values), allow_nan=False, separators=(",", ":"))
+    return expr.In(
+        Select(col("value")).From(TableFunctionRef("json_each")(literal(array)))
+    )
+
+
+def in_list(expr: Expression, values: Sequence[ParameterValue]) -> Expression:
+    """``expr IN values``, inline for short lists and as JSON for long ones.
+
+    Lists with bytes values are always inline.
+    """
+    if len(values) <= MAX_INLINE_VALUES or _has_bytes(values):
+        return expr.In(*values)
+    return in_json(expr, cast(Sequence[JsonValue], values))
+
+
+class TempValues:
+    """A temporary table of values, loaded on enter and emptied on exit.
+
+    Blocks nested on a connection use one table per nesting level, which is
+    created on first use and kept for the next block at that level.
+
+    The values are the primary key of the table, which cannot be NULL: None
+    raises ValueError.
+    """
+
+    __slots__ = ("_executor", "_values", "_level", "name")
+
+    name: Name
+
+    def __init__(self, executor: Executor, values: Iterable[ParameterValue]) -> None:
+        self._executor = executor
+        self._values = values
+
+    def __enter__(self) -> Self:
+        db = self._executor
+        levels = _open_levels.setdefault(id(db.connection), set())
+        self._level = next(i for i in itertools.count() if i not in levels)
+        self.name = Name(f"sqlinpython_values_{self._level}")
+        levels.add(self._level)
+        try:
+            db.execute(
+                Create.Temp.Table.IfNotExists(self.name)(
+                    ColumnDef("value").PrimaryKey
+                ).WithoutRowId
+            )
+            # Only the temp schema is written to, which locks no database file.
+            with db.transaction("DEFERRED"):
+                # A rolled back transaction may have restored earlier values.
+                db.execute(Delete.From(TEMP_SCHEMA, self.name))
+                db.executemany(
+                    Insert.OrIgnore.Into(TEMP_SCHEMA, self.name)(
+                        "value"
+                    ).ValuesTemplate,
+                    _rows(self._values),
+                )
+        except BaseException:
+            self._release()
+            raise
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        try:
+            self._executor.execute(Delete.From(TEMP_SCHEMA, self.name))
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        key = id(self._executor.connection)
+        levels = _open_levels[key]
+        levels.discard(self._level)
+        if not levels:
+            del _open_levels[key]
+
+    def contains(self, expr: Expression) -> Expression:
+        """``expr IN temp.<table>``."""
+        return expr.In(Name(TEMP_SCHEMA), self.name)
+
+
+def _rows(values: Iterable[ParameterValue]) -> Iterator[tuple[ParameterValue]]:
+    for value in values:
+        if value is None:
+            raise ValueError("TempValues cannot hold NULL values")
+        yield (value,)
+
+
+@contextmanager
+def in_values(
+    executor: Executor, expr: Expression, values: Sequence[ParameterValue]
+) -> Iterator[Expression]:
+    """``expr IN values`` for statements executed on executor in the block."""
+    if len(values) <= MAX_INLINE_VALUES or (
+        len(values) <= MAX_JSON_VALUES and not _has_bytes(values)
+    ):
+        yield in_list(expr, values)
+        return
+    with TempValues(executor, values) as table:
+        yield table.contains(expr)
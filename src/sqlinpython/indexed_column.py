@@ -1,19 +1,22 @@
 from __future__ import annotations
 
 from abc import ABC
+from collections.abc import Sequence
 from typing import override
 
-from sqlinpython.base import SqlElement
+from sqlinpython.base import QueryPart, SqlElement
 from sqlinpython.ordering_term import IHasNulls
 
 # SPEC: https://sqlite.org/syntax/indexed-column.html
 
 
 class IndexedColumn(SqlElement, ABC):
-    pass
+    __slots__ = ()
 
 
 class IHasAscDesc(IndexedColumn, IHasNulls, ABC):
+    __slots__ = ()
+
     @property
     def Asc(self) -> ColumnNameWithOrdering:
         return ColumnNameWithOrdering(self, True)
@@ -24,6 +27,8 @@ class IHasAscDesc(IndexedColumn, IHasNulls, ABC):
 
 
 class ColumnNameWithOrdering(IHasAscDesc):
+    __slots__ = ("_prev", "_asc")
+
     def __init__(self, prev: SqlElement, asc: bool) -> None:
         self._prev = prev
         self._asc = asc
@@ -33,3 +38,7 @@ class ColumnNameWithOrdering(IHasAscDesc):
         self._prev._create_query(buffer)
         asc_desc = " ASC" if self._asc else " DESC"
         buffer.append(asc_desc)
+
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ASC" if self._asc else " DESC")
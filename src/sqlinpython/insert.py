@@ -2,13 +2,23 @@ from __future__ import annotations
 
 import typing
 from abc import ABC
-from typing import override
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import Any, Protocol, override
 
 from typing_extensions import TypeIs
 
-from sqlinpython.base import CompleteSqlQuery, SqlElement, comma_separated
+from sqlinpython.base import (
+    CompleteSqlQuery,
+    ISqlElement,
+    ParameterBuffer,
+    QueryPart,
+    SqlElement,
+    comma_separated,
+    comma_separated_parts,
+)
 from sqlinpython.expression import (
     AliasedExpression,
+    BindParameter,
     Expression,
     ExpressionOrLiteral,
     Star,
@@ -20,6 +30,32 @@ from sqlinpython.name import Name
 from sqlinpython.returning import ReturningBase
 from sqlinpython.select_base import SelectStatement, SelectStatement_
 
+# Default limits of IInsertBody.ValuesChunked. SQLITE_MAX_VARIABLE_NUMBER is
+# SQLite's compile-time default since 3.32.0.
+DEFAULT_CHUNK_ROWS = 1_000
+DEFAULT_CHUNK_BYTES = 1_000_000
+SQLITE_MAX_VARIABLE_NUMBER = 32_766
+
+
+def _measure(element: ISqlElement) -> tuple[int, int]:
+    """UTF-8 length of the get_query() text of element, and its bind count."""
+    buffer: list[str] = []
+    element._create_query(buffer)
+    params = ParameterBuffer("qmark")
+    element._create_query(params)
+    binds = len(params.params) + len(params.explicit_parameters)
+    return len("".join(buffer).encode()), binds
+
+
+class _Row:
+    __slots__ = ("_exprs",)
+
+    def __init__(self, exprs: tuple[Expression, ...]) -> None:
+        self._exprs = exprs
+
+    def _create_query(self, buffer: list[str]) -> None:
+        comma_separated(buffer, self._exprs)
+
 
 def _is_column_names(
     args: tuple[Name | str | SelectStatement, *tuple[Name | str, ...]],
@@ -27,16 +63,35 @@ def _is_column_names(
     return not isinstance(args[0], SelectStatement_)
 
 
+class SupportsExecuteMany(Protocol):
+    """A DB-API connection or cursor, e.g. sqlite3.Connection."""
+
+    def executemany(self, sql: str, parameters: Iterable[Sequence[Any]], /) -> Any: ...
+
+
 # SPEC: https://sqlite.org/lang_insert.html
 class InsertStatement(CompleteSqlQuery, ABC):
-    pass
+    __slots__ = ()
+
+    def executemany(
+        self, db: SupportsExecuteMany, rows: Iterable[Sequence[Any]]
+    ) -> Any:
+        """Execute the statement once per row through db.executemany.
+
+        The rows are handed to the driver untouched, as its bind parameters,
+        so no nodes are built per row. Meant for templates such as
+        InsertColumnNames.ValuesTemplate; returns what the driver returns.
+        """
+        return db.executemany(self.get_query(), rows)
 
 
 class ReturningClause(InsertStatement, ReturningBase):
-    pass
+    __slots__ = ()
 
 
 class IBeforeReturningClause(InsertStatement, ABC):
+    __slots__ = ()
+
     def Returning(
         self, *args: typing.Literal["*"] | Expression | AliasedExpression | Star_
     ) -> ReturningClause:
@@ -45,6 +100,8 @@ class IBeforeReturningClause(InsertStatement, ABC):
 
 
 class OnConflictUpdateWhere(IBeforeReturningClause):
+    __slots__ = ("_prev", "_condition")
+
     def __init__(self, prev: SqlElement, condition: Expression):
         self._prev = prev
         self._condition = condition
@@ -55,12 +112,18 @@ class OnConflictUpdateWhere(IBeforeReturningClause):
         buffer.append(" WHERE ")
         self._condition._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " WHERE ", self._condition)
+
 
 _Assignment = tuple[Name | tuple[Name, ...], Expression]
 
 
 class OnConflictDoUpdateSet(IBeforeReturningClause):
-    def __init__(self, prev: SqlElement, assignments: list[_Assignment]) -> None:
+    __slots__ = ("_prev", "_assignments")
+
+    def __init__(self, prev: SqlElement, assignments: tuple[_Assignment, ...]) -> None:
         self._prev = prev
         self._assignments = assignments
 
@@ -83,14 +146,33 @@ class OnConflictDoUpdateSet(IBeforeReturningClause):
                 buffer.append(") = ")
             v._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        parts: list[QueryPart] = [self._prev, " UPDATE SET "]
+        for i, (k, v) in enumerate(self._assignments):
+            if i > 0:
+                parts.append(", ")
+            if isinstance(k, Name):
+                parts.extend((k, " = "))
+            else:
+                parts.append("(")
+                parts.extend(comma_separated_parts(k))
+                parts.append(") = ")
+            parts.append(v)
+        return parts
+
 
 class IBeforeUpsertClause(IBeforeReturningClause, ABC):
+    __slots__ = ()
+
     @property
     def OnConflict(self) -> OnConflictClause:
         return OnConflictClause(self)
 
 
 class OnConflictDoNothing(IBeforeUpsertClause):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement):
         self._prev = prev
 
@@ -99,8 +181,14 @@ class OnConflictDoNothing(IBeforeUpsertClause):
         self._prev._create_query(buffer)
         buffer.append(" NOTHING")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " NOTHING")
+
 
 class OnConflictDo(SqlElement):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement) -> None:
         self._prev = prev
 
@@ -131,21 +219,29 @@ class OnConflictDo(SqlElement):
             assignments.append((Name(k), v))
         if not assignments:
             raise ValueError("UpdateSet() requires at least one assignment")
-        return OnConflictDoUpdateSet(self, assignments)
+        return OnConflictDoUpdateSet(self, tuple(assignments))
 
     @override
     def _create_query(self, buffer: list[str]) -> None:
         self._prev._create_query(buffer)
         buffer.append(" DO")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " DO")
+
 
 class IOnConflictDo(SqlElement, ABC):
+    __slots__ = ()
+
     @property
     def Do(self) -> OnConflictDo:
         return OnConflictDo(self)
 
 
 class OnConflictWhere(IOnConflictDo):
+    __slots__ = ("_prev", "_expr")
+
     def __init__(self, prev: SqlElement, expr: Expression):
         self._prev = prev
         self._expr = expr
@@ -156,8 +252,14 @@ class OnConflictWhere(IOnConflictDo):
         buffer.append(" WHERE ")
         self._expr._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " WHERE ", self._expr)
+
 
 class OnConflictCall(IOnConflictDo):
+    __slots__ = ("_prev", "_args")
+
     def __init__(self, prev: SqlElement, args: tuple[IndexedColumn, ...]):
         self._prev = prev
         self._args = args
@@ -172,8 +274,14 @@ class OnConflictCall(IOnConflictDo):
         comma_separated(buffer, self._args)
         buffer.append(")")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, "(", *comma_separated_parts(self._args), ")")
+
 
 class OnConflictClause(IOnConflictDo):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement) -> None:
         self._prev = prev
 
@@ -185,8 +293,14 @@ class OnConflictClause(IOnConflictDo):
         self._prev._create_query(buffer)
         buffer.append(" ON CONFLICT")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ON CONFLICT")
+
 
 class InsertDefaultValues(IBeforeReturningClause):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement) -> None:
         self._prev = prev
 
@@ -195,8 +309,14 @@ class InsertDefaultValues(IBeforeReturningClause):
         self._prev._create_query(buffer)
         buffer.append(" DEFAULT VALUES")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " DEFAULT VALUES")
+
 
 class InsertSelect(IBeforeUpsertClause):
+    __slots__ = ("_prev", "_select_stm")
+
     def __init__(self, prev: SqlElement, select_stm: SelectStatement) -> None:
         self._prev = prev
         self._select_stm = select_stm
@@ -207,8 +327,14 @@ class InsertSelect(IBeforeUpsertClause):
         buffer.append(" ")
         self._select_stm._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ", self._select_stm)
+
 
 class InsertValues(IBeforeUpsertClause):
+    __slots__ = ("_prev", "_values")
+
     def __init__(
         self, prev: SqlElement, values: tuple[tuple[Expression, ...], ...]
     ) -> None:
@@ -226,13 +352,113 @@ class InsertValues(IBeforeUpsertClause):
             comma_separated(buffer, tuple)
             buffer.append(")")
 
+    @override
+    def _parts(self) -> Iterator[QueryPart]:
+        # A generator, so that streaming renders do not expand all rows at once.
+        yield self._prev
+        yield " VALUES "
+        for i, row in enumerate(self._values):
+            yield ", (" if i > 0 else "("
+            yield from comma_separated_parts(row)
+            yield ")"
+
 
 class IInsertBody(SqlElement, ABC):
+    __slots__ = ()
+
     def Values(self, *values: tuple[ExpressionOrLiteral, ...]) -> InsertValues:
         return InsertValues(
             self, tuple(tuple(to_expr(e) for e in row) for row in values)
         )
 
+    @typing.overload
+    def ValuesChunked(
+        self,
+        rows: Iterable[tuple[ExpressionOrLiteral, ...]],
+        *,
+        max_rows: int = ...,
+        max_bytes: int | None = ...,
+        max_binds: int | None = ...,
+    ) -> Iterator[InsertValues]: ...
+    @typing.overload
+    def ValuesChunked[T: InsertStatement](
+        self,
+        rows: Iterable[tuple[ExpressionOrLiteral, ...]],
+        *,
+        tail: Callable[[InsertValues], T],
+        max_rows: int = ...,
+        max_bytes: int | None = ...,
+        max_binds: int | None = ...,
+    ) -> Iterator[T]: ...
+    def ValuesChunked(
+        self,
+        rows: Iterable[tuple[ExpressionOrLiteral, ...]],
+        *,
+        tail: Callable[[InsertValues], InsertStatement] | None = None,
+        max_rows: int = DEFAULT_CHUNK_ROWS,
+        max_bytes: int | None = DEFAULT_CHUNK_BYTES,
+        max_binds: int | None = SQLITE_MAX_VARIABLE_NUMBER,
+    ) -> Iterator[InsertStatement]:
+        """Split rows over as many INSERT ... VALUES statements as needed.
+
+        Each statement holds at most max_rows rows, renders to at most
+        max_bytes UTF-8 bytes with get_query() (the get_query_and_params text
+        is never longer) and has at most max_binds bind parameters once
+        parameterized. tail is applied to every statement, e.g.
+        ``tail=lambda values: values.OnConflict.Do.Nothing.Returning("*")``.
+        Rows are consumed lazily; a row that does not fit on its own raises
+        ValueError. Passing None for max_bytes and max_binds skips measuring
+        the rows.
+        """
+        if max_rows <= 0:
+            raise ValueError(f"max_rows must be positive, got {max_rows}")
+        finish = tail if tail is not None else _identity
+        return self._values_chunked(rows, finish, max_rows, max_bytes, max_binds)
+
+    def _values_chunked(
+        self,
+        rows: Iterable[tuple[ExpressionOrLiteral, ...]],
+        finish: Callable[[InsertValues], InsertStatement],
+        max_rows: int,
+        max_bytes: int | None,
+        max_binds: int | None,
+    ) -> Iterator[InsertStatement]:
+        measured = max_bytes is not None or max_binds is not None
+        byte_limit = max_bytes if max_bytes is not None else float("inf")
+        bind_limit = max_binds if max_binds is not None else float("inf")
+        base_bytes = base_binds = 0
+        if measured:
+            base_bytes, base_binds = _measure(finish(InsertValues(self, ((),))))
+        chunk: list[tuple[Expression, ...]] = []
+        chunk_bytes, chunk_binds = base_bytes, base_binds
+        for i, row in enumerate(rows):
+            exprs = tuple(to_expr(e) for e in row)
+            row_bytes = row_binds = 0
+            if measured:
+                row_bytes, row_binds = _measure(_Row(exprs))
+                # Separator and parentheses: ", (" and ")".
+                row_bytes += 4
+                if base_bytes + row_bytes > byte_limit or (
+                    base_binds + row_binds > bind_limit
+                ):
+                    raise ValueError(
+                        f"Row {i} does not fit in a single statement: "
+                        f"{row_bytes} bytes, {row_binds} bind parameters"
+                    )
+            if chunk and (
+                len(chunk) >= max_rows
+                or chunk_bytes + row_bytes > byte_limit
+                or chunk_binds + row_binds > bind_limit
+            ):
+                yield finish(InsertValues(self, tuple(chunk)))
+                chunk = []
+                chunk_bytes, chunk_binds = base_bytes, base_binds
+            chunk.append(exprs)
+            chunk_bytes += row_bytes
+            chunk_binds += row_binds
+        if chunk:
+            yield finish(InsertValues(self, tuple(chunk)))
+
     def __call__(self, select_stm: SelectStatement, /) -> InsertSelect:
         return InsertSelect(self, select_stm)
 
@@ -241,7 +467,13 @@ class IInsertBody(SqlElement, ABC):
         return InsertDefaultValues(self)
 
 
+def _identity(values: InsertValues) -> InsertValues:
+    return values
+
+
 class InsertColumnNames(IInsertBody):
+    __slots__ = ("_prev", "_column_names")
+
     def __init__(self, prev: SqlElement, column_names: tuple[Name, ...]) -> None:
         self._prev = prev
         self._column_names = column_names
@@ -253,8 +485,20 @@ class InsertColumnNames(IInsertBody):
         comma_separated(buffer, self._column_names)
         buffer.append(")")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " (", *comma_separated_parts(self._column_names), ")")
+
+    @property
+    def ValuesTemplate(self) -> InsertValues:
+        """``VALUES (?, ?, ...)`` with one positional parameter per column."""
+        row = tuple(BindParameter() for _ in self._column_names)
+        return InsertValues(self, (row,))
+
 
 class ICallableWithColumnNames(IInsertBody, ABC):
+    __slots__ = ()
+
     @typing.overload
     def __call__(self, select_stm: SelectStatement, /) -> InsertSelect: ...  # ty: ignore[invalid-overload]  # https://github.com/astral-sh/ty/issues/1746
 
@@ -279,6 +523,8 @@ class ICallableWithColumnNames(IInsertBody, ABC):
 
 
 class InsertNameAs(ICallableWithColumnNames):
+    __slots__ = ("_prev", "_alias")
+
     def __init__(self, prev: SqlElement, alias: Name) -> None:
         self._prev = prev
         self._alias = alias
@@ -289,8 +535,14 @@ class InsertNameAs(ICallableWithColumnNames):
         buffer.append(" AS ")
         self._alias._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " AS ", self._alias)
+
 
 class IntoName(ICallableWithColumnNames):
+    __slots__ = ("_prev", "_schema", "_table")
+
     def __init__(self, prev: SqlElement, schema: Name, table: Name | None) -> None:
         self._prev = prev
         self._schema = schema
@@ -310,8 +562,17 @@ class IntoName(ICallableWithColumnNames):
             buffer.append(".")
             self._table._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        parts: list[QueryPart] = [self._prev, " ", self._schema]
+        if self._table is not None:
+            parts.extend((".", self._table))
+        return parts
+
 
 class Into_(SqlElement):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement) -> None:
         self._prev = prev
 
@@ -329,8 +590,14 @@ class Into_(SqlElement):
         self._prev._create_query(buffer)
         buffer.append(" INTO")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " INTO")
+
 
 class InsertOr(SqlElement):
+    __slots__ = ("_prev", "_conflict")
+
     def __init__(
         self,
         prev: SqlElement,
@@ -348,8 +615,14 @@ class InsertOr(SqlElement):
         self._prev._create_query(buffer)
         buffer.append(f" OR {self._conflict}")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, f" OR {self._conflict}")
+
 
 class InsertKeyword(SqlElement):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement | None = None) -> None:
         self._prev = prev
 
@@ -385,8 +658,16 @@ class InsertKeyword(SqlElement):
             self._prev._create_query(buffer)
             buffer.append(" INSERT")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        if self._prev is None:
+            return ("INSERT",)
+        return (self._prev, " INSERT")
+
 
 class ReplaceKeyword(SqlElement):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement | None = None) -> None:
         self._prev = prev
 
@@ -402,6 +683,12 @@ class ReplaceKeyword(SqlElement):
             self._prev._create_query(buffer)
             buffer.append(" REPLACE")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        if self._prev is None:
+            return ("REPLACE",)
+        return (self._prev, " REPLACE")
+
 
 # Entry point singletons
 Insert = InsertKeyword()
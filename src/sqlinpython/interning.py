@@ -0,0 +1,98 @@
+"""Hash-consing of query tree nodes.
+
+Inside ``with interning():`` every node that is constructed is looked up in a
+table of the nodes built so far, and an existing structurally equal node is
+returned instead of the new one. Workloads that rebuild the same predicates
+over and over then share one copy of each subtree, including its cached
+rendered text.
+
+Outside of an interning block node construction is not affected at all: the
+lookup is installed on the metaclass only while at least one block is active,
+or while a construction listener is registered. Listeners are called with the
+class of every node constructed, e.g. to count them (see sqlinpython.hooks):
+
+    add_construction_listener(lambda cls: counts.update([cls.__name__]))
+"""
+
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from sqlinpython.base import SqlElement, SqlElementMeta
+
+_table: ContextVar[dict[SqlElement, SqlElement] | None] = ContextVar(
+    "sqlinpython_interning_table", default=None
+)
+_lock = threading.Lock()
+_active_blocks = 0
+# Replaced, never mutated, so that constructing nodes needs no lock.
+_listeners: tuple[Callable[[type[SqlElement]], None], ...] = ()
+
+
+def _construct(cls: SqlElementMeta, *args: Any, **kwargs: Any) -> Any:
+    node = super(SqlElementMeta, cls).__call__(*args, **kwargs)
+    table = _table.get()
+    if table is not None:
+        node = table.setdefault(node, node)
+    for listener in _listeners:
+        listener(cls)  # type: ignore[arg-type]
+    return node
+
+
+def _install() -> None:
+    # Called with _lock held.
+    installed = "__call__" in vars(SqlElementMeta)
+    if (_active_blocks or _listeners) and not installed:
+        setattr(SqlElementMeta, "__call__", _construct)
+    elif not (_active_blocks or _listeners) and installed:
+        delattr(SqlElementMeta, "__call__")
+
+
+def add_construction_listener(listener: Callable[[type[SqlElement]], None]) -> None:
+    """Call listener with the class of every node constructed from now on."""
+    global _listeners
+    with _lock:
+        _listeners = (*_listeners, listener)
+        _install()
+
+
+def remove_construction_listener(
+    listener: Callable[[type[SqlElement]], None],
+) -> None:
+    """Stop calling listener; raises ValueError if it was not added."""
+    global _listeners
+    with _lock:
+        listeners = list(_listeners)
+        listeners.remove(listener)
+        _listeners = tuple(listeners)
+        _install()
+
+
+@contextmanager
+def interning(
+    table: dict[SqlElement, SqlElement] | None = None,
+) -> Iterator[dict[SqlElement, SqlElement]]:
+    """Reuse structurally equal nodes constructed inside the block.
+
+    Nested blocks share the table of the enclosing block unless one is
+    passed explicitly. Passing the same table to several blocks keeps the
+    interned nodes alive between them.
+    """
+    global _active_blocks
+    if table is None:
+        table = _table.get()
+        if table is None:
+            table = {}
+    token = _table.set(table)
+    with _lock:
+        _active_blocks += 1
+        _install()
+    try:
+        yield table
+    finally:
+        with _lock:
+            _active_blocks -= 1
+            _install()
+        _table.reset(token)
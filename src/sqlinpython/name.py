@@ -1,15 +1,22 @@
 from __future__ import annotations
 
+import functools
 import re
-from typing import override
+from typing import Any, Self, cast, override
 
 from sqlinpython.base import SqlElement
 
 UNQUOTED_NAME_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
 
 
+# Bounds the interning table of Name instances, see Name.__new__.
+_INTERN_LIMIT = 4096
+_interned: dict[tuple[type[Name], str, bool], Name] = {}
+
+
+@functools.lru_cache(maxsize=_INTERN_LIMIT)
 def quote_if_necessary(s: str, force_quote: bool = False) -> str:
-    result = re.match(UNQUOTED_NAME_PATTERN, s)
+    result = UNQUOTED_NAME_PATTERN.match(s)
 
     if force_quote or result is None:
         s = s.replace('"', '""')
@@ -19,9 +26,35 @@ def quote_if_necessary(s: str, force_quote: bool = False) -> str:
 
 
 class Name(SqlElement):
-    def __init__(self, name: str, force_quote: bool = False) -> None:
-        name = quote_if_necessary(name, force_quote)
-        self._name = name
+    """An identifier, quoted when it is not a plain SQL identifier.
+
+    Names are interned: constructing the same name again returns the shared
+    instance, which is safe because nodes are immutable. The table is
+    cleared once it holds _INTERN_LIMIT names.
+    """
+
+    __slots__ = ("_name",)
+
+    _name: str
+
+    def __new__(cls, name: str, force_quote: bool = False) -> Self:
+        key = (cls, name, force_quote)
+        try:
+            return cast(Self, _interned[key])
+        except KeyError:
+            pass
+        self = super().__new__(cls)
+        self._name = quote_if_necessary(name, force_quote)
+        if len(_interned) >= _INTERN_LIMIT:
+            _interned.clear()
+        _interned[key] = self
+        return self
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # There is no __init__ to restore the slots with, rebuild from the text.
+        if self._name.startswith('"'):
+            return (type(self), (self._name[1:-1].replace('""', '"'), True))
+        return (type(self), (self._name,))
 
     @override
     def _create_query(self, buffer: list[str]) -> None:
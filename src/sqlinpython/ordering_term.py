@@ -1,16 +1,19 @@
 from abc import ABC
+from collections.abc import Sequence
 from typing import override
 
-from sqlinpython.base import SqlElement
+from sqlinpython.base import QueryPart, SqlElement
 
 # SPEC: https://sqlite.org/syntax/ordering-term.html
 
 
 class OrderingTerm(SqlElement, ABC):
-    pass
+    __slots__ = ()
 
 
 class OrderingTermWithNulls(OrderingTerm):
+    __slots__ = ("_prev", "_nulls_first")
+
     def __init__(self, prev: SqlElement, nulls_first: bool) -> None:
         self._prev = prev
         self._nulls_first = nulls_first
@@ -23,8 +26,14 @@ class OrderingTermWithNulls(OrderingTerm):
         else:
             buffer.append(" NULLS LAST")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " NULLS FIRST" if self._nulls_first else " NULLS LAST")
+
 
 class IHasNulls(OrderingTerm, ABC):
+    __slots__ = ()
+
     @property
     def NullsFirst(self) -> OrderingTermWithNulls:
         return OrderingTermWithNulls(self, True)
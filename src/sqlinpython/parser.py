@@ -0,0 +1,1689 @@
+"""Parse SQL text into sqlinpython statements.
+
+``parse`` builds a statement from SQL text with the same builders application
+code uses, so the result can be cached, compared, hashed and rendered like
+any other statement:
+
+    query = parse("SELECT a FROM t WHERE b > 1")
+    assert query == Select(col("a")).From(TableRef("t")).Where(col("b") > literal(1))
+
+The grammar is the part of the SQLite grammar the builders model. SQL
+rendered by ``get_query()`` parses back to a statement that renders to the
+same text. Other spellings are normalized the way the builders render:
+keywords are upper-cased, whitespace and comments are dropped, and
+identifiers quoted with backticks or brackets are double-quoted. SQL the
+builders cannot represent raises ParseError.
+
+``tokenize`` makes a single pass of one regular expression over the text, and
+``parse_script`` reads statements from the token stream one at a time, so
+scripts of many megabytes are parsed in linear time and without holding
+their tokens in memory.
+"""
+
+from __future__ import annotations
+
+import operator
+import re
+from collections import deque
+from collections.abc import Callable, Iterator
+from typing import Any, NamedTuple
+
+from sqlinpython.base import CompleteSqlQuery
+from sqlinpython.builders import (
+    ColumnDef,
+    FunctionName,
+    Name,
+    NestedFromClause,
+    TableFunctionRef,
+    TableName,
+    TableRef,
+    TypeName,
+    WindowName,
+)
+from sqlinpython.builders import Subquery as SubquerySource
+from sqlinpython.expression import (
+    AliasedExpression,
+    BindParameter,
+    BlobLiteral,
+    Cast,
+    ColumnName,
+    Exists,
+    Expression,
+    HexLiteral,
+    Literal,
+    Not,
+    NumericLiteral,
+    Raise,
+    Row,
+    SchemaTableColumnName,
+    Star,
+    Subquery,
+    TableColumnName,
+    literal,
+)
+from sqlinpython.expression.core import (
+    InExpressionWithExpressions,
+    ParenthesizedExpression,
+    UnaryOperator,
+)
+from sqlinpython.keywords import (
+    AlterTable,
+    Analyze,
+    Attach,
+    Begin,
+    Case,
+    Check,
+    Commit,
+    Constraint,
+    Create,
+    CurrentDate,
+    CurrentTime,
+    CurrentTimestamp,
+    Delete,
+    Detach,
+    Drop,
+    End,
+    ForeignKey,
+    Groups,
+    Insert,
+    OrderBy,
+    PartitionBy,
+    Pragma,
+    PrimaryKey,
+    Range,
+    Reindex,
+    Release,
+    Replace,
+    Rollback,
+    Rows,
+    Savepoint,
+    Select,
+    Unique,
+    Update,
+    Vacuum,
+    Values,
+    With,
+)
+from sqlinpython.table_constraint import ConstraintBeforeConflictClause
+from sqlinpython.table_or_subquery import JoinClause, TableStarResultColumn
+
+
+class ParseError(ValueError):
+    """SQL text that is invalid or that the builders cannot represent."""
+
+    def __init__(self, message: str, sql: str, pos: int) -> None:
+        self.pos = pos
+        self.line = sql.count("\n", 0, pos) + 1
+        self.column = pos - sql.rfind("\n", 0, pos)
+        super().__init__(f"{message} (line {self.line}, column {self.column})")
+
+
+class Token(NamedTuple):
+    # One of the kind constants below.
+    kind: str
+    # Upper-cased text of words, text of operators, "" otherwise.
+    key: str
+    text: str
+    pos: int
+
+
+WORD = "word"
+QUOTED = "quoted"
+STRING = "string"
+BLOB = "blob"
+NUMBER = "number"
+PARAMETER = "parameter"
+OPERATOR = "operator"
+END_OF_INPUT = "end of input"
+
+_TOKEN = re.compile(
+    r"""
+    (?P<space> \s+ | --[^\n]* | /\*.*?(?:\*/|\Z) )
+    | (?P<blob> [xX]'[0-9A-Fa-f]*' )
+    | (?P<string> '[^']*(?:''[^']*)*' )
+    | (?P<number>
+        0[xX][0-9A-Fa-f]+
+        | (?: [0-9](?:_?[0-9])* (?:\.(?:[0-9](?:_?[0-9])*)?)? | \.[0-9](?:_?[0-9])* )
+          (?: [eE][-+]?[0-9](?:_?[0-9])* )?
+      )
+    | (?P<word> [^\W0-9][\w$]* )
+    | (?P<quoted> "[^"]*(?:""[^"]*)*" | `[^`]*(?:``[^`]*)*` | \[[^\]]*\] )
+    | (?P<parameter> \?[0-9]* | [:@]\w+ | \$\w+(?:::\w+)*(?:\([^)\s]*\))? )
+    | (?P<operator> ->> | -> | \|\| | << | >> | <= | >= | == | != | <> | [-+*/%&|~<>=(),.;] )
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+
+def tokenize(sql: str) -> Iterator[Token]:
+    """Yield the tokens of sql, without whitespace and comments.
+
+    The last token has kind END_OF_INPUT.
+    """
+    pos = 0
+    for match in _TOKEN.finditer(sql):
+        start = match.start()
+        if start != pos:
+            break
+        pos = match.end()
+        kind = match.lastgroup
+        text = match.group()
+        if kind == WORD:
+            yield Token(WORD, text.upper(), text, start)
+        elif kind == OPERATOR:
+            yield Token(OPERATOR, text, text, start)
+        elif kind != "space":
+            yield Token(kind or "", "", text, start)
+    if pos != len(sql):
+        if sql[pos] in "'\"`[":
+            message = "unterminated quoted text"
+        else:
+            message = f"unexpected character {sql[pos]!r}"
+        raise ParseError(message, sql, pos)
+    yield Token(END_OF_INPUT, "", "", pos)
+
+
+# SQLite keywords, which are not taken as aliases when AS is omitted.
+_KEYWORDS = frozenset(
+    """
+    ABORT ACTION ADD AFTER ALL ALTER ALWAYS ANALYZE AND AS ASC ATTACH
+    AUTOINCREMENT BEFORE BEGIN BETWEEN BY CASCADE CASE CAST CHECK COLLATE
+    COLUMN COMMIT CONFLICT CONSTRAINT CREATE CROSS CURRENT CURRENT_DATE
+    CURRENT_TIME CURRENT_TIMESTAMP DATABASE DEFAULT DEFERRABLE DEFERRED DELETE
+    DESC DETACH DISTINCT DO DROP EACH ELSE END ESCAPE EXCEPT EXCLUDE EXCLUSIVE
+    EXISTS EXPLAIN FAIL FILTER FIRST FOLLOWING FOR FOREIGN FROM FULL GENERATED
+    GLOB GROUP GROUPS HAVING IF IGNORE IMMEDIATE IN INDEX INDEXED INITIALLY
+    INNER INSERT INSTEAD INTERSECT INTO IS ISNULL JOIN KEY LAST LEFT LIKE LIMIT
+    MATCH MATERIALIZED NATURAL NO NOT NOTHING NOTNULL NULL NULLS OF OFFSET ON
+    OR ORDER OTHERS OUTER OVER PARTITION PLAN PRAGMA PRECEDING PRIMARY QUERY
+    RAISE RANGE RECURSIVE REFERENCES REGEXP REINDEX RELEASE RENAME REPLACE
+    RESTRICT RETURNING RIGHT ROLLBACK ROW ROWS SAVEPOINT SELECT SET TABLE TEMP
+    TEMPORARY THEN TIES TO TRANSACTION TRIGGER UNBOUNDED UNION UNIQUE UPDATE
+    USING VACUUM VALUES VIEW VIRTUAL WHEN WHERE WINDOW WITH WITHOUT
+    """.split()
+)
+
+# Keywords that cannot be column names.
+_RESERVED = frozenset(
+    """
+    ALL ALTER AND AS AUTOINCREMENT BETWEEN CASE CHECK COLLATE COMMIT CONSTRAINT
+    CREATE DEFAULT DEFERRABLE DELETE DISTINCT DROP ELSE ESCAPE EXCEPT EXISTS
+    FOREIGN FROM GROUP HAVING IN INDEX INSERT INTERSECT INTO IS ISNULL JOIN
+    LIMIT NOT NOTNULL NULL ON OR ORDER PRIMARY REFERENCES SELECT SET TABLE THEN
+    TO TRANSACTION UNION UNIQUE UPDATE USING VALUES WHEN WHERE
+    """.split()
+)
+
+# Binary operators by precedence, lowest first, from comparisons up to ||.
+_BINARY_LEVELS: tuple[dict[str, Callable[[Any, Any], Any]], ...] = (
+    {"<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge},
+    {
+        "&": operator.and_,
+        "|": operator.or_,
+        "<<": operator.lshift,
+        ">>": operator.rshift,
+    },
+    {"+": operator.add, "-": operator.sub},
+    {"*": operator.mul, "/": operator.truediv, "%": operator.mod},
+    {
+        "||": Expression.Concat,
+        "->": Expression.Extract,
+        "->>": Expression.Extract2,
+    },
+)
+_PATTERN_OPERATORS = frozenset(("BETWEEN", "IN", "LIKE", "GLOB", "REGEXP", "MATCH"))
+_CONFLICT_ACTIONS = frozenset(("ROLLBACK", "ABORT", "FAIL", "IGNORE", "REPLACE"))
+_COLUMN_CONSTRAINTS = frozenset(
+    (
+        "CONSTRAINT",
+        "PRIMARY",
+        "NOT",
+        "NULL",
+        "UNIQUE",
+        "CHECK",
+        "DEFAULT",
+        "COLLATE",
+        "REFERENCES",
+        "GENERATED",
+        "AS",
+    )
+)
+_TABLE_CONSTRAINTS = frozenset(("CONSTRAINT", "PRIMARY", "UNIQUE", "CHECK", "FOREIGN"))
+_FRAME_KINDS = {"RANGE": Range, "ROWS": Rows, "GROUPS": Groups}
+
+
+def _unquote(text: str) -> str:
+    quote = text[0]
+    if quote == "[":
+        return text[1:-1]
+    return text[1:-1].replace(quote * 2, quote)
+
+
+def _number(text: str, negative: bool = False) -> Literal | None:
+    """The literal rendering as text (with a leading "-" if negative).
+
+    None if negative and no literal renders that way.
+    """
+    sign = "-" if negative else ""
+    if text.isdigit():
+        value = int(sign + text)
+        if str(value) == sign + text:
+            return literal(value)
+    elif text[:2] in ("0x", "0X"):
+        if not negative and f"0x{int(text, 16):X}" == text:
+            return HexLiteral(int(text, 16))
+    elif "_" not in text:
+        number = float(sign + text)
+        if str(number) == sign + text:
+            return literal(number)
+    return None if negative else NumericLiteral(text)
+
+
+def _parameter(text: str) -> BindParameter:
+    if text[0] == "?":
+        return BindParameter(int(text[1:])) if len(text) > 1 else BindParameter()
+    name = text[1:]
+    if text[0] == "$":
+        return BindParameter(name, "$")
+    if text[0] == "@":
+        return BindParameter(name, "@")
+    return BindParameter(name)
+
+
+class _Parser:
+    """Recursive descent over the tokens of one SQL text.
+
+    The builders check the combinations they accept, so most methods just
+    chain builder calls and return Any.
+    """
+
+    __slots__ = ("_sql", "_tokens", "_ahead", "_end", "tok")
+
+    def __init__(self, sql: str) -> None:
+        self._sql = sql
+        self._tokens = tokenize(sql)
+        self._ahead: deque[Token] = deque()
+        self._end = Token(END_OF_INPUT, "", "", len(sql))
+        self.tok = next(self._tokens)
+
+    # Token stream
+
+    def _advance(self) -> Token:
+        tok = self.tok
+        self.tok = (
+            self._ahead.popleft() if self._ahead else next(self._tokens, self._end)
+        )
+        return tok
+
+    def _peek(self, n: int = 1) -> Token:
+        ahead = self._ahead
+        while len(ahead) < n:
+            ahead.append(next(self._tokens, self._end))
+        return ahead[n - 1]
+
+    def _accept(self, key: str) -> bool:
+        if self.tok.key == key:
+            self._advance()
+            return True
+        return False
+
+    def _expect(self, key: str) -> Token:
+        if self.tok.key != key:
+            raise self._error(f"expected {key}")
+        return self._advance()
+
+    def _error(self, message: str) -> ParseError:
+        tok = self.tok
+        found = END_OF_INPUT if tok.kind == END_OF_INPUT else repr(tok.text)
+        return ParseError(f"{message}, found {found}", self._sql, tok.pos)
+
+    def _at_end(self) -> bool:
+        return self.tok.kind == END_OF_INPUT or self.tok.key == ";"
+
+    def _guarded[T](self, parse: Callable[[], T]) -> T:
+        start = self.tok.pos
+        try:
+            return parse()
+        except ParseError:
+            raise
+        except RecursionError as exc:
+            # The parser recurses once per level of nesting.
+            raise ParseError("too deeply nested", self._sql, self.tok.pos) from exc
+        except (AttributeError, TypeError, ValueError) as exc:
+            raise ParseError(
+                f"unsupported syntax: {exc}", self._sql, max(start, self.tok.pos - 1)
+            ) from exc
+
+    # Entry points
+
+    def statement_then_end(self) -> CompleteSqlQuery:
+        statement: CompleteSqlQuery = self._guarded(self._statement)
+        self._accept(";")
+        if self.tok.kind != END_OF_INPUT:
+            raise self._error("expected end of statement")
+        return statement
+
+    def statements(self) -> Iterator[CompleteSqlQuery]:
+        while True:
+            while self._accept(";"):
+                pass
+            if self.tok.kind == END_OF_INPUT:
+                return
+            yield self._guarded(self._statement)
+            if self.tok.kind != END_OF_INPUT:
+                self._expect(";")
+
+    def expression_then_end(self) -> Expression:
+        expression: Expression = self._guarded(self._expr)
+        if self.tok.kind != END_OF_INPUT:
+            raise self._error("expected end of expression")
+        return expression
+
+    # Names
+
+    def _is_name(self, tok: Token) -> bool:
+        return tok.kind == WORD or tok.kind == QUOTED
+
+    def _is_alias(self) -> bool:
+        tok = self.tok
+        return tok.kind == QUOTED or (tok.kind == WORD and tok.key not in _KEYWORDS)
+
+    def _ident(self) -> tuple[str, bool]:
+        tok = self.tok
+        if tok.kind == WORD:
+            self._advance()
+            return tok.text, False
+        if tok.kind == QUOTED:
+            self._advance()
+            return _unquote(tok.text), True
+        raise self._error("expected a name")
+
+    def _name(self) -> Name:
+        return Name(*self._ident())
+
+    def _qualified(self) -> tuple[Name, Name | None]:
+        first = self._name()
+        if self._accept("."):
+            return first, self._name()
+        return first, None
+
+    def _names(self) -> list[Name]:
+        self._expect("(")
+        names = [self._name()]
+        while self._accept(","):
+            names.append(self._name())
+        self._expect(")")
+        return names
+
+    def _conflict_action(self) -> str:
+        if self.tok.key not in _CONFLICT_ACTIONS:
+            raise self._error("expected a conflict resolution")
+        return self._advance().key.capitalize()
+
+    # Statements
+
+    def _statement(self) -> Any:
+        key = self.tok.key
+        if key in ("SELECT", "VALUES", "WITH"):
+            return self._select_statement(statement=True)
+        if key in ("INSERT", "REPLACE"):
+            return self._insert(None)
+        if key == "UPDATE":
+            return self._update(None)
+        if key == "DELETE":
+            return self._delete(None)
+        method = _STATEMENTS.get(key)
+        if method is None:
+            raise self._error("expected a statement")
+        return method(self)
+
+    def _with(self) -> Any:
+        self._expect("WITH")
+        keyword: Any = With.Recursive if self._accept("RECURSIVE") else With
+        ctes = [self._cte()]
+        while self._accept(","):
+            ctes.append(self._cte())
+        return keyword(*ctes)
+
+    def _cte(self) -> Any:
+        table: Any = TableName(*self._ident())
+        if self.tok.key == "(":
+            table = table(*self._names())
+        self._expect("AS")
+        as_ = table.As
+        if self._accept("NOT"):
+            self._expect("MATERIALIZED")
+            as_ = as_.Not.Materialized
+        elif self._accept("MATERIALIZED"):
+            as_ = as_.Materialized
+        self._expect("(")
+        select = self._select_statement()
+        self._expect(")")
+        return as_(select)
+
+    def _select_statement(self, statement: bool = False) -> Any:
+        if self.tok.key != "WITH":
+            return self._select(None)
+        with_clause = self._with()
+        key = self.tok.key
+        if statement and key in ("INSERT", "REPLACE"):
+            return self._insert(with_clause)
+        if statement and key == "UPDATE":
+            return self._update(with_clause)
+        if statement and key == "DELETE":
+            return self._delete(with_clause)
+        return self._select(with_clause)
+
+    def _select(self, with_clause: Any) -> Any:
+        query = self._select_core(with_clause)
+        while True:
+            key = self.tok.key
+            if key == "UNION":
+                self._advance()
+                method = "UnionAll" if self._accept("ALL") else "Union"
+            elif key in ("INTERSECT", "EXCEPT"):
+                self._advance()
+                method = key.capitalize()
+            else:
+                break
+            query = getattr(query, method)(self._select_core(None))
+        if self._accept("ORDER"):
+            self._expect("BY")
+            query = query.OrderBy(*self._ordering_terms())
+        return self._limit(query)
+
+    def _select_core(self, with_clause: Any) -> Any:
+        if self._accept("VALUES"):
+            keyword: Any = Values if with_clause is None else with_clause.Values
+            return keyword(*self._rows())
+        self._expect("SELECT")
+        keyword = Select if with_clause is None else with_clause.Select
+        if self._accept("DISTINCT"):
+            keyword = keyword.Distinct
+        elif self._accept("ALL"):
+            keyword = keyword.All
+        query = keyword(*self._result_columns())
+        if self._accept("FROM"):
+            query = query.From(*self._sources())
+        if self._accept("WHERE"):
+            query = query.Where(self._expr())
+        if self._accept("GROUP"):
+            self._expect("BY")
+            query = query.GroupBy(*self._exprs())
+        if self._accept("HAVING"):
+            query = query.Having(self._expr())
+        if self._accept("WINDOW"):
+            windows = [self._named_window()]
+            while self._accept(","):
+                windows.append(self._named_window())
+            query = query.Window(*windows)
+        return query
+
+    def _named_window(self) -> tuple[Name, Any]:
+        name = self._name()
+        self._expect("AS")
+        self._expect("(")
+        definition = self._window_definition()
+        self._expect(")")
+        return name, definition
+
+    def _rows(self) -> list[tuple[Any, ...]]:
+        rows = []
+        while True:
+            self._expect("(")
+            rows.append(() if self.tok.key == ")" else tuple(self._exprs()))
+            self._expect(")")
+            if not self._accept(","):
+                return rows
+
+    def _result_columns(self) -> list[Any]:
+        columns = [self._result_column()]
+        while self._accept(","):
+            columns.append(self._result_column())
+        return columns
+
+    def _result_column(self) -> Any:
+        if self._accept("*"):
+            return "*"
+        if (
+            self._is_name(self.tok)
+            and self._peek().key == "."
+            and self._peek(2).key == "*"
+        ):
+            table = self._name()
+            self._advance()
+            self._advance()
+            return TableStarResultColumn(table)
+        return self._alias_expression(self._expr())
+
+    def _alias_expression(self, expression: Any) -> Any:
+        if self._accept("AS"):
+            return expression.As(self._name())
+        if self._is_alias():
+            return AliasedExpression(expression, self._name(), explicit_as=False)
+        return expression
+
+    def _limit(self, statement: Any) -> Any:
+        if not self._accept("LIMIT"):
+            return statement
+        limit = self._expr()
+        if self._accept("OFFSET"):
+            return statement.Limit(limit).Offset(self._expr())
+        if self._accept(","):
+            return statement.Limit(limit, self._expr())
+        return statement.Limit(limit)
+
+    def _ordering_terms(self) -> list[Any]:
+        terms = [self._ordering_term()]
+        while self._accept(","):
+            terms.append(self._ordering_term())
+        return terms
+
+    def _ordering_term(self) -> Any:
+        term = self._expr()
+        if self._accept("ASC"):
+            term = term.Asc
+        elif self._accept("DESC"):
+            term = term.Desc
+        if self._accept("NULLS"):
+            if self._accept("FIRST"):
+                return term.NullsFirst
+            self._expect("LAST")
+            return term.NullsLast
+        return term
+
+    # FROM clause
+
+    def _sources(self) -> list[Any]:
+        sources = [self._join_clause()]
+        while self._accept(","):
+            sources.append(self._join_clause())
+        return sources
+
+    def _join_clause(self) -> Any:
+        left = self._table_or_subquery()
+        while (method := self._join_operator()) is not None:
+            join = getattr(left, method)(self._table_or_subquery())
+            if self._accept("ON"):
+                left = join.On(self._expr())
+            elif self._accept("USING"):
+                left = join.Using(*self._names())
+            else:
+                left = join
+        return left
+
+    def _join_operator(self) -> str | None:
+        words = []
+        if self.tok.key == "NATURAL":
+            words.append(self._advance().key)
+        if self.tok.key in ("LEFT", "RIGHT", "FULL"):
+            words.append(self._advance().key)
+            if self.tok.key == "OUTER":
+                words.append(self._advance().key)
+        elif self.tok.key in ("INNER", "CROSS"):
+            words.append(self._advance().key)
+        if not words and self.tok.key != "JOIN":
+            return None
+        self._expect("JOIN")
+        return "".join(word.capitalize() for word in words) + "Join"
+
+    def _table_or_subquery(self) -> Any:
+        if self._accept("("):
+            if self.tok.key in ("SELECT", "VALUES", "WITH"):
+                source = SubquerySource(self._select_statement())
+                self._expect(")")
+                return self._alias_source(source)
+            sources = self._sources()
+            self._expect(")")
+            if len(sources) == 1 and isinstance(sources[0], JoinClause):
+                return NestedFromClause(sources[0])
+            return NestedFromClause(tuple(sources))
+        schema, name = self._qualified()
+        if self.tok.key == "(":
+            return self._alias_source(
+                TableFunctionRef(schema, name)(*self._arguments())
+            )
+        table = self._alias_source(TableRef(schema, name))
+        return self._indexed(table)
+
+    def _alias_source(self, source: Any) -> Any:
+        if self._accept("AS"):
+            return source.As(self._name())
+        if self._is_alias():
+            return source.As(self._name(), explicit_as=False)
+        return source
+
+    def _indexed(self, table: Any) -> Any:
+        if self._accept("INDEXED"):
+            self._expect("BY")
+            return table.IndexedBy(self._name())
+        if self.tok.key == "NOT" and self._peek().key == "INDEXED":
+            self._advance()
+            self._advance()
+            return table.NotIndexed
+        return table
+
+    def _arguments(self) -> list[Any]:
+        self._expect("(")
+        if self._accept(")"):
+            return []
+        arguments = self._exprs()
+        self._expect(")")
+        return arguments
+
+    # INSERT, UPDATE and DELETE
+
+    def _insert(self, with_clause: Any) -> Any:
+        if self._accept("REPLACE"):
+            keyword: Any = Replace if with_clause is None else with_clause.Replace
+        else:
+            self._expect("INSERT")
+            keyword = Insert if with_clause is None else with_clause.Insert
+            if self._accept("OR"):
+                keyword = getattr(keyword, "Or" + self._conflict_action())
+        self._expect("INTO")
+        target = keyword.Into(*self._qualified())
+        if self._accept("AS"):
+            target = target.As(self._name())
+        if self.tok.key == "(" and self._peek().key not in ("SELECT", "VALUES", "WITH"):
+            target = target(*self._names())
+        if self._accept("DEFAULT"):
+            self._expect("VALUES")
+            statement = target.DefaultValues
+        elif self._accept("VALUES"):
+            statement = target.Values(*self._rows())
+        else:
+            statement = target(self._select_statement())
+        if self.tok.key == "ON" and self._peek().key == "CONFLICT":
+            statement = self._upsert(statement)
+        return self._returning(statement)
+
+    def _upsert(self, statement: Any) -> Any:
+        self._advance()
+        self._advance()
+        upsert = statement.OnConflict
+        if self._accept("("):
+            columns = [self._indexed_column()]
+            while self._accept(","):
+                columns.append(self._indexed_column())
+            self._expect(")")
+            upsert = upsert(*columns)
+            if self._accept("WHERE"):
+                upsert = upsert.Where(self._expr())
+        self._expect("DO")
+        if self._accept("NOTHING"):
+            return upsert.Do.Nothing
+        self._expect("UPDATE")
+        self._expect("SET")
+        upsert = upsert.Do.UpdateSet(self._assignments())
+        if self._accept("WHERE"):
+            upsert = upsert.Where(self._expr())
+        return upsert
+
+    def _assignments(self) -> dict[Any, Any]:
+        assignments: dict[Any, Any] = {}
+        while True:
+            column: Any
+            if self.tok.key == "(":
+                column = tuple(self._names())
+            else:
+                column = self._name()
+            self._expect("=")
+            assignments[column] = self._expr()
+            if not self._accept(","):
+                return assignments
+
+    def _returning(self, statement: Any) -> Any:
+        if self._accept("RETURNING"):
+            return statement.Returning(*self._result_columns())
+        return statement
+
+    def _update(self, with_clause: Any) -> Any:
+        self._expect("UPDATE")
+        keyword: Any = Update if with_clause is None else with_clause.Update
+        if self._accept("OR"):
+            keyword = getattr(keyword, "Or" + self._conflict_action())
+        table = keyword(*self._qualified())
+        if self._accept("AS"):
+            table = table.As(self._name())
+        table = self._indexed(table)
+        self._expect("SET")
+        statement = table.Set(self._assignments())
+        if self._accept("FROM"):
+            statement = statement.From(*self._sources())
+        return self._where_returning_limit(statement)
+
+    def _delete(self, with_clause: Any) -> Any:
+        self._expect("DELETE")
+        self._expect("FROM")
+        keyword: Any = Delete if with_clause is None else with_clause.Delete
+        table = keyword.From(*self._qualified())
+        if self._accept("AS"):
+            table = table.As(self._name())
+        return self._where_returning_limit(self._indexed(table))
+
+    def _where_returning_limit(self, statement: Any) -> Any:
+        if self._accept("WHERE"):
+            statement = statement.Where(self._expr())
+        statement = self._returning(statement)
+        if self._accept("ORDER"):
+            self._expect("BY")
+            statement = statement.OrderBy(*self._ordering_terms())
+        return self._limit(statement)
+
+    # CREATE
+
+    def _create(self) -> Any:
+        self._expect("CREATE")
+        keyword: Any = Create
+        if self._accept("TEMP"):
+            keyword = keyword.Temp
+        elif self._accept("TEMPORARY"):
+            keyword = keyword.Temporary
+        elif self._accept("UNIQUE"):
+            keyword = keyword.Unique
+        elif self._accept("VIRTUAL"):
+            self._expect("TABLE")
+            return self._create_virtual_table(keyword.VirtualTable)
+        key = self.tok.key
+        if key == "TABLE":
+            self._advance()
+            return self._create_table(keyword.Table)
+        if key == "INDEX":
+            self._advance()
+            return self._create_index(keyword.Index)
+        if key == "VIEW":
+            self._advance()
+            return self._create_view(keyword.View)
+        if key == "TRIGGER":
+            self._advance()
+            return self._create_trigger(keyword.Trigger)
+        raise self._error("expected TABLE, INDEX, VIEW, TRIGGER or VIRTUAL")
+
+    def _if_not_exists(self, keyword: Any) -> Any:
+        if self._accept("IF"):
+            self._expect("NOT")
+            self._expect("EXISTS")
+            return keyword.IfNotExists
+        return keyword
+
+    def _create_table(self, keyword: Any) -> Any:
+        table = self._if_not_exists(keyword)(*self._qualified())
+        if self._accept("AS"):
+            return table.As(self._select_statement())
+        self._expect("(")
+        definitions = []
+        while True:
+            if self.tok.key in _TABLE_CONSTRAINTS:
+                definitions.append(self._table_constraint())
+            else:
+                definitions.append(self._column_definition())
+            if not self._accept(","):
+                break
+        self._expect(")")
+        statement = table(*definitions)
+        if self.tok.key not in ("WITHOUT", "STRICT"):
+            return statement
+        while True:
+            if self._accept("WITHOUT"):
+                self._expect("ROWID")
+                statement = statement.WithoutRowId
+            else:
+                self._expect("STRICT")
+                statement = statement.Strict
+            if not self._accept(","):
+                return statement
+
+    def _column_definition(self) -> Any:
+        column: Any = ColumnDef(self._name())
+        tok = self.tok
+        if self._is_name(tok) and tok.key not in _COLUMN_CONSTRAINTS:
+            column = column(self._type_name())
+        return self._column_constraints(column)
+
+    def _type_name(self) -> Any:
+        type_name: Any = TypeName(*self._ident())
+        tok = self.tok
+        if self._is_name(tok) and tok.key not in _COLUMN_CONSTRAINTS:
+            raise self._error("type names of several words are not supported")
+        if self._accept("("):
+            first = self._type_size()
+            second = self._type_size() if self._accept(",") else None
+            self._expect(")")
+            type_name = type_name(first, second)
+        return type_name
+
+    def _type_size(self) -> int:
+        tok = self.tok
+        if tok.kind != NUMBER or not tok.text.isdigit():
+            raise self._error("expected a type size")
+        self._advance()
+        return int(tok.text)
+
+    def _column_constraints(self, column: Any) -> Any:
+        while True:
+            key = self.tok.key
+            if key == "CONSTRAINT":
+                self._advance()
+                column = column.Constraint(self._name())
+            elif key == "PRIMARY":
+                self._advance()
+                self._expect("KEY")
+                column = column.PrimaryKey
+                if self._accept("ASC"):
+                    column = column.Asc
+                elif self._accept("DESC"):
+                    column = column.Desc
+                column = self._conflict_clause(column)
+                if self._accept("AUTOINCREMENT"):
+                    column = column.AutoIncrement
+            elif key == "NOT":
+                self._advance()
+                self._expect("NULL")
+                column = self._conflict_clause(column.NotNull)
+            elif key == "UNIQUE":
+                self._advance()
+                column = self._conflict_clause(column.Unique)
+            elif key == "CHECK":
+                self._advance()
+                column = column.Check(self._parenthesized())
+            elif key == "DEFAULT":
+                self._advance()
+                column = self._default(column)
+            elif key == "COLLATE":
+                self._advance()
+                column = column.Collate(self._name())
+            elif key == "REFERENCES":
+                self._advance()
+                reference = column.References(self._name())
+                if self.tok.key == "(":
+                    reference = reference(*self._names())
+                column = self._foreign_key_clause(reference)
+            elif key == "GENERATED":
+                self._advance()
+                self._expect("ALWAYS")
+                column = self._generated(column.GeneratedAlways)
+            elif key == "AS":
+                column = self._generated(column)
+            else:
+                return column
+
+    def _parenthesized(self) -> Any:
+        self._expect("(")
+        expression = self._expr()
+        self._expect(")")
+        return expression
+
+    def _conflict_clause(self, constraint: Any) -> Any:
+        if self.tok.key == "ON" and self._peek().key == "CONFLICT":
+            self._advance()
+            self._advance()
+            on_conflict = constraint.OnConflict
+            if isinstance(constraint, ConstraintBeforeConflictClause):
+                # A method rather than a property on table constraints.
+                on_conflict = on_conflict()
+            return getattr(on_conflict, self._conflict_action())
+        return constraint
+
+    def _default(self, column: Any) -> Any:
+        if self.tok.key == "(":
+            value = self._parenthesized()
+            if isinstance(value, Literal):
+                return column.Default(value, force_parenthesis=True)
+            return column.Default(value)
+        sign = self._advance().key if self.tok.key in ("+", "-") else ""
+        tok = self.tok
+        if tok.kind == NUMBER and tok.text.isdigit() and str(int(tok.text)) == tok.text:
+            self._advance()
+            value = int(tok.text)
+            return column.Default(
+                -value if sign == "-" else value, explicit_sign=sign == "+"
+            )
+        if sign == "-" and tok.kind == NUMBER:
+            number = _number(tok.text, negative=True)
+            if number is not None:
+                self._advance()
+                return column.Default(number)
+        if sign:
+            raise self._error("unsupported signed default")
+        value = self._primary()
+        if not isinstance(value, Literal):
+            raise self._error("expected a literal default value")
+        return column.Default(value)
+
+    def _foreign_key_clause(self, reference: Any) -> Any:
+        while True:
+            if self.tok.key == "ON" and self._peek().key in ("DELETE", "UPDATE"):
+                self._advance()
+                event = getattr(reference.On, self._advance().key.capitalize())
+                action = self._advance()
+                if action.key == "SET":
+                    if self._accept("NULL"):
+                        reference = event.SetNull
+                    else:
+                        self._expect("DEFAULT")
+                        reference = event.SetDefault
+                elif action.key == "NO":
+                    self._expect("ACTION")
+                    reference = event.NoAction
+                elif action.key in ("CASCADE", "RESTRICT"):
+                    reference = getattr(event, action.key.capitalize())
+                else:
+                    raise ParseError(
+                        "expected a foreign key action", self._sql, action.pos
+                    )
+            elif self._accept("MATCH"):
+                reference = reference.Match(self._name())
+            elif self.tok.key == "NOT" and self._peek().key == "DEFERRABLE":
+                self._advance()
+                self._advance()
+                return self._initially(reference.Not.Deferrable)
+            elif self._accept("DEFERRABLE"):
+                return self._initially(reference.Deferrable)
+            else:
+                return reference
+
+    def _initially(self, deferrable: Any) -> Any:
+        if not self._accept("INITIALLY"):
+            return deferrable
+        if self._accept("DEFERRED"):
+            return deferrable.Initially.Deferred
+        self._expect("IMMEDIATE")
+        return deferrable.Initially.Immediate
+
+    def _generated(self, column: Any) -> Any:
+        self._expect("AS")
+        generated = column.As(self._parenthesized())
+        if self._accept("STORED"):
+            return generated.Stored
+        if self._accept("VIRTUAL"):
+            return generated.Virtual
+        return generated
+
+    def _table_constraint(self) -> Any:
+        if self._accept("CONSTRAINT"):
+            named = Constraint(self._name())
+            primary_key, unique = named.PrimaryKey, named.Unique
+            check, foreign_key = named.Check, named.ForeignKey
+        else:
+            primary_key, unique = PrimaryKey, Unique
+            check, foreign_key = Check, ForeignKey
+        if self._accept("PRIMARY"):
+            self._expect("KEY")
+            self._expect("(")
+            columns = self._indexed_columns()
+            autoincrement = self._accept("AUTOINCREMENT")
+            self._expect(")")
+            return self._conflict_clause(
+                primary_key(*columns, autoincrement=autoincrement)
+            )
+        if self._accept("UNIQUE"):
+            self._expect("(")
+            columns = self._indexed_columns()
+            self._expect(")")
+            return self._conflict_clause(unique(*columns))
+        if self._accept("CHECK"):
+            return check(self._parenthesized())
+        self._expect("FOREIGN")
+        self._expect("KEY")
+        names = self._names()
+        self._expect("REFERENCES")
+        reference: Any = foreign_key(*names).References(self._name())
+        if self.tok.key == "(":
+            reference = reference(*self._names())
+        return self._foreign_key_clause(reference)
+
+    def _indexed_columns(self) -> list[Any]:
+        columns = [self._indexed_column()]
+        while self._accept(","):
+            columns.append(self._indexed_column())
+        return columns
+
+    def _indexed_column(self) -> Any:
+        column = self._expr()
+        if self._accept("ASC"):
+            return column.Asc
+        if self._accept("DESC"):
+            return column.Desc
+        return column
+
+    def _create_index(self, keyword: Any) -> Any:
+        index = self._if_not_exists(keyword)(*self._qualified())
+        self._expect("ON")
+        table = self._name()
+        self._expect("(")
+        columns = self._indexed_columns()
+        self._expect(")")
+        statement = index.On(table, *columns)
+        if self._accept("WHERE"):
+            statement = statement.Where(self._expr())
+        return statement
+
+    def _create_view(self, keyword: Any) -> Any:
+        view = self._if_not_exists(keyword)(*self._qualified())
+        if self.tok.key == "(":
+            view = view(*self._names())
+        self._expect("AS")
+        return view.As(self._select_statement())
+
+    def _create_trigger(self, keyword: Any) -> Any:
+        trigger = self._if_not_exists(keyword)(*self._qualified())
+        if self._accept("BEFORE"):
+            trigger = trigger.Before
+        elif self._accept("AFTER"):
+            trigger = trigger.After
+        elif self._accept("INSTEAD"):
+            self._expect("OF")
+            trigger = trigger.InsteadOf
+        if self._accept("DELETE"):
+            event = trigger.Delete
+        elif self._accept("INSERT"):
+            event = trigger.Insert
+        else:
+            self._expect("UPDATE")
+            event = trigger.Update
+            if self._accept("OF"):
+                names = [self._name()]
+                while self._accept(","):
+                    names.append(self._name())
+                event = event.Of(*names)
+        self._expect("ON")
+        trigger = event.On(self._name())
+        if self._accept("FOR"):
+            self._expect("EACH")
+            self._expect("ROW")
+            trigger = trigger.ForEachRow
+        if self._accept("WHEN"):
+            trigger = trigger.When(self._expr())
+        self._expect("BEGIN")
+        statements = []
+        while self.tok.key != "END":
+            key = self.tok.key
+            if key in ("INSERT", "REPLACE"):
+                statements.append(self._insert(None))
+            elif key == "UPDATE":
+                statements.append(self._update(None))
+            elif key == "DELETE":
+                statements.append(self._delete(None))
+            else:
+                statements.append(self._select_statement())
+            self._expect(";")
+        self._advance()
+        return trigger.Begin(*statements).End
+
+    def _create_virtual_table(self, keyword: Any) -> Any:
+        table = self._if_not_exists(keyword)(*self._qualified())
+        self._expect("USING")
+        statement = table.Using(self._name())
+        if self.tok.key != "(":
+            return statement
+        # Module arguments are kept as written, they are not SQL expressions.
+        self._advance()
+        arguments = []
+        depth = 0
+        start = end = self.tok.pos
+        while depth or self.tok.key != ")":
+            tok = self._advance()
+            if tok.kind == END_OF_INPUT:
+                raise self._error("expected )")
+            if tok.key == "," and not depth:
+                arguments.append(self._sql[start:end])
+                start = end = self.tok.pos
+                continue
+            if tok.key == "(":
+                depth += 1
+            elif tok.key == ")":
+                depth -= 1
+            end = tok.pos + len(tok.text)
+        if end > start or arguments:
+            arguments.append(self._sql[start:end])
+        self._advance()
+        return statement(*arguments)
+
+    # Other statements
+
+    def _drop(self) -> Any:
+        self._expect("DROP")
+        key = self.tok.key
+        if key not in ("TABLE", "VIEW", "INDEX", "TRIGGER"):
+            raise self._error("expected TABLE, VIEW, INDEX or TRIGGER")
+        self._advance()
+        keyword = getattr(Drop, key.capitalize())
+        if self._accept("IF"):
+            self._expect("EXISTS")
+            keyword = keyword.IfExists
+        return keyword(*self._qualified())
+
+    def _alter_table(self) -> Any:
+        self._expect("ALTER")
+        self._expect("TABLE")
+        table: Any = AlterTable(*self._qualified())
+        if self._accept("RENAME"):
+            rename = table.Rename
+            if self._accept("TO"):
+                return rename.To(self._name())
+            if self._accept("COLUMN"):
+                rename = rename.Column
+            column = rename(self._name())
+            self._expect("TO")
+            return column.To(self._name())
+        if self._accept("ADD"):
+            add = table.Add
+            if self._accept("COLUMN"):
+                return add.Column(self._column_definition())
+            if self._accept("CONSTRAINT"):
+                named = add.Constraint(self._name())
+                self._expect("CHECK")
+                return named.Check(self._parenthesized())
+            if self._accept("CHECK"):
+                return self._conflict_clause(add.Check(self._parenthesized()))
+            return add(self._column_definition())
+        if self._accept("DROP"):
+            drop = table.Drop
+            if self._accept("COLUMN"):
+                return drop.Column(self._name())
+            if self._accept("CONSTRAINT"):
+                return drop.Constraint(self._name())
+            return drop(self._name())
+        self._expect("ALTER")
+        alter = table.Alter
+        if self._accept("COLUMN"):
+            alter = alter.Column
+        column = alter(self._name())
+        if self._accept("DROP"):
+            self._expect("NOT")
+            self._expect("NULL")
+            return column.DropNotNull
+        self._expect("SET")
+        self._expect("NOT")
+        self._expect("NULL")
+        return self._conflict_clause(column.SetNotNull)
+
+    def _begin(self) -> Any:
+        self._expect("BEGIN")
+        statement: Any = Begin
+        if self.tok.key in ("DEFERRED", "IMMEDIATE", "EXCLUSIVE"):
+            statement = getattr(statement, self._advance().key.capitalize())
+        if self._accept("TRANSACTION"):
+            statement = statement.Transaction
+        return statement
+
+    def _commit(self) -> Any:
+        statement: Any = End if self._advance().key == "END" else Commit
+        if self._accept("TRANSACTION"):
+            statement = statement.Transaction
+        return statement
+
+    def _rollback(self) -> Any:
+        self._expect("ROLLBACK")
+        statement: Any = Rollback
+        if self._accept("TRANSACTION"):
+            statement = statement.Transaction
+        if self._accept("TO"):
+            to = statement.To
+            if self._accept("SAVEPOINT"):
+                to = to.Savepoint
+            statement = to(self._name())
+        return statement
+
+    def _savepoint(self) -> Any:
+        self._expect("SAVEPOINT")
+        return Savepoint(self._name())
+
+    def _release(self) -> Any:
+        self._expect("RELEASE")
+        keyword: Any = Release.Savepoint if self._accept("SAVEPOINT") else Release
+        return keyword(self._name())
+
+    def _pragma(self) -> Any:
+        self._expect("PRAGMA")
+        statement: Any = Pragma(*self._qualified())
+        if self._accept("="):
+            return statement(self._pragma_value(), eq=True)
+        if self._accept("("):
+            value = self._pragma_value()
+            self._expect(")")
+            return statement(value)
+        return statement
+
+    def _pragma_value(self) -> bool | int | Name:
+        sign = self._advance().key if self.tok.key in ("+", "-") else ""
+        tok = self.tok
+        if tok.kind == NUMBER and tok.text.isdigit() and sign != "+":
+            self._advance()
+            return int(sign + tok.text)
+        if sign:
+            raise self._error("expected a number")
+        if tok.key in ("TRUE", "FALSE") and tok.text.islower():
+            self._advance()
+            return tok.key == "TRUE"
+        return self._name()
+
+    def _analyze(self) -> Any:
+        self._expect("ANALYZE")
+        if self._at_end():
+            return Analyze
+        return Analyze(*self._qualified())
+
+    def _attach(self) -> Any:
+        self._expect("ATTACH")
+        keyword: Any = Attach.Database if self._accept("DATABASE") else Attach
+        database = keyword(self._expr())
+        self._expect("AS")
+        return database.As(self._name())
+
+    def _detach(self) -> Any:
+        self._expect("DETACH")
+        keyword: Any = Detach.Database if self._accept("DATABASE") else Detach
+        return keyword(self._name())
+
+    def _reindex(self) -> Any:
+        self._expect("REINDEX")
+        if self._at_end():
+            return Reindex
+        if self.tok.key == "EXPRESSIONS" and self.tok.kind == WORD:
+            self._advance()
+            return Reindex.Expressions
+        schema, name = self._qualified()
+        if name is not None:
+            return Reindex.Schema(schema, name)
+        return Reindex(schema)
+
+    def _vacuum(self) -> Any:
+        self._expect("VACUUM")
+        statement: Any = Vacuum
+        if self._is_name(self.tok) and self.tok.key != "INTO":
+            statement = statement(self._name())
+        if self._accept("INTO"):
+            if self.tok.kind not in (STRING, WORD, QUOTED):
+                raise self._error("expected a file name")
+            statement = statement.Into(self._advance().text)
+        return statement
+
+    # Expressions, lowest precedence first
+
+    def _exprs(self) -> list[Any]:
+        expressions = [self._expr()]
+        while self._accept(","):
+            expressions.append(self._expr())
+        return expressions
+
+    def _expr(self) -> Any:
+        left = self._and()
+        while self._accept("OR"):
+            left = left.Or(self._and())
+        return left
+
+    def _and(self) -> Any:
+        left = self._not()
+        while self._accept("AND"):
+            left = left.And(self._not())
+        return left
+
+    def _not(self) -> Any:
+        if self._accept("NOT"):
+            return Not(self._not())
+        return self._equality()
+
+    def _equality(self) -> Any:
+        left = self._binary(0)
+        while True:
+            key = self.tok.key
+            if key in ("=", "=="):
+                self._advance()
+                left = left.eq(self._binary(0), double_eq=key == "==")
+            elif key in ("!=", "<>"):
+                self._advance()
+                left = left.ne(self._binary(0), arrows=key == "<>")
+            elif key == "IS":
+                self._advance()
+                is_ = left.Is
+                if self._accept("NOT"):
+                    is_ = is_.Not
+                if self._accept("DISTINCT"):
+                    self._expect("FROM")
+                    is_ = is_.DistinctFrom
+                left = is_(self._binary(0))
+            elif key == "ISNULL":
+                self._advance()
+                left = left.IsNull
+            elif key == "NOTNULL":
+                self._advance()
+                left = left.Notnull
+            elif key == "NOT" and self._peek().key == "NULL":
+                self._advance()
+                self._advance()
+                left = left.Not.Null
+            elif key == "NOT" and self._peek().key in _PATTERN_OPERATORS:
+                self._advance()
+                left = self._pattern(left.Not)
+            elif key in _PATTERN_OPERATORS:
+                left = self._pattern(left)
+            else:
+                return left
+
+    def _pattern(self, left: Any) -> Any:
+        key = self._advance().key
+        if key == "BETWEEN":
+            low = self._binary(0)
+            self._expect("AND")
+            return left.Between(low, self._binary(0))
+        if key == "IN":
+            return self._in(left)
+        if key == "LIKE":
+            like = left.Like(self._binary(0))
+            if self._accept("ESCAPE"):
+                return like.Escape(self._binary(0))
+            return like
+        return getattr(left, key.capitalize())(self._binary(0))
+
+    def _in(self, left: Any) -> Any:
+        if self._accept("("):
+            if self._accept(")"):
+                return left.In()
+            if self.tok.key in ("SELECT", "VALUES", "WITH"):
+                select = self._select_statement()
+                self._expect(")")
+                return left.In(select)
+            expressions = self._exprs()
+            self._expect(")")
+            # Not left.In(...), which takes a single column name as a table.
+            return InExpressionWithExpressions(left, tuple(expressions))
+        schema, name = self._qualified()
+        if self.tok.key == "(":
+            return left.In(TableFunctionRef(schema, name)(*self._arguments()))
+        return left.In(schema) if name is None else left.In(schema, name)
+
+    def _binary(self, level: int) -> Any:
+        if level == len(_BINARY_LEVELS):
+            return self._collate()
+        operators = _BINARY_LEVELS[level]
+        left = self._binary(level + 1)
+        while (function := operators.get(self.tok.key)) is not None:
+            self._advance()
+            left = function(left, self._binary(level + 1))
+        return left
+
+    def _collate(self) -> Any:
+        expression = self._unary()
+        while self._accept("COLLATE"):
+            expression = expression.Collate(self._name())
+        return expression
+
+    def _unary(self) -> Any:
+        key = self.tok.key
+        if key not in ("-", "+", "~"):
+            return self._primary()
+        self._advance()
+        if key == "-" and self.tok.kind == NUMBER:
+            number = _number(self.tok.text, negative=True)
+            if number is not None:
+                self._advance()
+                return number
+        return UnaryOperator(self._unary(), key)  # type: ignore[arg-type]
+
+    def _primary(self) -> Any:
+        tok = self.tok
+        kind = tok.kind
+        if kind == NUMBER:
+            self._advance()
+            number = _number(tok.text)
+            assert number is not None
+            return number
+        if kind == STRING:
+            self._advance()
+            return literal(_unquote(tok.text))
+        if kind == BLOB:
+            self._advance()
+            return BlobLiteral(bytes.fromhex(tok.text[2:-1]))
+        if kind == PARAMETER:
+            self._advance()
+            return _parameter(tok.text)
+        if tok.key == "(":
+            self._advance()
+            if self.tok.key in ("SELECT", "VALUES", "WITH"):
+                select = self._select_statement()
+                self._expect(")")
+                return Subquery(select)
+            expressions = self._exprs()
+            self._expect(")")
+            if len(expressions) > 1:
+                return Row(*expressions)
+            return ParenthesizedExpression(expressions[0])
+        if kind == WORD:
+            method = _PRIMARIES.get(tok.key)
+            if method is not None:
+                return method(self)
+        if kind == QUOTED or (kind == WORD and tok.key not in _RESERVED):
+            return self._column_or_call()
+        raise self._error("expected an expression")
+
+    def _keyword_literal(self) -> Any:
+        key = self._advance().key
+        if key == "NULL":
+            return literal(None)
+        if key in ("TRUE", "FALSE"):
+            return literal(key == "TRUE")
+        if key == "CURRENT_TIME":
+            return CurrentTime
+        if key == "CURRENT_DATE":
+            return CurrentDate
+        return CurrentTimestamp
+
+    def _cast(self) -> Any:
+        self._expect("CAST")
+        self._expect("(")
+        expression = self._expr()
+        self._expect("AS")
+        type_name = self._type_name()
+        self._expect(")")
+        return Cast(expression, type_name)
+
+    def _case(self) -> Any:
+        self._expect("CASE")
+        case: Any = Case if self.tok.key == "WHEN" else Case(self._expr())
+        while self._accept("WHEN"):
+            when = case.When(self._expr())
+            self._expect("THEN")
+            case = when.Then(self._expr())
+        if self._accept("ELSE"):
+            case = case.Else(self._expr())
+        self._expect("END")
+        return case.End
+
+    def _exists(self) -> Any:
+        self._expect("EXISTS")
+        self._expect("(")
+        select = self._select_statement()
+        self._expect(")")
+        return Exists(select)
+
+    def _raise(self) -> Any:
+        self._expect("RAISE")
+        self._expect("(")
+        if self._accept("IGNORE"):
+            result: Any = Raise.Ignore
+        else:
+            action = self._conflict_action()
+            self._expect(",")
+            result = getattr(Raise, action)(self._expr())
+        self._expect(")")
+        return result
+
+    def _column_or_call(self) -> Any:
+        if self._peek().key == "(":
+            name, _ = self._ident()
+            return self._function_call(FunctionName(name))
+        parts = [self._ident()]
+        while self.tok.key == "." and self._is_name(self._peek()):
+            self._advance()
+            parts.append(self._ident())
+        if len(parts) == 1:
+            return ColumnName(*parts[0])
+        if len(parts) == 2:
+            return TableColumnName(Name(*parts[0]), Name(*parts[1]))
+        if len(parts) == 3:
+            return SchemaTableColumnName(
+                Name(*parts[0]), Name(*parts[1]), Name(*parts[2])
+            )
+        raise self._error("expected a column name")
+
+    def _function_call(self, function: FunctionName) -> Any:
+        self._expect("(")
+        call: Any
+        if self._accept("*"):
+            call = function(Star)
+        elif self.tok.key == ")":
+            call = function()
+        else:
+            distinct = self._accept("DISTINCT")
+            arguments = self._exprs()
+            order_by = None
+            if self._accept("ORDER"):
+                self._expect("BY")
+                order_by = tuple(self._ordering_terms())
+            call = function(*arguments, distinct=distinct, order_by=order_by)
+        self._expect(")")
+        if self._accept("FILTER"):
+            self._expect("(")
+            self._expect("WHERE")
+            call = call.FilterWhere(self._expr())
+            self._expect(")")
+        if self._accept("OVER"):
+            if self._accept("("):
+                definition = self._window_definition()
+                self._expect(")")
+                call = call.Over(definition)
+            else:
+                call = call.Over(WindowName(*self._ident()))
+        return call
+
+    def _window_definition(self) -> Any:
+        definition: Any = None
+        tok = self.tok
+        if tok.kind == QUOTED or (
+            tok.kind == WORD
+            and tok.key not in ("PARTITION", "ORDER", "RANGE", "ROWS", "GROUPS")
+        ):
+            definition = WindowName(*self._ident())
+        if self._accept("PARTITION"):
+            self._expect("BY")
+            expressions = self._exprs()
+            if definition is None:
+                definition = PartitionBy(*expressions)
+            else:
+                definition = definition.PartitionBy(*expressions)
+        if self._accept("ORDER"):
+            self._expect("BY")
+            terms = self._ordering_terms()
+            if definition is None:
+                definition = OrderBy(*terms)
+            else:
+                definition = definition.OrderBy(*terms)
+        key = self.tok.key
+        if key in _FRAME_KINDS:
+            self._advance()
+            if definition is None:
+                frame = _FRAME_KINDS[key]
+            else:
+                frame = getattr(definition, key.capitalize())
+            definition = self._frame_spec(frame)
+        return definition
+
+    def _frame_spec(self, frame: Any) -> Any:
+        if self._accept("BETWEEN"):
+            between = frame.Between
+            if self._accept("UNBOUNDED"):
+                self._expect("PRECEDING")
+                start = between.UnboundedPreceding
+            elif self._accept("CURRENT"):
+                self._expect("ROW")
+                start = between.CurrentRow
+            else:
+                start = between(self._frame_bound())
+            self._expect("AND")
+            and_ = start.And
+            if self._accept("UNBOUNDED"):
+                self._expect("FOLLOWING")
+                spec = and_.UnboundedFollowing
+            elif self._accept("CURRENT"):
+                self._expect("ROW")
+                spec = and_.CurrentRow
+            else:
+                spec = and_(self._frame_bound())
+        elif self._accept("UNBOUNDED"):
+            self._expect("PRECEDING")
+            spec = frame.UnboundedPreceding
+        elif self._accept("CURRENT"):
+            self._expect("ROW")
+            spec = frame.CurrentRow
+        else:
+            expression = self._expr()
+            self._expect("PRECEDING")
+            spec = frame(expression.Preceding)
+        if not self._accept("EXCLUDE"):
+            return spec
+        if self._accept("NO"):
+            self._expect("OTHERS")
+            return spec.ExcludeNoOthers
+        if self._accept("CURRENT"):
+            self._expect("ROW")
+            return spec.ExcludeCurrentRow
+        if self._accept("GROUP"):
+            return spec.ExcludeGroup
+        self._expect("TIES")
+        return spec.ExcludeTies
+
+    def _frame_bound(self) -> Any:
+        expression = self._expr()
+        if self._accept("PRECEDING"):
+            return expression.Preceding
+        self._expect("FOLLOWING")
+        return expression.Following
+
+
+_STATEMENTS: dict[str, Callable[[_Parser], Any]] = {
+    "CREATE": _Parser._create,
+    "DROP": _Parser._drop,
+    "ALTER": _Parser._alter_table,
+    "BEGIN": _Parser._begin,
+    "COMMIT": _Parser._commit,
+    "END": _Parser._commit,
+    "ROLLBACK": _Parser._rollback,
+    "SAVEPOINT": _Parser._savepoint,
+    "RELEASE": _Parser._release,
+    "PRAGMA": _Parser._pragma,
+    "ANALYZE": _Parser._analyze,
+    "ATTACH": _Parser._attach,
+    "DETACH": _Parser._detach,
+    "REINDEX": _Parser._reindex,
+    "VACUUM": _Parser._vacuum,
+}
+
+_PRIMARIES: dict[str, Callable[[_Parser], Any]] = {
+    "NULL": _Parser._keyword_literal,
+    "TRUE": _Parser._keyword_literal,
+    "FALSE": _Parser._keyword_literal,
+    "CURRENT_TIME": _Parser._keyword_literal,
+    "CURRENT_DATE": _Parser._keyword_literal,
+    "CURRENT_TIMESTAMP": _Parser._keyword_literal,
+    "CAST": _Parser._cast,
+    "CASE": _Parser._case,
+    "EXISTS": _Parser._exists,
+    "RAISE": _Parser._raise,
+}
+
+
+def parse(sql: str) -> CompleteSqlQuery:
+    """Parse a single SQL statement, optionally followed by a semicolon."""
+    return _Parser(sql).statement_then_end()
+
+
+def parse_script(sql: str) -> Iterator[CompleteSqlQuery]:
+    """Parse the semicolon-separated statements of sql, one at a time."""
+    return _Parser(sql).statements()
+
+
+def parse_expression(sql: str) -> Expression:
+    """Parse a single SQL expression."""
+    return _Parser(sql).expression_then_end()
@@ -0,0 +1,262 @@
+"""EXPLAIN QUERY PLAN analysis of built statements.
+
+``analyze_plan`` asks SQLite for the plan of a statement, parses it into a
+tree of steps and flags the steps that usually mean a missing index:
+
+- full table scans (``SCAN t``, as opposed to scans of a covering index);
+- temporary B-trees built to sort rows for ORDER BY, GROUP BY or DISTINCT;
+- automatic indexes SQLite builds for a single execution.
+
+Each finding carries the node of the statement it comes from: the table
+source (``TableRef``, possibly aliased, or an aliased subquery) named by the
+step, or for temporary B-trees the FROM clause source whose rows are sorted,
+the whole ``JoinClause`` for joins:
+
+    for finding in analyze_plan(query, connection).findings:
+        print(finding.kind, finding.detail, finding.node)
+
+``assert_no_scan`` checks a statement against a schema given as ``Create``
+statements, to catch plan regressions in tests:
+
+    def test_orders_by_customer_uses_index() -> None:
+        assert_no_scan(query, [create_orders, create_orders_index], "orders")
+"""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any, NamedTuple
+
+from sqlinpython.base import CompleteSqlQuery, QueryPart, SqlElement
+from sqlinpython.name import Name
+from sqlinpython.table_or_subquery import (
+    Aliased,
+    JoinClause,
+    JoinRhs,
+    Subquery,
+    TableRef,
+    TableRefIndexedBy,
+    TableRefNotIndexed,
+)
+
+FULL_SCAN = "full scan"
+TEMP_B_TREE = "temp b-tree"
+AUTOMATIC_INDEX = "automatic index"
+
+# Older SQLite versions spell "SCAN TABLE t AS x" where newer ones print "SCAN x".
+_LOOP = re.compile(
+    r"(?P<op>SCAN|SEARCH) (?:TABLE )?(?P<table>.+?)(?: AS (?P<alias>.+?))?"
+    r"(?: USING (?P<index>.*))?$"
+)
+# Scans of a constant row or of an unnamed materialized subquery.
+_UNNAMED = re.compile(r"CONSTANT ROW$|SUBQUERY \d+$|\(")
+_TEMP_B_TREE = re.compile(r"USE TEMP B-TREE FOR (?P<purpose>.*)$")
+
+
+class PlanStep(NamedTuple):
+    id: int
+    parent: int
+    detail: str
+    children: tuple[PlanStep, ...]
+
+
+class Finding(NamedTuple):
+    kind: str
+    # The step of the plan, e.g. "SCAN t" or "USE TEMP B-TREE FOR ORDER BY".
+    detail: str
+    # The table scanned or searched, without its schema; None for temporary
+    # B-trees.
+    table: str | None
+    # The source of the statement the step comes from, None if not found.
+    node: SqlElement | None
+
+
+class QueryPlan(NamedTuple):
+    steps: tuple[PlanStep, ...]
+    findings: tuple[Finding, ...]
+
+    def text(self) -> str:
+        """The plan as an indented tree, like the sqlite3 shell prints it."""
+        lines: list[str] = []
+        stack = [(step, 0) for step in reversed(self.steps)]
+        while stack:
+            step, depth = stack.pop()
+            lines.append("  " * depth + step.detail)
+            stack.extend((child, depth + 1) for child in reversed(step.children))
+        return "\n".join(lines)
+
+
+def _unquote(name: Name) -> str:
+    text = name._name
+    if text.startswith('"'):
+        return text[1:-1].replace('""', '"')
+    return text
+
+
+def _table_ref(node: SqlElement) -> TableRef | None:
+    while isinstance(node, TableRefIndexedBy | TableRefNotIndexed | Aliased):
+        node = node._prev
+    return node if isinstance(node, TableRef) else None
+
+
+def _table_name(ref: TableRef) -> str:
+    return _unquote(ref._schema if ref._table is None else ref._table)
+
+
+def _plan_name(node: SqlElement) -> str | None:
+    """The name steps use for node if it is a table source, else None."""
+    while isinstance(node, TableRefIndexedBy | TableRefNotIndexed):
+        node = node._prev
+    if isinstance(node, Aliased):
+        return _unquote(node._alias)
+    if isinstance(node, TableRef):
+        return _table_name(node)
+    return None
+
+
+def _sources(
+    statement: SqlElement,
+) -> dict[str, tuple[SqlElement, SqlElement]]:
+    """Table sources of statement by plan name, with their FROM clause source.
+
+    The FROM clause source is the outermost join containing the table
+    source, or the table source itself. When several sources share a name
+    the first one is kept.
+    """
+    sources: dict[str, tuple[SqlElement, SqlElement]] = {}
+    stack: list[tuple[QueryPart, SqlElement | None]] = [(statement, None)]
+    while stack:
+        part, join = stack.pop()
+        if isinstance(part, str):
+            continue
+        if isinstance(part, Subquery):
+            # Its FROM clause is not part of the enclosing join.
+            join = None
+        elif join is None and isinstance(part, JoinClause | JoinRhs):
+            join = part
+        name = _plan_name(part)
+        if name is not None:
+            sources.setdefault(name.casefold(), (part, join or part))
+            if _table_ref(part) is not None:
+                continue
+        parts = part._parts()
+        if parts is not None:
+            stack.extend((p, join) for p in reversed(tuple(parts)))
+    return sources
+
+
+def _source(
+    sources: Mapping[str, tuple[SqlElement, SqlElement]], name: str
+) -> tuple[SqlElement, SqlElement] | None:
+    # Newer SQLite versions print "SCAN main.t" for main.t, older ones "SCAN t".
+    name = name.casefold()
+    source = sources.get(name)
+    if source is None and "." in name:
+        source = sources.get(name.partition(".")[2])
+    return source
+
+
+def _steps(rows: Sequence[tuple[Any, ...]]) -> tuple[PlanStep, ...]:
+    children: dict[int, list[tuple[int, str]]] = {}
+    for id_, parent, _, detail in rows:
+        children.setdefault(parent, []).append((id_, detail))
+
+    def build(parent: int) -> tuple[PlanStep, ...]:
+        return tuple(
+            PlanStep(id_, parent, detail, build(id_))
+            for id_, detail in children.get(parent, ())
+        )
+
+    return build(0)
+
+
+def _findings(
+    steps: tuple[PlanStep, ...],
+    sources: Mapping[str, tuple[SqlElement, SqlElement]],
+    findings: list[Finding],
+) -> None:
+    loops = [(step, _LOOP.match(step.detail)) for step in steps]
+    # The FROM clause source of the loops these steps belong to.
+    from_source: SqlElement | None = None
+    for _, match in loops:
+        if match is not None:
+            source = _source(sources, match["alias"] or match["table"])
+            if source is not None:
+                from_source = source[1]
+                break
+    for step, match in loops:
+        if match is not None:
+            name = match["alias"] or match["table"]
+            node, _ = _source(sources, name) or (None, None)
+            ref = _table_ref(node) if node is not None else None
+            table = _table_name(ref) if ref is not None else match["table"]
+            index = match["index"] or ""
+            if index.startswith("AUTOMATIC "):
+                findings.append(Finding(AUTOMATIC_INDEX, step.detail, table, node))
+            elif (
+                match["op"] == "SCAN"
+                and not index.startswith("COVERING INDEX")
+                and not _UNNAMED.match(name)
+            ):
+                findings.append(Finding(FULL_SCAN, step.detail, table, node))
+        elif _TEMP_B_TREE.match(step.detail):
+            findings.append(Finding(TEMP_B_TREE, step.detail, None, from_source))
+        _findings(step.children, sources, findings)
+
+
+def analyze_plan(
+    statement: CompleteSqlQuery,
+    connection: sqlite3.Connection,
+    parameters: Sequence[Any] | Mapping[str, Any] = (),
+) -> QueryPlan:
+    """Explain statement on connection and flag the costly steps of its plan.
+
+    The statement is explained with its literals inline; parameters are the
+    values of its BindParameters, if any.
+    """
+    rows = connection.execute(
+        "EXPLAIN QUERY PLAN " + statement.get_query(), parameters
+    ).fetchall()
+    steps = _steps(rows)
+    findings: list[Finding] = []
+    _findings(steps, _sources(statement), findings)
+    return QueryPlan(steps, tuple(findings))
+
+
+def schema_connection(schema: Iterable[CompleteSqlQuery]) -> sqlite3.Connection:
+    """An in-memory database with the statements of schema executed on it."""
+    connection = sqlite3.connect(":memory:")
+    for statement in schema:
+        connection.execute(statement.get_query())
+    return connection
+
+
+def assert_no_scan(
+    statement: CompleteSqlQuery,
+    schema: Iterable[CompleteSqlQuery],
+    *tables: str,
+) -> None:
+    """Fail if the plan of statement against schema fully scans a table.
+
+    Only scans of the given tables fail if any are given. The error lists
+    the whole plan.
+    """
+    connection = schema_connection(schema)
+    try:
+        plan = analyze_plan(statement, connection)
+    finally:
+        connection.close()
+    wanted = {table.casefold() for table in tables}
+    scans = [
+        finding
+        for finding in plan.findings
+        if finding.kind == FULL_SCAN
+        and (not wanted or (finding.table or "").casefold() in wanted)
+    ]
+    if scans:
+        raise AssertionError(
+            f"{', '.join(f.detail for f in scans)} in the plan of"
+            f" {statement.get_query()}:\n{plan.text()}"
+        )
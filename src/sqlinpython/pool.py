@@ -0,0 +1,290 @@
+"""Thread-safe pool of sqlite3 connections to one database file.
+
+SQLite allows one writer and many concurrent readers (in WAL mode), so the
+pool keeps a single writer connection and up to ``readers`` reader
+connections. Connections are opened on demand and configured once with a
+profile of PRAGMA statements, then reused:
+
+    pool = ConnectionPool("app.db", readers=8)
+    with pool.reader() as db:
+        rows = db.fetchall(query)
+    with pool.writer() as db:
+        db.execute(update)
+
+Writes made in a ``writer()`` block are committed when it exits, or rolled
+back if it raises. Checked out connections are
+``sqlinpython.execution.Executor`` objects, so
+each connection also keeps its rendered statement cache between checkouts.
+Idle connections are checked with a trivial query before they are handed
+out, and connections older than ``max_age`` seconds are closed when they are
+returned.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from typing import Any, Self
+
+from sqlinpython.execution import Executor, connect
+from sqlinpython.expression import literal
+from sqlinpython.pragma import Pragma, PragmaStatement
+from sqlinpython.select import Select
+
+# Applied to every connection of the pool.
+DEFAULT_PROFILE: tuple[PragmaStatement, ...] = (
+    Pragma("journal_mode")("wal", eq=True),
+    Pragma("busy_timeout")(5_000, eq=True),
+    # Negative values are in KiB: 64 MiB of page cache per connection.
+    Pragma("cache_size")(-64 * 1024, eq=True),
+    Pragma("mmap_size")(256 * 1024 * 1024, eq=True),
+)
+# Applied to reader connections after the profile.
+READER_PROFILE: tuple[PragmaStatement, ...] = (Pragma("query_only")(True, eq=True),)
+
+DEFAULT_READERS = 4
+DEFAULT_MAX_AGE = 3600.0
+
+_HEALTH_CHECK = Select(literal(1))
+
+
+class PoolMetrics:
+    """Snapshot of the counters of a ConnectionPool."""
+
+    __slots__ = (
+        "reader_checkouts",
+        "writer_checkouts",
+        "wait_seconds",
+        "max_wait_seconds",
+        "opened",
+        "recycled",
+        "failed_health_checks",
+    )
+
+    def __init__(self) -> None:
+        self.reader_checkouts = 0
+        self.writer_checkouts = 0
+        # Time spent waiting for a free connection, over all checkouts.
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.opened = 0
+        self.recycled = 0
+        self.failed_health_checks = 0
+
+    @property
+    def checkouts(self) -> int:
+        return self.reader_checkouts + self.writer_checkouts
+
+    def _copy(self) -> PoolMetrics:
+        copy = PoolMetrics()
+        for name in self.__slots__:
+            setattr(copy, name, getattr(self, name))
+        return copy
+
+
+class _PooledConnection:
+    __slots__ = ("executor", "opened_at")
+
+    def __init__(self, executor: Executor) -> None:
+        self.executor = executor
+        self.opened_at = time.monotonic()
+
+
+class _Role:
+    """Connections of one kind (readers or the writer) and their limit."""
+
+    __slots__ = ("idle", "open", "limit", "profile")
+
+    def __init__(self, limit: int, profile: Sequence[PragmaStatement]) -> None:
+        self.idle: list[_PooledConnection] = []
+        self.open = 0
+        self.limit = limit
+        self.profile = profile
+
+
+class ConnectionPool:
+    """One writer and up to ``readers`` reader connections to database.
+
+    database should be a file (or a shared-cache URI): every connection of
+    the pool opens it separately. Keyword arguments are passed to
+    sqlinpython.execution.connect.
+    """
+
+    __slots__ = (
+        "database",
+        "max_age",
+        "health_check",
+        "_connect_kwargs",
+        "_readers",
+        "_writer",
+        "_condition",
+        "_metrics",
+        "_closed",
+    )
+
+    def __init__(
+        self,
+        database: str,
+        *,
+        readers: int = DEFAULT_READERS,
+        profile: Sequence[PragmaStatement] = DEFAULT_PROFILE,
+        reader_profile: Sequence[PragmaStatement] = READER_PROFILE,
+        max_age: float | None = DEFAULT_MAX_AGE,
+        health_check: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        if readers < 1:
+            raise ValueError(f"readers must be at least 1, got {readers}")
+        self.database = database
+        self.max_age = max_age
+        self.health_check = health_check
+        self._connect_kwargs = {"check_same_thread": False, **kwargs}
+        self._readers = _Role(readers, (*profile, *reader_profile))
+        self._writer = _Role(1, tuple(profile))
+        self._condition = threading.Condition()
+        self._metrics = PoolMetrics()
+        self._closed = False
+
+    @property
+    def metrics(self) -> PoolMetrics:
+        with self._condition:
+            return self._metrics._copy()
+
+    @contextlib.contextmanager
+    def reader(self, timeout: float | None = None) -> Iterator[Executor]:
+        """Check out a reader connection for the duration of the block.
+
+        Raises TimeoutError if none is free within timeout seconds.
+        """
+        with self._checkout(self._readers, timeout) as executor:
+            yield executor
+
+    @contextlib.contextmanager
+    def writer(self, timeout: float | None = None) -> Iterator[Executor]:
+        """Check out the writer connection for the duration of the block.
+
+        A transaction left open by the block is committed when the block
+        exits normally and rolled back when it raises.
+        """
+        with self._checkout(self._writer, timeout) as executor:
+            yield executor
+            if executor.connection.in_transaction:
+                executor.connection.commit()
+
+    @contextlib.contextmanager
+    def _checkout(self, role: _Role, timeout: float | None) -> Iterator[Executor]:
+        pooled = self._acquire(role, timeout)
+        try:
+            yield pooled.executor
+        finally:
+            self._release(role, pooled)
+
+    def _acquire(self, role: _Role, timeout: float | None) -> _PooledConnection:
+        start = time.monotonic()
+        deadline = None if timeout is None else start + timeout
+        pooled: _PooledConnection | None = None
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise sqlite3.ProgrammingError("Cannot operate on a closed pool.")
+                if role.idle:
+                    pooled = role.idle.pop()
+                    break
+                if role.open < role.limit:
+                    # Reserve the place, the connection is opened unlocked.
+                    role.open += 1
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"no connection free after {timeout} seconds")
+                self._condition.wait(remaining)
+            waited = time.monotonic() - start
+            metrics = self._metrics
+            if role is self._writer:
+                metrics.writer_checkouts += 1
+            else:
+                metrics.reader_checkouts += 1
+            metrics.wait_seconds += waited
+            metrics.max_wait_seconds = max(metrics.max_wait_seconds, waited)
+
+        if pooled is not None and self.health_check and not _is_healthy(pooled):
+            with self._condition:
+                self._metrics.failed_health_checks += 1
+            with contextlib.suppress(sqlite3.Error):
+                pooled.executor.close()
+            pooled = None
+        if pooled is None:
+            try:
+                pooled = self._open(role)
+            except BaseException:
+                with self._condition:
+                    role.open -= 1
+                    self._condition.notify()
+                raise
+        return pooled
+
+    def _open(self, role: _Role) -> _PooledConnection:
+        executor = connect(self.database, **self._connect_kwargs)
+        try:
+            for pragma in role.profile:
+                executor.connection.execute(pragma.get_query()).fetchall()
+        except BaseException:
+            executor.close()
+            raise
+        with self._condition:
+            self._metrics.opened += 1
+        return _PooledConnection(executor)
+
+    def _release(self, role: _Role, pooled: _PooledConnection) -> None:
+        connection = pooled.executor.connection
+        expired = (
+            self.max_age is not None
+            and time.monotonic() - pooled.opened_at >= self.max_age
+        )
+        broken = False
+        try:
+            if connection.in_transaction:
+                connection.rollback()
+        except sqlite3.Error:
+            broken = True
+        with self._condition:
+            discard = expired or broken or self._closed
+            if discard:
+                role.open -= 1
+                if expired:
+                    self._metrics.recycled += 1
+            else:
+                role.idle.append(pooled)
+            self._condition.notify()
+        if discard:
+            with contextlib.suppress(sqlite3.Error):
+                pooled.executor.close()
+
+    def close(self) -> None:
+        """Close the idle connections; busy ones are closed when returned."""
+        with self._condition:
+            self._closed = True
+            idle = [*self._readers.idle, *self._writer.idle]
+            for role in (self._readers, self._writer):
+                role.open -= len(role.idle)
+                role.idle.clear()
+            self._condition.notify_all()
+        for pooled in idle:
+            pooled.executor.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def _is_healthy(pooled: _PooledConnection) -> bool:
+    try:
+        pooled.executor.connection.execute(_HEALTH_CHECK.get_query()).fetchall()
+    except sqlite3.Error:
+        return False
+    return True
@@ -1,18 +1,21 @@
 from __future__ import annotations
 
 from abc import ABC
+from collections.abc import Sequence
 from typing import override
 
-from sqlinpython.base import CompleteSqlQuery, SqlElement
+from sqlinpython.base import CompleteSqlQuery, QueryPart, SqlElement
 from sqlinpython.name import Name
 
 
 # SPEC: https://sqlite.org/pragma.html
 class PragmaStatement(CompleteSqlQuery, ABC):
-    pass
+    __slots__ = ()
 
 
 class PragmaWithValue(PragmaStatement):
+    __slots__ = ("_prev", "_value", "_eq")
+
     def __init__(
         self, prev: SqlElement, value: bool | int | str | Name, eq: bool
     ) -> None:
@@ -36,8 +39,23 @@ class PragmaWithValue(PragmaStatement):
         if not self._eq:
             buffer.append(")")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        value = self._value
+        if isinstance(value, bool):
+            value = "true" if value else "false"
+        elif isinstance(value, int):
+            value = str(value)
+        elif isinstance(value, str):
+            value = Name(value)
+        if self._eq:
+            return (self._prev, " = ", value)
+        return (self._prev, " (", value, ")")
+
 
 class PragmaName(PragmaStatement):
+    __slots__ = ("_prev", "_schema", "_name")
+
     def __init__(self, prev: SqlElement, schema: Name, name: Name | None) -> None:
         self._prev = prev
         self._schema = schema
@@ -60,8 +78,17 @@ class PragmaName(PragmaStatement):
             buffer.append(".")
             self._name._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        parts: list[QueryPart] = [self._prev, " ", self._schema]
+        if self._name is not None:
+            parts.extend((".", self._name))
+        return parts
+
 
 class PragmaKeyword(SqlElement):
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
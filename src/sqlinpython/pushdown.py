@@ -0,0 +1,828 @@
+"""Pushing WHERE conditions down into the subqueries and views of FROM.
+
+A condition on the columns of a subquery of the FROM clause filters the rows
+of the subquery after all of them were computed. SQLite moves such
+conditions into the subquery, where indexes can serve them, but not in all
+the cases where that gives the same rows: not into UNION, INTERSECT or
+EXCEPT compounds, nor into the HAVING clause of aggregates. ``push_down``
+moves them before SQLite sees the statement:
+
+    schema = IndexSchema([create_sales, create_archive])
+    pushed = push_down(query, views=[create_sales_by_region], schema=schema)
+    for rewrite in pushed.rewrites:
+        print(rewrite.kind, rewrite.source, render_query(rewrite.pushed))
+    rows = connection.execute(pushed.statement.get_query()).fetchall()
+
+An operand of the AND of a WHERE clause is pushed into a subquery when it
+only refers to columns of that subquery, contains no subquery and calls no
+function returning a new value on each call, such as random(). The columns
+are replaced by the expressions the subquery returns for them, in each
+SELECT of a compound:
+
+- into the WHERE clause, for SELECTs without aggregates and for aggregates
+  when these expressions only depend on the GROUP BY terms;
+- into the HAVING clause, for other aggregates with a GROUP BY;
+- not past window functions, unless the expressions only depend on their
+  PARTITION BY terms;
+- not into subqueries with a LIMIT, whose rows would change, nor into the
+  side of a LEFT, RIGHT or FULL JOIN that is filled with NULLs.
+
+Into a compound, a condition is only pushed when each column it refers to
+has the same affinity and collation in all the SELECTs, as SQLite decides
+them from the CREATE TABLE statements of ``schema``: comparing the value of a
+column inside a SELECT could convert it differently than outside. It is not
+pushed into the SELECTs on the right of EXCEPT, whose rows are removed from
+the result rather than returned. UNION, INTERSECT and EXCEPT keep one of the
+rows that compare equal, e.g. of 1 and 1.0, so conditions are only pushed
+into them when they compare the columns and nothing else.
+
+The condition leaves the outer WHERE clause when it was pushed into all the
+SELECTs of the subquery. A view given by its CREATE VIEW statement (without
+a list of column names) is replaced by its SELECT as a subquery when a
+condition is pushed into it. Each pushed condition is reported as a Rewrite;
+subqueries are processed after the conditions were pushed into them, so that
+conditions move down as far as they can.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, NamedTuple, cast
+
+from sqlinpython.base import CompleteSqlQuery, SqlElement, _field_names, _replaced
+from sqlinpython.create_view import CreateViewAs, CreateViewWithName
+from sqlinpython.expression import (
+    AliasedExpression,
+    ColumnName,
+    Expression,
+    FunctionCall,
+    FunctionCallWithFilter,
+    SchemaTableColumnName,
+    Star_,
+    TableColumnName,
+    WindowName,
+    and_all,
+    col,
+)
+from sqlinpython.expression.core import (
+    AndCondition,
+    BetweenExpression,
+    Cast,
+    CollateOperator,
+    Comparison,
+    EmptyInExpression,
+    EqExpression,
+    Expression13,
+    InExpressionWithExpressions,
+    IsDistinctFromExpression,
+    IsExpression,
+    IsExpressionComplete,
+    IsNotExpression,
+    NeExpression,
+    NegatedOperator,
+    NullCompareExpression,
+    ParenthesizedExpression,
+    UnaryOperator,
+)
+from sqlinpython.expression.function import FunctionCallWithOver, PartitionByClause
+from sqlinpython.expression.literal import BooleanLiteral
+from sqlinpython.expression.logical import AndConditions
+from sqlinpython.expression.simplify import simplify
+from sqlinpython.plan import _unquote
+from sqlinpython.render import render_query
+from sqlinpython.sargable import (
+    _AGGREGATES,
+    IndexSchema,
+    _affinity,
+    _strip,
+    _table_sources,
+    _terms,
+)
+from sqlinpython.select import (
+    ResultColumn,
+    SelectColumns,
+    SelectCompound,
+    SelectFromClause,
+    SelectGroupByClause,
+    SelectHavingClause,
+    SelectLimit,
+    SelectLimitComma,
+    SelectLimitOffset,
+    SelectOrderBy,
+    SelectWhereClause,
+    SelectWindowClause,
+)
+from sqlinpython.select_base import SelectStatement_
+from sqlinpython.table_or_subquery import (
+    JoinClause,
+    JoinOn,
+    JoinRhs,
+    JoinUsing,
+    NestedFromClause,
+    Subquery,
+    SubqueryAliased,
+    TableOrSubquery,
+    TableRef,
+    TableRefAliased,
+    TableStarResultColumn,
+)
+
+PUSHED_INTO_WHERE = "pushed into where"
+PUSHED_INTO_HAVING = "pushed into having"
+
+# Functions that return a different value on each call.
+_NON_DETERMINISTIC = frozenset(
+    {"changes", "last_insert_rowid", "random", "randomblob", "total_changes"}
+)
+_COLUMNS = (ColumnName, TableColumnName, SchemaTableColumnName)
+_LIMITS = (SelectLimit, SelectLimitOffset, SelectLimitComma)
+# Clauses that apply to all the SELECTs of a compound.
+_AFTER_ARMS = (SelectOrderBy, *_LIMITS)
+_ABOVE_FROM = (
+    SelectWindowClause,
+    SelectHavingClause,
+    SelectGroupByClause,
+    SelectWhereClause,
+)
+
+type _Clause = type[SelectWhereClause[Any]] | type[SelectHavingClause[Any]]
+# The affinity and collation of a result column.
+type _ColumnType = tuple[str, str]
+
+# The affinity of expressions that have none, unlike BLOB columns.
+_NO_AFFINITY = "NONE"
+# Operators that give the same result for values that compare equal.
+_COMPARISONS = (
+    EqExpression,
+    NeExpression,
+    Comparison,
+    IsExpression,
+    IsNotExpression,
+    IsDistinctFromExpression,
+    IsExpressionComplete,
+    BetweenExpression,
+    EmptyInExpression,
+    InExpressionWithExpressions,
+    NullCompareExpression,
+    NegatedOperator,
+)
+
+
+class Rewrite(NamedTuple):
+    kind: str
+    # The alias of the subquery or view in the outer query; None for
+    # subqueries without one.
+    source: str | None
+    # The SELECT of the compound the condition went into, from 0.
+    arm: int
+    # The condition of the outer WHERE clause.
+    predicate: Expression
+    # The condition added to the subquery, on its own columns.
+    pushed: Expression
+
+
+class Pushdown(NamedTuple):
+    statement: CompleteSqlQuery
+    rewrites: tuple[Rewrite, ...]
+
+
+def _nodes(element: SqlElement) -> Iterator[SqlElement]:
+    """The nodes of element; subqueries are yielded but not entered."""
+    stack = [element]
+    while stack:
+        node = stack.pop()
+        yield node
+        if not isinstance(node, SelectStatement_):
+            stack.extend(node._children())
+
+
+def _function_name(call: FunctionCall) -> str:
+    return _unquote(call._func._name).lower()
+
+
+def _deterministic(element: SqlElement) -> bool:
+    return not any(
+        isinstance(node, FunctionCall) and _function_name(node) in _NON_DETERMINISTIC
+        for node in _nodes(element)
+    )
+
+
+def _is_aggregate(node: SqlElement) -> bool:
+    """Whether node is an aggregate call, given it is not over a window."""
+    if isinstance(node, FunctionCallWithFilter):
+        return True
+    if not isinstance(node, FunctionCall):
+        return False
+    name = _function_name(node)
+    if name in ("min", "max"):
+        return len(node._args) == 1
+    return name in _AGGREGATES
+
+
+def _has_aggregate(element: SqlElement) -> bool:
+    # Calls under OVER are window functions.
+    windowed: set[int] = set()
+    for node in _nodes(element):
+        if isinstance(node, FunctionCallWithOver):
+            windowed.add(id(node._prev))
+        elif id(node) in windowed:
+            if isinstance(node, FunctionCallWithFilter):
+                windowed.add(id(node._prev))
+        elif _is_aggregate(node):
+            return True
+    return False
+
+
+def _depends_on(
+    expr: SqlElement, terms: Sequence[Expression], aggregates: bool = False
+) -> bool:
+    """Whether expr is computed from terms alone, and from aggregates if allowed."""
+    keys = {_strip(term) for term in terms}
+    stack = [expr]
+    while stack:
+        node = stack.pop()
+        if _strip(node) in keys:
+            continue
+        if _is_aggregate(node):
+            if aggregates:
+                continue
+            return False
+        if isinstance(node, (*_COLUMNS, FunctionCallWithOver, SelectStatement_)):
+            return False
+        stack.extend(node._children())
+    return True
+
+
+def _partition(
+    window: FunctionCallWithOver, named: dict[str, SqlElement]
+) -> tuple[Expression, ...] | None:
+    """The PARTITION BY terms of a window function, None if unknown."""
+    node: SqlElement | None = window._arg
+    seen: set[str] = set()
+    while node is not None:
+        if isinstance(node, PartitionByClause):
+            return node._exprs
+        if isinstance(node, WindowName):
+            name = _unquote(node).lower()
+            if name in seen or name not in named:
+                return None
+            seen.add(name)
+            node = named[name]
+        else:
+            node = getattr(node, "_prev", None)
+    return ()
+
+
+class _Arm(NamedTuple):
+    """A SELECT of a compound, as far as pushing conditions into it goes."""
+
+    columns: tuple[ResultColumn, ...]
+    # The GROUP BY terms of aggregates, () for aggregates of all rows.
+    group_by: tuple[Expression, ...] | None
+    # The PARTITION BY terms of each window function, None if unknown.
+    partitions: tuple[tuple[Expression, ...] | None, ...]
+    # Whether FROM has a single table or subquery.
+    single_source: bool
+
+    def kind(self, exprs: Sequence[Expression]) -> str | None:
+        """Where a condition on exprs, results of this SELECT, can go."""
+        if not all(_deterministic(expr) for expr in exprs):
+            return None
+        for partition in self.partitions:
+            if partition is None:
+                return None
+            if not all(_depends_on(expr, partition) for expr in exprs):
+                return None
+        if self.group_by is None:
+            return PUSHED_INTO_WHERE if _no_windows(exprs) else None
+        if not self.group_by:
+            return None
+        if all(_depends_on(expr, self.group_by) for expr in exprs):
+            return PUSHED_INTO_WHERE
+        if all(_depends_on(expr, self.group_by, aggregates=True) for expr in exprs):
+            return PUSHED_INTO_HAVING
+        return None
+
+
+def _no_windows(exprs: Sequence[Expression]) -> bool:
+    return not any(
+        isinstance(node, FunctionCallWithOver | SelectStatement_)
+        for expr in exprs
+        for node in _nodes(expr)
+    )
+
+
+def _arm(select: SqlElement, order_by: SelectOrderBy | None) -> _Arm | None:
+    """The SELECT of a compound; None for VALUES."""
+    group_by: tuple[Expression, ...] | None = None
+    aggregate = False
+    single_source = False
+    named: dict[str, SqlElement] = {}
+    node = select
+    while not isinstance(node, SelectColumns):
+        if isinstance(node, SelectWindowClause):
+            named.update((_unquote(name).lower(), defn) for name, defn in node._defs)
+        elif isinstance(node, SelectGroupByClause):
+            group_by = node._exprs
+        elif isinstance(node, SelectHavingClause):
+            aggregate = True
+        elif isinstance(node, SelectFromClause):
+            source = node._source
+            single_source = isinstance(source, tuple) and len(source) == 1
+        elif not isinstance(node, SelectWhereClause):
+            return None
+        node = node._prev
+    columns = node._cols
+    scanned: list[SqlElement] = list(columns)
+    if order_by is not None:
+        scanned.extend(order_by._terms)
+    if group_by is None and (aggregate or any(_has_aggregate(c) for c in columns)):
+        group_by = ()
+    partitions = tuple(
+        _partition(window, named)
+        for element in scanned
+        for window in _nodes(element)
+        if isinstance(window, FunctionCallWithOver)
+    )
+    return _Arm(columns, group_by, partitions, single_source)
+
+
+def _has_star(shape: _Arm) -> bool:
+    return any(isinstance(c, Star_ | TableStarResultColumn) for c in shape.columns)
+
+
+def _output_name(column: ResultColumn) -> str | None:
+    if isinstance(column, AliasedExpression):
+        return _unquote(column._alias).lower()
+    if isinstance(column, ColumnName):
+        return _unquote(column).lower()
+    if isinstance(column, TableColumnName | SchemaTableColumnName):
+        return _unquote(column._column).lower()
+    return None
+
+
+def _split(
+    statement: SqlElement,
+) -> tuple[list[SqlElement], list[SelectCompound[Any]], list[SqlElement]]:
+    """The clauses after the SELECTs, the compound operators and the SELECTs."""
+    after: list[SqlElement] = []
+    node = statement
+    while isinstance(node, _AFTER_ARMS):
+        after.append(node)
+        node = node._prev
+    compounds: list[SelectCompound[Any]] = []
+    while isinstance(node, SelectCompound):
+        compounds.append(node)
+        node = node._prev
+    arms = [node, *(compound._rhs for compound in reversed(compounds))]
+    return after, compounds, arms
+
+
+def _with_arms(statement: SqlElement, arms: Sequence[SqlElement]) -> SqlElement:
+    after, compounds, old = _split(statement)
+    if all(new is arm for new, arm in zip(arms, old, strict=True)):
+        return statement
+    result = arms[0]
+    for compound, rhs in zip(reversed(compounds), arms[1:], strict=True):
+        result = _replaced(compound, _prev=result, _rhs=rhs)
+    for clause in reversed(after):
+        result = _replaced(clause, _prev=result)
+    return result
+
+
+def _with_condition(
+    select: SqlElement, clause: _Clause, terms: Sequence[Expression]
+) -> SqlElement:
+    """select with terms added to its WHERE or HAVING clause."""
+    below = (SelectFromClause, SelectColumns)
+    if clause is SelectHavingClause:
+        below = (SelectGroupByClause,)
+    above: list[SqlElement] = []
+    node = select
+    while True:
+        if isinstance(node, clause):
+            result: SqlElement = clause(node._prev, and_all(node._expr, *terms))
+            break
+        if isinstance(node, below):
+            result = clause(node, and_all(*terms))
+            break
+        above.append(node)
+        node = cast(Any, node)._prev
+    for node in reversed(above):
+        result = _replaced(node, _prev=result)
+    return result
+
+
+def _substituted[T: SqlElement](root: T, replacements: dict[int, SqlElement]) -> T:
+    """root with the nodes of the ids in replacements replaced, subqueries aside."""
+    done: dict[int, SqlElement] = {}
+
+    def replace(value: object) -> object:
+        if isinstance(value, tuple):
+            items = tuple(replace(item) for item in value)
+            same = all(new is old for new, old in zip(items, value, strict=True))
+            return value if same else items
+        if isinstance(value, SqlElement):
+            return done.get(id(value), value)
+        return value
+
+    stack: list[tuple[SqlElement, bool]] = [(root, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if id(node) in replacements:
+            done[id(node)] = replacements[id(node)]
+        elif not expanded:
+            stack.append((node, True))
+            if not isinstance(node, SelectStatement_):
+                stack.extend((child, False) for child in node._children())
+        else:
+            changed: dict[str, object] = {}
+            for name in _field_names(type(node)):
+                if hasattr(node, name):
+                    value = getattr(node, name)
+                    new = replace(value)
+                    if new is not value:
+                        changed[name] = new
+            done[id(node)] = _replaced(node, **changed) if changed else node
+    return cast(T, done[id(root)])
+
+
+def _from_items(
+    source: JoinClause | tuple[TableOrSubquery, ...],
+) -> Iterator[tuple[SqlElement, bool]]:
+    """The tables and subqueries of a FROM clause, and whether they are on no
+    side of an outer join that is filled with NULLs."""
+    stack: list[tuple[SqlElement, bool]]
+    if isinstance(source, tuple):
+        stack = [(item, True) for item in reversed(source)]
+    else:
+        stack = [(source, True)]
+    while stack:
+        node, inner = stack.pop()
+        if isinstance(node, JoinClause | JoinOn | JoinUsing):
+            stack.append((node._prev, inner))
+        elif isinstance(node, JoinRhs):
+            keyword = node._keyword.upper()
+            outer = "FULL" in keyword
+            stack.append((node._rhs, inner and not outer and "LEFT" not in keyword))
+            stack.append((node._lhs, inner and not outer and "RIGHT" not in keyword))
+        elif isinstance(node, NestedFromClause):
+            nested = node._sources
+            items = list(nested) if isinstance(nested, tuple) else [nested]
+            stack.extend((item, inner) for item in reversed(items))
+        else:
+            yield node, inner
+
+
+class _Target(NamedTuple):
+    """A subquery or view of a FROM clause conditions can be pushed into."""
+
+    # The node of the FROM clause.
+    item: SqlElement
+    name: str | None
+    select: SqlElement
+
+
+def _tables(select: SqlElement) -> dict[str, str]:
+    """The tables of the FROM clause of select, by the name it uses for them."""
+    node: SqlElement | None = select
+    while node is not None and not isinstance(node, SelectColumns):
+        if isinstance(node, SelectFromClause):
+            return dict(_table_sources(node._source))
+        node = getattr(node, "_prev", None)
+    return {}
+
+
+def _column_type(
+    expr: SqlElement, tables: dict[str, str], schema: IndexSchema
+) -> _ColumnType | None:
+    """The affinity and collation SQLite gives expr as a result column.
+
+    None if unknown, e.g. for columns of subqueries or views.
+    """
+    expr = _strip(expr)
+    if isinstance(expr, CollateOperator):
+        inner = _column_type(expr._left, tables, schema)
+        return None if inner is None else (inner[0], _unquote(expr._right).upper())
+    if isinstance(expr, Cast):
+        inner = _column_type(expr._expr, tables, schema)
+        declared = render_query(expr._type_name)
+        return None if inner is None else (_affinity(declared), inner[1])
+    if isinstance(expr, UnaryOperator) and expr._op == "+":
+        # A unary + keeps the collation but drops the affinity.
+        inner = _column_type(expr._left, tables, schema)
+        return None if inner is None else (_NO_AFFINITY, inner[1])
+    if isinstance(expr, _COLUMNS):
+        if isinstance(expr, ColumnName):
+            column = _unquote(expr).lower()
+            found = [t for t in tables.values() if column in schema.columns.get(t, ())]
+            table = found[0] if len(set(found)) == 1 else None
+        elif isinstance(expr, TableColumnName):
+            column = _unquote(expr._column).lower()
+            table = tables.get(_unquote(expr._table).lower())
+        else:
+            return None
+        if table is None:
+            return None
+        declared = schema.columns.get(table, {}).get(column)
+        collation = schema.collations.get(table, {}).get(column)
+        if declared is None or collation is None:
+            return None
+        return _affinity(declared), collation
+    # Other expressions have no affinity, and the default collation unless
+    # one of their operands has a COLLATE.
+    if any(
+        isinstance(node, CollateOperator | SelectStatement_) for node in _nodes(expr)
+    ):
+        return None
+    return _NO_AFFINITY, "BINARY"
+
+
+class _Pusher:
+    __slots__ = ("views", "schema", "rewrites")
+
+    def __init__(
+        self, views: Iterable[CompleteSqlQuery], schema: IndexSchema | None
+    ) -> None:
+        # The SELECT of views by name.
+        self.views: dict[str, SqlElement] = {}
+        for view in views:
+            if isinstance(view, CreateViewAs) and isinstance(
+                view._prev, CreateViewWithName
+            ):
+                name = view._prev._view or view._prev._schema
+                self.views[_unquote(name).lower()] = view._select_stmt
+        self.schema = schema
+        self.rewrites: list[Rewrite] = []
+
+    def target(self, item: SqlElement) -> _Target | None:
+        if isinstance(item, SubqueryAliased):
+            inner = item._prev
+            select = inner._select_stmt if isinstance(inner, Subquery) else inner
+            return _Target(item, _unquote(item._alias).lower(), select)
+        if isinstance(item, Subquery):
+            return _Target(item, None, item._select_stmt)
+        ref = item._prev if isinstance(item, TableRefAliased) else item
+        if isinstance(ref, TableRef):
+            name = ref._table if ref._table is not None else ref._schema
+            view = self.views.get(_unquote(name).lower())
+            if view is not None:
+                alias = item._alias if isinstance(item, TableRefAliased) else name
+                return _Target(item, _unquote(alias).lower(), view)
+        return None
+
+    def statement(self, statement: SqlElement) -> SqlElement:
+        """statement with conditions pushed down in each of its SELECTs."""
+        _, _, arms = _split(statement)
+        return _with_arms(statement, [self.select(arm) for arm in arms])
+
+    def select(self, select: SqlElement) -> SqlElement:
+        # The clauses down to FROM, from the last one.
+        clauses: list[SqlElement] = []
+        node = select
+        while not isinstance(node, SelectFromClause):
+            if not isinstance(node, _ABOVE_FROM):
+                return select
+            clauses.append(node)
+            node = node._prev
+        from_ = node
+        items = list(_from_items(from_._source))
+        targets = [self.target(item) for item, inner in items if inner]
+        single = isinstance(from_._source, tuple) and len(from_._source) == 1
+        where = next((c for c in clauses if isinstance(c, SelectWhereClause)), None)
+        # Conditions for each SELECT of each target, by clause.
+        added: dict[int, dict[tuple[int, _Clause], list[Expression]]] = {}
+        kept: list[Expression] = []
+        terms = (
+            [] if where is None else _terms(where._expr, AndCondition, AndConditions)
+        )
+        for term in terms:
+            placed = _place(term, [t for t in targets if t is not None], single)
+            if placed is None or not self.push(term, *placed, added):
+                kept.append(term)
+        replacements: dict[int, SqlElement] = {}
+        for item, _ in items:
+            target = self.target(item)
+            pushed = added.get(id(item), {})
+            # Views are only replaced by their SELECT to push conditions.
+            view = not isinstance(item, Subquery | SubqueryAliased)
+            if target is None or view and not pushed:
+                continue
+            new = target.select
+            for (arm, clause), conditions in pushed.items():
+                _, _, arms = _split(new)
+                arms[arm] = _with_condition(arms[arm], clause, conditions)
+                new = _with_arms(new, arms)
+            new = self.statement(new)
+            if new is not target.select:
+                replacements[id(item)] = _as_source(item, new)
+        if not replacements and len(kept) == len(terms):
+            return select
+        kept_all = len(kept) == len(terms)
+        source = from_._source
+        if isinstance(source, tuple):
+            source = tuple(_substituted(s, replacements) for s in source)
+        else:
+            source = _substituted(source, replacements)
+        result: SqlElement = _replaced(from_, _source=source)
+        for clause in reversed(clauses):
+            if clause is where and not kept_all:
+                if kept:
+                    result = SelectWhereClause[Any](result, and_all(*kept))
+            else:
+                result = _replaced(clause, _prev=result)
+        return result
+
+    def push(
+        self,
+        term: Expression,
+        target: _Target,
+        columns: list[tuple[SqlElement, str]],
+        added: dict[int, dict[tuple[int, _Clause], list[Expression]]],
+    ) -> bool:
+        """Push term into the SELECTs of target; whether it went into all."""
+        after, compounds, arms = _split(target.select)
+        if any(isinstance(clause, _LIMITS) for clause in after):
+            return False
+        # Filtering the right side of EXCEPT would change the rows it removes.
+        excluded = {
+            i
+            for i, compound in enumerate(reversed(compounds), 1)
+            if compound._op.upper() == "EXCEPT"
+        }
+        order_by = next((c for c in after if isinstance(c, SelectOrderBy)), None)
+        shapes = [_arm(arm, order_by if len(arms) == 1 else None) for arm in arms]
+        first = shapes[0]
+        if first is None:
+            return False
+        star = len(first.columns) == 1 and isinstance(first.columns[0], Star_)
+        if star and (len(arms) > 1 or not first.single_source):
+            return False
+        if not star and _has_star(first):
+            return False
+        names = [_output_name(column) for column in first.columns]
+        positions: list[int] = []
+        for _, name in columns:
+            if not star and names.count(name) != 1:
+                return False
+            positions.append(0 if star else names.index(name))
+        if len(arms) > 1 and not self.same_types(arms, shapes, positions):
+            return False
+        distinct = any(compound._op.upper() != "UNION ALL" for compound in compounds)
+        if distinct and not _compares_only(term, [node for node, _ in columns]):
+            return False
+        everywhere = True
+        for i, shape in enumerate(shapes):
+            exprs = _expressions(shape, columns, positions, star)
+            kind = None if shape is None or exprs is None else shape.kind(exprs)
+            if kind is None or exprs is None or i in excluded:
+                everywhere = False
+                continue
+            replacements: dict[int, SqlElement] = {
+                id(node): _operand(expr)
+                for (node, _), expr in zip(columns, exprs, strict=True)
+            }
+            pushed = simplify(_substituted(term, replacements), predicate=True)
+            if pushed == BooleanLiteral(True):
+                continue
+            clause: _Clause = SelectWhereClause
+            if kind == PUSHED_INTO_HAVING:
+                clause = SelectHavingClause
+            conditions = added.setdefault(id(target.item), {})
+            conditions.setdefault((i, clause), []).append(pushed)
+            self.rewrites.append(Rewrite(kind, target.name, i, term, pushed))
+        return everywhere
+
+    def same_types(
+        self,
+        arms: Sequence[SqlElement],
+        shapes: Sequence[_Arm | None],
+        positions: Sequence[int],
+    ) -> bool:
+        """Whether the columns at positions have the same affinity and
+        collation in all the SELECTs of a compound."""
+        if self.schema is None:
+            return False
+        for position in set(positions):
+            types: set[_ColumnType | None] = set()
+            for arm, shape in zip(arms, shapes, strict=True):
+                if shape is None or position >= len(shape.columns):
+                    return False
+                column = shape.columns[position]
+                if isinstance(column, AliasedExpression):
+                    column = column._expression
+                types.add(_column_type(column, _tables(arm), self.schema))
+            if None in types or len(types) != 1:
+                return False
+        return True
+
+
+def _compares_only(term: Expression, columns: Sequence[SqlElement]) -> bool:
+    """Whether term only compares columns, with their own collation."""
+    parents: dict[int, SqlElement] = {}
+    for node in _nodes(term):
+        if isinstance(node, CollateOperator):
+            return False
+        for child in node._children():
+            parents[id(child)] = node
+    for column in columns:
+        parent = parents.get(id(column))
+        while isinstance(parent, ParenthesizedExpression):
+            parent = parents.get(id(parent))
+        if not isinstance(parent, _COMPARISONS):
+            return False
+    return True
+
+
+def _expressions(
+    shape: _Arm | None,
+    columns: list[tuple[SqlElement, str]],
+    positions: list[int],
+    star: bool,
+) -> list[Expression] | None:
+    """What a SELECT returns for the columns a condition refers to."""
+    if shape is None or not star and _has_star(shape):
+        return None
+    exprs: list[Expression] = []
+    for (_, name), position in zip(columns, positions, strict=True):
+        if star:
+            exprs.append(col(name))
+            continue
+        if position >= len(shape.columns):
+            return None
+        column = shape.columns[position]
+        if isinstance(column, AliasedExpression):
+            column = column._expression
+        if not isinstance(column, Expression):
+            return None
+        exprs.append(column)
+    return exprs
+
+
+def _operand(expr: Expression) -> Expression:
+    if isinstance(expr, (Expression13, *_COLUMNS)):
+        return expr
+    return ParenthesizedExpression(expr)
+
+
+def _place(
+    term: Expression, targets: list[_Target], single: bool
+) -> tuple[_Target, list[tuple[SqlElement, str]]] | None:
+    """The target term only refers to, and its columns with their names."""
+    columns: list[tuple[SqlElement, str]] = []
+    tables: set[str] = set()
+    for node in _nodes(term):
+        if isinstance(node, SelectStatement_ | SchemaTableColumnName):
+            return None
+        if (
+            isinstance(node, FunctionCall)
+            and _function_name(node) in _NON_DETERMINISTIC
+        ):
+            return None
+        if isinstance(node, TableColumnName):
+            tables.add(_unquote(node._table).lower())
+            columns.append((node, _unquote(node._column).lower()))
+        elif isinstance(node, ColumnName):
+            if not single:
+                return None
+            columns.append((node, _unquote(node).lower()))
+    if not columns or len(tables) > 1:
+        return None
+    for target in targets:
+        if tables == {target.name} or not tables and single:
+            return target, columns
+    return None
+
+
+def _as_source(item: SqlElement, select: SqlElement) -> SqlElement:
+    """item of a FROM clause, with select in place of its subquery or view."""
+    if isinstance(item, SubqueryAliased):
+        if isinstance(item._prev, Subquery):
+            return _replaced(item, _prev=Subquery(cast(Any, select)))
+        return _replaced(item, _prev=select)
+    if isinstance(item, Subquery):
+        return Subquery(cast(Any, select))
+    alias = item._alias if isinstance(item, TableRefAliased) else None
+    if alias is None:
+        ref = cast(TableRef, item)
+        alias = ref._table if ref._table is not None else ref._schema
+    return SubqueryAliased(Subquery(cast(Any, select)), alias, True)
+
+
+def push_down(
+    statement: CompleteSqlQuery,
+    views: Iterable[CompleteSqlQuery] = (),
+    schema: IndexSchema | None = None,
+) -> Pushdown:
+    """statement with the conditions of its WHERE clauses pushed into subqueries.
+
+    views are CREATE VIEW statements of the views the statement refers to.
+    schema has the tables read by compounds; without it nothing is pushed
+    into compounds. The statement is returned as it is when there is
+    nothing to push.
+    """
+    if not isinstance(statement, SelectStatement_):
+        return Pushdown(statement, ())
+    pusher = _Pusher(views, schema)
+    result = pusher.statement(statement)
+    return Pushdown(cast(CompleteSqlQuery, result), tuple(pusher.rewrites))
@@ -1,18 +1,21 @@
 from __future__ import annotations
 
 from abc import ABC
+from collections.abc import Sequence
 from typing import override
 
-from sqlinpython.base import CompleteSqlQuery, SqlElement
+from sqlinpython.base import CompleteSqlQuery, QueryPart, SqlElement
 from sqlinpython.name import Name
 
 
 # SPEC: https://sqlite.org/lang_reindex.html
 class ReindexStatement(CompleteSqlQuery, ABC):
-    pass
+    __slots__ = ()
 
 
 class ReindexSchemaComplete(ReindexStatement):
+    __slots__ = ("_prev", "_schema", "_table_or_index")
+
     def __init__(self, prev: SqlElement, schema: Name, table_or_index: Name) -> None:
         self._prev = prev
         self._schema = schema
@@ -26,8 +29,14 @@ class ReindexSchemaComplete(ReindexStatement):
         buffer.append(".")
         self._table_or_index._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ", self._schema, ".", self._table_or_index)
+
 
 class ReindexExpressions(ReindexStatement):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement) -> None:
         self._prev = prev
 
@@ -36,8 +45,14 @@ class ReindexExpressions(ReindexStatement):
         self._prev._create_query(buffer)
         buffer.append(" EXPRESSIONS")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " EXPRESSIONS")
+
 
 class ReindexWithName(ReindexStatement):
+    __slots__ = ("_prev", "_name")
+
     def __init__(self, prev: SqlElement, name: Name) -> None:
         self._prev = prev
         self._name = name
@@ -48,8 +63,14 @@ class ReindexWithName(ReindexStatement):
         buffer.append(" ")
         self._name._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ", self._name)
+
 
 class ReindexKeyword(ReindexStatement):
+    __slots__ = ()
+
     def __call__(self, name: Name | str) -> ReindexWithName:
         if isinstance(name, str):
             name = Name(name)
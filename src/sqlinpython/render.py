@@ -0,0 +1,97 @@
+"""Iterative rendering of query trees.
+
+``_create_query`` recurses once per level of nesting, so very deep trees (an OR
+chain of thousands of predicates, thousands of UNION ALL arms, long join
+chains) exhaust the interpreter stack. ``render`` produces the same text by
+walking the tree with an explicit stack, expanding each node through its
+``_parts``. Nodes without a shallow form are rendered with ``_create_query``.
+
+``iter_query`` and ``write_query`` walk the tree the same way but hand the
+text out in chunks as it is produced, so very large statements (seed scripts,
+bulk INSERTs) never exist as one string.
+"""
+
+from collections.abc import Iterator
+
+from sqlinpython.base import DEFAULT_CHUNK_SIZE, QueryPart, SqlElement, TextSink
+
+
+def render(element: SqlElement, buffer: list[str]) -> None:
+    """Append the query text of element to buffer without recursing."""
+    stack: list[QueryPart] = [element]
+    pop = stack.pop
+    push = stack.extend
+    append = buffer.append
+    while stack:
+        part = pop()
+        if isinstance(part, str):
+            append(part)
+            continue
+        parts = part._parts()
+        if parts is None:
+            part._create_query(buffer)
+        else:
+            # tuple() is free for the tuples most nodes return.
+            push(reversed(tuple(parts)))
+
+
+def render_query(element: SqlElement) -> str:
+    """Return the query text of element; same output as get_query()."""
+    buffer: list[str] = []
+    render(element, buffer)
+    return "".join(buffer)
+
+
+def iter_query(
+    element: SqlElement, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[str]:
+    """Yield the query text of element in chunks of at most chunk_size characters.
+
+    Only the chunk being filled and the path from the root to the current
+    node are held in memory, not the whole text.
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    cached = getattr(element, "_query", None)
+    if cached is not None:
+        for start in range(0, len(cached), chunk_size):
+            yield cached[start : start + chunk_size]
+        return
+    stack: list[Iterator[QueryPart]] = [iter((element,))]
+    buffer: list[str] = []
+    size = 0
+    while stack:
+        for part in stack[-1]:
+            if isinstance(part, str):
+                buffer.append(part)
+                size += len(part)
+            else:
+                parts = part._parts()
+                if parts is not None:
+                    stack.append(iter(parts))
+                    break
+                start = len(buffer)
+                part._create_query(buffer)
+                size += sum(len(s) for s in buffer[start:])
+            if size >= chunk_size:
+                text = "".join(buffer)
+                end = len(text) - len(text) % chunk_size
+                for start in range(0, end, chunk_size):
+                    yield text[start : start + chunk_size]
+                buffer = [text[end:]]
+                size = len(buffer[0])
+        else:
+            stack.pop()
+    if size:
+        yield "".join(buffer)
+
+
+def write_query(
+    element: SqlElement, sink: TextSink, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> int:
+    """Write the query text of element to sink in chunks; return its length."""
+    written = 0
+    for chunk in iter_query(element, chunk_size):
+        sink.write(chunk)
+        written += len(chunk)
+    return written
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
 from abc import ABC
+from collections.abc import Sequence
 from typing import override
 
-from sqlinpython.base import SqlElement, comma_separated
+from sqlinpython.base import (
+    QueryPart,
+    SqlElement,
+    comma_separated,
+    comma_separated_parts,
+)
 from sqlinpython.expression import AliasedExpression, Expression, Star_
 
 
 class ReturningBase(SqlElement, ABC):
+    __slots__ = ("_prev", "_values")
+
     def __init__(
         self,
         prev: SqlElement,
@@ -21,3 +29,7 @@ class ReturningBase(SqlElement, ABC):
         self._prev._create_query(buffer)
         buffer.append(" RETURNING ")
         comma_separated(buffer, self._values)
+
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " RETURNING ", *comma_separated_parts(self._values))
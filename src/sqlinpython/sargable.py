@@ -0,0 +1,739 @@
+"""Conditions an index cannot be used for, and rewrites that fix some of them.
+
+SQLite only uses an index on column ``a`` for a condition that compares
+``a`` itself to values. Conditions written around the column scan the whole
+table instead, although the index exists:
+
+- ``lower(a) = ?``, a function of the column (FUNCTION_ON_COLUMN), unless an
+  index is defined on that expression;
+- ``a + 0 > ?``, arithmetic on the column (ARITHMETIC_ON_COLUMN);
+- ``a LIKE '%x'``, a pattern starting with a wildcard (LEADING_WILDCARD);
+- ``a LIKE 'x%'``, which SQLite only searches in NOCASE indexes since LIKE
+  ignores case (LIKE_PREFIX);
+- ``a = ? OR b = ?`` where some of the alternatives cannot use an index, so
+  that none of them does (OR_ACROSS_COLUMNS).
+
+``find_issues`` flags these in the WHERE clauses of SELECT, UPDATE and DELETE
+statements, subqueries included, given the indexes of a schema of ``Create``
+statements:
+
+    schema = IndexSchema([create_users, create_users_name])
+    for issue in find_issues(query, schema):
+        print(issue.kind, issue.columns, render_query(issue.predicate))
+
+``make_sargable`` rewrites the WHERE clause of a statement into one with the
+same results that indexes can serve:
+
+- ``a IN (x)`` becomes ``a = x``;
+- ``a LIKE 'abc%'`` on an indexed TEXT column becomes
+  ``a >= 'ABC' AND a < 'abd' AND a LIKE 'abc%'``: the range holds every
+  match in either case, and the LIKE still filters it. BLOB values stored in
+  the column sort after all text and are no longer matched;
+- the OR of conditions on different indexed columns, in a SELECT of a single
+  table without DISTINCT, aggregates or further clauses, becomes a UNION ALL
+  of one SELECT per condition, each leaving out the rows of the previous
+  ones.
+
+Subqueries are left as they are.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import string
+from collections.abc import Iterable, Iterator
+from typing import Any, NamedTuple, cast
+
+from sqlinpython.base import CompleteSqlQuery, SqlElement, _replaced
+from sqlinpython.create_index import CreateIndexOnTable, CreateIndexWithWhere
+from sqlinpython.delete import DeleteFrom, DeleteFromAliased, DeleteWhere
+from sqlinpython.expression import (
+    Cast,
+    ColumnName,
+    Expression,
+    FunctionCall,
+    FunctionCallWithFilter,
+    SchemaTableColumnName,
+    TableColumnName,
+    and_all,
+    literal,
+    or_all,
+)
+from sqlinpython.expression.core import (
+    AndCondition,
+    BetweenExpression,
+    BitOperation,
+    Comparison,
+    ConcatLikeOperator,
+    EqExpression,
+    Factor,
+    InExpressionWithExpressions,
+    InExpressionWithSelect,
+    InExpressionWithTableFunction,
+    InExpressionWithTableName,
+    IsExpression,
+    IsExpressionComplete,
+    LikeExpression,
+    MatchLikeExpression,
+    NegatedOperator,
+    NullCompareExpression,
+    OrCondition,
+    ParenthesizedExpression,
+    Summand,
+    UnaryOperator,
+)
+from sqlinpython.expression.function import FunctionCallWithOver
+from sqlinpython.expression.literal import StringLiteral
+from sqlinpython.expression.logical import AndConditions, OrConditions
+from sqlinpython.indexed_column import ColumnNameWithOrdering
+from sqlinpython.name import Name
+from sqlinpython.plan import _unquote, schema_connection
+from sqlinpython.render import render_query
+from sqlinpython.select import (
+    SelectAllKeyword,
+    SelectColumns,
+    SelectFromClause,
+    SelectKeyword,
+    SelectValues,
+    SelectWhereClause,
+)
+from sqlinpython.select_base import Core, SelectStatement_
+from sqlinpython.table_or_subquery import (
+    Aliased,
+    JoinClause,
+    TableOrSubquery,
+    TableRef,
+)
+from sqlinpython.update import (
+    UpdateSetFrom,
+    UpdateTable,
+    UpdateTableAliased,
+    UpdateWhere,
+)
+
+FUNCTION_ON_COLUMN = "function on column"
+ARITHMETIC_ON_COLUMN = "arithmetic on column"
+LEADING_WILDCARD = "leading wildcard"
+LIKE_PREFIX = "like prefix"
+OR_ACROSS_COLUMNS = "or across columns"
+
+# Names of the rowid of tables that have one.
+_ROWID_NAMES = ("rowid", "oid", "_rowid_")
+# Functions that are aggregates; min and max only with a single argument.
+_AGGREGATES = frozenset(
+    {
+        "avg",
+        "count",
+        "group_concat",
+        "json_group_array",
+        "json_group_object",
+        "jsonb_group_array",
+        "jsonb_group_object",
+        "max",
+        "min",
+        "string_agg",
+        "sum",
+        "total",
+    }
+)
+_WILDCARDS = {"LIKE": "%_", "GLOB": "*?["}
+_UPPER = str.maketrans(string.ascii_lowercase, string.ascii_uppercase)
+_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+_WHERE_CLAUSES = (SelectWhereClause, UpdateWhere, DeleteWhere)
+# Nodes of the statement chain that come before the WHERE clause.
+_BEFORE_WHERE = (SelectColumns, SelectValues, UpdateTable, DeleteFrom)
+_COLUMNS = (ColumnName, TableColumnName, SchemaTableColumnName)
+_FUNCTIONS = (FunctionCall, Cast)
+_ARITHMETIC = (Summand, Factor, UnaryOperator, ConcatLikeOperator, BitOperation)
+
+type _WhereClause = SelectWhereClause[Any] | UpdateWhere | DeleteWhere
+
+
+class Issue(NamedTuple):
+    kind: str
+    # The condition of the WHERE clause: the comparison, LIKE or OR.
+    predicate: Expression
+    # The indexed columns that cannot be used, as "table.column".
+    columns: tuple[str, ...]
+
+
+def _affinity(declared_type: str) -> str:
+    # https://sqlite.org/datatype3.html#determination_of_column_affinity
+    declared = declared_type.upper()
+    if "INT" in declared:
+        return "INTEGER"
+    if any(name in declared for name in ("CHAR", "CLOB", "TEXT")):
+        return "TEXT"
+    if "BLOB" in declared or not declared:
+        return "BLOB"
+    if any(name in declared for name in ("REAL", "FLOA", "DOUB")):
+        return "REAL"
+    return "NUMERIC"
+
+
+def _text_affinity(declared_type: str) -> bool:
+    return _affinity(declared_type) == "TEXT"
+
+
+def _indexed_expression(statement: CompleteSqlQuery) -> tuple[str, Expression] | None:
+    """The table and first indexed expression of a CREATE INDEX statement."""
+    if isinstance(statement, CreateIndexWithWhere):
+        statement = cast(CreateIndexOnTable, statement._prev)
+    if not isinstance(statement, CreateIndexOnTable):
+        return None
+    first: SqlElement = statement._columns[0]
+    if isinstance(first, ColumnNameWithOrdering):
+        first = first._prev
+    if not isinstance(first, Expression) or isinstance(first, _COLUMNS):
+        return None
+    return _unquote(statement._table).lower(), first
+
+
+class IndexSchema:
+    """The columns and indexes of the tables created by statements.
+
+    Only the first column of each index is kept: it is the one conditions on
+    a single column can search.
+    """
+
+    __slots__ = ("columns", "collations", "indexed", "expressions")
+
+    def __init__(self, statements: Iterable[CompleteSqlQuery]) -> None:
+        statements = list(statements)
+        # Declared types by column, by table; names are lowercase.
+        self.columns: dict[str, dict[str, str]] = {}
+        # Collations by column, by table, where SQLite can index the table.
+        self.collations: dict[str, dict[str, str]] = {}
+        # Collations of the indexes starting with (table, column).
+        self.indexed: dict[tuple[str, str], set[str]] = {}
+        # Indexed expressions by table, as built in the CREATE INDEX statements.
+        self.expressions: dict[str, list[Expression]] = {}
+        connection = schema_connection(statements)
+        try:
+            tables = connection.execute(
+                "SELECT name, sql LIKE '%WITHOUT ROWID%' FROM sqlite_schema"
+                " WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+            ).fetchall()
+            for table, without_rowid in tables:
+                self._add_table(connection, table, bool(without_rowid))
+        finally:
+            connection.close()
+        for statement in statements:
+            indexed = _indexed_expression(statement)
+            if indexed is not None:
+                table, expression = indexed
+                self.expressions.setdefault(table, []).append(expression)
+
+    def _add_table(
+        self, connection: sqlite3.Connection, table: str, without_rowid: bool
+    ) -> None:
+        key = table.lower()
+        rows = connection.execute(
+            "SELECT name, type, pk FROM pragma_table_info(?)", (table,)
+        ).fetchall()
+        self.columns[key] = {name.lower(): type_ for name, type_, _ in rows}
+        self._add_collations(connection, table, [name for name, _, _ in rows])
+        if not without_rowid:
+            rowid = list(_ROWID_NAMES)
+            primary_key = [(name, type_) for name, type_, pk in rows if pk]
+            # An INTEGER PRIMARY KEY column is the rowid under another name.
+            if len(primary_key) == 1 and primary_key[0][1].upper() == "INTEGER":
+                rowid.append(primary_key[0][0].lower())
+            for name in rowid:
+                self.indexed.setdefault((key, name), set()).add("BINARY")
+        indexes = connection.execute(
+            "SELECT name FROM pragma_index_list(?)", (table,)
+        ).fetchall()
+        for (index,) in indexes:
+            column, collation = connection.execute(
+                "SELECT name, coll FROM pragma_index_xinfo(?) WHERE seqno = 0",
+                (index,),
+            ).fetchone()
+            # Indexes on expressions have no column name.
+            if column is not None:
+                collations = self.indexed.setdefault((key, column.lower()), set())
+                collations.add(collation.upper())
+
+    def _add_collations(
+        self, connection: sqlite3.Connection, table: str, columns: list[str]
+    ) -> None:
+        # SQLite has no pragma for the collation of a column, but an index
+        # on it uses that collation.
+        probe = "sqlinpython_collations"
+        names = ", ".join(_quote(column) for column in columns)
+        try:
+            connection.execute(f"CREATE INDEX {probe} ON {_quote(table)} ({names})")
+        except sqlite3.Error:
+            # E.g. virtual tables.
+            return
+        try:
+            rows = connection.execute(
+                "SELECT name, coll FROM pragma_index_xinfo(?) WHERE key",
+                (probe,),
+            ).fetchall()
+        finally:
+            connection.execute(f"DROP INDEX {probe}")
+        self.collations[table.lower()] = {
+            name.lower(): collation.upper() for name, collation in rows
+        }
+
+    def is_indexed(self, table: str, column: str) -> bool:
+        """Whether an index of table starts with column."""
+        return (table, column) in self.indexed
+
+    def has_text_affinity(self, table: str, column: str) -> bool:
+        return _text_affinity(self.columns.get(table, {}).get(column, ""))
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _strip(expr: SqlElement) -> SqlElement:
+    while isinstance(expr, ParenthesizedExpression):
+        expr = expr._prev
+    return expr
+
+
+def _terms(
+    expr: Expression,
+    binary: type[AndCondition | OrCondition],
+    nary: type[AndConditions | OrConditions],
+) -> list[Expression]:
+    """The operands of a chain of AND or of OR, looking through parentheses."""
+    terms: list[Expression] = []
+    stack = [expr]
+    while stack:
+        term = stack.pop()
+        inner = _strip(term)
+        if isinstance(inner, binary):
+            stack.append(inner._right)
+            stack.append(inner._left)
+        elif isinstance(inner, nary):
+            stack.extend(reversed(inner._terms))
+        else:
+            terms.append(term)
+    return terms
+
+
+def _expressions(element: SqlElement) -> Iterator[SqlElement]:
+    """The nodes of element, without going into subqueries."""
+    stack = [element]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, SelectStatement_):
+            continue
+        yield node
+        stack.extend(node._children())
+
+
+def _is_constant(expr: SqlElement) -> bool:
+    """Whether expr refers to no column, subqueries aside."""
+    return not any(isinstance(node, _COLUMNS) for node in _expressions(expr))
+
+
+def _condition(where: _WhereClause) -> Expression:
+    if isinstance(where, SelectWhereClause):
+        return where._expr
+    return where._condition
+
+
+def _pattern_prefix(pattern: str, wildcards: str) -> str:
+    for i, char in enumerate(pattern):
+        if char in wildcards:
+            return pattern[:i]
+    return pattern
+
+
+def _successor(text: str) -> str | None:
+    """The smallest string greater than all strings starting with text."""
+    while text:
+        code = ord(text[-1]) + 1
+        if code == 0xD800:
+            # Surrogates cannot be encoded.
+            code = 0xE000
+        if code <= 0x10FFFF:
+            return text[:-1] + chr(code)
+        text = text[:-1]
+    return None
+
+
+def _table_sources(
+    sources: JoinClause | tuple[TableOrSubquery, ...],
+) -> Iterator[tuple[str, str]]:
+    """(name referred to by, table) of the tables of a FROM clause."""
+    stack: list[SqlElement] = list(sources) if isinstance(sources, tuple) else [sources]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, SelectStatement_):
+            continue
+        if isinstance(node, Aliased | TableRef):
+            ref: SqlElement = node
+            while not isinstance(ref, TableRef) and hasattr(ref, "_prev"):
+                ref = ref._prev
+            if isinstance(ref, TableRef):
+                name = ref._table if ref._table is not None else ref._schema
+                table = _unquote(name).lower()
+                if isinstance(node, Aliased):
+                    yield _unquote(node._alias).lower(), table
+                else:
+                    yield table, table
+                continue
+        stack.extend(node._children())
+
+
+def _is_aggregate(node: SqlElement) -> bool:
+    if isinstance(node, FunctionCallWithOver | FunctionCallWithFilter):
+        return True
+    if not isinstance(node, FunctionCall):
+        return False
+    name = _unquote(node._func._name).lower()
+    if name in ("min", "max"):
+        return len(node._args) == 1
+    return name in _AGGREGATES
+
+
+class _Scope:
+    """The tables a WHERE clause refers to, and the indexes of the schema."""
+
+    __slots__ = ("schema", "tables")
+
+    def __init__(self, schema: IndexSchema, where: _WhereClause) -> None:
+        self.schema = schema
+        # Tables by the name or alias the statement uses for them.
+        self.tables: dict[str, str] = {}
+        alias: Name | None = None
+        node: SqlElement | None = where._prev
+        while node is not None and not isinstance(node, SelectColumns):
+            if isinstance(node, SelectFromClause):
+                self.tables.update(_table_sources(node._source))
+                break
+            if isinstance(node, UpdateSetFrom):
+                self.tables.update(_table_sources(node._sources))
+            elif isinstance(node, UpdateTableAliased | DeleteFromAliased):
+                alias = node._alias
+            elif isinstance(node, UpdateTable | DeleteFrom):
+                name = node._table if node._table is not None else node._schema
+                table = _unquote(name).lower()
+                self.tables[_unquote(alias or name).lower()] = table
+                break
+            node = getattr(node, "_prev", None)
+
+    def resolve(self, expr: SqlElement) -> tuple[str, str] | None:
+        """(table, column) if expr is a column of a table of the schema."""
+        expr = _strip(expr)
+        if isinstance(expr, ColumnName):
+            column = _unquote(expr).lower()
+            tables = {
+                table
+                for table in self.tables.values()
+                if column in self.schema.columns.get(table, ())
+                or self.schema.is_indexed(table, column)
+            }
+            return (tables.pop(), column) if len(tables) == 1 else None
+        if isinstance(expr, TableColumnName | SchemaTableColumnName):
+            table = self.tables.get(_unquote(expr._table).lower())
+            if table is not None:
+                return table, _unquote(expr._column).lower()
+        return None
+
+    def indexed(self, expr: SqlElement) -> str | None:
+        """The name of the index column expr is, if it is one."""
+        resolved = self.resolve(expr)
+        if resolved is not None:
+            return ".".join(resolved) if self.schema.is_indexed(*resolved) else None
+        expr = _strip(expr)
+        for table in self.tables.values():
+            if expr in self.schema.expressions.get(table, ()):
+                return f"{table}.{render_query(expr)}"
+        return None
+
+    def searchable(self, term: SqlElement) -> str | None:
+        """The index column term restricts to values or ranges, if any.
+
+        SQLite can search an index for the rows of such a term instead of
+        scanning the table.
+        """
+        term = _strip(term)
+        if isinstance(term, AndCondition | AndConditions):
+            for conjunct in _terms(term, AndCondition, AndConditions):
+                column = self.searchable(conjunct)
+                if column is not None:
+                    return column
+            return None
+        if isinstance(term, EqExpression | Comparison):
+            for side, other in ((term._left, term._right), (term._right, term._left)):
+                column = self.indexed(side)
+                if column is not None and _is_constant(other):
+                    return column
+            return None
+        subject, values = _subject(term)
+        if subject is None or not all(_is_constant(v) for v in values):
+            return None
+        if isinstance(term, LikeExpression | MatchLikeExpression):
+            return self._searchable_pattern(term)
+        return self.indexed(subject)
+
+    def _searchable_pattern(
+        self, term: LikeExpression | MatchLikeExpression
+    ) -> str | None:
+        op = term._op if isinstance(term, MatchLikeExpression) else "LIKE"
+        pattern = term._pattern
+        if op not in _WILDCARDS or not isinstance(pattern, StringLiteral):
+            return None
+        if not _pattern_prefix(pattern._value, _WILDCARDS[op]):
+            return None
+        resolved = self.resolve(term._prev)
+        if resolved is None or not self.schema.has_text_affinity(*resolved):
+            return None
+        # LIKE ignores case, so only NOCASE indexes keep its matches together.
+        collation = "NOCASE" if op == "LIKE" else "BINARY"
+        if collation in self.schema.indexed.get(resolved, ()):
+            return ".".join(resolved)
+        return None
+
+    def issues(self, condition: Expression) -> Iterator[Issue]:
+        # Nodes with the index columns that other conditions ANDed with
+        # them already search.
+        stack: list[tuple[SqlElement, frozenset[str]]] = [(condition, frozenset())]
+        while stack:
+            node, searched = stack.pop()
+            if isinstance(node, SelectStatement_):
+                continue
+            if isinstance(node, AndCondition | AndConditions):
+                terms = _terms(node, AndCondition, AndConditions)
+                columns = {self.searchable(term) for term in terms} - {None}
+                searched |= cast(set[str], columns)
+                stack.extend((term, searched) for term in reversed(terms))
+                continue
+            if isinstance(node, OrCondition | OrConditions):
+                terms = _terms(node, OrCondition, OrConditions)
+                issue = self._or_issue(node, terms)
+                if issue is not None:
+                    yield issue
+                stack.extend((term, searched) for term in reversed(terms))
+                continue
+            if isinstance(node, Expression):
+                issue = self._term_issue(node)
+                if issue is not None and not set(issue.columns) <= searched:
+                    yield issue
+            stack.extend((child, searched) for child in node._children())
+
+    def _wrapped(self, expr: SqlElement) -> tuple[str, tuple[str, ...]] | None:
+        """The kind of issue and the indexed columns if expr wraps them."""
+        expr = _strip(expr)
+        if isinstance(expr, _FUNCTIONS):
+            kind = FUNCTION_ON_COLUMN
+        elif isinstance(expr, _ARITHMETIC):
+            kind = ARITHMETIC_ON_COLUMN
+        else:
+            return None
+        if self.indexed(expr) is not None:
+            return None
+        columns = []
+        for node in _expressions(expr):
+            resolved = self.resolve(node)
+            if resolved is not None and self.schema.is_indexed(*resolved):
+                columns.append(".".join(resolved))
+        return (kind, tuple(dict.fromkeys(columns))) if columns else None
+
+    def _term_issue(self, term: Expression) -> Issue | None:
+        if isinstance(term, EqExpression | Comparison):
+            for side, other in ((term._left, term._right), (term._right, term._left)):
+                wrapped = self._wrapped(side)
+                if wrapped is not None and _is_constant(other):
+                    return Issue(wrapped[0], term, wrapped[1])
+            return None
+        subject, values = _subject(term)
+        if subject is None or not all(_is_constant(v) for v in values):
+            return None
+        wrapped = self._wrapped(subject)
+        if wrapped is not None:
+            return Issue(wrapped[0], term, wrapped[1])
+        if isinstance(term, LikeExpression | MatchLikeExpression):
+            return self._pattern_issue(term)
+        return None
+
+    def _pattern_issue(
+        self, term: LikeExpression | MatchLikeExpression
+    ) -> Issue | None:
+        op = term._op if isinstance(term, MatchLikeExpression) else "LIKE"
+        pattern = term._pattern
+        if op not in _WILDCARDS or not isinstance(pattern, StringLiteral):
+            return None
+        resolved = self.resolve(term._prev)
+        if resolved is None or not self.schema.is_indexed(*resolved):
+            return None
+        columns = (".".join(resolved),)
+        if pattern._value and not _pattern_prefix(pattern._value, _WILDCARDS[op]):
+            return Issue(LEADING_WILDCARD, term, columns)
+        if op == "LIKE" and pattern._value and self._searchable_pattern(term) is None:
+            return Issue(LIKE_PREFIX, term, columns)
+        return None
+
+    def _or_issue(self, node: Expression, terms: list[Expression]) -> Issue | None:
+        columns = [self.searchable(term) for term in terms]
+        if None not in columns or all(column is None for column in columns):
+            return None
+        referenced = {
+            resolved
+            for term in terms
+            for part in _expressions(term)
+            if (resolved := self.resolve(part)) is not None
+        }
+        if len(referenced) < 2:
+            return None
+        searchable = tuple(dict.fromkeys(c for c in columns if c is not None))
+        return Issue(OR_ACROSS_COLUMNS, node, searchable)
+
+
+def _subject(
+    term: SqlElement,
+) -> tuple[SqlElement | None, tuple[SqlElement, ...]]:
+    """The operand and the values compared to it by IS, BETWEEN, IN and LIKE.
+
+    (None, ()) for other terms and negated operators, which no index serves.
+    """
+    subject: SqlElement | None = None
+    values: tuple[SqlElement, ...] = ()
+    if isinstance(term, IsExpressionComplete):
+        if type(term._prev) is IsExpression:
+            subject, values = term._prev._prev, (term._other,)
+    elif isinstance(term, BetweenExpression):
+        subject, values = term._prev, (term._lower, term._upper)
+    elif isinstance(term, InExpressionWithExpressions):
+        subject, values = term._prev, term._exprs
+    elif isinstance(
+        term,
+        InExpressionWithSelect
+        | InExpressionWithTableName
+        | InExpressionWithTableFunction,
+    ):
+        subject = term._prev
+    elif isinstance(term, NullCompareExpression):
+        if term._op == "ISNULL":
+            subject = term._prev
+    elif isinstance(term, LikeExpression | MatchLikeExpression):
+        subject, values = term._prev, (term._pattern,)
+    if isinstance(subject, NegatedOperator):
+        return None, ()
+    return subject, values
+
+
+def find_issues(statement: SqlElement, schema: IndexSchema) -> tuple[Issue, ...]:
+    """The conditions of the WHERE clauses of statement no index can serve."""
+    issues: list[Issue] = []
+    stack = [statement]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, _WHERE_CLAUSES):
+            issues.extend(_Scope(schema, node).issues(_condition(node)))
+        stack.extend(node._children())
+    return tuple(issues)
+
+
+def _rewrite_term(scope: _Scope, expr: Expression) -> Expression:
+    term = _strip(expr)
+    if isinstance(term, InExpressionWithExpressions) and len(term._exprs) == 1:
+        # Both forms apply the affinity of the column to the value.
+        (value,) = term._exprs
+        if isinstance(_strip(term._prev), _COLUMNS) and _is_constant(value):
+            return cast(Expression, term._prev).eq(value)
+    if isinstance(term, LikeExpression) and isinstance(term._pattern, StringLiteral):
+        resolved = scope.resolve(term._prev)
+        if resolved is None or not scope.schema.has_text_affinity(*resolved):
+            return expr
+        collations = scope.schema.indexed.get(resolved, set())
+        if "BINARY" not in collations or "NOCASE" in collations:
+            return expr
+        prefix = _pattern_prefix(term._pattern._value, "%_")
+        # LIKE matches ASCII letters in either case: "ABC" sorts before all
+        # matches, and all matches before the successor of "abc".
+        upper = _successor(prefix.translate(_LOWER))
+        if prefix and upper is not None:
+            column = cast(Expression, term._prev)
+            return and_all(
+                column >= literal(prefix.translate(_UPPER)),
+                column < literal(upper),
+                term,
+            )
+    return expr
+
+
+def _rewrite(scope: _Scope, expr: Expression) -> Expression:
+    inner = _strip(expr)
+    if isinstance(inner, AndCondition | AndConditions):
+        terms = _terms(inner, AndCondition, AndConditions)
+        rewritten = [_rewrite(scope, term) for term in terms]
+        if any(new is not old for new, old in zip(rewritten, terms)):
+            return and_all(*rewritten)
+        return expr
+    if isinstance(inner, OrCondition | OrConditions):
+        terms = _terms(inner, OrCondition, OrConditions)
+        rewritten = [_rewrite(scope, term) for term in terms]
+        if any(new is not old for new, old in zip(rewritten, terms)):
+            return or_all(*rewritten)
+        return expr
+    return _rewrite_term(scope, expr)
+
+
+def _union_all(
+    scope: _Scope, where: SelectWhereClause[Any], condition: Expression
+) -> CompleteSqlQuery | None:
+    """The UNION ALL of one SELECT per term of an OR, if each can use an index."""
+    source = where._prev
+    if not isinstance(source, SelectFromClause) or len(scope.tables) != 1:
+        return None
+    if isinstance(source._source, JoinClause) or len(source._source) != 1:
+        return None
+    columns = source._prev
+    if not isinstance(columns, SelectColumns):
+        return None
+    keyword = columns._prev
+    if isinstance(keyword, SelectAllKeyword):
+        keyword = keyword._prev
+    # Without WITH, so that the arms can share the FROM clause.
+    if not isinstance(keyword, SelectKeyword) or keyword._prev is not None:
+        return None
+    if any(_is_aggregate(n) for c in columns._cols for n in _expressions(c)):
+        return None
+    terms = _terms(condition, OrCondition, OrConditions)
+    indexed = [scope.searchable(term) for term in terms]
+    if len(terms) < 2 or None in indexed or len(set(indexed)) < 2:
+        return None
+    query = SelectWhereClause[Core](source, terms[0])
+    for i in range(1, len(terms)):
+        # Rows of the previous arms, for which this condition is true too,
+        # are left out; unknown is not true.
+        seen = ParenthesizedExpression(or_all(*terms[:i])).Is.Not(True)
+        query = query.UnionAll(SelectWhereClause[Core](source, and_all(terms[i], seen)))
+    return query
+
+
+def make_sargable(statement: CompleteSqlQuery, schema: IndexSchema) -> CompleteSqlQuery:
+    """statement with its WHERE clause rewritten so that indexes can serve it.
+
+    The statement is returned as it is when there is nothing to rewrite.
+    """
+    # The clauses that follow the WHERE clause, e.g. ORDER BY or RETURNING.
+    after: list[SqlElement] = []
+    node: SqlElement = statement
+    while not isinstance(node, _WHERE_CLAUSES):
+        if isinstance(node, _BEFORE_WHERE) or not hasattr(node, "_prev"):
+            return statement
+        after.append(node)
+        node = node._prev
+    scope = _Scope(schema, node)
+    condition = _condition(node)
+    rewritten = _rewrite(scope, condition)
+    if not after and isinstance(node, SelectWhereClause):
+        union = _union_all(scope, node, rewritten)
+        if union is not None:
+            return union
+    if rewritten is condition:
+        return statement
+    result: SqlElement = type(node)(node._prev, rewritten)
+    for clause in reversed(after):
+        result = _replaced(clause, _prev=result)
+    return cast(CompleteSqlQuery, result)
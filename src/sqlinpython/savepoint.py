@@ -1,7 +1,8 @@
 from abc import ABC
+from collections.abc import Sequence
 from typing import override
 
-from sqlinpython.base import CompleteSqlQuery, SqlElement
+from sqlinpython.base import CompleteSqlQuery, QueryPart, SqlElement
 from sqlinpython.name import Name
 
 # SPEC: https://sqlite.org/lang_savepoint.html
@@ -10,10 +11,12 @@ from sqlinpython.name import Name
 
 
 class SavepointStatement(CompleteSqlQuery, ABC):
-    pass
+    __slots__ = ()
 
 
 class SavepointComplete(SavepointStatement):
+    __slots__ = ("_prev", "_savepoint")
+
     def __init__(self, prev: SqlElement, savepoint: Name) -> None:
         self._prev = prev
         self._savepoint = savepoint
@@ -24,8 +27,14 @@ class SavepointComplete(SavepointStatement):
         buffer.append(" ")
         self._savepoint._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ", self._savepoint)
+
 
 class SavepointKeyword(SqlElement):
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
@@ -43,10 +52,12 @@ Savepoint = SavepointKeyword()
 
 
 class ReleaseStatement(CompleteSqlQuery, ABC):
-    pass
+    __slots__ = ()
 
 
 class ReleaseComplete(ReleaseStatement):
+    __slots__ = ("_prev", "_savepoint")
+
     def __init__(self, prev: SqlElement, savepoint: Name) -> None:
         self._prev = prev
         self._savepoint = savepoint
@@ -57,8 +68,14 @@ class ReleaseComplete(ReleaseStatement):
         buffer.append(" ")
         self._savepoint._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ", self._savepoint)
+
 
 class ICallableReleaseSavepoint(SqlElement, ABC):
+    __slots__ = ()
+
     def __call__(self, savepoint: Name | str) -> ReleaseComplete:
         if isinstance(savepoint, str):
             savepoint = Name(savepoint)
@@ -66,6 +83,8 @@ class ICallableReleaseSavepoint(SqlElement, ABC):
 
 
 class ReleaseWithSavepoint(ICallableReleaseSavepoint):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement) -> None:
         self._prev = prev
 
@@ -74,8 +93,14 @@ class ReleaseWithSavepoint(ICallableReleaseSavepoint):
         self._prev._create_query(buffer)
         buffer.append(" SAVEPOINT")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " SAVEPOINT")
+
 
 class ReleaseKeyword(ICallableReleaseSavepoint):
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
@@ -92,10 +117,12 @@ Release = ReleaseKeyword()
 
 
 class RollbackStatement(CompleteSqlQuery, ABC):
-    pass
+    __slots__ = ()
 
 
 class RollbackComplete(RollbackStatement):
+    __slots__ = ("_prev", "_savepoint")
+
     def __init__(self, prev: SqlElement, savepoint: Name) -> None:
         self._prev = prev
         self._savepoint = savepoint
@@ -106,8 +133,14 @@ class RollbackComplete(RollbackStatement):
         buffer.append(" ")
         self._savepoint._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ", self._savepoint)
+
 
 class ICallableRollbackSavepoint(SqlElement, ABC):
+    __slots__ = ()
+
     def __call__(self, savepoint: Name | str) -> RollbackComplete:
         if isinstance(savepoint, str):
             savepoint = Name(savepoint)
@@ -115,6 +148,8 @@ class ICallableRollbackSavepoint(SqlElement, ABC):
 
 
 class RollbackWithToSavepoint(ICallableRollbackSavepoint):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement) -> None:
         self._prev = prev
 
@@ -123,8 +158,14 @@ class RollbackWithToSavepoint(ICallableRollbackSavepoint):
         self._prev._create_query(buffer)
         buffer.append(" SAVEPOINT")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " SAVEPOINT")
+
 
 class RollbackWithTo(ICallableRollbackSavepoint):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement) -> None:
         self._prev = prev
 
@@ -137,14 +178,22 @@ class RollbackWithTo(ICallableRollbackSavepoint):
         self._prev._create_query(buffer)
         buffer.append(" TO")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " TO")
+
 
 class IRollbackWithTo(RollbackStatement, ABC):
+    __slots__ = ()
+
     @property
     def To(self) -> RollbackWithTo:
         return RollbackWithTo(self)
 
 
 class RollbackWithTransaction(IRollbackWithTo):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement) -> None:
         self._prev = prev
 
@@ -153,8 +202,14 @@ class RollbackWithTransaction(IRollbackWithTo):
         self._prev._create_query(buffer)
         buffer.append(" TRANSACTION")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " TRANSACTION")
+
 
 class RollbackKeyword(IRollbackWithTo):
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
@@ -2,9 +2,17 @@ from __future__ import annotations
 
 import typing
 from abc import ABC
+from collections.abc import Iterator, Sequence
 from typing import Literal, override
 
-from sqlinpython.base import NoArg, SqlElement, comma_separated
+from sqlinpython.base import (
+    NoArg,
+    ParameterBuffer,
+    QueryPart,
+    SqlElement,
+    comma_separated,
+    comma_separated_parts,
+)
 from sqlinpython.expression import (
     AliasedExpression,
     Expression,
@@ -13,8 +21,15 @@ from sqlinpython.expression import (
     WindowDefn,
     to_expr,
 )
+from sqlinpython.expression.core import (
+    CollateOperator,
+    ParenthesizedExpression,
+    UnaryOperator,
+)
+from sqlinpython.expression.literal import HexLiteral, IntLiteral
+from sqlinpython.indexed_column import ColumnNameWithOrdering
 from sqlinpython.name import Name
-from sqlinpython.ordering_term import OrderingTerm
+from sqlinpython.ordering_term import OrderingTerm, OrderingTermWithNulls
 from sqlinpython.select_base import Complete, Core, SelectStatement_
 from sqlinpython.table_or_subquery import (
     JoinClause,
@@ -34,6 +49,43 @@ ResultColumn = Expression | AliasedExpression | Star_ | TableStarResultColumn
 _ResultColumnArg = Literal["*"] | ResultColumn
 
 
+def _is_column_number(term: SqlElement) -> bool:
+    # SQLite reads an integer term of ORDER BY or GROUP BY, under COLLATE,
+    # a sign or parentheses, as the number of a result column.
+    node = term
+    while True:
+        if isinstance(node, ColumnNameWithOrdering | OrderingTermWithNulls):
+            node = node._prev
+        elif isinstance(node, ParenthesizedExpression):
+            node = node._prev
+        elif isinstance(node, CollateOperator):
+            node = node._left
+        elif isinstance(node, UnaryOperator) and node._op != "~":
+            node = node._left
+        else:
+            return isinstance(node, IntLiteral | HexLiteral)
+
+
+def _terms_query(buffer: list[str], terms: Sequence[SqlElement]) -> None:
+    """Render ORDER BY or GROUP BY terms, keeping column numbers inline.
+
+    A bind parameter is a constant to SQLite, so ``ORDER BY ?`` bound to 2
+    does not sort by the second result column as ``ORDER BY 2`` does.
+    """
+    if not isinstance(buffer, ParameterBuffer):
+        comma_separated(buffer, terms)
+        return
+    for i, term in enumerate(terms):
+        if i > 0:
+            buffer.append(", ")
+        if _is_column_number(term):
+            inline: list[str] = []
+            term._create_query(inline)
+            buffer.extend(inline)
+        else:
+            term._create_query(buffer)
+
+
 def _resolve_result_column(arg: _ResultColumnArg) -> ResultColumn:
     from sqlinpython.expression import Star as StarSingleton
 
@@ -45,6 +97,8 @@ def _resolve_result_column(arg: _ResultColumnArg) -> ResultColumn:
 class ISelectAliasable(SelectStatement_[Complete], ABC):
     """Mixin for SELECT statements that can be aliased as subqueries."""
 
+    __slots__ = ()
+
     def As(self, alias: Name | str, *, explicit_as: bool = True) -> SubqueryAliased:
         if isinstance(alias, str):
             alias = Name(alias)
@@ -57,18 +111,26 @@ class ISelectAliasable(SelectStatement_[Complete], ABC):
 
 
 class SelectLimitOffset(ISelectAliasable):
+    __slots__ = ("_prev", "_offset")
+
     def __init__(self, prev: SqlElement, offset: Expression) -> None:
         self._prev = prev
         self._offset = offset
 
     @override
     def _create_query(self, buffer: list[str]) -> None:
-        self._prev._create_query(buffer)
+        self._prev._create_query_cached(buffer)
         buffer.append(" OFFSET ")
         self._offset._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " OFFSET ", self._offset)
+
 
 class SelectLimitComma(ISelectAliasable):
+    __slots__ = ("_prev", "_limit", "_offset")
+
     def __init__(self, prev: SqlElement, limit: Expression, offset: Expression) -> None:
         self._prev = prev
         self._limit = limit
@@ -76,14 +138,20 @@ class SelectLimitComma(ISelectAliasable):
 
     @override
     def _create_query(self, buffer: list[str]) -> None:
-        self._prev._create_query(buffer)
+        self._prev._create_query_cached(buffer)
         buffer.append(" LIMIT ")
         self._limit._create_query(buffer)
         buffer.append(", ")
         self._offset._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " LIMIT ", self._limit, ", ", self._offset)
+
 
 class SelectLimit(ISelectAliasable):
+    __slots__ = ("_prev", "_limit")
+
     def __init__(self, prev: SqlElement, limit: Expression) -> None:
         self._prev = prev
         self._limit = limit
@@ -93,10 +161,14 @@ class SelectLimit(ISelectAliasable):
 
     @override
     def _create_query(self, buffer: list[str]) -> None:
-        self._prev._create_query(buffer)
+        self._prev._create_query_cached(buffer)
         buffer.append(" LIMIT ")
         self._limit._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " LIMIT ", self._limit)
+
 
 # ---------------------------------------------------------------------------
 # Concrete SELECT clause chain
@@ -104,6 +176,8 @@ class SelectLimit(ISelectAliasable):
 
 
 class ISelectLimit(SqlElement, ABC):
+    __slots__ = ()
+
     @typing.overload
     def Limit(self, expr: ExpressionOrLiteral) -> SelectLimit: ...
     @typing.overload
@@ -123,23 +197,33 @@ class ISelectLimit(SqlElement, ABC):
 class SelectOrderBy(ISelectLimit, SelectStatement_[Complete]):
     """... ORDER BY term, ..."""
 
+    __slots__ = ("_prev", "_terms")
+
     def __init__(self, prev: SqlElement, terms: tuple[OrderingTerm, ...]) -> None:
         self._prev = prev
         self._terms = terms
 
     @override
     def _create_query(self, buffer: list[str]) -> None:
-        self._prev._create_query(buffer)
+        self._prev._create_query_cached(buffer)
         buffer.append(" ORDER BY ")
-        comma_separated(buffer, self._terms)
+        _terms_query(buffer, self._terms)
+
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ORDER BY ", *comma_separated_parts(self._terms))
 
 
 class ISelectOrderBy(ISelectLimit, ABC):
+    __slots__ = ()
+
     def OrderBy(self, *terms: OrderingTerm) -> SelectOrderBy:
         return SelectOrderBy(self, terms)
 
 
 class ISelectCompound[T: Core | Complete](ISelectOrderBy, SelectStatement_[T], ABC):
+    __slots__ = ()
+
     def Union(self, rhs: SelectStatement_[Core]) -> SelectCompound[T]:
         return SelectCompound(self, "UNION", rhs)
 
@@ -156,6 +240,8 @@ class ISelectCompound[T: Core | Complete](ISelectOrderBy, SelectStatement_[T], A
 class SelectValues[T: Core | Complete](ISelectCompound[T], SelectStatement_[T]):
     """VALUES (expr, ...), ..."""
 
+    __slots__ = ("_prev", "_rows")
+
     def __init__(
         self, prev: SqlElement, rows: tuple[tuple[Expression, ...], ...]
     ) -> None:
@@ -164,7 +250,7 @@ class SelectValues[T: Core | Complete](ISelectCompound[T], SelectStatement_[T]):
 
     @override
     def _create_query(self, buffer: list[str]) -> None:
-        self._prev._create_query(buffer)
+        self._prev._create_query_cached(buffer)
         buffer.append(" ")
         for i, row in enumerate(self._rows):
             if i > 0:
@@ -173,10 +259,22 @@ class SelectValues[T: Core | Complete](ISelectCompound[T], SelectStatement_[T]):
             comma_separated(buffer, row)
             buffer.append(")")
 
+    @override
+    def _parts(self) -> Iterator[QueryPart]:
+        # A generator, so that streaming renders do not expand all rows at once.
+        yield self._prev
+        yield " "
+        for i, row in enumerate(self._rows):
+            yield ", (" if i > 0 else "("
+            yield from comma_separated_parts(row)
+            yield ")"
+
 
 class SelectCompound[T: Core | Complete](ISelectCompound[T], SelectStatement_[T]):
     """... UNION/INTERSECT/EXCEPT select-stmt"""
 
+    __slots__ = ("_prev", "_op", "_rhs")
+
     def __init__(
         self,
         prev: SqlElement,
@@ -189,14 +287,30 @@ class SelectCompound[T: Core | Complete](ISelectCompound[T], SelectStatement_[T]
 
     @override
     def _create_query(self, buffer: list[str]) -> None:
+        # Only the clauses of each SELECT cache their prefixes: caching the
+        # operands would store every prefix of a long chain of compounds.
         self._prev._create_query(buffer)
         buffer.append(f" {self._op} ")
         self._rhs._create_query(buffer)
 
+    @override
+    def _create_query_cached(self, buffer: list[str]) -> None:
+        # Reuses the text of get_query(), but does not store any.
+        if hasattr(self, "_query") and not isinstance(buffer, ParameterBuffer):
+            buffer.append(self._query)
+        else:
+            self._create_query(buffer)
+
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, f" {self._op} ", self._rhs)
+
 
 class SelectWindowClause[T: Core | Complete](ISelectCompound[T], SelectStatement_[T]):
     """... WINDOW name AS (window-defn), ..."""
 
+    __slots__ = ("_prev", "_defs")
+
     def __init__(
         self, prev: SqlElement, defs: tuple[tuple[Name, WindowDefn], ...]
     ) -> None:
@@ -205,7 +319,7 @@ class SelectWindowClause[T: Core | Complete](ISelectCompound[T], SelectStatement
 
     @override
     def _create_query(self, buffer: list[str]) -> None:
-        self._prev._create_query(buffer)
+        self._prev._create_query_cached(buffer)
         buffer.append(" WINDOW ")
         for i, (name, defn) in enumerate(self._defs):
             if i > 0:
@@ -215,8 +329,19 @@ class SelectWindowClause[T: Core | Complete](ISelectCompound[T], SelectStatement
             defn._create_query(buffer)
             buffer.append(")")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        parts: list[QueryPart] = [self._prev, " WINDOW "]
+        for i, (name, defn) in enumerate(self._defs):
+            if i > 0:
+                parts.append(", ")
+            parts.extend((name, " AS (", defn, ")"))
+        return parts
+
 
 class ISelectWindowClause[T: Core | Complete](ISelectCompound[T], ABC):
+    __slots__ = ()
+
     def Window(self, *defs: tuple[Name | str, WindowDefn]) -> SelectWindowClause[T]:
         defs_names = tuple(
             (Name(name) if isinstance(name, str) else name, defn) for name, defn in defs
@@ -229,18 +354,26 @@ class SelectHavingClause[T: Core | Complete](
 ):
     """... HAVING expr"""
 
+    __slots__ = ("_prev", "_expr")
+
     def __init__(self, prev: SqlElement, expr: Expression) -> None:
         self._prev = prev
         self._expr = expr
 
     @override
     def _create_query(self, buffer: list[str]) -> None:
-        self._prev._create_query(buffer)
+        self._prev._create_query_cached(buffer)
         buffer.append(" HAVING ")
         self._expr._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " HAVING ", self._expr)
+
 
 class ISelectHavingClause[T: Core | Complete](ISelectWindowClause[T], ABC):
+    __slots__ = ()
+
     def Having(self, expr: ExpressionOrLiteral) -> SelectHavingClause[T]:
         return SelectHavingClause(self, to_expr(expr))
 
@@ -250,18 +383,26 @@ class SelectGroupByClause[T: Core | Complete](
 ):
     """... GROUP BY expr, ..."""
 
+    __slots__ = ("_prev", "_exprs")
+
     def __init__(self, prev: SqlElement, exprs: tuple[Expression, ...]) -> None:
         self._prev = prev
         self._exprs = exprs
 
     @override
     def _create_query(self, buffer: list[str]) -> None:
-        self._prev._create_query(buffer)
+        self._prev._create_query_cached(buffer)
         buffer.append(" GROUP BY ")
-        comma_separated(buffer, self._exprs)
+        _terms_query(buffer, self._exprs)
+
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " GROUP BY ", *comma_separated_parts(self._exprs))
 
 
 class ISelectGroupByClause[T: Core | Complete](ISelectHavingClause[T], ABC):
+    __slots__ = ()
+
     def GroupBy(self, *exprs: ExpressionOrLiteral) -> SelectGroupByClause[T]:
         return SelectGroupByClause(self, tuple(to_expr(e) for e in exprs))
 
@@ -271,18 +412,26 @@ class SelectWhereClause[T: Core | Complete](
 ):
     """... WHERE expr"""
 
+    __slots__ = ("_prev", "_expr")
+
     def __init__(self, prev: SqlElement, expr: Expression) -> None:
         self._prev = prev
         self._expr = expr
 
     @override
     def _create_query(self, buffer: list[str]) -> None:
-        self._prev._create_query(buffer)
+        self._prev._create_query_cached(buffer)
         buffer.append(" WHERE ")
         self._expr._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " WHERE ", self._expr)
+
 
 class ISelectWhereClause[T: Core | Complete](ISelectGroupByClause[T], ABC):
+    __slots__ = ()
+
     def Where(self, expr: ExpressionOrLiteral) -> SelectWhereClause[T]:
         return SelectWhereClause(self, to_expr(expr))
 
@@ -290,6 +439,8 @@ class ISelectWhereClause[T: Core | Complete](ISelectGroupByClause[T], ABC):
 class SelectFromClause[T: Core | Complete](ISelectWhereClause[T], SelectStatement_[T]):
     """... FROM source(s)"""
 
+    __slots__ = ("_prev", "_source")
+
     def __init__(
         self, prev: SqlElement, source: JoinClause | tuple[TableOrSubquery, ...]
     ) -> None:
@@ -298,15 +449,23 @@ class SelectFromClause[T: Core | Complete](ISelectWhereClause[T], SelectStatemen
 
     @override
     def _create_query(self, buffer: list[str]) -> None:
-        self._prev._create_query(buffer)
+        self._prev._create_query_cached(buffer)
         buffer.append(" FROM ")
         if isinstance(self._source, JoinClause):
             self._source._create_query(buffer)
         else:
             comma_separated(buffer, self._source)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        if isinstance(self._source, JoinClause):
+            return (self._prev, " FROM ", self._source)
+        return (self._prev, " FROM ", *comma_separated_parts(self._source))
+
 
 class ISelectFromClause[T: Core | Complete](ISelectWhereClause[T], ABC):
+    __slots__ = ()
+
     def From(
         self, *sources: TableOrSubquery | JoinClause | SelectStatement_[Complete]
     ) -> SelectFromClause[T]:
@@ -321,16 +480,22 @@ class ISelectFromClause[T: Core | Complete](ISelectWhereClause[T], ABC):
 class SelectColumns[T: Core | Complete](ISelectFromClause[T], SelectStatement_[T]):
     """SELECT [DISTINCT|ALL] col1, col2, ..."""
 
+    __slots__ = ("_prev", "_cols")
+
     def __init__(self, prev: SqlElement, cols: tuple[ResultColumn, ...]) -> None:
         self._prev = prev
         self._cols = cols
 
     @override
     def _create_query(self, buffer: list[str]) -> None:
-        self._prev._create_query(buffer)
+        self._prev._create_query_cached(buffer)
         buffer.append(" ")
         comma_separated(buffer, self._cols)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ", *comma_separated_parts(self._cols))
+
 
 # ---------------------------------------------------------------------------
 # Entry point keywords
@@ -340,6 +505,8 @@ class SelectColumns[T: Core | Complete](ISelectFromClause[T], SelectStatement_[T
 class SelectDistinctKeyword[T: Core | Complete](SqlElement):
     """SELECT DISTINCT — awaiting result columns."""
 
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SelectKeyword[T]) -> None:
         self._prev = prev
 
@@ -349,13 +516,19 @@ class SelectDistinctKeyword[T: Core | Complete](SqlElement):
 
     @override
     def _create_query(self, buffer: list[str]) -> None:
-        self._prev._create_query(buffer)
+        self._prev._create_query_cached(buffer)
         buffer.append(" DISTINCT")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " DISTINCT")
+
 
 class SelectAllKeyword[T: Core | Complete](SqlElement):
     """SELECT ALL — awaiting result columns."""
 
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SelectKeyword[T]) -> None:
         self._prev = prev
 
@@ -365,13 +538,19 @@ class SelectAllKeyword[T: Core | Complete](SqlElement):
 
     @override
     def _create_query(self, buffer: list[str]) -> None:
-        self._prev._create_query(buffer)
+        self._prev._create_query_cached(buffer)
         buffer.append(" ALL")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ALL")
+
 
 class SelectKeyword[T: Core | Complete](SqlElement):
     """SELECT keyword — entry point for SELECT statements."""
 
+    __slots__ = ("_prev",)
+
     @typing.overload
     def __init__(self: SelectKeyword[Core], prev: None = None) -> None: ...
     @typing.overload
@@ -394,14 +573,22 @@ class SelectKeyword[T: Core | Complete](SqlElement):
     @override
     def _create_query(self, buffer: list[str]) -> None:
         if self._prev is not None:
-            self._prev._create_query(buffer)
+            self._prev._create_query_cached(buffer)
             buffer.append(" ")
         buffer.append("SELECT")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        if self._prev is None:
+            return ("SELECT",)
+        return (self._prev, " SELECT")
+
 
 class ValuesKeyword[T: Core | Complete](SqlElement):
     """VALUES keyword — entry point for VALUES statements."""
 
+    __slots__ = ("_prev",)
+
     @typing.overload
     def __init__(self: ValuesKeyword[Core], prev: None = None) -> None: ...
     @typing.overload
@@ -415,10 +602,16 @@ class ValuesKeyword[T: Core | Complete](SqlElement):
     @override
     def _create_query(self, buffer: list[str]) -> None:
         if self._prev is not None:
-            self._prev._create_query(buffer)
+            self._prev._create_query_cached(buffer)
             buffer.append(" ")
         buffer.append("VALUES")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        if self._prev is None:
+            return ("VALUES",)
+        return (self._prev, " VALUES")
+
 
 # Entry point singletons
 Select = SelectKeyword()
@@ -34,5 +34,7 @@ class Core(Complete):
 class SelectStatement_[T: Core | Complete](CompleteSqlQuery, ABC):
     """Abstract base for SELECT statements. Isolated to avoid circular imports."""
 
+    __slots__ = ()
+
 
 SelectStatement = SelectStatement_[Complete]
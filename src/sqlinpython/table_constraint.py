@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 from abc import ABC
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, overload, override
 
-from sqlinpython.base import SqlElement, comma_separated
+from sqlinpython.base import (
+    QueryPart,
+    SqlElement,
+    comma_separated,
+    comma_separated_parts,
+)
 from sqlinpython.conflict_clause import OnConflict_, OnConflictAction
 from sqlinpython.expression import Expression, ExpressionOrLiteral, to_expr
 from sqlinpython.indexed_column import IndexedColumn
@@ -17,14 +23,16 @@ if TYPE_CHECKING:
 
 
 class TableConstraint(SqlElement, ABC):
-    pass
+    __slots__ = ()
 
 
 class TableConstraintWithConflictClause(OnConflictAction, TableConstraint):
-    pass
+    __slots__ = ()
 
 
 class ConstraintBeforeConflictClause(TableConstraint):
+    __slots__ = ("_prev", "_columns", "_autoincrement")
+
     def __init__(
         self,
         prev: SqlElement,
@@ -47,8 +55,22 @@ class ConstraintBeforeConflictClause(TableConstraint):
             buffer.append(" AUTOINCREMENT")
         buffer.append(")")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        parts: list[QueryPart] = [
+            self._prev,
+            " (",
+            *comma_separated_parts(self._columns),
+        ]
+        if self._autoincrement:
+            parts.append(" AUTOINCREMENT")
+        parts.append(")")
+        return parts
+
 
 class PrimaryKeyConstraint(SqlElement):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: ConstraintWithName | None) -> None:
         self._prev = prev
 
@@ -73,11 +95,19 @@ class PrimaryKeyConstraint(SqlElement):
             self._prev._create_query(buffer)
             buffer.append(" PRIMARY KEY")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        if self._prev is None:
+            return ("PRIMARY KEY",)
+        return (self._prev, " PRIMARY KEY")
+
 
 PrimaryKey = PrimaryKeyConstraint(None)
 
 
 class UniqueConstraint(SqlElement):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: ConstraintWithName | None) -> None:
         self._prev = prev
 
@@ -92,11 +122,19 @@ class UniqueConstraint(SqlElement):
             self._prev._create_query(buffer)
             buffer.append(" UNIQUE")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        if self._prev is None:
+            return ("UNIQUE",)
+        return (self._prev, " UNIQUE")
+
 
 Unique = UniqueConstraint(None)
 
 
 class CheckConstraint(TableConstraint):
+    __slots__ = ("_prev", "_expr")
+
     def __init__(self, prev: ConstraintWithName | None, expr: Expression) -> None:
         self._prev = prev
         self._expr = expr
@@ -113,12 +151,20 @@ class CheckConstraint(TableConstraint):
             self._expr._create_query(buffer)
             buffer.append(")")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        if self._prev is None:
+            return ("CHECK (", self._expr, ")")
+        return (self._prev, " CHECK (", self._expr, ")")
+
 
 def Check(expr: ExpressionOrLiteral) -> CheckConstraint:
     return CheckConstraint(None, to_expr(expr))
 
 
 class ForeignKeyConstraint(SqlElement):
+    __slots__ = ("_prev", "_column_names")
+
     def __init__(
         self, prev: ConstraintWithName | None, column_names: tuple[Name, ...]
     ) -> None:
@@ -144,6 +190,16 @@ class ForeignKeyConstraint(SqlElement):
         comma_separated(buffer, self._column_names)
         buffer.append(")")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        parts: list[QueryPart] = []
+        if self._prev is not None:
+            parts.extend((self._prev, " FOREIGN KEY("))
+        else:
+            parts.append("FOREIGN KEY(")
+        parts.extend((*comma_separated_parts(self._column_names), ")"))
+        return parts
+
 
 def ForeignKey(*column_names: Name | str) -> ForeignKeyConstraint:
     names = tuple(
@@ -154,6 +210,8 @@ def ForeignKey(*column_names: Name | str) -> ForeignKeyConstraint:
 
 
 class ConstraintWithName(SqlElement):
+    __slots__ = ("_prev", "_name")
+
     def __init__(self, prev: SqlElement, name: Name) -> None:
         self._prev = prev
         self._name = name
@@ -182,8 +240,14 @@ class ConstraintWithName(SqlElement):
         buffer.append(" ")
         self._name._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ", self._name)
+
 
 class ConstraintKeyword(SqlElement):
+    __slots__ = ()
+
     def __call__(self, name: Name | str) -> ConstraintWithName:
         if isinstance(name, str):
             name = Name(name)
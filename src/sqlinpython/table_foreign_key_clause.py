@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 from abc import ABC
+from collections.abc import Sequence
 from typing import override
 
-from sqlinpython.base import SqlElement, comma_separated
+from sqlinpython.base import (
+    QueryPart,
+    SqlElement,
+    comma_separated,
+    comma_separated_parts,
+)
 from sqlinpython.name import Name
 from sqlinpython.table_constraint import TableConstraint
 
@@ -11,10 +17,12 @@ from sqlinpython.table_constraint import TableConstraint
 
 
 class TableForeignKeyClause(TableConstraint, ABC):
-    pass
+    __slots__ = ()
 
 
 class TableInitiallyHow(TableForeignKeyClause):
+    __slots__ = ("_prev", "_how")
+
     def __init__(self, prev: SqlElement, how: str) -> None:
         self._prev = prev
         self._how = how
@@ -24,8 +32,14 @@ class TableInitiallyHow(TableForeignKeyClause):
         self._prev._create_query(buffer)
         buffer.append(f" {self._how}")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, f" {self._how}")
+
 
 class TableInitially_(SqlElement):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement) -> None:
         self._prev = prev
 
@@ -42,8 +56,14 @@ class TableInitially_(SqlElement):
         self._prev._create_query(buffer)
         buffer.append(" INITIALLY")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " INITIALLY")
+
 
 class TableDeferrable_(TableForeignKeyClause):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement) -> None:
         self._prev = prev
 
@@ -56,8 +76,14 @@ class TableDeferrable_(TableForeignKeyClause):
         self._prev._create_query(buffer)
         buffer.append(" DEFERRABLE")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " DEFERRABLE")
+
 
 class TableNot_(SqlElement):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement) -> None:
         self._prev = prev
 
@@ -70,8 +96,14 @@ class TableNot_(SqlElement):
         self._prev._create_query(buffer)
         buffer.append(" NOT")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " NOT")
+
 
 class ITableBeforeDeferrable(TableForeignKeyClause, ABC):
+    __slots__ = ()
+
     @property
     def On(self) -> TableOn_:
         return TableOn_(self)
@@ -91,6 +123,8 @@ class ITableBeforeDeferrable(TableForeignKeyClause, ABC):
 
 
 class TableOnActionDo(ITableBeforeDeferrable):
+    __slots__ = ("_prev", "_action")
+
     def __init__(self, prev: SqlElement, action: str) -> None:
         self._prev = prev
         self._action = action
@@ -100,8 +134,14 @@ class TableOnActionDo(ITableBeforeDeferrable):
         self._prev._create_query(buffer)
         buffer.append(f" {self._action}")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, f" {self._action}")
+
 
 class TableOnAction_(SqlElement):
+    __slots__ = ("_prev", "_event")
+
     def __init__(self, prev: SqlElement, event: str) -> None:
         self._prev = prev
         self._event = event
@@ -131,8 +171,14 @@ class TableOnAction_(SqlElement):
         self._prev._create_query(buffer)
         buffer.append(f" {self._event}")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, f" {self._event}")
+
 
 class TableOn_(SqlElement):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement) -> None:
         self._prev = prev
 
@@ -149,8 +195,14 @@ class TableOn_(SqlElement):
         self._prev._create_query(buffer)
         buffer.append(" ON")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ON")
+
 
 class TableMatch_(ITableBeforeDeferrable):
+    __slots__ = ("_prev", "_name")
+
     def __init__(self, prev: SqlElement, name: Name) -> None:
         self._prev = prev
         self._name = name
@@ -161,8 +213,14 @@ class TableMatch_(ITableBeforeDeferrable):
         buffer.append(" MATCH ")
         self._name._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " MATCH ", self._name)
+
 
 class TableReferenceWithColumns(ITableBeforeDeferrable):
+    __slots__ = ("_prev", "_column_names")
+
     def __init__(self, prev: SqlElement, column_names: tuple[Name, ...]) -> None:
         self._prev = prev
         self._column_names = column_names
@@ -174,8 +232,14 @@ class TableReferenceWithColumns(ITableBeforeDeferrable):
         comma_separated(buffer, self._column_names)
         buffer.append(")")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " (", *comma_separated_parts(self._column_names), ")")
+
 
 class TableReferences_(ITableBeforeDeferrable):
+    __slots__ = ("_prev", "_table_name")
+
     def __init__(self, prev: SqlElement, table_name: Name) -> None:
         self._prev = prev
         self._table_name = table_name
@@ -189,3 +253,7 @@ class TableReferences_(ITableBeforeDeferrable):
         self._prev._create_query(buffer)
         buffer.append(" REFERENCES ")
         self._table_name._create_query(buffer)
+
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " REFERENCES ", self._table_name)
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 from abc import ABC
+from collections.abc import Sequence
 from typing import override
 
-from sqlinpython.base import SqlElement, comma_separated
+from sqlinpython.base import (
+    QueryPart,
+    SqlElement,
+    comma_separated,
+    comma_separated_parts,
+)
 from sqlinpython.expression import (
     Expression,
     ExpressionOrLiteral,
@@ -21,6 +27,8 @@ from sqlinpython.select_base import Complete, SelectStatement_
 class TableStarResultColumn(SqlElement):
     """Represents table-name.* in result columns."""
 
+    __slots__ = ("_table_name",)
+
     def __init__(self, table_name: Name) -> None:
         self._table_name = table_name
 
@@ -29,10 +37,16 @@ class TableStarResultColumn(SqlElement):
         self._table_name._create_query(buffer)
         buffer.append(".*")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._table_name, ".*")
+
 
 class TableOrSubquery(SqlElement, ABC):
     """Base class for all table-or-subquery variants. Provides join methods."""
 
+    __slots__ = ()
+
     def Join(self, rhs: TableOrSubquery) -> JoinRhs:
         return JoinRhs(self, "JOIN", rhs)
 
@@ -88,6 +102,8 @@ class TableOrSubquery(SqlElement, ABC):
 class Aliased(TableOrSubquery, ABC):
     """`<prev> [AS] <alias>` — shared base for all aliased table-or-subquery forms."""
 
+    __slots__ = ("_prev", "_alias", "_explicit_as")
+
     def __init__(self, prev: SqlElement, alias: Name, explicit_as: bool) -> None:
         self._prev = prev
         self._alias = alias
@@ -99,8 +115,14 @@ class Aliased(TableOrSubquery, ABC):
         buffer.append(" AS " if self._explicit_as else " ")
         self._alias._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " AS " if self._explicit_as else " ", self._alias)
+
 
 class TableRefAliased(Aliased):
+    __slots__ = ()
+
     @property
     def Star(self) -> TableStarResultColumn:
         return TableStarResultColumn(self._alias)
@@ -110,6 +132,8 @@ class TableRefAliased(Aliased):
 
 
 class TableRefIndexedBy(TableOrSubquery):
+    __slots__ = ("_prev", "_index_name")
+
     def __init__(self, prev: SqlElement, index_name: Name) -> None:
         self._prev = prev
         self._index_name = index_name
@@ -120,8 +144,14 @@ class TableRefIndexedBy(TableOrSubquery):
         buffer.append(" INDEXED BY ")
         self._index_name._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " INDEXED BY ", self._index_name)
+
 
 class TableRefNotIndexed(TableOrSubquery):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement) -> None:
         self._prev = prev
 
@@ -130,10 +160,16 @@ class TableRefNotIndexed(TableOrSubquery):
         self._prev._create_query(buffer)
         buffer.append(" NOT INDEXED")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " NOT INDEXED")
+
 
 class TableRef(TableOrSubquery):
     """Represents [schema.]table-name in a FROM clause."""
 
+    __slots__ = ("_schema", "_table")
+
     def __init__(self, schema: Name | str, table: Name | str | None = None, /) -> None:
         if isinstance(schema, str):
             schema = Name(schema)
@@ -174,12 +210,21 @@ class TableRef(TableOrSubquery):
             buffer.append(".")
             self._table._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        parts: list[QueryPart] = [self._schema]
+        if self._table is not None:
+            parts.extend((".", self._table))
+        return parts
+
 
 class TableFunctionRefAliased(Aliased):
-    pass
+    __slots__ = ()
 
 
 class TableFunctionRefCall(TableOrSubquery):
+    __slots__ = ("_prev", "_args")
+
     def __init__(self, prev: SqlElement, args: tuple[Expression, ...]) -> None:
         self._prev = prev
         self._args = args
@@ -198,10 +243,16 @@ class TableFunctionRefCall(TableOrSubquery):
         comma_separated(buffer, self._args)
         buffer.append(")")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, "(", *comma_separated_parts(self._args), ")")
+
 
 class TableFunctionRef(SqlElement):
     """Table function name — call it to produce a table-function-ref."""
 
+    __slots__ = ("_schema", "_name")
+
     def __init__(self, schema: Name | str, name: Name | str | None = None, /) -> None:
         if isinstance(schema, str):
             schema = Name(schema)
@@ -220,14 +271,23 @@ class TableFunctionRef(SqlElement):
             buffer.append(".")
             self._name._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        parts: list[QueryPart] = [self._schema]
+        if self._name is not None:
+            parts.extend((".", self._name))
+        return parts
+
 
 class SubqueryAliased(Aliased):
-    pass
+    __slots__ = ()
 
 
 class Subquery(TableOrSubquery):
     """A SELECT statement wrapped in parentheses as a table source."""
 
+    __slots__ = ("_select_stmt",)
+
     def __init__(self, select_stmt: SelectStatement_[Complete]) -> None:
         self._select_stmt = select_stmt
 
@@ -242,10 +302,16 @@ class Subquery(TableOrSubquery):
         self._select_stmt._create_query(buffer)
         buffer.append(")")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return ("(", self._select_stmt, ")")
+
 
 class NestedFromClause(TableOrSubquery):
     """(table-or-subquery, ... | join-clause) — nested FROM clause."""
 
+    __slots__ = ("_sources",)
+
     def __init__(self, sources: tuple[TableOrSubquery, ...] | JoinClause) -> None:
         self._sources = sources
 
@@ -258,10 +324,18 @@ class NestedFromClause(TableOrSubquery):
             comma_separated(buffer, self._sources)
         buffer.append(")")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        if isinstance(self._sources, JoinClause):
+            return ("(", self._sources, ")")
+        return ("(", *comma_separated_parts(self._sources), ")")
+
 
 class JoinClause(TableOrSubquery):
     """A complete join clause — can be extended with more joins."""
 
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement) -> None:
         self._prev = prev
 
@@ -269,10 +343,16 @@ class JoinClause(TableOrSubquery):
     def _create_query(self, buffer: list[str]) -> None:
         self._prev._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev,)
+
 
 class JoinOn(SqlElement):
     """join-op + rhs + ON expr — intermediate, pending constraint."""
 
+    __slots__ = ("_prev", "_expr")
+
     def __init__(self, prev: SqlElement, expr: SqlElement) -> None:
         self._prev = prev
         self._expr = expr
@@ -283,10 +363,16 @@ class JoinOn(SqlElement):
         buffer.append(" ON ")
         self._expr._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ON ", self._expr)
+
 
 class JoinUsing(SqlElement):
     """join-op + rhs + USING (cols) — intermediate, pending constraint."""
 
+    __slots__ = ("_prev", "_cols")
+
     def __init__(self, prev: SqlElement, cols: tuple[Name, ...]) -> None:
         self._prev = prev
         self._cols = cols
@@ -298,10 +384,16 @@ class JoinUsing(SqlElement):
         comma_separated(buffer, self._cols)
         buffer.append(")")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " USING (", *comma_separated_parts(self._cols), ")")
+
 
 class JoinRhs(TableOrSubquery):
     """join-op + rhs, optionally followed by ON/USING constraint."""
 
+    __slots__ = ("_lhs", "_keyword", "_rhs")
+
     def __init__(
         self, lhs: TableOrSubquery, keyword: str, rhs: TableOrSubquery
     ) -> None:
@@ -323,3 +415,7 @@ class JoinRhs(TableOrSubquery):
         buffer.append(self._keyword)
         buffer.append(" ")
         self._rhs._create_query(buffer)
+
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._lhs, " ", self._keyword, " ", self._rhs)
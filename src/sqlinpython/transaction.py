@@ -1,17 +1,20 @@
 from __future__ import annotations
 
 from abc import ABC
+from collections.abc import Sequence
 from typing import Literal, override
 
-from sqlinpython.base import CompleteSqlQuery, SqlElement
+from sqlinpython.base import CompleteSqlQuery, QueryPart, SqlElement
 
 
 # SPEC: https://sqlite.org/lang_transaction.html
 class BeginStatement(CompleteSqlQuery, ABC):
-    pass
+    __slots__ = ()
 
 
 class BeginWithTransaction(BeginStatement):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement) -> None:
         self._prev = prev
 
@@ -20,14 +23,22 @@ class BeginWithTransaction(BeginStatement):
         self._prev._create_query(buffer)
         buffer.append(" TRANSACTION")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " TRANSACTION")
+
 
 class IBeginTransaction(BeginStatement, ABC):
+    __slots__ = ()
+
     @property
     def Transaction(self) -> BeginWithTransaction:
         return BeginWithTransaction(self)
 
 
 class BeginWithType(IBeginTransaction):
+    __slots__ = ("_prev", "_type")
+
     def __init__(
         self,
         prev: SqlElement,
@@ -41,8 +52,14 @@ class BeginWithType(IBeginTransaction):
         self._prev._create_query(buffer)
         buffer.append(f" {self._type}")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, f" {self._type}")
+
 
 class BeginKeyword(IBeginTransaction):
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
@@ -67,10 +84,12 @@ Begin = BeginKeyword()
 
 
 class CommitStatement(CompleteSqlQuery, ABC):
-    pass
+    __slots__ = ()
 
 
 class CommitWithTransaction(CommitStatement):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement) -> None:
         self._prev = prev
 
@@ -79,14 +98,22 @@ class CommitWithTransaction(CommitStatement):
         self._prev._create_query(buffer)
         buffer.append(" TRANSACTION")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " TRANSACTION")
+
 
 class ICommitTransaction(CommitStatement, ABC):
+    __slots__ = ()
+
     @property
     def Transaction(self) -> CommitWithTransaction:
         return CommitWithTransaction(self)
 
 
 class CommitKeyword(ICommitTransaction):
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
@@ -99,6 +126,8 @@ Commit = CommitKeyword()
 
 
 class EndKeyword(ICommitTransaction):
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
@@ -1,16 +1,19 @@
 from abc import ABC
+from collections.abc import Sequence
 from typing import override
 
-from sqlinpython.base import SqlElement
+from sqlinpython.base import QueryPart, SqlElement
 from sqlinpython.name import Name
 
 
 # SPEC: https://sqlite.org/syntax/type-name.html
 class CompleteTypeName(SqlElement, ABC):
-    pass
+    __slots__ = ()
 
 
 class TypeNameWithArgs(CompleteTypeName):
+    __slots__ = ("_prev", "_num1", "_num2")
+
     def __init__(self, prev: SqlElement, num1: int, num2: int | None = None):
         self._prev = prev
         self._num1 = num1
@@ -24,7 +27,15 @@ class TypeNameWithArgs(CompleteTypeName):
         else:
             buffer.append(f"({self._num1}, {self._num2})")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        if self._num2 is None:
+            return (self._prev, f"({self._num1})")
+        return (self._prev, f"({self._num1}, {self._num2})")
+
 
 class TypeName(Name, CompleteTypeName):
+    __slots__ = ()
+
     def __call__(self, num1: int, num2: int | None = None) -> TypeNameWithArgs:
         return TypeNameWithArgs(self, num1, num2)
@@ -2,9 +2,17 @@ from __future__ import annotations
 
 import typing
 from abc import ABC
+from collections.abc import Sequence
 from typing import Literal, override
 
-from sqlinpython.base import CompleteSqlQuery, NoArg, SqlElement, comma_separated
+from sqlinpython.base import (
+    CompleteSqlQuery,
+    NoArg,
+    QueryPart,
+    SqlElement,
+    comma_separated,
+    comma_separated_parts,
+)
 from sqlinpython.expression import (
     AliasedExpression,
     Expression,
@@ -32,12 +40,16 @@ from sqlinpython.table_or_subquery import TableOrSubquery
 class UpdateStatementLimited(CompleteSqlQuery, ABC):
     """Base for update-stmt-limited (ORDER BY / LIMIT requires SQLITE_ENABLE_UPDATE_DELETE_LIMIT)."""
 
+    __slots__ = ()
+
     pass
 
 
 class UpdateStatement(UpdateStatementLimited, ABC):
     """Base for update-stmt (no ORDER BY / LIMIT; no compile-time flag needed)."""
 
+    __slots__ = ()
+
     pass
 
 
@@ -47,6 +59,8 @@ class UpdateStatement(UpdateStatementLimited, ABC):
 
 
 class UpdateLimitOffset(UpdateStatementLimited):
+    __slots__ = ("_prev", "_offset")
+
     def __init__(self, prev: SqlElement, offset: Expression) -> None:
         self._prev = prev
         self._offset = offset
@@ -57,8 +71,14 @@ class UpdateLimitOffset(UpdateStatementLimited):
         buffer.append(" OFFSET ")
         self._offset._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " OFFSET ", self._offset)
+
 
 class UpdateLimitComma(UpdateStatementLimited):
+    __slots__ = ("_prev", "_limit", "_offset")
+
     def __init__(self, prev: SqlElement, limit: Expression, offset: Expression) -> None:
         self._prev = prev
         self._limit = limit
@@ -72,8 +92,14 @@ class UpdateLimitComma(UpdateStatementLimited):
         buffer.append(", ")
         self._offset._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " LIMIT ", self._limit, ", ", self._offset)
+
 
 class UpdateLimit(UpdateStatementLimited):
+    __slots__ = ("_prev", "_limit")
+
     def __init__(self, prev: SqlElement, limit: Expression) -> None:
         self._prev = prev
         self._limit = limit
@@ -87,8 +113,14 @@ class UpdateLimit(UpdateStatementLimited):
         buffer.append(" LIMIT ")
         self._limit._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " LIMIT ", self._limit)
+
 
 class IUpdateLimit(SqlElement, ABC):
+    __slots__ = ()
+
     @typing.overload
     def Limit(self, expr: ExpressionOrLiteral) -> UpdateLimit: ...
     @typing.overload
@@ -106,6 +138,8 @@ class IUpdateLimit(SqlElement, ABC):
 
 
 class UpdateOrderBy(UpdateStatementLimited, IUpdateLimit):
+    __slots__ = ("_prev", "_terms")
+
     def __init__(self, prev: SqlElement, terms: tuple[OrderingTerm, ...]) -> None:
         self._prev = prev
         self._terms = terms
@@ -116,8 +150,14 @@ class UpdateOrderBy(UpdateStatementLimited, IUpdateLimit):
         buffer.append(" ORDER BY ")
         comma_separated(buffer, self._terms)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ORDER BY ", *comma_separated_parts(self._terms))
+
 
 class IUpdateOrderBy(IUpdateLimit, ABC):
+    __slots__ = ()
+
     def OrderBy(
         self, *terms: *tuple[OrderingTerm, *tuple[OrderingTerm, ...]]
     ) -> UpdateOrderBy:
@@ -130,10 +170,12 @@ class IUpdateOrderBy(IUpdateLimit, ABC):
 
 
 class UpdateReturning(UpdateStatement, IUpdateOrderBy, ReturningBase):
-    pass
+    __slots__ = ()
 
 
 class IBeforeReturningClause(UpdateStatement, IUpdateOrderBy, ABC):
+    __slots__ = ()
+
     def Returning(
         self,
         *args: typing.Literal["*"] | Expression | AliasedExpression | Star_,
@@ -143,6 +185,8 @@ class IBeforeReturningClause(UpdateStatement, IUpdateOrderBy, ABC):
 
 
 class UpdateWhere(IBeforeReturningClause):
+    __slots__ = ("_prev", "_condition")
+
     def __init__(self, prev: SqlElement, condition: Expression) -> None:
         self._prev = prev
         self._condition = condition
@@ -153,13 +197,21 @@ class UpdateWhere(IBeforeReturningClause):
         buffer.append(" WHERE ")
         self._condition._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " WHERE ", self._condition)
+
 
 class IBeforeWhereClause(IBeforeReturningClause, ABC):
+    __slots__ = ()
+
     def Where(self, condition: ExpressionOrLiteral) -> UpdateWhere:
         return UpdateWhere(self, to_expr(condition))
 
 
 class UpdateSetFrom(IBeforeWhereClause):
+    __slots__ = ("_prev", "_sources")
+
     def __init__(self, prev: SqlElement, sources: tuple[TableOrSubquery, ...]) -> None:
         self._prev = prev
         self._sources = sources
@@ -170,12 +222,18 @@ class UpdateSetFrom(IBeforeWhereClause):
         buffer.append(" FROM ")
         comma_separated(buffer, self._sources)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " FROM ", *comma_separated_parts(self._sources))
+
 
 _Assignment = tuple[Name | tuple[Name, ...], Expression]
 
 
 class UpdateSet(IBeforeWhereClause):
-    def __init__(self, prev: SqlElement, assignments: list[_Assignment]) -> None:
+    __slots__ = ("_prev", "_assignments")
+
+    def __init__(self, prev: SqlElement, assignments: tuple[_Assignment, ...]) -> None:
         self._prev = prev
         self._assignments = assignments
 
@@ -198,8 +256,25 @@ class UpdateSet(IBeforeWhereClause):
                 buffer.append(") = ")
             v._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        parts: list[QueryPart] = [self._prev, " SET "]
+        for i, (k, v) in enumerate(self._assignments):
+            if i > 0:
+                parts.append(", ")
+            if isinstance(k, Name):
+                parts.extend((k, " = "))
+            else:
+                parts.append("(")
+                parts.extend(comma_separated_parts(k))
+                parts.append(") = ")
+            parts.append(v)
+        return parts
+
 
 class IBeforeSetClause(SqlElement, ABC):
+    __slots__ = ()
+
     def Set(
         self,
         __assignments: dict[str | Name | tuple[str | Name, ...], Expression]
@@ -223,10 +298,12 @@ class IBeforeSetClause(SqlElement, ABC):
             assignments.append((Name(k), v))
         if not assignments:
             raise ValueError("Set() requires at least one assignment")
-        return UpdateSet(self, assignments)
+        return UpdateSet(self, tuple(assignments))
 
 
 class UpdateTableNotIndexed(IBeforeSetClause):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement) -> None:
         self._prev = prev
 
@@ -235,8 +312,14 @@ class UpdateTableNotIndexed(IBeforeSetClause):
         self._prev._create_query(buffer)
         buffer.append(" NOT INDEXED")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " NOT INDEXED")
+
 
 class UpdateTableIndexedBy(IBeforeSetClause):
+    __slots__ = ("_prev", "_index_name")
+
     def __init__(self, prev: SqlElement, index_name: Name) -> None:
         self._prev = prev
         self._index_name = index_name
@@ -247,8 +330,14 @@ class UpdateTableIndexedBy(IBeforeSetClause):
         buffer.append(" INDEXED BY ")
         self._index_name._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " INDEXED BY ", self._index_name)
+
 
 class IIndexHints(IBeforeSetClause, ABC):
+    __slots__ = ()
+
     def IndexedBy(self, index_name: Name | str) -> UpdateTableIndexedBy:
         if isinstance(index_name, str):
             index_name = Name(index_name)
@@ -260,6 +349,8 @@ class IIndexHints(IBeforeSetClause, ABC):
 
 
 class UpdateTableAliased(IIndexHints):
+    __slots__ = ("_prev", "_alias")
+
     def __init__(self, prev: SqlElement, alias: Name) -> None:
         self._prev = prev
         self._alias = alias
@@ -270,8 +361,14 @@ class UpdateTableAliased(IIndexHints):
         buffer.append(" AS ")
         self._alias._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " AS ", self._alias)
+
 
 class UpdateTable(IIndexHints):
+    __slots__ = ("_prev", "_schema", "_table")
+
     def __init__(self, prev: SqlElement, schema: Name, table: Name | None) -> None:
         self._prev = prev
         self._schema = schema
@@ -291,8 +388,17 @@ class UpdateTable(IIndexHints):
             buffer.append(".")
             self._table._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        parts: list[QueryPart] = [self._prev, " ", self._schema]
+        if self._table is not None:
+            parts.extend((".", self._table))
+        return parts
+
 
 class UpdateOr(SqlElement):
+    __slots__ = ("_prev", "_conflict")
+
     def __init__(
         self,
         prev: SqlElement,
@@ -315,8 +421,14 @@ class UpdateOr(SqlElement):
         self._prev._create_query(buffer)
         buffer.append(f" OR {self._conflict}")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, f" OR {self._conflict}")
+
 
 class UpdateKeyword(SqlElement):
+    __slots__ = ("_prev",)
+
     def __init__(self, prev: SqlElement | None = None) -> None:
         self._prev = prev
 
@@ -357,5 +469,11 @@ class UpdateKeyword(SqlElement):
             self._prev._create_query(buffer)
             buffer.append(" UPDATE")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        if self._prev is None:
+            return ("UPDATE",)
+        return (self._prev, " UPDATE")
+
 
 Update = UpdateKeyword()
@@ -1,16 +1,19 @@
 from abc import ABC
+from collections.abc import Sequence
 from typing import override
 
-from sqlinpython.base import CompleteSqlQuery, SqlElement
+from sqlinpython.base import CompleteSqlQuery, QueryPart, SqlElement
 from sqlinpython.name import Name
 
 
 # SPEC: https://sqlite.org/lang_vacuum.html
 class VacuumStatement(CompleteSqlQuery, ABC):
-    pass
+    __slots__ = ()
 
 
 class VacuumWithIntoFileName(VacuumStatement):
+    __slots__ = ("_prev", "_file_name")
+
     def __init__(self, prev: SqlElement, file_name: str) -> None:
         self._prev = prev
         self._file_name = file_name
@@ -20,13 +23,21 @@ class VacuumWithIntoFileName(VacuumStatement):
         self._prev._create_query(buffer)
         buffer.append(f" INTO {self._file_name}")
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, f" INTO {self._file_name}")
+
 
 class IVacuumInto(VacuumStatement, ABC):
+    __slots__ = ()
+
     def Into(self, file_name: str) -> VacuumWithIntoFileName:
         return VacuumWithIntoFileName(self, file_name)
 
 
 class VacuumWithSchema(IVacuumInto):
+    __slots__ = ("_prev", "_schema")
+
     def __init__(self, prev: SqlElement, schema: Name) -> None:
         self._prev = prev
         self._schema = schema
@@ -37,8 +48,14 @@ class VacuumWithSchema(IVacuumInto):
         buffer.append(" ")
         self._schema._create_query(buffer)
 
+    @override
+    def _parts(self) -> Sequence[QueryPart]:
+        return (self._prev, " ", self._schema)
+
 
 class VacuumKeyword(IVacuumInto):
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
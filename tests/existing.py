@@ -0,0 +1,64 @@
+"""Re-running the query tests of the suite with a check on every statement.
+
+@parametrize_existing_tests(__name__)
+def test_check(test_func: Callable[[], None], monkeypatch: MonkeyPatch) -> None:
+    check_get_query(monkeypatch, lambda statement, query: ...)
+    test_func()
+"""
+
+import importlib
+import inspect
+import pkgutil
+from collections.abc import Callable
+
+import pytest
+
+import tests
+from sqlinpython.base import CompleteSqlQuery
+
+
+def existing_tests(*excluded: str) -> list[Callable[[], None]]:
+    """The test functions without fixtures, except those of excluded modules."""
+    found: list[Callable[[], None]] = []
+    for module_info in pkgutil.walk_packages(tests.__path__, "tests."):
+        if module_info.name in excluded:
+            continue
+        module = importlib.import_module(module_info.name)
+        for name, func in inspect.getmembers(module, inspect.isfunction):
+            if name.startswith("test_") and not inspect.signature(func).parameters:
+                found.append(func)
+    return found
+
+
+def parametrize_existing_tests(*excluded: str) -> pytest.MarkDecorator:
+    """Parametrize test_func over existing_tests(*excluded)."""
+    return pytest.mark.parametrize(
+        "test_func",
+        existing_tests(*excluded),
+        ids=lambda f: f"{f.__module__}.{f.__name__}",
+    )
+
+
+def check_get_query(
+    monkeypatch: pytest.MonkeyPatch,
+    check: Callable[[CompleteSqlQuery, str], None],
+) -> None:
+    """Call check with each statement and its SQL when get_query() is called.
+
+    Statements rendered by check itself are not checked again.
+    """
+    original = CompleteSqlQuery.get_query
+    checking = False
+
+    def checked_get_query(self: CompleteSqlQuery) -> str:
+        nonlocal checking
+        query = original(self)
+        if not checking:
+            checking = True
+            try:
+                check(self, query)
+            finally:
+                checking = False
+        return query
+
+    monkeypatch.setattr(CompleteSqlQuery, "get_query", checked_get_query)
@@ -0,0 +1,200 @@
+import asyncio
+import sqlite3
+import threading
+
+import pytest
+
+from sqlinpython import (
+    ColumnDef,
+    Create,
+    FunctionName,
+    Insert,
+    Select,
+    TableName,
+    TableRef,
+    TypeName,
+    With,
+    aio,
+    col,
+    literal,
+)
+from sqlinpython.aio import AsyncConnection
+
+ROWS = 1_000
+
+
+async def _open() -> AsyncConnection:
+    db = await aio.connect(":memory:")
+    await Create.Table("t")(
+        ColumnDef("a")(TypeName("INTEGER")), ColumnDef("b")(TypeName("TEXT"))
+    ).execute(db)
+    await db.executemany(
+        Insert.Into("t")("a", "b").ValuesTemplate,
+        [(i, f"row {i}") for i in range(ROWS)],
+    )
+    return db
+
+
+def test_execute() -> None:
+    async def main() -> None:
+        async with await _open() as db:
+            result = (
+                await Insert.Into("t")("a", "b")
+                .Values((literal(ROWS), literal("last")))
+                .execute(db)
+            )
+            assert result.rowcount == 1
+            assert result.lastrowid == ROWS + 1
+            query = Select(col("b")).From(TableRef("t")).Where(col("a") < literal(3))
+            assert list(await query.execute(db)) == [("row 0",), ("row 1",), ("row 2",)]
+            assert await db.fetchone(query) == ("row 0",)
+            assert len(await db.fetchall(query)) == 3
+
+    asyncio.run(main())
+
+
+def test_stream() -> None:
+    async def main() -> None:
+        async with await _open() as db:
+            query = Select(col("a")).From(TableRef("t")).OrderBy(col("a"))
+            rows = [a async for (a,) in query.stream(db)]
+            assert rows == list(range(ROWS))
+            batched = [a async for (a,) in db.stream(query, batch_size=7)]
+            assert batched == rows
+
+    asyncio.run(main())
+
+
+def test_stream_reads_one_batch_ahead() -> None:
+    async def main() -> None:
+        async with await _open() as db:
+            calls = 0
+
+            def tick(value: int) -> int:
+                nonlocal calls
+                calls += 1
+                return value
+
+            await db._submit(
+                lambda: db._executor.connection.create_function("tick", 1, tick)
+            )
+            query = Select(FunctionName("tick")(col("a"))).From(TableRef("t"))
+            stream = db.stream(query, batch_size=10)
+            for _ in range(5):
+                await anext(stream)
+            await asyncio.sleep(0.05)
+            # The current batch and the one prefetched behind it.
+            assert calls <= 21
+            await stream.aclose()
+            assert await db.fetchone(Select(literal(1))) == (1,)
+
+    asyncio.run(main())
+
+
+def test_cancel_interrupts_running_statement() -> None:
+    counter = TableName("c")("x").As(
+        Select(literal(1)).UnionAll(Select(col("x") + literal(1)).From(TableRef("c")))
+    )
+    endless = (
+        With.Recursive(counter)
+        .Select(FunctionName("max")(col("x")))
+        .From(TableRef("c"))
+    )
+
+    async def main() -> None:
+        async with await aio.connect(":memory:") as db:
+            task = asyncio.create_task(endless.execute(db))
+            await asyncio.sleep(0.1)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            assert await db.fetchone(Select(literal(1))) == (1,)
+
+    asyncio.run(main())
+
+
+def test_pending_calls_are_bounded() -> None:
+    async def main() -> None:
+        async with await aio.connect(":memory:", max_pending=2) as db:
+            release = threading.Event()
+            blocker = asyncio.ensure_future(db._submit(release.wait))
+            queries = [
+                asyncio.ensure_future(db.fetchone(Select(literal(i)))) for i in range(5)
+            ]
+            await asyncio.sleep(0.05)
+            # The blocking call runs, one more waits in the queue.
+            assert db._jobs.qsize() == 1
+            release.set()
+            await blocker
+            assert await asyncio.gather(*queries) == [(i,) for i in range(5)]
+
+    asyncio.run(main())
+
+
+def test_cancel_queued_call() -> None:
+    async def main() -> None:
+        async with await aio.connect(":memory:") as db:
+            release = threading.Event()
+            blocker = asyncio.ensure_future(db._submit(release.wait))
+            queued = asyncio.ensure_future(db.fetchone(Select(literal(1))))
+            await asyncio.sleep(0.01)
+            queued.cancel()
+            release.set()
+            await blocker
+            assert queued.cancelled()
+            assert await db.fetchone(Select(literal(2))) == (2,)
+
+    asyncio.run(main())
+
+
+def test_closed_connection() -> None:
+    async def main() -> None:
+        db = await aio.connect(":memory:")
+        await db.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            await db.fetchone(Select(literal(1)))
+
+        with pytest.raises(sqlite3.OperationalError):
+            await aio.connect("/nonexistent/directory/db.sqlite")
+
+    asyncio.run(main())
+
+
+def test_transaction() -> None:
+    count = Select(FunctionName("count")(col("a"))).From(TableRef("t"))
+
+    async def main() -> None:
+        async with await _open() as db:
+            await db.execute(Select(literal(1)))
+            async with db.transaction():
+                await Insert.Into("t")("a").Values((literal(-1),)).execute(db)
+                with pytest.raises(RuntimeError):
+                    async with db.transaction():
+                        await Insert.Into("t")("a").Values((literal(-2),)).execute(db)
+                        raise RuntimeError
+            assert await db.fetchone(count) == (ROWS + 1,)
+
+    asyncio.run(main())
+
+
+def test_batch() -> None:
+    count = Select(FunctionName("count")(col("a"))).From(TableRef("t"))
+
+    async def main() -> None:
+        async with await _open() as db:
+            async with db.batch(max_rows=100) as batch:
+                for i in range(250):
+                    await batch.execute(
+                        Insert.Into("t")("a").Values((literal(ROWS + i),))
+                    )
+                await batch.executemany(
+                    Insert.Into("t")("a").ValuesTemplate, [(-i,) for i in range(10)]
+                )
+            assert await db.fetchone(count) == (ROWS + 260,)
+            with pytest.raises(RuntimeError):
+                async with db.batch() as batch:
+                    await batch.execute(Insert.Into("t")("a").Values((literal(-1),)))
+                    raise RuntimeError
+            assert await db.fetchone(count) == (ROWS + 260,)
+
+    asyncio.run(main())
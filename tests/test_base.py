@@ -0,0 +1,238 @@
+import importlib
+import pkgutil
+import sqlite3
+
+import pytest
+
+import sqlinpython
+from sqlinpython import (
+    ColumnDef,
+    Create,
+    FunctionName,
+    Insert,
+    Select,
+    Star,
+    TableRef,
+    Update,
+    col,
+    literal,
+)
+from sqlinpython.base import SqlElement
+from sqlinpython.expression import BindParameter, Expression, NumericLiteral
+
+
+def test_get_query_is_cached() -> None:
+    query = Select(col("a")).From(TableRef("t")).Where(col("a") > literal(1))
+    first = query.get_query()
+    assert first == "SELECT a FROM t WHERE a > 1"
+    assert query.get_query() is first
+
+
+def test_nodes_are_immutable() -> None:
+    query = Select(col("a")).From(TableRef("t"))
+    with pytest.raises(AttributeError, match="immutable"):
+        query._prev = Select(col("b"))
+    with pytest.raises(AttributeError, match="immutable"):
+        del query._prev
+
+
+def test_nodes_have_no_instance_dict() -> None:
+    for module_info in pkgutil.walk_packages(sqlinpython.__path__, "sqlinpython."):
+        importlib.import_module(module_info.name)
+    pending = [SqlElement]
+    while pending:
+        cls = pending.pop()
+        assert "__slots__" in vars(cls), cls
+        assert cls.__dictoffset__ == 0, cls
+        pending.extend(cls.__subclasses__())
+
+
+def test_cached_query_cannot_be_overwritten() -> None:
+    query = Insert.Into("t")("a").Values((literal(1),))
+    query.get_query()
+    with pytest.raises(AttributeError, match="immutable"):
+        query._query = "DELETE FROM t"
+    assert query.get_query() == "INSERT INTO t (a) VALUES (1)"
+
+
+def test_shared_prefix_is_rendered_once() -> None:
+    base = Select(col("a")).From(TableRef("t"))
+    first = base.Where(col("a").eq(literal(1)))
+    second = base.Where(col("a").eq(literal(2))).Limit(literal(5))
+    assert first.get_query() == "SELECT a FROM t WHERE a = 1"
+    assert base._query == "SELECT a FROM t"
+    assert second.get_query() == "SELECT a FROM t WHERE a = 2 LIMIT 5"
+    assert base.get_query() is base._query
+
+
+def test_compound_operands_are_not_cached() -> None:
+    base = Select(col("a")).From(TableRef("t"))
+    arm = base.Where(col("a").eq(literal(1)))
+    compounds = [arm.UnionAll(arm)]
+    for _ in range(100):
+        compounds.append(compounds[-1].UnionAll(arm))
+    query = compounds[-1].OrderBy(col("a"))
+    assert (
+        query.get_query()
+        == " UNION ALL ".join(["SELECT a FROM t WHERE a = 1"] * 102) + " ORDER BY a"
+    )
+    # Each prefix of the chain would hold its whole text.
+    assert not any(hasattr(compound, "_query") for compound in compounds)
+    assert not hasattr(arm, "_query")
+    assert base._query == "SELECT a FROM t"
+
+
+def test_get_query_and_params_qmark() -> None:
+    query = (
+        Select(col("a"))
+        .From(TableRef("t"))
+        .Where(col("a").eq(literal(1)).And(col("b").eq(literal("x'y"))))
+        .Limit(10)
+        .Offset(20)
+    )
+    assert query.get_query_and_params() == (
+        "SELECT a FROM t WHERE a = ? AND b = ? LIMIT ? OFFSET ?",
+        (1, "x'y", 10, 20),
+    )
+    assert query.get_query() == (
+        "SELECT a FROM t WHERE a = 1 AND b = 'x''y' LIMIT 10 OFFSET 20"
+    )
+
+
+def test_get_query_and_params_named() -> None:
+    query = Update("t").Set(a=literal(b"\x01"), b=literal(1.5)).Where(col("c") > 3)
+    assert query.get_query_and_params("named") == (
+        "UPDATE t SET a = :p1, b = :p2 WHERE c > :p3",
+        {"p1": b"\x01", "p2": 1.5, "p3": 3},
+    )
+
+
+def test_get_query_and_params_keeps_keywords_inline() -> None:
+    query = Select(
+        literal(None), literal(True), NumericLiteral("1e3"), literal(2)
+    ).From(TableRef("t"))
+    assert query.get_query_and_params() == (
+        "SELECT NULL, TRUE, 1e3, ? FROM t",
+        (2,),
+    )
+
+
+def test_get_query_and_params_shared_text() -> None:
+    base = Select(col("a")).From(TableRef("t"))
+    first = base.Where(col("a").eq(literal(1)))
+    second = base.Where(col("a").eq(literal(2)))
+    first.get_query()  # Populates the inline prefix cache.
+    assert first.get_query_and_params() == ("SELECT a FROM t WHERE a = ?", (1,))
+    assert second.get_query_and_params() == ("SELECT a FROM t WHERE a = ?", (2,))
+
+
+def test_get_query_and_params_ddl_is_inline() -> None:
+    query = Create.Table("t")(ColumnDef("a").Check(col("a") > literal(1)))
+    assert query.get_query_and_params() == (
+        "CREATE TABLE t (a CHECK (a > 1))",
+        (),
+    )
+
+
+def test_get_query_and_params_explicit_parameters() -> None:
+    query = (
+        Select(col("a"))
+        .From(TableRef("t"))
+        .Where(col("a").eq(BindParameter("a")).And(col("b").eq(literal(1))))
+    )
+    assert query.get_query_and_params("named") == (
+        "SELECT a FROM t WHERE a = :a AND b = :p1",
+        {"p1": 1},
+    )
+    with pytest.raises(ValueError, match="qmark"):
+        query.get_query_and_params()
+    clash = (
+        Select(col("a"))
+        .From(TableRef("t"))
+        .Where(col("a").eq(BindParameter("p1")).And(col("b").eq(literal(1))))
+    )
+    with pytest.raises(ValueError, match="conflicts"):
+        clash.get_query_and_params("named")
+
+
+def test_get_query_and_params_executes() -> None:
+    db = sqlite3.connect(":memory:")
+    db.execute("CREATE TABLE t (a, b)")
+    db.executemany("INSERT INTO t VALUES (?, ?)", [(i, str(i)) for i in range(10)])
+    insert = Insert.Into("t")("a", "b").Values((literal(10), literal("10")))
+    db.execute(*insert.get_query_and_params())
+    query = (
+        Select(col("a"))
+        .From(TableRef("t"))
+        .Where(col("b").In(literal("3"), literal("10")))
+        .OrderBy(col("a"))
+        .Limit(5)
+    )
+    assert db.execute(*query.get_query_and_params()).fetchall() == [(3,), (10,)]
+    assert db.execute(*query.get_query_and_params("named")).fetchall() == [
+        (3,),
+        (10,),
+    ]
+
+
+def test_get_query_and_params_keeps_column_numbers() -> None:
+    db = sqlite3.connect(":memory:")
+    db.execute("CREATE TABLE t (a, b)")
+    db.executemany("INSERT INTO t VALUES (?, ?)", [(1, 3), (1, 2), (2, 1), (3, 1)])
+    t = TableRef("t")
+    queries = [
+        Select(col("a"), col("b")).From(t).OrderBy(literal(2), literal(1)),
+        Select(col("a"), col("b"))
+        .From(t)
+        .Union(Select(col("b"), col("a")).From(t))
+        .OrderBy(literal(2).Desc, literal(1)),
+        Select(col("b"), FunctionName("count")(Star))
+        .From(t)
+        .Where(col("a") > literal(0))
+        .GroupBy(literal(1))
+        .OrderBy(literal(1).Collate("binary")),
+    ]
+    for query in queries:
+        sql, params = query.get_query_and_params()
+        assert "BY ?" not in sql
+        assert (
+            db.execute(sql, params).fetchall()
+            == db.execute(query.get_query()).fetchall()
+        )
+    # Other integers in the terms are still parameters.
+    sql, params = (
+        Select(col("a")).From(t).OrderBy(col("a") + literal(2)).get_query_and_params()
+    )
+    assert (sql, params) == ("SELECT a FROM t ORDER BY a + ?", (2,))
+
+
+def test_structural_equality() -> None:
+    def build(value: int) -> SqlElement:
+        return Select(col("a")).From(TableRef("t")).Where(col("a").eq(literal(value)))
+
+    assert build(1) == build(1)
+    assert hash(build(1)) == hash(build(1))
+    assert build(1) != build(2)
+    assert {build(1): "one"}[build(1)] == "one"
+    assert len({build(1), build(1), build(2)}) == 2
+
+
+def test_structural_equality_distinguishes_types() -> None:
+    assert literal(1) != literal(1.0)
+    assert literal(1) != literal(True)
+    assert col("a") != TableRef("a")
+    assert literal(1) != 1
+    assert literal(0.0) != literal(-0.0)
+    assert literal(-0.0) == literal(-0.0)
+
+
+def test_structural_equality_deep_tree() -> None:
+    def build() -> Expression:
+        expr: Expression = col("id").eq(literal(0))
+        for i in range(1, 20_000):
+            expr = expr.Or(col("id").eq(literal(i)))
+        return expr
+
+    first, second = build(), build()
+    assert hash(first) == hash(second)
+    assert first == second
@@ -1,6 +1,7 @@
 from sqlinpython import Select, TableName, TableRef, With
 from sqlinpython.common_table_expression import (
     CommonTableExpression,
+    CteTableNameWithColumns,
     WithClause,
 )
 
@@ -107,3 +108,8 @@ def test_with_recursive_multiple_ctes() -> None:
         to_str(With.Recursive(cte1, cte2))
         == f"WITH RECURSIVE t1 AS ({_expected}), t2 AS MATERIALIZED ({_expected})"
     )
+
+
+def test_table_name_is_cte_table_name() -> None:
+    assert isinstance(TableName("t1"), CteTableNameWithColumns)
+    assert isinstance(TableName("t1")("a"), CteTableNameWithColumns)
@@ -0,0 +1,278 @@
+import sqlite3
+from collections.abc import Iterator
+
+import pytest
+
+from sqlinpython import (
+    ColumnDef,
+    Create,
+    FunctionName,
+    Insert,
+    Select,
+    TableRef,
+    TypeName,
+    col,
+    execution,
+    literal,
+)
+from sqlinpython.base import CompleteSqlQuery
+from sqlinpython.execution import Executor, connect, recommended_cached_statements
+from sqlinpython.expression import BindParameter
+from sqlinpython.parser import parse
+
+
+@pytest.fixture
+def db() -> Iterator[Executor]:
+    db = Executor(sqlite3.connect(":memory:"))
+    db.execute(
+        Create.Table("t")(
+            ColumnDef("a")(TypeName("INTEGER")), ColumnDef("b")(TypeName("TEXT"))
+        )
+    )
+    db.executemany(
+        Insert.Into("t")("a", "b").ValuesTemplate,
+        [(i, f"row {i}") for i in range(10)],
+    )
+    yield db
+    db.close()
+
+
+def test_execute_select(db: Executor) -> None:
+    query = Select(col("b")).From(TableRef("t")).Where(col("a").eq(literal(3)))
+    assert db.fetchone(query) == ("row 3",)
+    assert db.fetchall(query) == [("row 3",)]
+
+
+def test_fetchmany_and_iteration(db: Executor) -> None:
+    query = Select(col("a")).From(TableRef("t")).OrderBy(col("a"))
+    assert db.fetchmany(query, 3) == [(0,), (1,), (2,)]
+    assert [row for (row,) in db.execute(query)] == list(range(10))
+
+
+def test_compile_is_cached_per_statement(db: Executor) -> None:
+    query = Select(col("b")).From(TableRef("t")).Where(col("a") > literal(7))
+    sql, params = db.compile(query)
+    assert sql == "SELECT b FROM t WHERE a > ?"
+    assert params == (7,)
+    assert db.compile(query) is db.compile(query)
+    # Structurally equal statements share the entry.
+    same = Select(col("b")).From(TableRef("t")).Where(col("a") > literal(7))
+    assert db.compile(same) is db.compile(query)
+    # The cache holds SQL text, not the statements.
+    assert ("SELECT b FROM t WHERE a > 7", False) in db._compiled
+    assert all(isinstance(sql, str) for sql, _ in db._compiled)
+
+
+def test_compile_cache_is_bounded() -> None:
+    db = Executor(sqlite3.connect(":memory:"), cache_size=2)
+    first = Select(literal(1))
+    entry = db.compile(first)
+    db.compile(Select(literal(2)))
+    db.compile(Select(literal(3)))
+    assert db.compile(first) is not entry
+    assert db.compile(first) == entry
+
+
+def test_literals_share_one_statement(db: Executor) -> None:
+    for i in range(10):
+        query = Select(col("b")).From(TableRef("t")).Where(col("a").eq(literal(i)))
+        assert db.fetchone(query) == (f"row {i}",)
+    # Both DDL statements, the insert template and the parameterized select.
+    assert db.distinct_statements == 3
+
+
+def test_column_numbers_keep_their_meaning(db: Executor) -> None:
+    t = TableRef("t")
+    by_text = Select(col("a"), col("b")).From(t).OrderBy(literal(2).Desc).Limit(2)
+    assert db.fetchall(by_text) == [(9, "row 9"), (8, "row 8")]
+    grouped = Select(col("a") % literal(3), FunctionName("count")(col("b")))
+    grouped = grouped.From(t).GroupBy(literal(1)).OrderBy(literal(1))
+    assert db.fetchall(grouped) == [(0, 4), (1, 3), (2, 3)]
+    for query in (by_text, grouped):
+        assert db.fetchall(query) == db.connection.execute(query.get_query()).fetchall()
+
+
+def test_integers_beyond_64_bits(db: Executor) -> None:
+    values = [2**63, -(2**63) - 1, 2**63 - 1, -(2**63), 10**30]
+    query = Select(*map(literal, values))
+    assert db.compile(query)[1] == (2**63 - 1, -(2**63))
+    assert db.fetchall(query) == db.connection.execute(query.get_query()).fetchall()
+    # Floats of any size are bound.
+    assert db.compile(Select(literal(1e20)))[1] == (1e20,)
+    # Hex literals are 64-bit two's complement integers.
+    hex_values = parse("SELECT 0xFFFFFFFFFFFFFFFF, 0x8000000000000000, 0x7F")
+    assert db.compile(hex_values)[1] == (-1, -(2**63), 0x7F)
+    assert db.fetchall(hex_values) == [(-1, -(2**63), 0x7F)]
+    assert db.fetchall(hex_values) == (
+        db.connection.execute(hex_values.get_query()).fetchall()
+    )
+
+
+def test_execute_without_parameterization() -> None:
+    db = Executor(sqlite3.connect(":memory:"), parameterize=False)
+    query = Select(literal(1) + literal(2))
+    assert db.compile(query) == ("SELECT 1 + 2", ())
+    assert db.fetchone(query) == (3,)
+
+
+def test_named_parameters_merge_with_literals(db: Executor) -> None:
+    query = (
+        Select(col("b"))
+        .From(TableRef("t"))
+        .Where(col("a").eq(BindParameter("a")).And(col("b").ne(literal("x"))))
+    )
+    assert db.fetchall(query, {"a": 4}) == [("row 4",)]
+
+
+def test_positional_parameters_use_inline_literals(db: Executor) -> None:
+    query = (
+        Select(col("b"))
+        .From(TableRef("t"))
+        .Where(col("a").eq(BindParameter()).And(col("b").ne(literal("x"))))
+    )
+    assert db.fetchall(query, (5,)) == [("row 5",)]
+
+
+def test_connect_sizes_statement_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(execution, "_observed_sql", set())
+    assert recommended_cached_statements() == execution.MIN_CACHED_STATEMENTS
+    execution._observed_sql.update(f"SELECT {i}" for i in range(400))
+    assert recommended_cached_statements() == 500
+    execution._observed_sql.update(f"SELECT {i}" for i in range(10_000))
+    assert recommended_cached_statements() == execution.MAX_CACHED_STATEMENTS
+
+    db = connect(":memory:")
+    assert db.fetchone(Select(literal("a"))) == ("a",)
+    db.close()
+
+
+def test_distinct_statements_are_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(execution, "MAX_CACHED_STATEMENTS", 5)
+    monkeypatch.setattr(execution, "_observed_sql", set())
+    db = Executor(sqlite3.connect(":memory:"))
+    for i in range(10):
+        db.fetchone(Select(literal(1).As(f"c{i}")))
+    assert db.distinct_statements == 5
+    assert len(execution._observed_sql) == 5
+
+
+def _count(db: Executor) -> int:
+    count: int = db.fetchone(
+        Select(FunctionName("count")(col("a"))).From(TableRef("t"))
+    )[0]
+    return count
+
+
+def _insert(value: int) -> CompleteSqlQuery:
+    return Insert.Into("t")("a", "b").Values((literal(value), literal("new")))
+
+
+def test_transaction_commits(db: Executor) -> None:
+    db.connection.commit()
+    with db.transaction():
+        assert db.connection.in_transaction
+        db.execute(_insert(100))
+    assert not db.connection.in_transaction
+    assert _count(db) == 11
+
+
+def test_transaction_rolls_back(db: Executor) -> None:
+    db.connection.commit()
+    with pytest.raises(RuntimeError), db.transaction():
+        db.execute(_insert(100))
+        raise RuntimeError
+    assert not db.connection.in_transaction
+    assert _count(db) == 10
+
+
+def test_nested_transactions_use_savepoints(db: Executor) -> None:
+    db.connection.commit()
+    statements: list[str] = []
+    db.connection.set_trace_callback(statements.append)
+    with db.transaction("DEFERRED"):
+        db.execute(_insert(100))
+        with pytest.raises(RuntimeError), db.transaction():
+            db.execute(_insert(101))
+            raise RuntimeError
+        with db.transaction():
+            db.execute(_insert(102))
+    db.connection.set_trace_callback(None)
+    assert _count(db) == 12
+    assert [s for s in statements if not s.startswith("INSERT")] == [
+        "BEGIN DEFERRED",
+        "SAVEPOINT sqlinpython_1",
+        "ROLLBACK TO sqlinpython_1",
+        "RELEASE sqlinpython_1",
+        "SAVEPOINT sqlinpython_1",
+        "RELEASE sqlinpython_1",
+        "COMMIT",
+    ]
+
+
+def test_transaction_inside_implicit_transaction(db: Executor) -> None:
+    # The fixture's inserts left sqlite3's implicit transaction open.
+    assert db.connection.in_transaction
+    with pytest.raises(RuntimeError), db.transaction():
+        db.execute(_insert(100))
+        raise RuntimeError
+    assert db.connection.in_transaction
+    assert _count(db) == 10
+
+
+def test_batch_commits_every_max_rows(db: Executor) -> None:
+    db.connection.commit()
+    statements: list[str] = []
+    db.connection.set_trace_callback(statements.append)
+    insert = Insert.Into("t")("a", "b").ValuesTemplate
+    with db.batch(max_rows=10, max_ms=60_000) as batch:
+        for i in range(25):
+            batch.execute(_insert(100 + i))
+        assert statements.count("COMMIT") == 2
+        batch.executemany(insert, [(i, "many") for i in range(20)])
+        assert statements.count("COMMIT") == 3
+        batch.execute(_insert(200))
+    assert statements.count("COMMIT") == 4
+    db.connection.set_trace_callback(None)
+    assert _count(db) == 10 + 25 + 20 + 1
+
+
+def test_batch_commits_after_max_ms(db: Executor) -> None:
+    db.connection.commit()
+    with db.batch(max_rows=1_000, max_ms=0) as batch:
+        batch.execute(_insert(100))
+        assert not db.connection.in_transaction
+
+
+def test_batch_rolls_back_uncommitted_writes(db: Executor) -> None:
+    db.connection.commit()
+    with pytest.raises(RuntimeError), db.batch(max_rows=2, max_ms=60_000) as batch:
+        for i in range(3):
+            batch.execute(_insert(100 + i))
+        raise RuntimeError
+    assert _count(db) == 12
+
+
+def test_transaction_inside_batch(db: Executor) -> None:
+    db.connection.commit()
+    with db.batch(max_rows=2, max_ms=60_000) as batch:
+        batch.execute(_insert(100))
+        with pytest.raises(RuntimeError), db.transaction():
+            # The limit is reached, but the batch cannot commit in here.
+            for i in range(3):
+                batch.execute(_insert(101 + i))
+            with pytest.raises(sqlite3.ProgrammingError, match="write batch"):
+                batch.flush()
+            raise RuntimeError
+        assert db.connection.in_transaction
+        assert _count(db) == 11
+        batch.execute(_insert(104))
+        assert not db.connection.in_transaction
+    assert _count(db) == 12
+
+
+def test_batch_must_end_inside_its_transaction_block(db: Executor) -> None:
+    db.connection.commit()
+    batch = db.batch(max_rows=100, max_ms=60_000)
+    with pytest.raises(sqlite3.ProgrammingError, match="reverse order"):
+        with db.transaction():
+            batch.execute(_insert(100))
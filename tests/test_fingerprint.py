@@ -0,0 +1,75 @@
+import weakref
+
+from sqlinpython import ColumnDef, Create, Insert, Select, TableRef, col, literal
+from sqlinpython.base import CompleteSqlQuery
+from sqlinpython.expression import BindParameter
+from sqlinpython.fingerprint import _fingerprints, fingerprint, normalize
+
+
+def _lookup(value: int, *ids: int) -> CompleteSqlQuery:
+    return (
+        Select(col("a"), literal("x"))
+        .From(TableRef("t"))
+        .Where(col("b").eq(literal(value)).And(col("id").In(*map(literal, ids))))
+        .OrderBy(col("a").Desc.NullsLast)
+        .Limit(literal(10))
+    )
+
+
+def test_normalize_replaces_values() -> None:
+    assert normalize(_lookup(1, 2, 3)) == (
+        "SELECT a, ? FROM t WHERE b = ? AND id IN (...) ORDER BY a DESC NULLS LAST "
+        "LIMIT ?"
+    )
+    query = Select(col("a")).Where(
+        col("a").Is(literal(None)).Or(col("b").eq(BindParameter("name")))
+    )
+    assert normalize(query) == "SELECT a WHERE a IS ? OR b = ?"
+
+
+def test_same_shape_same_fingerprint() -> None:
+    first = fingerprint(_lookup(1, 2))
+    second = fingerprint(_lookup(5, 6, 7, 8))
+    assert first == second
+    assert len(first.digest) == 16
+    assert first.text == normalize(_lookup(0, 1))
+    assert fingerprint(col("a").Not.In(literal(1))).text == "a NOT IN (...)"
+
+
+def test_different_shape_different_fingerprint() -> None:
+    other = Select(col("a")).From(TableRef("t")).Where(col("b") > literal(1))
+    assert fingerprint(other).digest != fingerprint(_lookup(1)).digest
+
+
+def test_fingerprint_is_stable() -> None:
+    # Stored fingerprints must not change between processes.
+    assert fingerprint(Select(literal(1))).digest == "c148796e1220075a"
+
+
+def test_fingerprint_is_cached() -> None:
+    query = _lookup(1, 2)
+    assert fingerprint(query) is fingerprint(query)
+    assert _fingerprints[query] is fingerprint(query)
+    assert fingerprint(_lookup(1, 2)) == fingerprint(query)
+    # The table does not keep statements alive.
+    statement = weakref.ref(query)
+    del query
+    assert statement() is None
+
+
+def test_fingerprint_keeps_column_numbers() -> None:
+    def ordered(*terms: int) -> CompleteSqlQuery:
+        query = Select(col("a"), col("b")).From(TableRef("t"))
+        return query.GroupBy(literal(1), col("b") + 2).OrderBy(*map(literal, terms))
+
+    assert normalize(ordered(2, 1)) == (
+        "SELECT a, b FROM t GROUP BY 1, b + ? ORDER BY 2, 1"
+    )
+    assert fingerprint(ordered(2)) != fingerprint(ordered(1))
+
+
+def test_fingerprint_statements_without_parts() -> None:
+    insert = Insert.Into("t")("a", "b").Values((literal(1), literal("x")))
+    assert fingerprint(insert).text == "INSERT INTO t (a, b) VALUES (?, ?)"
+    table = Create.Table("t")(ColumnDef("a").Default(literal(1)))
+    assert fingerprint(table).text == "CREATE TABLE t (a DEFAULT ?)"
@@ -0,0 +1,155 @@
+import io
+import sqlite3
+
+import pytest
+
+from sqlinpython import Select, TableRef, col, hooks, interning, literal
+from sqlinpython.base import CompleteSqlQuery, SqlElement, SqlElementMeta
+from sqlinpython.execution import Executor
+from sqlinpython.hooks import Histogram, Hook, MetricsRecorder, hooked
+
+
+class Events(Hook):
+    __slots__ = ("events",)
+
+    def __init__(self) -> None:
+        self.events: list[tuple[object, ...]] = []
+
+    def node_created(self, cls: type[SqlElement]) -> None:
+        self.events.append(("node", cls.__name__))
+
+    def query_rendered(self, statement: CompleteSqlQuery, seconds: float) -> None:
+        self.events.append(("render", type(statement).__name__))
+
+
+class Rows(Hook):
+    __slots__ = ("rows",)
+
+    def __init__(self) -> None:
+        self.rows: list[int] = []
+
+    def rows_fetched(
+        self, statement: CompleteSqlQuery, rows: int, seconds: float
+    ) -> None:
+        assert seconds >= 0
+        self.rows.append(rows)
+
+
+def _uninstrumented() -> bool:
+    return (
+        "__call__" not in vars(SqlElementMeta)
+        and not hooks.observing_renders
+        and not hooks.observing_execution
+    )
+
+
+def test_nothing_installed_without_hooks() -> None:
+    assert _uninstrumented()
+    with hooked(Hook()):
+        # A hook overriding nothing observes nothing.
+        assert _uninstrumented()
+    with hooked(Rows()):
+        assert "__call__" not in vars(SqlElementMeta)
+        assert not hooks.observing_renders
+        assert hooks.observing_execution
+    assert _uninstrumented()
+
+
+def test_node_created_and_query_rendered() -> None:
+    hook = Events()
+    with hooked(hook):
+        query = Select(col("a"))
+        assert query.get_query() == "SELECT a"
+    query.get_query()
+    # The cached text is not rendered again.
+    with hooked(hook):
+        query.get_query()
+    assert hook.events == [
+        ("node", "ColumnName"),
+        ("node", "SelectColumns"),
+        ("render", "SelectColumns"),
+    ]
+    assert _uninstrumented()
+
+
+def test_unregister() -> None:
+    hook = Events()
+    hooks.register(hook)
+    hooks.register(hook)
+    hooks.unregister(hook)
+    col("a")
+    hooks.unregister(hook)
+    col("b")
+    assert hook.events == [("node", "ColumnName")]
+    with pytest.raises(ValueError):
+        hooks.unregister(hook)
+    assert _uninstrumented()
+
+
+def test_composes_with_interning() -> None:
+    hook = Events()
+    with interning.interning():
+        with hooked(hook):
+            assert col("a") is col("a")
+        assert col("b") is col("b")
+        assert "__call__" in vars(SqlElementMeta)
+        with hooked(hook):
+            pass
+    assert hook.events == [("node", "ColumnName")] * 2
+    with hooked(hook), interning.interning():
+        assert col("c") is col("c")
+    assert _uninstrumented()
+
+
+def test_execution_events() -> None:
+    db = Executor(sqlite3.connect(":memory:"))
+    db.connection.executescript("CREATE TABLE t (a); INSERT INTO t VALUES (1), (2)")
+    recorder = MetricsRecorder()
+    rows = Rows()
+    query = Select(col("a")).From(TableRef("t"))
+    with hooked(recorder), hooked(rows):
+        assert db.fetchall(query) == [(1,), (2,)]
+        assert db.fetchone(query) == (1,)
+        assert db.fetchmany(query, 1) == [(1,)]
+        assert list(db.stream(query, batch_size=1)) == [(1,), (2,)]
+        db.execute(Select(literal(1)))
+    assert rows.rows == [2, 1, 1, 2]
+    assert recorder.step_seconds.count == 5
+    assert recorder.prepare_seconds.count == 5
+    assert recorder.rows.count == 4
+    assert recorder.rows.total == 6
+    # Only the last statement was built while the hooks were registered.
+    assert recorder.nodes_created == {"IntLiteral": 1, "SelectColumns": 1}
+    db.close()
+    assert _uninstrumented()
+
+
+def test_histogram() -> None:
+    histogram = Histogram([1, 2, 4])
+    assert histogram.quantile(0.5) == 0.0
+    for value in (0.5, 1, 1.5, 3, 100):
+        histogram.observe(value)
+    assert histogram.counts == [2, 1, 1, 1]
+    assert histogram.count == 5
+    assert histogram.mean == pytest.approx(106 / 5)
+    assert histogram.quantile(0) == 1
+    assert histogram.quantile(0.5) == 2
+    assert histogram.quantile(0.8) == 4
+    assert histogram.quantile(1) == 100
+    with pytest.raises(ValueError):
+        histogram.quantile(2)
+
+
+def test_export_text() -> None:
+    recorder = MetricsRecorder()
+    with hooked(recorder):
+        Select(literal(1)).get_query()
+    text = recorder.export_text()
+    assert 'sqlinpython_nodes_created_total{class="SelectColumns"} 1\n' in text
+    assert "# TYPE sqlinpython_render_seconds histogram\n" in text
+    assert 'sqlinpython_render_seconds_bucket{le="+Inf"} 1\n' in text
+    assert "sqlinpython_render_seconds_count 1\n" in text
+    assert "sqlinpython_step_seconds_count 0\n" in text
+    sink = io.StringIO()
+    recorder.write_text(sink)
+    assert sink.getvalue() == text
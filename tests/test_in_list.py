@@ -0,0 +1,164 @@
+import sqlite3
+from collections.abc import Iterator
+
+import pytest
+
+from sqlinpython import FunctionName, Select, TableRef, col
+from sqlinpython.base import CompleteSqlQuery
+from sqlinpython.execution import Executor
+from sqlinpython.expression import Expression
+from sqlinpython.in_list import (
+    MAX_INLINE_VALUES,
+    TempValues,
+    in_json,
+    in_list,
+    in_values,
+)
+from sqlinpython.render import render_query
+
+ROWS = 1_000
+
+
+@pytest.fixture
+def db() -> Iterator[Executor]:
+    connection = sqlite3.connect(":memory:", isolation_level=None)
+    connection.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT)")
+    connection.executemany(
+        "INSERT INTO t VALUES (?, ?)", [(i, f"row {i}") for i in range(ROWS)]
+    )
+    db = Executor(connection)
+    yield db
+    db.close()
+
+
+def _count(condition: Expression) -> CompleteSqlQuery:
+    return Select(FunctionName("count")("*")).From(TableRef("t")).Where(condition)
+
+
+def test_short_lists_are_inline() -> None:
+    assert (
+        render_query(in_list(col("id"), [1, "a", b"\x00"])) == "id IN (1, 'a', X'00')"
+    )
+    assert render_query(in_list(col("id"), [])) == "id IN ()"
+
+
+def test_long_lists_use_json() -> None:
+    ids = list(range(MAX_INLINE_VALUES + 1))
+    assert in_list(col("id"), ids) == in_json(col("id"), ids)
+    assert render_query(in_json(col("id"), [1, "a"])) == (
+        "id IN (SELECT value FROM json_each('[1,\"a\"]'))"
+    )
+    with pytest.raises(ValueError):
+        in_json(col("id"), [float("nan")])
+
+
+def test_json_statement_is_shared(db: Executor) -> None:
+    for n in (20, 30, 50_000):
+        ids = list(range(-n, n, 2))
+        query = _count(in_list(col("id"), ids))
+        assert db.fetchone(query) == (min(ROWS, n) // 2,)
+    # The three lists share one parameterized statement.
+    sql, params = db.compile(query)
+    assert sql == "SELECT count(*) FROM t WHERE id IN (SELECT value FROM json_each(?))"
+    assert len(params) == 1
+    assert db.distinct_statements == 1
+
+
+def test_temp_values(db: Executor) -> None:
+    with TempValues(db, [5, 1, 5, 7, 10_000]) as values:
+        assert db.fetchone(_count(values.contains(col("id")))) == (3,)
+        names = (
+            Select(col("name")).From(TableRef("t")).Where(values.contains(col("id")))
+        )
+        assert db.fetchall(names.OrderBy(col("id"))) == [
+            ("row 1",),
+            ("row 5",),
+            ("row 7",),
+        ]
+        assert not db.connection.in_transaction
+    # The table is kept, empty, for the next block.
+    tables = "SELECT name FROM sqlite_temp_master"
+    assert db.connection.execute(tables).fetchall() == [("sqlinpython_values_0",)]
+    assert _temp_rows(db, "sqlinpython_values_0") == 0
+
+
+def _temp_rows(db: Executor, table: str) -> int:
+    count: int = db.connection.execute(f"SELECT count(*) FROM temp.{table}").fetchone()[
+        0
+    ]
+    return count
+
+
+def test_temp_values_reuse_statements(db: Executor) -> None:
+    def lookup(values: list[int]) -> None:
+        with TempValues(db, values) as table:
+            assert db.fetchone(_count(table.contains(col("id")))) == (len(values),)
+
+    lookup([1, 2, 3])
+    statements = db.distinct_statements
+    for n in range(1, 10):
+        lookup(list(range(n)))
+    assert db.distinct_statements == statements
+
+
+def test_nested_temp_values(db: Executor) -> None:
+    with TempValues(db, [1, 2]) as outer:
+        with TempValues(db, [2, 3, 4]) as inner:
+            assert inner.name != outer.name
+            both = outer.contains(col("id")).And(inner.contains(col("id")))
+            assert db.fetchone(_count(both)) == (1,)
+        with TempValues(db, [5]) as again:
+            assert again.name == inner.name
+            assert db.fetchone(_count(again.contains(col("id")))) == (1,)
+        assert db.fetchone(_count(outer.contains(col("id")))) == (2,)
+    with TempValues(db, [7]) as table:
+        assert table.name == outer.name
+
+
+def test_temp_values_after_rollback(db: Executor) -> None:
+    # Emptying the table on exit is undone by rolling back the transaction
+    # it ran in; the next block must not see those values.
+    with TempValues(db, [1, 2]) as table:
+        db.connection.execute("BEGIN")
+    db.connection.execute("ROLLBACK")
+    assert _temp_rows(db, "sqlinpython_values_0") == 2
+    with TempValues(db, [3]) as table:
+        assert db.fetchone(_count(table.contains(col("id")))) == (1,)
+
+
+def test_in_values_chooses_by_size(
+    db: Executor, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    with in_values(db, col("id"), [1, 2]) as condition:
+        assert condition == col("id").In(1, 2)
+    with in_values(db, col("id"), list(range(100))) as condition:
+        assert condition == in_json(col("id"), range(100))
+        assert db.fetchone(_count(condition)) == (100,)
+    monkeypatch.setattr("sqlinpython.in_list.MAX_JSON_VALUES", 50)
+    with in_values(db, col("id"), list(range(100))) as condition:
+        assert "temp.sqlinpython_values_" in render_query(condition)
+        assert db.fetchone(_count(condition)) == (100,)
+
+
+def test_bytes_values(db: Executor) -> None:
+    db.connection.execute("CREATE TABLE b (id INTEGER PRIMARY KEY, data BLOB)")
+    db.connection.executemany(
+        "INSERT INTO b VALUES (?, ?)", [(i, bytes([i])) for i in range(100)]
+    )
+    blobs = [bytes([i]) for i in range(0, 200, 2)]
+    query = Select(FunctionName("count")("*")).From(TableRef("b"))
+    # JSON has no blobs: long lists stay inline.
+    condition = in_list(col("data"), blobs)
+    assert condition == col("data").In(*blobs)
+    assert db.fetchone(query.Where(condition)) == (50,)
+    with in_values(db, col("data"), blobs) as condition:
+        assert "temp.sqlinpython_values_" in render_query(condition)
+        assert db.fetchone(query.Where(condition)) == (50,)
+
+
+def test_temp_values_reject_null(db: Executor) -> None:
+    with pytest.raises(ValueError, match="NULL"):
+        with TempValues(db, [1, None, 2]):  # type: ignore[list-item]
+            pass
+    assert _temp_rows(db, "sqlinpython_values_0") == 0
+    assert not db.connection.in_transaction
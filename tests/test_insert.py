@@ -17,6 +17,11 @@
 # - AliasedExpression placeholder for RETURNING clause
 
 
+import sqlite3
+from collections.abc import Iterator
+
+import pytest
+
 from sqlinpython import (
     ColumnName,
     Insert,
@@ -28,6 +33,7 @@ from sqlinpython import (
     With,
     literal,
 )
+from sqlinpython.expression import BindParameter
 
 # =============================================================================
 # Basic INSERT ... VALUES (simplest complete queries first)
@@ -629,3 +635,139 @@ def test_replace_returning() -> None:
         Replace.Into("users")("id").Values((literal(1),)).Returning("*").get_query()
         == "REPLACE INTO users (id) VALUES (1) RETURNING *"
     )
+
+
+# =============================================================================
+# Chunked INSERT ... VALUES
+# =============================================================================
+
+
+def test_values_chunked_by_rows() -> None:
+    rows = ((literal(i), literal(f"n{i}")) for i in range(5))
+    chunks = list(Insert.Into("t")("a", "b").ValuesChunked(rows, max_rows=2))
+    assert [q.get_query() for q in chunks] == [
+        "INSERT INTO t (a, b) VALUES (0, 'n0'), (1, 'n1')",
+        "INSERT INTO t (a, b) VALUES (2, 'n2'), (3, 'n3')",
+        "INSERT INTO t (a, b) VALUES (4, 'n4')",
+    ]
+
+
+def test_values_chunked_by_bytes() -> None:
+    rows = [(literal("x" * 10),) for _ in range(10)]
+    chunks = list(Insert.Into("t")("a").ValuesChunked(rows, max_bytes=60))
+    assert all(len(q.get_query().encode()) <= 60 for q in chunks)
+    assert sum(q.get_query().count("'x") for q in chunks) == 10
+    assert len(chunks) == 5
+
+
+def test_values_chunked_by_binds() -> None:
+    rows = [(literal(i), literal(i), literal(None)) for i in range(10)]
+    chunks = list(Insert.Into("t")("a", "b", "c").ValuesChunked(rows, max_binds=5))
+    # NULL stays inline, so each row has two bind parameters.
+    assert [len(q.get_query_and_params()[1]) for q in chunks] == [4, 4, 4, 4, 4]
+
+
+def test_values_chunked_keeps_tail() -> None:
+    rows = [(literal(i),) for i in range(3)]
+    chunks = list(
+        Insert.Into("t")("a").ValuesChunked(
+            rows,
+            tail=lambda values: values.OnConflict.Do.Nothing.Returning("*"),
+            max_rows=2,
+        )
+    )
+    assert [q.get_query() for q in chunks] == [
+        "INSERT INTO t (a) VALUES (0), (1) ON CONFLICT DO NOTHING RETURNING *",
+        "INSERT INTO t (a) VALUES (2) ON CONFLICT DO NOTHING RETURNING *",
+    ]
+
+
+def test_values_chunked_tail_counts_towards_limits() -> None:
+    rows = [(literal(i),) for i in range(4)]
+    chunks = list(
+        Insert.Into("t")("a").ValuesChunked(
+            rows,
+            tail=lambda values: values.Returning(literal(1), literal(2)),
+            max_binds=4,
+        )
+    )
+    assert [len(q.get_query_and_params()[1]) for q in chunks] == [4, 4]
+
+
+def test_values_chunked_counts_explicit_parameters() -> None:
+    rows = [(BindParameter("a"), literal(1)) for _ in range(3)]
+    chunks = list(Insert.Into("t")("a", "b").ValuesChunked(rows, max_binds=4))
+    assert len(chunks) == 2
+
+
+def test_values_chunked_row_too_large() -> None:
+    rows = [(literal("x" * 100),)]
+    with pytest.raises(ValueError, match="Row 0 does not fit"):
+        list(Insert.Into("t")("a").ValuesChunked(rows, max_bytes=50))
+
+
+def test_values_chunked_max_rows_must_be_positive() -> None:
+    for max_rows in (0, -1):
+        # Raised on the call, before any row is consumed.
+        with pytest.raises(ValueError, match="max_rows"):
+            Insert.Into("t")("a").ValuesChunked([], max_rows=max_rows)
+
+
+def test_values_chunked_empty() -> None:
+    assert list(Insert.Into("t")("a").ValuesChunked([])) == []
+
+
+def test_values_chunked_executes() -> None:
+    db = sqlite3.connect(":memory:")
+    db.execute("CREATE TABLE t (a INTEGER PRIMARY KEY, b)")
+    rows = ((literal(i), literal(f"value {i}")) for i in range(2_500))
+    inserted = 0
+    for query in Insert.Into("t")("a", "b").ValuesChunked(
+        rows, tail=lambda values: values.Returning(ColumnName("a")), max_binds=999
+    ):
+        inserted += len(db.execute(*query.get_query_and_params()).fetchall())
+    assert inserted == 2_500
+    assert db.execute("SELECT count(*), max(a) FROM t").fetchone() == (2_500, 2_499)
+
+
+# =============================================================================
+# executemany templates
+# =============================================================================
+
+
+def test_values_template() -> None:
+    assert (
+        Insert.Into("t")("a", "b", "c").ValuesTemplate.get_query()
+        == "INSERT INTO t (a, b, c) VALUES (?, ?, ?)"
+    )
+
+
+def test_values_template_with_upsert() -> None:
+    assert (
+        Insert.Into("t")("a", "b")
+        .ValuesTemplate.OnConflict(ColumnName("a"))
+        .Do.Nothing.get_query()
+        == "INSERT INTO t (a, b) VALUES (?, ?) ON CONFLICT(a) DO NOTHING"
+    )
+
+
+def test_executemany_streams_rows() -> None:
+    db = sqlite3.connect(":memory:")
+    db.execute("CREATE TABLE t (a INTEGER PRIMARY KEY, b)")
+    consumed = []
+
+    def rows() -> Iterator[tuple[int, str]]:
+        for i in range(10_000):
+            consumed.append(i)
+            yield (i, f"value {i}")
+
+    statement = Insert.Into("t")("a", "b").ValuesTemplate
+    cursor = statement.executemany(db, rows())
+    assert cursor.rowcount == 10_000
+    assert len(consumed) == 10_000
+    assert db.execute("SELECT count(*), max(b) FROM t").fetchone() == (
+        10_000,
+        "value 9999",
+    )
+    statement.OnConflict.Do.Nothing.executemany(db.cursor(), [(1, "x"), (10_000, "y")])
+    assert db.execute("SELECT count(*) FROM t").fetchone() == (10_001,)
@@ -0,0 +1,84 @@
+import pytest
+
+from sqlinpython import Select, TableRef, col, literal
+from sqlinpython.base import SqlElement, SqlElementMeta
+from sqlinpython.interning import (
+    add_construction_listener,
+    interning,
+    remove_construction_listener,
+)
+
+
+def test_interning_reuses_equal_nodes() -> None:
+    with interning():
+        first = col("a").eq(literal(1))
+        second = col("a").eq(literal(1))
+        other = col("a").eq(literal(2))
+    assert first is second
+    assert other is not first
+
+
+def test_interning_keeps_signed_zeros_apart() -> None:
+    with interning():
+        positive = Select(literal(0.0))
+        negative = Select(literal(-0.0))
+    assert negative is not positive
+    assert negative.get_query() == "SELECT -0.0"
+    assert positive.get_query() == "SELECT 0.0"
+
+
+def test_interning_shares_subtrees() -> None:
+    with interning():
+        first = Select(col("a")).From(TableRef("t")).Where(col("a") > literal(1))
+        second = Select(col("b")).From(TableRef("t")).Where(col("a") > literal(1))
+    assert first.get_query() == "SELECT a FROM t WHERE a > 1"
+    assert second.get_query() == "SELECT b FROM t WHERE a > 1"
+    assert first._expr is second._expr
+
+
+def test_interning_is_scoped_to_the_block() -> None:
+    with interning() as table:
+        inside = literal("x")
+        assert table[literal("x")] is inside
+    assert "__call__" not in vars(SqlElementMeta)
+    assert literal("x") is not inside
+    assert literal("x") == inside
+
+
+def test_interning_table_can_be_reused() -> None:
+    table: dict[object, object] = {}
+    with interning(table):  # type: ignore[arg-type]
+        first = col("a") + literal(1)
+    with interning(table):  # type: ignore[arg-type]
+        second = col("a") + literal(1)
+    assert first is second
+
+
+def test_nested_interning_shares_table() -> None:
+    with interning() as outer:
+        first = literal(1)
+        with interning() as inner:
+            second = literal(1)
+        assert inner is outer
+        assert "__call__" in vars(SqlElementMeta)
+    assert first is second
+
+
+def test_construction_listeners() -> None:
+    built: list[str] = []
+
+    def listener(cls: type[SqlElement]) -> None:
+        built.append(cls.__name__)
+
+    add_construction_listener(listener)
+    try:
+        col("a")
+        with interning():
+            assert literal(1) is literal(1)
+    finally:
+        remove_construction_listener(listener)
+    col("b")
+    assert built == ["ColumnName", "IntLiteral", "IntLiteral"]
+    assert "__call__" not in vars(SqlElementMeta)
+    with pytest.raises(ValueError):
+        remove_construction_listener(listener)
@@ -0,0 +1,120 @@
+import sqlite3
+
+import pytest
+
+from sqlinpython import (
+    Check,
+    ColumnDef,
+    Create,
+    Select,
+    TableRef,
+    and_all,
+    col,
+    literal,
+    or_all,
+)
+from sqlinpython.expression import Expression
+from sqlinpython.expression.logical import (
+    MAX_EXPR_DEPTH,
+    MAX_FLAT_TERMS,
+    AndConditions,
+    OrConditions,
+    check_depth,
+    measure,
+)
+from sqlinpython.render import render_query
+
+a, b, c, d = col("a"), col("b"), col("c"), col("d")
+
+
+def test_renders_like_chained_calls() -> None:
+    assert render_query(and_all(a, b, c)) == render_query(a.And(b).And(c))
+    assert render_query(or_all(a, b, c)) == "a OR b OR c"
+    assert render_query(and_all(a.Or(b), c)) == "(a OR b) AND c"
+    assert render_query(or_all(a.And(b), c)) == "a AND b OR c"
+    assert render_query(and_all(or_all(a, b), c).Or(d)) == "(a OR b) AND c OR d"
+    assert render_query(and_all(a, 1)) == "a AND 1"
+
+
+def test_degenerate_lists() -> None:
+    assert and_all() == literal(True)
+    assert or_all() == literal(False)
+    assert and_all(a) is a
+    assert or_all(a) is a
+
+
+def test_nested_conditions_are_flattened() -> None:
+    flat = and_all(a, and_all(b, c), a.And(d))
+    assert isinstance(flat, AndConditions)
+    assert flat == AndConditions((a, b, c, a, d))
+    assert flat == and_all(a, b, c, a, d)
+    assert hash(flat) == hash(and_all(a, b, c, a, d))
+    nested = or_all(and_all(a, b), or_all(c, d))
+    assert isinstance(nested, OrConditions)
+    assert render_query(nested) == "a AND b OR c OR d"
+
+
+def test_long_lists_are_grouped() -> None:
+    terms = [col(f"c{i}") for i in range(MAX_FLAT_TERMS + 1)]
+    query = render_query(and_all(*terms))
+    assert query.startswith("(c0 AND c1) AND (c2 AND c3)")
+    assert query.endswith("(c62 AND c63) AND c64")
+    # 33 groups of two conditions.
+    assert measure(and_all(*terms)).depth == 33 + 1
+
+
+def _chained(n: int) -> Expression:
+    where: Expression = col("a").ne(literal(0))
+    for i in range(1, n):
+        where = where.And(col("a").ne(literal(i)))
+    return where
+
+
+def test_large_filters_execute() -> None:
+    db = sqlite3.connect(":memory:")
+    db.executescript("CREATE TABLE t (a); INSERT INTO t VALUES (-1), (5), (6000)")
+    ands = (
+        Select(col("a"))
+        .From(TableRef("t"))
+        .Where(and_all(*(col("a").ne(literal(i)) for i in range(5_000))))
+    )
+    size = check_depth(ands)
+    assert size.depth < 200
+    assert size.nodes > 15_000
+    assert db.execute(ands.get_query()).fetchall() == [(-1,), (6000,)]
+    ors = (
+        Select(col("a"))
+        .From(TableRef("t"))
+        .Where(or_all(*(col("a").eq(literal(i)) for i in range(10_000))))
+    )
+    assert db.execute(ors.get_query()).fetchall() == [(5,), (6000,)]
+
+    chained = _chained(5_000)
+    query = Select(col("a")).From(TableRef("t")).Where(chained)
+    assert measure(query).depth > MAX_EXPR_DEPTH
+    with pytest.raises(ValueError, match="expression depth 5"):
+        check_depth(query)
+    with pytest.raises(sqlite3.OperationalError, match="too large"):
+        db.execute(render_query(query))
+    # Existing chains can be passed in as they are.
+    rebuilt = Select(col("a")).From(TableRef("t")).Where(and_all(chained))
+    assert rebuilt == ands
+    assert check_depth(rebuilt).depth < 200
+
+
+def test_measure() -> None:
+    assert measure(a) == (1, 1)
+    assert measure(a.And(b)) == (2, 3)
+    assert measure(and_all(a, b, c)) == (3, 4)
+    assert measure(Select(a.Or(b).And(c))).depth == 3
+
+
+def test_measure_check_constraint() -> None:
+    query = Create.Table("t")(ColumnDef("a"), Check(_chained(1_500)))
+    assert measure(query).depth > MAX_EXPR_DEPTH
+    with pytest.raises(ValueError, match="expression depth 1"):
+        check_depth(query)
+    with pytest.raises(sqlite3.OperationalError, match="too large"):
+        sqlite3.connect(":memory:").execute(render_query(query))
+    rebuilt = Create.Table("t")(ColumnDef("a"), Check(and_all(_chained(1_500))))
+    assert check_depth(rebuilt).depth < 200
@@ -0,0 +1,34 @@
+import copy
+import pickle
+
+from sqlinpython import Name, TableName, col
+from sqlinpython.name import _INTERN_LIMIT, _interned, quote_if_necessary
+
+
+def test_quote_if_necessary() -> None:
+    assert quote_if_necessary("user_id") == "user_id"
+    assert quote_if_necessary("user id") == '"user id"'
+    assert quote_if_necessary('a"b') == '"a""b"'
+    assert quote_if_necessary("user_id", force_quote=True) == '"user_id"'
+
+
+def test_names_are_interned() -> None:
+    assert Name("user_id") is Name("user_id")
+    assert col("user_id") is col("user_id")
+    assert Name("user_id") is not Name("user_id", force_quote=True)
+    assert Name("user_id") is not TableName("user_id")
+    assert Name("user_id") == Name("user_id")
+
+
+def test_intern_table_is_bounded() -> None:
+    for i in range(_INTERN_LIMIT + 10):
+        Name(f"name_{i}")
+    assert len(_interned) <= _INTERN_LIMIT
+
+
+def test_names_can_be_copied_and_pickled() -> None:
+    for name in (Name("a"), Name("a b"), Name('a"b'), Name("a", force_quote=True)):
+        assert copy.deepcopy(name) == name
+        restored = pickle.loads(pickle.dumps(name))
+        assert restored == name
+        assert restored._name == name._name
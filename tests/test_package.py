@@ -0,0 +1,88 @@
+import subprocess
+import sys
+
+import pytest
+
+import sqlinpython
+import sqlinpython.builders
+import sqlinpython.keywords
+import sqlinpython.types
+
+# Budgets for `from sqlinpython import Select` in a fresh interpreter. It
+# loads 20 modules; the margin leaves room for small splits.
+SELECT_IMPORT_MAX_MODULES = 25
+SELECT_IMPORT_MAX_MS = 250
+# Modules that building a SELECT must never load.
+SELECT_IMPORT_EXCLUDED = (
+    "sqlinpython.aio",
+    "sqlinpython.create_table",
+    "sqlinpython.execution",
+    "sqlinpython.functions",
+    "sqlinpython.parser",
+    "sqlinpython.pool",
+    "sqlinpython.pushdown",
+    "sqlinpython.sargable",
+)
+
+
+def _import_time(statement: str) -> dict[str, int]:
+    """Import time in microseconds of the sqlinpython modules loaded by statement.
+
+    Maps each module to its cumulative time, except for the "total" key which
+    holds the time of all of them together.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {"total": 0}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        if not name.strip().startswith("sqlinpython"):
+            continue
+        times[name.strip()] = int(cumulative)
+        # Nested imports are indented by two spaces per level.
+        if name == " " + name.strip():
+            times["total"] += int(cumulative)
+    return times
+
+
+def test_lazy_attributes_match_reexports() -> None:
+    reexported = {
+        name: getattr(module, name)
+        for module in (
+            sqlinpython.builders,
+            sqlinpython.keywords,
+            sqlinpython.types,
+        )
+        for name in vars(module)
+        if not name.startswith("_") and name != "sqlinpython"
+    }
+    assert set(sqlinpython._LAZY_ATTRIBUTES) == set(reexported)
+    for name, value in reexported.items():
+        assert getattr(sqlinpython, name) is value
+
+
+def test_unknown_attribute() -> None:
+    with pytest.raises(AttributeError, match="DoesNotExist"):
+        sqlinpython.DoesNotExist  # type: ignore[attr-defined]
+
+
+def test_dir_lists_lazy_attributes() -> None:
+    assert {"Select", "Insert", "col", "SelectStatement"} <= set(dir(sqlinpython))
+
+
+def test_import_package_is_lazy() -> None:
+    times = _import_time("import sqlinpython")
+    assert set(times) == {"total", "sqlinpython"}
+
+
+def test_select_import_budget() -> None:
+    times = _import_time("from sqlinpython import Select")
+    assert not set(SELECT_IMPORT_EXCLUDED) & set(times)
+    assert len(times) - 1 <= SELECT_IMPORT_MAX_MODULES, sorted(times)
+    assert times["total"] / 1000 < SELECT_IMPORT_MAX_MS
@@ -0,0 +1,179 @@
+import time
+from collections.abc import Callable
+
+import pytest
+
+from sqlinpython import (
+    ColumnDef,
+    Create,
+    FunctionName,
+    Insert,
+    Select,
+    TableRef,
+    TypeName,
+    col,
+    literal,
+)
+from sqlinpython.base import CompleteSqlQuery
+from sqlinpython.expression import BindParameter, NumericLiteral
+from sqlinpython.parser import (
+    END_OF_INPUT,
+    ParseError,
+    parse,
+    parse_expression,
+    parse_script,
+    tokenize,
+)
+from tests.existing import check_get_query, parametrize_existing_tests
+
+
+# The nodes parsed by the check would show up in the events of test_hooks.
+@parametrize_existing_tests(__name__, "tests.test_render", "tests.test_hooks")
+def test_parse_round_trips(
+    test_func: Callable[[], None], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Re-run the existing query tests, parsing every rendered statement back.
+    def check(statement: CompleteSqlQuery, query: str) -> None:
+        assert parse(query).get_query() == query
+
+    check_get_query(monkeypatch, check)
+    test_func()
+
+
+def test_parse_builds_equal_statements() -> None:
+    assert parse("SELECT a FROM t WHERE b > 1") == Select(col("a")).From(
+        TableRef("t")
+    ).Where(col("b") > literal(1))
+    assert parse("SELECT count(*) FROM t AS x") == Select(
+        FunctionName("count")("*")
+    ).From(TableRef("t").As("x"))
+    assert parse("INSERT INTO t (a) VALUES (?)") == Insert.Into("t")("a").Values(
+        (BindParameter(),)
+    )
+    assert parse("CREATE TABLE t (a INTEGER NOT NULL)") == Create.Table("t")(
+        ColumnDef("a")(TypeName("INTEGER")).NotNull
+    )
+
+
+def test_parse_normalizes_spelling() -> None:
+    query = parse(
+        """
+        select `a b`, [c]  -- comment
+        from "t" /* block
+        comment */ where x<>1;
+        """
+    )
+    assert query.get_query() == 'SELECT "a b", "c" FROM "t" WHERE x <> 1'
+
+
+def test_parse_precedence() -> None:
+    for sql in (
+        "SELECT (a + b) * c, a + b * c, -(a + b), NOT a = b OR c AND d",
+        "SELECT a BETWEEN 1 + 1 AND 3 AND b NOT LIKE 'x%' ESCAPE '!'",
+        "SELECT a IS NOT DISTINCT FROM b, a ISNULL, a NOT NULL, a -> '$.x' || b",
+        "SELECT a IN (SELECT b FROM u), a NOT IN (), a IN t, a IN main.t",
+        "SELECT (a, b) = (1, 2), (SELECT 1), EXISTS (SELECT 1), ~a COLLATE nocase",
+        "SELECT CASE WHEN a THEN 1 ELSE 2 END, CAST(a AS INTEGER), b IN (c)",
+        # "--" would start a comment.
+        "SELECT - -3, - - -a, -(-3), - -3.5 + 1, +-3, -+3",
+    ):
+        assert parse(sql).get_query() == sql
+
+
+def test_parse_number_literals() -> None:
+    query = parse("SELECT 1, -1, 1.5, -1.5, 0x1F, 1e5, 1_000, -0, .5")
+    assert query.get_query() == "SELECT 1, -1, 1.5, -1.5, 0x1F, 1e5, 1_000, -0, .5"
+    assert query == Select(
+        literal(1),
+        literal(-1),
+        literal(1.5),
+        literal(-1.5),
+        *[parse_expression("0x1F")],
+        NumericLiteral("1e5"),
+        NumericLiteral("1_000"),
+        -literal(0),
+        NumericLiteral(".5"),
+    )
+
+
+def test_parse_script() -> None:
+    statements = list(
+        parse_script(";CREATE TABLE t (a); INSERT INTO t VALUES (1);; SELECT a FROM t")
+    )
+    assert [s.get_query() for s in statements] == [
+        "CREATE TABLE t (a)",
+        "INSERT INTO t VALUES (1)",
+        "SELECT a FROM t",
+    ]
+    with pytest.raises(ParseError, match="expected ;"):
+        list(parse_script("SELECT 1 SELECT 2"))
+
+
+def test_parse_errors() -> None:
+    with pytest.raises(ParseError, match=r"expected an expression.*line 2, column 1"):
+        parse("SELECT\nWHERE")
+    with pytest.raises(ParseError, match="expected end of statement"):
+        parse("SELECT 1; SELECT 2")
+    with pytest.raises(ParseError, match="expected a statement"):
+        parse("EXPLAIN SELECT 1")
+    with pytest.raises(ParseError, match="several words"):
+        parse("CREATE TABLE t (a UNSIGNED BIG INT)")
+    with pytest.raises(ParseError, match="unsupported syntax"):
+        parse("SELECT a FROM t AS x INDEXED BY i")
+    with pytest.raises(ParseError, match="unexpected character '#'"):
+        parse("SELECT #")
+    with pytest.raises(ParseError) as info:
+        parse("SELECT 'abc")
+    assert info.value.pos == 7
+    assert isinstance(info.value, ValueError)
+    deep = "(" * 5000 + "1" + ")" * 5000
+    with pytest.raises(ParseError, match="too deeply nested") as info:
+        parse_expression(deep)
+    assert 0 < info.value.pos < 5000
+    with pytest.raises(ParseError, match="too deeply nested"):
+        parse(f"SELECT {deep}")
+
+
+def test_tokenize() -> None:
+    tokens = list(tokenize("SELECT x'0A', \"a\"\"b\", :p, a->>'$'"))
+    assert [(t.kind, t.key, t.text) for t in tokens] == [
+        ("word", "SELECT", "SELECT"),
+        ("blob", "", "x'0A'"),
+        ("operator", ",", ","),
+        ("quoted", "", '"a""b"'),
+        ("operator", ",", ","),
+        ("parameter", "", ":p"),
+        ("operator", ",", ","),
+        ("word", "A", "a"),
+        ("operator", "->>", "->>"),
+        ("string", "", "'$'"),
+        (END_OF_INPUT, "", ""),
+    ]
+
+
+def test_tokenize_unterminated_comment() -> None:
+    tokens = list(tokenize("SELECT 1 /* never closed"))
+    assert [t.text for t in tokens] == ["SELECT", "1", ""]
+
+
+def test_tokenize_is_linear() -> None:
+    # Inputs that make backtracking patterns quadratic.
+    n = 200_000
+    for sql in ("'" + "''" * n + "'", "/*" + "*" * n, "1" + "_1" * n + "x"):
+        start = time.perf_counter()
+        assert len(list(tokenize(sql))) <= 3
+        assert time.perf_counter() - start < 5
+    with pytest.raises(ParseError, match="unterminated"):
+        list(tokenize("'" + "''" * n))
+
+
+def test_parse_large_script() -> None:
+    statement = "INSERT INTO t (a, b) VALUES (1, 'some text'), (2, 'more text');\n"
+    script = statement * 40_000
+    assert len(script) > 2_000_000
+    assert sum(1 for _ in tokenize(script)) == 40_000 * 21 + 1
+    count = 0
+    for query in parse_script(statement * 4_000):
+        count += 1
+    assert count == 4_000
+    assert query.get_query() == statement.rstrip(";\n")
@@ -0,0 +1,155 @@
+import sqlite3
+from collections.abc import Iterator
+
+import pytest
+
+from sqlinpython import (
+    ColumnDef,
+    ColumnName,
+    Create,
+    Select,
+    Star,
+    Subquery,
+    TableRef,
+    TypeName,
+    col,
+    literal,
+)
+from sqlinpython.base import CompleteSqlQuery
+from sqlinpython.expression import BindParameter
+from sqlinpython.plan import (
+    AUTOMATIC_INDEX,
+    FULL_SCAN,
+    TEMP_B_TREE,
+    analyze_plan,
+    assert_no_scan,
+    schema_connection,
+)
+
+SCHEMA: list[CompleteSqlQuery] = [
+    Create.Table("users")(
+        ColumnDef("id")(TypeName("INTEGER")).PrimaryKey, ColumnDef("name")
+    ),
+    Create.Table("orders")(
+        ColumnDef("id")(TypeName("INTEGER")).PrimaryKey,
+        ColumnDef("user_id")(TypeName("INTEGER")),
+        ColumnDef("total"),
+    ),
+    Create.Index("orders_user").On("orders", ColumnName("user_id")),
+]
+
+
+@pytest.fixture
+def db() -> Iterator[sqlite3.Connection]:
+    connection = schema_connection(SCHEMA)
+    yield connection
+    connection.close()
+
+
+def test_full_scan_and_sort(db: sqlite3.Connection) -> None:
+    orders = TableRef("orders")
+    query = Select(col("id")).From(orders).Where(col("total") > literal(10))
+    plan = analyze_plan(query.OrderBy(col("total")), db)
+    assert [(f.kind, f.detail, f.table) for f in plan.findings] == [
+        (FULL_SCAN, "SCAN orders", "orders"),
+        (TEMP_B_TREE, "USE TEMP B-TREE FOR ORDER BY", None),
+    ]
+    assert plan.findings[0].node is orders
+    assert plan.findings[1].node is orders
+    assert plan.text() == "SCAN orders\nUSE TEMP B-TREE FOR ORDER BY"
+
+
+def test_indexed_lookup_has_no_findings(db: sqlite3.Connection) -> None:
+    query = (
+        Select(col("total"))
+        .From(TableRef("orders"))
+        .Where(col("user_id").eq(BindParameter()))
+    )
+    plan = analyze_plan(query, db, (1,))
+    assert plan.findings == ()
+    assert [step.detail for step in plan.steps] == [
+        "SEARCH orders USING INDEX orders_user (user_id=?)"
+    ]
+    # A scan of a covering index is not a full table scan.
+    assert (
+        analyze_plan(Select(col("user_id")).From(TableRef("orders")), db).findings == ()
+    )
+
+
+def test_findings_map_to_join(db: sqlite3.Connection) -> None:
+    orders = TableRef("orders").As("o")
+    join = (
+        TableRef("users")
+        .As("u")
+        .Join(orders)
+        .On(col("o", "user_id").eq(col("u", "id")))
+    )
+    plan = analyze_plan(
+        Select(col("u", "name")).From(join).OrderBy(col("o", "total")), db
+    )
+    assert [(f.kind, f.table, f.node) for f in plan.findings] == [
+        # Users are looked up by primary key for each order.
+        (FULL_SCAN, "orders", orders),
+        (TEMP_B_TREE, None, join),
+    ]
+    assert plan.findings[1].node is join
+
+
+def test_automatic_index_and_subqueries(db: sqlite3.Connection) -> None:
+    totals = Subquery(
+        Select(col("user_id"), col("total"))
+        .From(TableRef("orders"))
+        .GroupBy(col("total"))
+    ).As("s")
+    users = TableRef("users")
+    query = Select(col("name")).From(
+        users.Join(totals).On(col("s", "total").eq(col("users", "name")))
+    )
+    findings = analyze_plan(query, db).findings
+    by_kind = {(f.kind, f.table): f.node for f in findings}
+    assert by_kind[FULL_SCAN, "users"] is users
+    assert by_kind[AUTOMATIC_INDEX, "s"] is totals
+    # The GROUP BY sorts the rows of the subquery's own FROM clause.
+    assert by_kind[TEMP_B_TREE, None] == TableRef("orders")
+    steps = analyze_plan(query, db).steps
+    assert steps[0].detail.startswith("MATERIALIZE")
+    assert [child.detail for child in steps[0].children][0] == "SCAN orders"
+
+
+def test_schema_qualified_tables(db: sqlite3.Connection) -> None:
+    orders = TableRef("main", "orders")
+    users = TableRef("main", "users").As("u")
+    query = Select(col("total")).From(
+        orders.Join(users).On(col("u", "id").eq(col("orders", "user_id")))
+    )
+    findings = analyze_plan(query.Where(col("total") > literal(1)), db).findings
+    # Depending on the SQLite version the step is "SCAN main.orders" or
+    # "SCAN orders"; the table is named without its schema either way.
+    assert [(f.kind, f.table) for f in findings] == [(FULL_SCAN, "orders")]
+    assert findings[0].node is orders
+    with pytest.raises(AssertionError, match="orders"):
+        assert_no_scan(Select(Star).From(orders), SCHEMA, "orders")
+
+
+def test_statements_without_table_sources(db: sqlite3.Connection) -> None:
+    assert analyze_plan(Select(literal(1)), db).findings == ()
+
+
+def test_assert_no_scan() -> None:
+    lookup = (
+        Select(col("total"))
+        .From(TableRef("orders"))
+        .Where(col("user_id").eq(literal(1)))
+    )
+    assert_no_scan(lookup, SCHEMA)
+    by_total = (
+        Select(col("id")).From(TableRef("orders")).Where(col("total").eq(literal(1)))
+    )
+    with pytest.raises(AssertionError, match="SCAN orders in the plan of SELECT"):
+        assert_no_scan(by_total, SCHEMA)
+    with pytest.raises(AssertionError):
+        assert_no_scan(by_total, SCHEMA, "ORDERS")
+    assert_no_scan(by_total, SCHEMA, "users")
+    # Without the index, looking orders up by user scans the table.
+    with pytest.raises(AssertionError):
+        assert_no_scan(lookup, SCHEMA[:2], "orders")
@@ -0,0 +1,141 @@
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+from sqlinpython import (
+    ColumnDef,
+    Create,
+    Insert,
+    Pragma,
+    Select,
+    TableRef,
+    TypeName,
+    col,
+    literal,
+)
+from sqlinpython.pool import ConnectionPool
+
+
+@pytest.fixture
+def pool(tmp_path: Path) -> ConnectionPool:
+    pool = ConnectionPool(str(tmp_path / "db.sqlite"), readers=2)
+    with pool.writer() as db:
+        db.execute(Create.Table("t")(ColumnDef("a")(TypeName("INTEGER"))))
+        db.executemany(Insert.Into("t")("a").ValuesTemplate, [(i,) for i in range(10)])
+    return pool
+
+
+def test_profile_is_applied(pool: ConnectionPool) -> None:
+    with pool.reader() as db:
+        assert db.fetchone(Pragma("journal_mode")) == ("wal",)
+        assert db.fetchone(Pragma("busy_timeout")) == (5_000,)
+        assert db.fetchone(Pragma("cache_size")) == (-64 * 1024,)
+        assert db.fetchone(Pragma("query_only")) == (1,)
+        with pytest.raises(sqlite3.OperationalError, match="readonly"):
+            db.execute(Insert.Into("t")("a").Values((literal(1),)))
+    with pool.writer() as db:
+        assert db.fetchone(Pragma("query_only")) == (0,)
+    pool.close()
+
+
+def test_readers_see_committed_writes(pool: ConnectionPool) -> None:
+    query = Select(col("a")).From(TableRef("t")).Where(col("a") > literal(7))
+    with pool.reader() as db:
+        assert db.fetchall(query) == [(8,), (9,)]
+    with pool.writer() as db:
+        db.execute(Insert.Into("t")("a").Values((literal(10),)))
+    with pool.reader() as db:
+        assert db.fetchall(query) == [(8,), (9,), (10,)]
+    # The insert of a block that raises is rolled back.
+    with pytest.raises(ZeroDivisionError), pool.writer() as db:
+        db.execute(Insert.Into("t")("a").Values((literal(11),)))
+        1 / 0
+    with pool.reader() as db:
+        assert db.fetchall(query) == [(8,), (9,), (10,)]
+    pool.close()
+
+
+def test_connections_are_reused(pool: ConnectionPool) -> None:
+    for _ in range(5):
+        with pool.reader() as db:
+            db.fetchone(Select(literal(1)))
+    metrics = pool.metrics
+    assert metrics.reader_checkouts == 5
+    assert metrics.writer_checkouts == 1
+    assert metrics.checkouts == 6
+    assert metrics.opened == 2
+    pool.close()
+
+
+def test_concurrent_readers_are_bounded(pool: ConnectionPool) -> None:
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def work() -> None:
+        nonlocal active, peak
+        for _ in range(20):
+            with pool.reader() as db:
+                with lock:
+                    active += 1
+                    peak = max(peak, active)
+                db.fetchall(Select(col("a")).From(TableRef("t")))
+                with lock:
+                    active -= 1
+
+    threads = [threading.Thread(target=work) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert peak <= 2
+    metrics = pool.metrics
+    assert metrics.reader_checkouts == 120
+    assert metrics.opened <= 3
+    assert metrics.max_wait_seconds >= 0
+    pool.close()
+
+
+def test_checkout_timeout(pool: ConnectionPool) -> None:
+    with pool.reader(), pool.reader():
+        with pytest.raises(TimeoutError):
+            with pool.reader(timeout=0.05):
+                pass
+    assert pool.metrics.wait_seconds >= 0
+    pool.close()
+
+
+def test_max_age_recycles_connections(tmp_path: Path) -> None:
+    pool = ConnectionPool(str(tmp_path / "db.sqlite"), max_age=0)
+    for _ in range(3):
+        with pool.reader() as db:
+            assert db.fetchone(Select(literal(1))) == (1,)
+    metrics = pool.metrics
+    assert metrics.opened == 3
+    assert metrics.recycled == 3
+    pool.close()
+
+
+def test_health_check_replaces_broken_connection(pool: ConnectionPool) -> None:
+    with pool.reader() as broken:
+        pass
+    broken.connection.close()
+    with pool.reader() as db:
+        assert db is not broken
+        assert db.fetchone(Select(literal(1))) == (1,)
+    assert pool.metrics.failed_health_checks == 1
+    pool.close()
+
+
+def test_closed_pool(pool: ConnectionPool) -> None:
+    pool.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        with pool.reader():
+            pass
+
+
+def test_readers_must_be_positive(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="readers"):
+        ConnectionPool(str(tmp_path / "db.sqlite"), readers=0)
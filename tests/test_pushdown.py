@@ -0,0 +1,423 @@
+import sqlite3
+from collections.abc import Callable, Iterator
+from random import Random
+from typing import Any
+
+import pytest
+
+from sqlinpython import (
+    ColumnDef,
+    ColumnName,
+    Create,
+    FunctionName,
+    PartitionBy,
+    Select,
+    TableRef,
+    TypeName,
+    col,
+)
+from sqlinpython.base import CompleteSqlQuery
+from sqlinpython.expression import Cast, Expression, Star
+from sqlinpython.expression.literal import SqlLiteral
+from sqlinpython.plan import FULL_SCAN, analyze_plan, schema_connection
+from sqlinpython.pushdown import (
+    PUSHED_INTO_HAVING,
+    PUSHED_INTO_WHERE,
+    Pushdown,
+    push_down,
+)
+from sqlinpython.render import render_query
+from sqlinpython.sargable import IndexSchema
+from sqlinpython.table_or_subquery import Subquery
+
+count = FunctionName("count")
+total = FunctionName("sum")
+row_number = FunctionName("row_number")
+random = FunctionName("random")
+
+SCHEMA: list[CompleteSqlQuery] = [
+    *(
+        Create.Table(name)(
+            ColumnDef("id")(TypeName("INTEGER")).PrimaryKey,
+            ColumnDef("region")(TypeName("TEXT")),
+            ColumnDef("amount")(TypeName("INTEGER")),
+        )
+        for name in ("sales", "archive")
+    ),
+    Create.Index("sales_region").On("sales", ColumnName("region")),
+    Create.Index("archive_region").On("archive", ColumnName("region")),
+]
+SCHEMA_INFO = IndexSchema(SCHEMA)
+REGIONS = ["north", "south", "east", "west"]
+
+sales, archive = TableRef("sales"), TableRef("archive")
+north = col("s", "region").eq("north")
+
+
+@pytest.fixture
+def db() -> Iterator[sqlite3.Connection]:
+    connection = schema_connection(SCHEMA)
+    for table, offset in (("sales", 0), ("archive", 5)):
+        connection.executemany(
+            f"INSERT INTO {table} (region, amount) VALUES (?, ?)",
+            [(REGIONS[i % 4], (i + offset) % 7) for i in range(40)],
+        )
+    yield connection
+    connection.close()
+
+
+def _scans(query: CompleteSqlQuery, db: sqlite3.Connection) -> bool:
+    # Scans of the rows of subqueries are fine, of tables not.
+    findings = analyze_plan(query, db).findings
+    return any(
+        f.kind == FULL_SCAN and f.table in ("sales", "archive") for f in findings
+    )
+
+
+def _rows(query: CompleteSqlQuery, db: sqlite3.Connection) -> list[object]:
+    return sorted(db.execute(query.get_query()).fetchall())
+
+
+def _rewrites(pushed: Pushdown) -> list[tuple[str, str | None, int, str]]:
+    return [(r.kind, r.source, r.arm, render_query(r.pushed)) for r in pushed.rewrites]
+
+
+def _from(inner: Any) -> Any:
+    return Select(Star).From(Subquery(inner).As("s"))
+
+
+def _regions(table: TableRef) -> Any:
+    return Select(col("region"), col("amount")).From(table)
+
+
+@pytest.mark.parametrize(
+    ("operator", "keyword"),
+    [
+        ("Union", "UNION"),
+        ("UnionAll", "UNION ALL"),
+        ("Intersect", "INTERSECT"),
+        ("Except", "EXCEPT"),
+    ],
+)
+def test_compound_arms(db: sqlite3.Connection, operator: str, keyword: str) -> None:
+    inner = getattr(_regions(sales), operator)(_regions(archive))
+    query = _from(inner).Where(north.And(col("s", "amount") > 2))
+    pushed = push_down(query, schema=SCHEMA_INFO)
+    condition = "region = 'north' AND amount > 2"
+    assert pushed.rewrites[0].predicate == north
+    # SQLite pushes into UNION ALL itself, but scans the other compounds.
+    assert _scans(query, db) == (keyword != "UNION ALL")
+    assert _rows(pushed.statement, db) == _rows(query, db)
+    if keyword == "EXCEPT":
+        # The rows removed by EXCEPT must not be filtered.
+        assert render_query(pushed.statement) == (
+            f"SELECT * FROM (SELECT region, amount FROM sales WHERE {condition}"
+            " EXCEPT SELECT region, amount FROM archive) AS s"
+            " WHERE s.region = 'north' AND s.amount > 2"
+        )
+        assert [r.arm for r in pushed.rewrites] == [0, 0]
+        return
+    assert render_query(pushed.statement) == (
+        f"SELECT * FROM (SELECT region, amount FROM sales WHERE {condition}"
+        f" {keyword} SELECT region, amount FROM archive WHERE {condition}) AS s"
+    )
+    assert _rewrites(pushed) == [
+        (PUSHED_INTO_WHERE, "s", 0, "region = 'north'"),
+        (PUSHED_INTO_WHERE, "s", 1, "region = 'north'"),
+        (PUSHED_INTO_WHERE, "s", 0, "amount > 2"),
+        (PUSHED_INTO_WHERE, "s", 1, "amount > 2"),
+    ]
+    assert not _scans(pushed.statement, db)
+
+
+def test_arms_by_position(db: sqlite3.Connection) -> None:
+    inner = (
+        Select(col("region").As("r"), (col("amount") * 2).As("a"))
+        .From(sales)
+        .Union(Select(col("region"), col("amount") + 1).From(archive))
+        .OrderBy(col("r"))
+    )
+    query = _from(inner).Where(col("s", "r").eq("east").And(col("s", "a") > 4))
+    pushed = push_down(query, schema=SCHEMA_INFO)
+    assert _rewrites(pushed) == [
+        (PUSHED_INTO_WHERE, "s", 0, "region = 'east'"),
+        (PUSHED_INTO_WHERE, "s", 1, "region = 'east'"),
+        (PUSHED_INTO_WHERE, "s", 0, "amount * 2 > 4"),
+        (PUSHED_INTO_WHERE, "s", 1, "amount + 1 > 4"),
+    ]
+    assert "ORDER BY r) AS s" in render_query(pushed.statement)
+    assert not _scans(pushed.statement, db)
+    assert _rows(pushed.statement, db) == _rows(query, db)
+
+
+def test_aggregates(db: sqlite3.Connection) -> None:
+    inner = (
+        Select(col("region"), count(Star).As("n"), total(col("amount")).As("t"))
+        .From(sales)
+        .GroupBy(col("region"))
+    )
+    query = _from(inner).Where(
+        north.Or(col("s", "region").eq("east"))
+        .And(col("s", "t") > 30)
+        .And(col("s", "n").ne(col("s", "region")))
+    )
+    pushed = push_down(query)
+    assert render_query(pushed.statement) == (
+        "SELECT * FROM (SELECT region, count(*) AS n, sum(amount) AS t FROM sales"
+        " WHERE (region = 'north' OR region = 'east') GROUP BY region"
+        " HAVING sum(amount) > 30 AND count(*) != region) AS s"
+    )
+    assert [r[0] for r in _rewrites(pushed)] == [
+        PUSHED_INTO_WHERE,
+        PUSHED_INTO_HAVING,
+        PUSHED_INTO_HAVING,
+    ]
+    assert not _scans(pushed.statement, db)
+    assert _rows(pushed.statement, db) == _rows(query, db)
+    # Aggregates of all the rows and bare columns keep their conditions.
+    for unchanged in (
+        _from(Select(col("region"), count(Star)).From(sales)).Where(north),
+        _from(inner).Where(col("s", "amount").eq(1)),
+    ):
+        assert push_down(unchanged) == (unchanged, ())
+
+
+def test_windows(db: sqlite3.Connection) -> None:
+    inner = Select(
+        col("region"),
+        col("amount"),
+        row_number().Over(PartitionBy(col("region")).OrderBy(col("id"))).As("rn"),
+    ).From(sales)
+    query = _from(inner).Where(
+        north.And(col("s", "amount") > 2).And(col("s", "rn") < 5)
+    )
+    pushed = push_down(query)
+    # Only conditions on the PARTITION BY columns keep the same windows.
+    assert render_query(pushed.statement) == (
+        "SELECT * FROM (SELECT region, amount, row_number() OVER"
+        " (PARTITION BY region ORDER BY id) AS rn FROM sales"
+        " WHERE region = 'north') AS s WHERE s.amount > 2 AND s.rn < 5"
+    )
+    assert _rows(pushed.statement, db) == _rows(query, db)
+    whole = Select(col("region"), row_number().Over().As("rn")).From(sales)
+    unchanged = _from(whole).Where(north)
+    assert push_down(unchanged) == (unchanged, ())
+
+
+def test_unchanged(db: sqlite3.Connection) -> None:
+    queries: list[Any] = [
+        # A LIMIT keeps the first rows, not the first rows that match.
+        _from(_regions(sales).Limit(5)).Where(north),
+        _from(_regions(sales).Union(_regions(archive)).Limit(5)).Where(north),
+        # Conditions on NULL rows of LEFT JOIN or on several sources.
+        Select(Star)
+        .From(archive.As("a").LeftJoin(Subquery(_regions(sales)).As("s")).On(north))
+        .Where(north),
+        Select(Star)
+        .From(archive.As("a"), Subquery(_regions(sales)).As("s"))
+        .Where(col("a", "amount").eq(col("s", "amount"))),
+        # Functions returning new values, subqueries and ambiguous names.
+        _from(_regions(sales)).Where(col("s", "amount") > random()),
+        _from(_regions(sales)).Where(
+            col("s", "region").In(Select(col("region")).From(archive))
+        ),
+        _from(Select(col("region"), col("region")).From(sales)).Where(north),
+        _from(Select(Star).From(sales, archive)).Where(col("s", "amount").eq(1)),
+    ]
+    for query in queries:
+        pushed = push_down(query)
+        assert pushed.statement is query
+        assert pushed.rewrites == ()
+        assert _rows(query, db) is not None
+    assert push_down(Create.View("v").As(_regions(sales))).rewrites == ()
+
+
+def test_inner_side_of_joins(db: sqlite3.Connection) -> None:
+    query = (
+        Select(col("a", "id"), col("s", "amount"))
+        .From(
+            Subquery(_regions(sales))
+            .As("s")
+            .LeftJoin(archive.As("a"))
+            .On(col("a", "region").eq(col("s", "region")))
+        )
+        .Where(north)
+    )
+    pushed = push_down(query)
+    assert _rewrites(pushed) == [(PUSHED_INTO_WHERE, "s", 0, "region = 'north'")]
+    assert "AS s LEFT JOIN archive AS a" in render_query(pushed.statement)
+    assert _rows(pushed.statement, db) == _rows(query, db)
+
+
+def test_views(db: sqlite3.Connection) -> None:
+    totals = Create.View("totals").As(
+        _regions(sales)
+        .UnionAll(_regions(archive))
+        .Union(Select(col("region"), col("amount")).From(archive))
+    )
+    db.execute(totals.get_query())
+    query = Select(col("t", "amount")).From(TableRef("totals").As("t"))
+    filtered = query.Where(col("t", "region").eq("west"))
+    pushed = push_down(filtered, views=[totals], schema=SCHEMA_INFO)
+    assert render_query(pushed.statement).startswith(
+        "SELECT t.amount FROM (SELECT region, amount FROM sales"
+        " WHERE region = 'west' UNION ALL"
+    )
+    assert [r.arm for r in pushed.rewrites] == [0, 1, 2]
+    assert _scans(filtered, db)
+    assert not _scans(pushed.statement, db)
+    assert _rows(pushed.statement, db) == _rows(filtered, db)
+    # Views are left as they are when nothing is pushed.
+    assert push_down(query, views=[totals]) == (query, ())
+
+
+def test_nested_subqueries(db: sqlite3.Connection) -> None:
+    inner = Select(col("region").As("r"), col("amount")).From(sales)
+    middle = Select(Star).From(Subquery(inner).As("i"))
+    query = Select(col("o", "amount")).From(Subquery(middle).As("o"))
+    query = query.Where(col("o", "r").eq("south"))
+    pushed = push_down(query)
+    assert render_query(pushed.statement) == (
+        "SELECT o.amount FROM (SELECT * FROM (SELECT region AS r, amount FROM sales"
+        " WHERE region = 'south') AS i) AS o"
+    )
+    assert _rewrites(pushed) == [
+        (PUSHED_INTO_WHERE, "o", 0, "r = 'south'"),
+        (PUSHED_INTO_WHERE, "i", 0, "region = 'south'"),
+    ]
+    assert not _scans(pushed.statement, db)
+    assert _rows(pushed.statement, db) == _rows(query, db)
+
+
+def test_conditions_in_subqueries_of_the_from_clause() -> None:
+    condition: Expression = col("region").eq("x")
+    # The statement itself has no WHERE clause, its subquery has.
+    nested = _from(_from(_regions(sales)).Where(col("s", "region").eq("x")))
+    pushed = push_down(nested)
+    assert render_query(pushed.statement) == (
+        "SELECT * FROM (SELECT * FROM (SELECT region, amount FROM sales"
+        " WHERE region = 'x') AS s) AS s"
+    )
+    assert [r.pushed for r in pushed.rewrites] == [condition]
+
+
+# Compounds whose SELECTs convert or compare their values differently.
+
+MIXED: list[CompleteSqlQuery] = [
+    Create.Table("t1")(ColumnDef("a")(TypeName("TEXT")), ColumnDef("b")),
+    Create.Table("t2")(ColumnDef("a")(TypeName("REAL")), ColumnDef("b")),
+    Create.Table("t3")(
+        ColumnDef("a")(TypeName("TEXT")).Collate("nocase"), ColumnDef("b")
+    ),
+    Create.Table("t4")(ColumnDef("a"), ColumnDef("b")(TypeName("INTEGER"))),
+]
+MIXED_INFO = IndexSchema(MIXED)
+MIXED_VALUES: list[SqlLiteral] = [
+    None,
+    1,
+    1.0,
+    "1",
+    "a",
+    "A",
+    "b",
+    b"1",
+    2,
+    "2.0",
+    -1.5,
+]
+
+
+@pytest.fixture(scope="module")
+def mixed() -> Iterator[sqlite3.Connection]:
+    connection = schema_connection(MIXED)
+    rng = Random(0)
+    for table in ("t1", "t2", "t3", "t4"):
+        connection.executemany(
+            f"INSERT INTO {table} VALUES (?, ?)",
+            [(rng.choice(MIXED_VALUES), rng.choice(MIXED_VALUES)) for _ in range(12)],
+        )
+    yield connection
+    connection.close()
+
+
+def _sorted_rows(db: sqlite3.Connection, query: CompleteSqlQuery) -> list[str]:
+    return sorted(map(repr, db.execute(query.get_query()).fetchall()))
+
+
+def test_compound_arms_with_other_affinities(mixed: sqlite3.Connection) -> None:
+    x = col("s", "x")
+    inner = (
+        Select(col("a").As("x"))
+        .From(TableRef("t4"))
+        .UnionAll(Select(col("a")).From(TableRef("t1")))
+    )
+    query = _from(inner).Where(x.eq(1))
+    assert push_down(query, schema=MIXED_INFO) == (query, ())
+    # Without the schema the affinities are unknown.
+    same = Select(col("a").As("x")).From(TableRef("t1"))
+    query = _from(same.UnionAll(same)).Where(x.eq(1))
+    assert push_down(query) == (query, ())
+    assert len(push_down(query, schema=MIXED_INFO).rewrites) == 2
+    # Nor into columns with other collations.
+    nocase = Select(col("a").As("x")).From(TableRef("t3"))
+    query = _from(nocase.Union(same)).Where(x.eq("a"))
+    assert push_down(query, schema=MIXED_INFO) == (query, ())
+    # UNION keeps either of 1 and 1.0, which typeof() tells apart.
+    query = _from(same.Union(same)).Where(FunctionName("typeof")(x).eq("real"))
+    assert push_down(query, schema=MIXED_INFO) == (query, ())
+    # Nor into the right side of EXCEPT.
+    query = _from(same.Except(same)).Where(x.eq("a"))
+    pushed = push_down(query, schema=MIXED_INFO)
+    assert [r.arm for r in pushed.rewrites] == [0]
+    assert render_query(pushed.statement).endswith(") AS s WHERE s.x = 'a'")
+    assert _sorted_rows(mixed, pushed.statement) == _sorted_rows(mixed, query)
+
+
+def _random_column(rng: Random) -> Expression:
+    column: Expression = col(rng.choice(("a", "b")))
+    choice = rng.randrange(6)
+    if choice == 0:
+        return column.Collate(rng.choice(("nocase", "binary")))
+    if choice == 1:
+        return Cast(column, TypeName(rng.choice(("TEXT", "INTEGER", "REAL"))))
+    if choice == 2:
+        return column + 0
+    return column
+
+
+def _random_condition(rng: Random) -> Expression:
+    column = col("s", rng.choice(("x", "y")))
+    value = rng.choice(MIXED_VALUES[1:])
+    operations: list[Callable[[], Expression]] = [
+        lambda: column.eq(value),
+        lambda: column > value,
+        lambda: column.Is(value),
+        lambda: FunctionName("typeof")(column).eq(rng.choice(("text", "real"))),
+        lambda: column.Collate("binary").eq(value),
+    ]
+    return rng.choice(operations)()
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_same_rows_as_sqlite(mixed: sqlite3.Connection, seed: int) -> None:
+    rng = Random(seed)
+    operators = ("Union", "UnionAll", "Intersect", "Except")
+    for _ in range(50):
+        # Few tables and columns, so that the SELECTs often have the same types.
+        tables = rng.sample(("t1", "t2", "t3", "t4"), 2)
+        columns = [_random_column(rng) for _ in range(3)]
+        arms = [
+            Select(rng.choice(columns).As("x"), rng.choice(columns).As("y")).From(
+                TableRef(rng.choice(tables))
+            )
+            for _ in range(rng.randint(2, 3))
+        ]
+        inner: Any = arms[0]
+        for arm in arms[1:]:
+            inner = getattr(inner, rng.choice(operators))(arm)
+        query = _from(inner).Where(_random_condition(rng))
+        pushed = push_down(query, schema=MIXED_INFO)
+        assert _sorted_rows(mixed, pushed.statement) == _sorted_rows(mixed, query), (
+            render_query(query),
+            render_query(pushed.statement),
+        )
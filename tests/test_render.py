@@ -0,0 +1,185 @@
+import ast
+import importlib
+import inspect
+import io
+import pkgutil
+import tracemalloc
+from collections.abc import Callable, Iterator
+
+import pytest
+
+import sqlinpython
+from sqlinpython import (
+    Check,
+    ColumnDef,
+    Create,
+    FunctionName,
+    Insert,
+    PartitionBy,
+    Select,
+    TableRef,
+    Update,
+    col,
+    literal,
+)
+from sqlinpython.base import CompleteSqlQuery, SqlElement
+from sqlinpython.expression import Expression
+from sqlinpython.render import iter_query, render_query
+from tests.existing import check_get_query, parametrize_existing_tests
+
+
+@parametrize_existing_tests(__name__)
+def test_render_matches_get_query(
+    test_func: Callable[[], None], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Re-run the existing query tests, checking every rendered statement
+    # against the iterative renderer.
+    def check(statement: CompleteSqlQuery, query: str) -> None:
+        assert render_query(statement) == query
+        assert "".join(iter_query(statement, chunk_size=7)) == query
+
+    check_get_query(monkeypatch, check)
+    test_func()
+
+
+def _subclasses(cls: type[SqlElement]) -> Iterator[type[SqlElement]]:
+    for sub in cls.__subclasses__():
+        yield sub
+        yield from _subclasses(sub)
+
+
+def _defining_class(cls: type, name: str) -> type:
+    return next(klass for klass in cls.__mro__ if name in vars(klass))
+
+
+def _renders_children(cls: type) -> bool:
+    # Leaves only append to the buffer; containers hand it to other code
+    # (a child's _create_query, comma_separated, ...).
+    source = inspect.getsource(vars(cls)["_create_query"])
+    function = ast.parse(inspect.cleandoc("\n" + source)).body[0]
+    assert isinstance(function, ast.FunctionDef)
+    return any(
+        isinstance(node, ast.Call)
+        and not (isinstance(node.func, ast.Name) and node.func.id == "isinstance")
+        and any(isinstance(arg, ast.Name) and arg.id == "buffer" for arg in node.args)
+        for node in ast.walk(ast.Module(function.body, []))
+    )
+
+
+def test_parts_and_create_query_are_defined_together() -> None:
+    for module_info in pkgutil.walk_packages(sqlinpython.__path__, "sqlinpython."):
+        importlib.import_module(module_info.name)
+    for cls in set(_subclasses(SqlElement)):
+        parts_owner = _defining_class(cls, "_parts")
+        query_owner = _defining_class(cls, "_create_query")
+        if parts_owner is not SqlElement:
+            # A subclass overriding _create_query must also override _parts.
+            assert issubclass(parts_owner, query_owner), cls
+        elif query_owner is not SqlElement:
+            # Without _parts the iterative renderer recurses into children.
+            assert not _renders_children(query_owner), cls
+
+
+def test_render_deep_or_chain() -> None:
+    expr: Expression = col("id").eq(literal(0))
+    for i in range(1, 100_000):
+        expr = expr.Or(col("id").eq(literal(i)))
+    query = Select(col("id")).From(TableRef("t")).Where(expr)
+    text = render_query(query)
+    assert text.startswith("SELECT id FROM t WHERE id = 0 OR id = 1 OR ")
+    assert text.endswith(" OR id = 99999")
+
+
+def test_render_deep_union_chain() -> None:
+    query = Select(literal(0))
+    for i in range(1, 20_000):
+        query = query.UnionAll(Select(literal(i)))
+    text = render_query(query)
+    assert text.startswith("SELECT 0 UNION ALL SELECT 1 UNION ALL ")
+    assert text.endswith("UNION ALL SELECT 19999")
+
+
+def test_render_deep_arithmetic_in_update() -> None:
+    expr: Expression = col("x")
+    for _ in range(50_000):
+        expr = expr + literal(1)
+    query = Update("t").Set(x=expr).Where(col("x") < literal(10))
+    text = render_query(query)
+    assert text.startswith("UPDATE t SET x = x + 1 + 1")
+    assert text.endswith(" + 1 WHERE x < 10")
+
+
+def _or_chain(length: int) -> Expression:
+    expr: Expression = col("x").eq(literal(0))
+    for i in range(1, length):
+        expr = expr.Or(col("x").eq(literal(i)))
+    return expr
+
+
+def test_render_deep_check_constraint() -> None:
+    query = Create.Table("t")(ColumnDef("x"), Check(_or_chain(100_000)))
+    text = render_query(query)
+    assert text.startswith("CREATE TABLE t (x, CHECK (x = 0 OR x = 1 OR ")
+    assert text.endswith(" OR x = 99999))")
+
+
+def test_render_deep_partition_by() -> None:
+    window = PartitionBy(_or_chain(100_000)).OrderBy(col("x").Asc).Rows.CurrentRow
+    query = Select(FunctionName("sum")(col("x")).Over(window)).From(TableRef("t"))
+    text = render_query(query)
+    assert text.startswith("SELECT sum(x) OVER (PARTITION BY x = 0 OR x = 1 OR ")
+    assert text.endswith(" OR x = 99999 ORDER BY x ASC ROWS CURRENT ROW) FROM t")
+
+
+def test_iter_query_chunks() -> None:
+    query = Insert.Into("t")("a", "b").Values(
+        *((literal(i), literal(f"value {i}")) for i in range(1_000))
+    )
+    chunks = list(query.iter_query(chunk_size=100))
+    text = query.get_query()
+    assert "".join(chunks) == text
+    assert all(len(chunk) == 100 for chunk in chunks[:-1])
+    assert 0 < len(chunks[-1]) <= 100
+    # Once the text is cached it is sliced instead of rendered again.
+    assert list(query.iter_query(chunk_size=100)) == chunks
+
+
+def test_iter_query_large_fragment() -> None:
+    query = Select(literal("x" * 1_000))
+    chunks = list(iter_query(query, chunk_size=64))
+    assert "".join(chunks) == "SELECT '" + "x" * 1_000 + "'"
+    assert max(len(chunk) for chunk in chunks) == 64
+
+
+def test_iter_query_rejects_bad_chunk_size() -> None:
+    with pytest.raises(ValueError, match="chunk_size"):
+        list(iter_query(Select(literal(1)), chunk_size=0))
+
+
+def test_write_query() -> None:
+    query = Select(col("a")).From(TableRef("t")).Where(col("a") > literal(1))
+    sink = io.StringIO()
+    assert query.write_query(sink, chunk_size=4) == len(query.get_query())
+    assert sink.getvalue() == query.get_query()
+
+
+class _CountingSink:
+    def __init__(self) -> None:
+        self.written = 0
+
+    def write(self, s: str) -> None:
+        self.written += len(s)
+
+
+def test_write_query_memory_is_bounded() -> None:
+    rows = 100_000
+    query = Insert.Into("t")("a", "b").Values(
+        *((literal(i), literal("some text value")) for i in range(rows))
+    )
+    sink = _CountingSink()
+    tracemalloc.start()
+    query.write_query(sink, chunk_size=16 * 1024)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert sink.written > 2_500_000
+    assert peak < 256 * 1024
@@ -0,0 +1,264 @@
+import sqlite3
+from collections.abc import Iterator
+
+import pytest
+
+from sqlinpython import (
+    ColumnDef,
+    ColumnName,
+    Create,
+    Delete,
+    FunctionName,
+    Select,
+    TableRef,
+    TypeName,
+    Update,
+    col,
+    literal,
+)
+from sqlinpython.base import CompleteSqlQuery
+from sqlinpython.expression import Expression, Subquery
+from sqlinpython.plan import FULL_SCAN, analyze_plan, schema_connection
+from sqlinpython.render import render_query
+from sqlinpython.sargable import (
+    ARITHMETIC_ON_COLUMN,
+    FUNCTION_ON_COLUMN,
+    LEADING_WILDCARD,
+    LIKE_PREFIX,
+    OR_ACROSS_COLUMNS,
+    IndexSchema,
+    find_issues,
+    make_sargable,
+)
+from sqlinpython.select import SelectWhereClause
+from sqlinpython.select_base import Core
+
+lower = FunctionName("lower")
+
+SCHEMA: list[CompleteSqlQuery] = [
+    Create.Table("users")(
+        ColumnDef("id")(TypeName("INTEGER")).PrimaryKey,
+        ColumnDef("name")(TypeName("TEXT")),
+        ColumnDef("email")(TypeName("TEXT")),
+        ColumnDef("age")(TypeName("INTEGER")),
+        ColumnDef("note"),
+    ),
+    Create.Index("users_name").On("users", ColumnName("name")),
+    Create.Index("users_age").On("users", ColumnName("age")),
+    Create.Index("users_email").On("users", lower(col("email"))),
+]
+NAMES = ["abc", "ABC", "Abd", "abcd", "ab", "abd", "b", "aB_c", "xabc", "ab%c"]
+
+
+@pytest.fixture
+def db() -> Iterator[sqlite3.Connection]:
+    connection = schema_connection(SCHEMA)
+    connection.executemany(
+        "INSERT INTO users VALUES (?, ?, ?, ?, NULL)",
+        [(i, name, f"{name}@example.com", 20 + i % 4) for i, name in enumerate(NAMES)],
+    )
+    yield connection
+    connection.close()
+
+
+@pytest.fixture
+def schema() -> IndexSchema:
+    return IndexSchema(SCHEMA)
+
+
+users = TableRef("users")
+
+
+def _select(condition: Expression) -> SelectWhereClause[Core]:
+    return Select(col("id"), col("email")).From(users).Where(condition)
+
+
+def _scans(query: CompleteSqlQuery, db: sqlite3.Connection) -> bool:
+    return any(f.kind == FULL_SCAN for f in analyze_plan(query, db).findings)
+
+
+def _rows(query: CompleteSqlQuery, db: sqlite3.Connection) -> list[object]:
+    return sorted(db.execute(query.get_query()).fetchall())
+
+
+def test_schema(schema: IndexSchema) -> None:
+    assert schema.columns["users"]["age"] == "INTEGER"
+    assert schema.is_indexed("users", "name")
+    assert schema.is_indexed("users", "id")
+    assert schema.is_indexed("users", "rowid")
+    assert not schema.is_indexed("users", "email")
+    assert schema.expressions == {"users": [lower(col("email"))]}
+    assert schema.has_text_affinity("users", "name")
+    assert not schema.has_text_affinity("users", "note")
+    assert schema.collations["users"]["name"] == "BINARY"
+    nocase = IndexSchema([Create.Table("t")(ColumnDef("a").Collate("nocase"))])
+    assert nocase.collations == {"t": {"a": "NOCASE"}}
+
+
+def test_finds_issues(schema: IndexSchema) -> None:
+    query = _select(
+        lower(col("name"))
+        .eq("x")
+        .And(col("age") + 0 > 3)
+        .And(col("name").Like("%x"))
+        .And(col("name").Like("x%"))
+        .And(col("age").eq(1).Or(col("note").eq(2)))
+    )
+    found = [
+        (i.kind, i.columns, render_query(i.predicate))
+        for i in find_issues(query, schema)
+    ]
+    assert found == [
+        (FUNCTION_ON_COLUMN, ("users.name",), "lower(name) = 'x'"),
+        (ARITHMETIC_ON_COLUMN, ("users.age",), "age + 0 > 3"),
+        (LEADING_WILDCARD, ("users.name",), "name LIKE '%x'"),
+        (LIKE_PREFIX, ("users.name",), "name LIKE 'x%'"),
+        (OR_ACROSS_COLUMNS, ("users.age",), "age = 1 OR note = 2"),
+    ]
+
+
+def test_sargable_conditions_are_not_flagged(schema: IndexSchema) -> None:
+    query = _select(
+        # The indexed expression, unindexed columns, columns of other tables.
+        lower(col("email"))
+        .eq("x")
+        .And(lower(col("note")).eq("x"))
+        .And(col("age").eq(1).Or(col("name").Between("a", "b")))
+        .And(col("age").eq(1).Or(col("age").eq(2)))
+        .And(col("name").Not.Like("%x"))
+        .And(lower(col("other", "name")).eq("x"))
+    )
+    assert find_issues(query, schema) == ()
+
+
+def test_finds_issues_in_update_delete_and_subqueries(schema: IndexSchema) -> None:
+    update = (
+        Update("users").As("u").Set(note=literal(1)).Where(col("u", "age") * 2 > 10)
+    )
+    delete = Delete.From("users").Where(
+        col("id").In(Select(col("id")).From(users).Where(lower(col("name")).eq("x")))
+    )
+    scalar = (
+        Select(Subquery(_select(col("name").Like("_x"))))
+        .From(users.As("v"))
+        .Where(col("v", "age").eq(1))
+    )
+    assert [(i.kind, i.columns) for i in find_issues(update, schema)] == [
+        (ARITHMETIC_ON_COLUMN, ("users.age",))
+    ]
+    assert [(i.kind, i.columns) for i in find_issues(delete, schema)] == [
+        (FUNCTION_ON_COLUMN, ("users.name",))
+    ]
+    assert [(i.kind, i.columns) for i in find_issues(scalar, schema)] == [
+        (LEADING_WILDCARD, ("users.name",))
+    ]
+
+
+def test_single_value_in(db: sqlite3.Connection, schema: IndexSchema) -> None:
+    query = _select(col("age").In(21).And(col("note").IsNull))
+    rewritten = make_sargable(query, schema)
+    assert render_query(rewritten) == (
+        "SELECT id, email FROM users WHERE age = 21 AND note ISNULL"
+    )
+    assert not _scans(rewritten, db)
+    assert _rows(rewritten, db) == _rows(query, db)
+    # A value that is not a constant is left alone.
+    correlated = _select(col("age").In(col("id")))
+    assert make_sargable(correlated, schema) is correlated
+
+
+@pytest.mark.parametrize("prefix", ["ab", "AB", "aB_", "ab%", "x"])
+def test_like_prefix_becomes_range(
+    db: sqlite3.Connection, schema: IndexSchema, prefix: str
+) -> None:
+    query = _select(col("name").Like(f"{prefix}%"))
+    rewritten = make_sargable(query, schema)
+    assert _scans(query, db)
+    assert not _scans(rewritten, db)
+    assert find_issues(rewritten, schema) == ()
+    assert _rows(rewritten, db) == _rows(query, db)
+
+
+def test_like_range_bounds(schema: IndexSchema) -> None:
+    query = _select(col("name").Like("aB1%"))
+    assert render_query(make_sargable(query, schema)) == (
+        "SELECT id, email FROM users WHERE"
+        " name >= 'AB1' AND name < 'ab2' AND name LIKE 'aB1%'"
+    )
+    # Patterns that start with a wildcard, have an ESCAPE or are on an
+    # unindexed column are left alone.
+    for condition in (
+        col("name").Like("%ab"),
+        col("name").Like("ab%").Escape("\\"),
+        col("note").Like("ab%"),
+    ):
+        assert make_sargable(_select(condition), schema) == _select(condition)
+
+
+def test_or_becomes_union_all(db: sqlite3.Connection, schema: IndexSchema) -> None:
+    query = _select(col("age").eq(21).Or(col("name").Like("ab%")))
+    rewritten = make_sargable(query, schema)
+    assert render_query(rewritten) == (
+        "SELECT id, email FROM users WHERE age = 21"
+        " UNION ALL SELECT id, email FROM users WHERE name >= 'AB' AND name < 'ac'"
+        " AND name LIKE 'ab%' AND (age = 21) IS NOT TRUE"
+    )
+    assert _scans(query, db)
+    plan = analyze_plan(rewritten, db)
+    assert plan.findings == ()
+    assert "SEARCH users USING INDEX users_age (age=?)" in plan.text()
+    assert "SEARCH users USING INDEX users_name (name>? AND name<?)" in plan.text()
+    # Rows matching several conditions come once, as without the rewrite.
+    assert _rows(rewritten, db) == _rows(query, db)
+
+
+def test_or_of_three_conditions(db: sqlite3.Connection, schema: IndexSchema) -> None:
+    query = _select(
+        col("age").eq(20).Or(col("id") > 7).Or(col("name").Between("abc", "abd"))
+    )
+    rewritten = make_sargable(query, schema)
+    assert render_query(rewritten).count("UNION ALL") == 2
+    assert not _scans(rewritten, db)
+    assert _rows(rewritten, db) == _rows(query, db)
+
+
+def test_or_is_kept(schema: IndexSchema) -> None:
+    name_or_age = col("age").eq(1).Or(col("name").eq("x"))
+    unchanged = [
+        # An alternative no index serves.
+        _select(col("age").eq(1).Or(col("note").eq(2))),
+        # A single column, which SQLite handles as an IN.
+        _select(col("age").eq(1).Or(col("age").eq(2))),
+        Select.Distinct(col("age")).From(users).Where(name_or_age),
+        Select(FunctionName("count")("*")).From(users).Where(name_or_age),
+        _select(name_or_age).OrderBy(col("id")),
+        Select(col("id")).From(users, TableRef("other")).Where(name_or_age),
+    ]
+    for query in unchanged:
+        assert make_sargable(query, schema) is query
+
+
+def test_rewrites_update_and_delete(
+    db: sqlite3.Connection, schema: IndexSchema
+) -> None:
+    update = (
+        Update("users")
+        .Set(note=literal("x"))
+        .Where(col("name").Like("ab%"))
+        .Returning(col("id"))
+    )
+    delete = Delete.From("users").As("u").Where(col("u", "age").In(22))
+    new_update = make_sargable(update, schema)
+    new_delete = make_sargable(delete, schema)
+    assert render_query(new_update) == (
+        "UPDATE users SET note = 'x' WHERE name >= 'AB' AND name < 'ac'"
+        " AND name LIKE 'ab%' RETURNING id"
+    )
+    assert render_query(new_delete) == "DELETE FROM users AS u WHERE u.age = 22"
+    assert _scans(update, db)
+    assert not _scans(new_update, db)
+    assert not _scans(new_delete, db)
+    names = Select(col("id")).From(users).Where(col("name").Like("ab%"))
+    assert _rows(new_update, db) == _rows(names, db)
+    # The original is unchanged.
+    assert render_query(update).endswith("WHERE name LIKE 'ab%' RETURNING id")
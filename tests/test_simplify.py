@@ -0,0 +1,256 @@
+import random
+import sqlite3
+from collections.abc import Callable, Iterator
+
+import pytest
+
+from sqlinpython import FunctionName, Select, TableRef, col, literal
+from sqlinpython.expression import (
+    ColumnName,
+    Exists,
+    Expression,
+    Literal,
+    Not,
+    Subquery,
+)
+from sqlinpython.expression.core import ParenthesizedExpression
+from sqlinpython.expression.literal import SqlLiteral
+from sqlinpython.expression.simplify import simplify
+from sqlinpython.render import render_query
+
+x, y = col("x"), col("y")
+
+
+def _simple(expr: Expression, predicate: bool = False) -> str:
+    return render_query(simplify(expr, predicate=predicate))
+
+
+def test_boolean_identities() -> None:
+    assert _simple(literal(True).And(x.eq(1))) == "x = 1"
+    assert _simple(x.eq(1).Or(False)) == "x = 1"
+    assert _simple(Not(Not(x > 1))) == "x > 1"
+    assert _simple(x.eq(1).And(False)) == "FALSE"
+    assert _simple(literal(True).Or(x.eq(1))) == "TRUE"
+    assert _simple(literal(1).eq(1)) == "TRUE"
+    assert _simple(x.eq(1).And(literal(1).eq(1)).And(y.eq(2))) == "x = 1 AND y = 2"
+    assert _simple(literal(True).And(True)) == "TRUE"
+    assert _simple(literal(False).Or(False)) == "FALSE"
+
+
+def test_three_valued_logic() -> None:
+    null = literal(None)
+    # NULL AND x is NULL or FALSE depending on x.
+    assert _simple(null.And(x.eq(1))) == "NULL AND x = 1"
+    assert _simple(null.And(False)) == "FALSE"
+    assert _simple(null.Or(True)) == "TRUE"
+    assert _simple(Not(null)) == "NULL"
+    assert _simple(null.eq(null)) == "NULL"
+    assert _simple(null.Is(None)) == "TRUE"
+    assert _simple(literal(5).Is(True)) == "TRUE"
+    assert _simple(null.Is.Not(False)) == "TRUE"
+    # x IS TRUE tests whether x is true, x IS (NOT FALSE) whether it is 1.
+    assert _simple(x.Is(Not(literal(False)))) == "x IS 1"
+    assert _simple(literal(5).Is(ParenthesizedExpression(Not(literal(False))))) == (
+        "FALSE"
+    )
+
+
+def test_value_context() -> None:
+    # 5 AND TRUE is 1, not 5: x stays in a boolean operator.
+    assert _simple(x.And(True)) == "x AND TRUE"
+    assert _simple(x.And(True), predicate=True) == "x"
+    assert _simple(Not(Not(x))) == "NOT NOT x"
+    assert _simple(Not(Not(x)), predicate=True) == "x"
+    assert _simple(x.And(True).And(True)) == "x AND TRUE"
+    # Inside AND, OR and NOT only the truth value of x matters.
+    assert _simple(y.eq(1).And(x.And(True))) == "y = 1 AND x"
+    assert _simple(Not(x.Or(False))) == "NOT x"
+
+
+def test_folds_literals() -> None:
+    assert _simple(x + (literal(1) + 2) * 3) == "x + 9"
+    assert _simple(literal(7) / 2) == "3"
+    assert _simple(literal(-7) / 2) == "-3"
+    assert _simple(literal(-7) % 3) == "-1"
+    assert _simple(literal(1) / 0) == "NULL"
+    assert _simple(literal(1.5) * 2) == "3.0"
+    assert _simple(literal("a").Concat(1)) == "'a1'"
+    assert _simple(literal(1) << 63) == "-9223372036854775808"
+    assert _simple(literal("1") < 1) == "FALSE"
+    assert _simple(literal(b"a") > "b") == "TRUE"
+    assert _simple(-(literal(2) - 3)) == "1"
+    assert _simple(~literal(0)) == "-1"
+    # SQLite computes these as floats or from text: left to it.
+    for expr in (
+        literal(2**62) * 4,
+        literal("1a") + 1,
+        literal(1.5) % 1,
+        literal(1.5).Concat("a"),
+    ):
+        assert simplify(expr) == expr
+
+
+def test_parentheses() -> None:
+    assert _simple(ParenthesizedExpression(x)) == "x"
+    assert _simple((x + y) * 2) == "(x + y) * 2"
+    assert _simple((x + (literal(1) - 1)) * 2) == "(x + 0) * 2"
+    assert _simple(x * (y + (literal(0) * 2))) == "x * (y + 0)"
+    assert _simple(Not(x.Or(y)).And(True)) == "NOT (x OR y)"
+    assert _simple(x.eq(1).Or(x.eq(2)).And(literal(1).eq(1))) == "x = 1 OR x = 2"
+    assert _simple(-(literal(1) - 2)) == "1"
+    assert _simple(-(x + (literal(0) - 1))) == "-(x + -1)"
+    assert _simple(-ParenthesizedExpression(literal(0) - 1)) == "1"
+    assert _simple(-ParenthesizedExpression(-ParenthesizedExpression(x + 0 * 1))) == (
+        "-(-(x + 0))"
+    )
+    assert _simple(-ParenthesizedExpression(-literal(2**63 - 1) - 1)) == (
+        "-(-9223372036854775808)"
+    )
+
+
+def test_subqueries_are_kept() -> None:
+    inner = Select(col("a")).From(TableRef("t")).Where(literal(True).And(x))
+    expr = Exists(inner).And(literal(1).eq(1)).Or(Subquery(inner).eq(1))
+    assert _simple(expr) == (
+        "EXISTS (SELECT a FROM t WHERE TRUE AND x)"
+        " OR (SELECT a FROM t WHERE TRUE AND x) = 1"
+    )
+
+
+def test_unchanged_expression_is_returned() -> None:
+    expr = x.eq(1).And(y.Like("a%")).Or(Not(x.In(1, 2)))
+    assert simplify(expr) is expr
+
+
+# Equivalence with SQLite over random expressions.
+
+COLUMNS = ("i", "f", "s", "n")
+ROWS = [
+    (1, 0, 0.0, "", None),
+    (2, 1, 1.5, "1", None),
+    (3, -7, -2.5, "1a", None),
+    (4, None, None, None, None),
+    (5, 2**62, 1e300, "abc", None),
+    (6, 3, 0.5, "x", None),
+]
+LITERALS: list[SqlLiteral] = [
+    None,
+    True,
+    False,
+    0,
+    1,
+    -1,
+    2,
+    7,
+    -3,
+    2**62,
+    2**63 - 1,
+    -(2**63),
+    64,
+    0.0,
+    1.5,
+    -2.25,
+    1e300,
+    "",
+    "1",
+    "a",
+    "2b",
+    b"a",
+]
+
+
+@pytest.fixture(scope="module")
+def db() -> Iterator[sqlite3.Connection]:
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, i, f, s, n)")
+    connection.executemany("INSERT INTO t VALUES (?, ?, ?, ?, ?)", ROWS)
+    yield connection
+    connection.close()
+
+
+def _operand(expr: Expression) -> Expression:
+    if isinstance(expr, Literal | ColumnName):
+        return expr
+    return ParenthesizedExpression(expr)
+
+
+def _random_expression(rng: random.Random, depth: int) -> Expression:
+    if depth == 0 or rng.random() < 0.2:
+        if rng.random() < 0.3:
+            return col(rng.choice(COLUMNS))
+        return literal(rng.choice(LITERALS))
+    # Operands are parenthesized: the builders leave out parentheses SQLite
+    # needs to read some expressions as they were built.
+    left = _operand(_random_expression(rng, depth - 1))
+    right = _operand(_random_expression(rng, depth - 1))
+    operations: list[Callable[[], Expression]] = [
+        lambda: left.And(right),
+        lambda: left.Or(right),
+        lambda: Not(left),
+        lambda: left.eq(right),
+        lambda: left.ne(right),
+        lambda: left < right,
+        lambda: left >= right,
+        lambda: left.Is(right),
+        lambda: left.Is.Not(right),
+        lambda: left.Is.Not.DistinctFrom(right),
+        lambda: left + right,
+        lambda: left - right,
+        lambda: left * right,
+        lambda: left / right,
+        lambda: left % right,
+        lambda: left & right,
+        lambda: left << right,
+        lambda: left >> right,
+        lambda: left.Concat(right),
+        lambda: -ParenthesizedExpression(left),
+        lambda: ~ParenthesizedExpression(left),
+        lambda: ParenthesizedExpression(left),
+        lambda: left.Between(right, 1),
+        lambda: left.In(right, 1),
+        lambda: left.IsNull,
+    ]
+    return rng.choice(operations)()
+
+
+def _run(db: sqlite3.Connection, sql: str) -> list[tuple[object, ...]] | None:
+    try:
+        return db.execute(sql).fetchall()
+    except sqlite3.Error:
+        return None
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_same_values_as_sqlite(db: sqlite3.Connection, seed: int) -> None:
+    rng = random.Random(seed)
+    for _ in range(100):
+        expr = _random_expression(rng, 4)
+        simplified = simplify(expr)
+
+        def values(e: Expression) -> str:
+            return render_query(
+                Select(e, FunctionName("typeof")(e)).From(TableRef("t"))
+            )
+
+        before = _run(db, values(expr) + " ORDER BY id")
+        if before is None:
+            continue
+        after = _run(db, values(simplified) + " ORDER BY id")
+        assert after == before, (render_query(expr), render_query(simplified))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_same_rows_as_sqlite(db: sqlite3.Connection, seed: int) -> None:
+    rng = random.Random(1000 + seed)
+    for _ in range(100):
+        expr = _random_expression(rng, 4)
+        simplified = simplify(expr, predicate=True)
+
+        def rows(e: Expression) -> str:
+            return render_query(Select(col("id")).From(TableRef("t")).Where(e))
+
+        before = _run(db, rows(expr) + " ORDER BY id")
+        if before is None:
+            continue
+        after = _run(db, rows(simplified) + " ORDER BY id")
+        assert after == before, (render_query(expr), render_query(simplified))